@@ -0,0 +1,80 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fast paths for the hot unary RPCs of the publisher and subscriber clients.
+
+The generated clients coerce the request into a proto-plus message, build the
+routing header and wrap the response on every call, and the request is
+serialized again on every retry. The RPCs created here instead take the
+serialized request, which is reused across retries, and return the raw
+protobuf response.
+"""
+
+from __future__ import absolute_import
+
+import functools
+from typing import Any, Callable, Tuple
+
+from google.api_core import gapic_v1
+
+# The number of distinct topics and subscriptions whose routing headers are
+# kept. Clients rarely use more.
+_ROUTING_METADATA_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_ROUTING_METADATA_CACHE_SIZE)
+def routing_metadata(field: str, value: str) -> Tuple[Tuple[str, str], ...]:
+    """Return the request metadata that routes a request by a field value.
+
+    Args:
+        field: The name of the request field, e.g. ``"topic"``.
+        value: The value of the field.
+    """
+    return (gapic_v1.routing_header.to_grpc_metadata(((field, value),)),)
+
+
+def wrap_method(
+    transport: Any,
+    method: Callable,
+    path: str,
+    response_deserializer: Callable[[bytes], Any],
+    client_info: gapic_v1.client_info.ClientInfo,
+) -> Callable[..., Any]:
+    """Create a variant of a gRPC transport method for serialized requests.
+
+    The returned callable takes the serialized request, and returns the raw
+    protobuf response. It has the same default retry and timeout as the
+    wrapped transport method, and accepts the same ``retry``, ``timeout`` and
+    ``metadata`` arguments.
+
+    Args:
+        transport: The gRPC transport of the client.
+        method: The method of the transport, e.g. ``transport.publish``.
+        path: The full path of the RPC method.
+        response_deserializer: Parses the raw protobuf response, e.g.
+            ``PublishResponse.pb().FromString``.
+        client_info: The client info of the client, for the metrics header.
+    """
+    stub = transport._logged_channel.unary_unary(
+        path,
+        request_serializer=None,
+        response_deserializer=response_deserializer,
+    )
+    wrapped = transport._wrapped_methods[method]
+    return gapic_v1.method.wrap_method(
+        stub,
+        default_retry=wrapped._retry,
+        default_timeout=wrapped._timeout,
+        client_info=client_info,
+    )
@@ -0,0 +1,150 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeadlineTimer(object):
+    """Run callbacks at their deadlines on a single long-lived thread.
+
+    The pending callbacks are kept in a min-heap ordered by deadline. The
+    timer thread sleeps until the earliest deadline, or until a callback with
+    an earlier deadline is scheduled, and then runs all of the callbacks that
+    are due. The thread is only started when the first callback is scheduled.
+
+    Callbacks run on the timer thread, one after another, thus they should
+    not block.
+
+    Public methods are thread-safe.
+
+    Args:
+        name: The name of the timer thread.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        # Entries are (deadline, sequence number, callback). The sequence
+        # number keeps entries with equal deadlines in FIFO order and avoids
+        # comparing the callbacks.
+        self._heap: List[Tuple[float, int, Callable[[], Any]]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        # Whether to stop once there are no more callbacks to run.
+        self._draining = False
+
+    def __len__(self) -> int:
+        """Return the number of callbacks waiting for their deadline."""
+        return len(self._heap)
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> bool:
+        """Run a callback once the given delay has elapsed.
+
+        If the timer has been stopped, this method does nothing.
+
+        Args:
+            delay: The number of seconds to wait before running the callback.
+            callback: The callable to run, called without arguments.
+
+        Returns:
+            Whether the callback has been scheduled, i.e. the timer has not
+            been stopped.
+        """
+        deadline = time.monotonic() + delay
+        with self._condition:
+            if self._stopped:
+                return False
+
+            entry = (deadline, next(self._counter), callback)
+            heapq.heappush(self._heap, entry)
+
+            # Only wake up the timer thread if its next deadline changed.
+            if self._heap[0] is entry:
+                self._condition.notify()
+
+            if self._thread is None:
+                self._start_thread()
+        return True
+
+    def stop(self, drain: bool = False) -> None:
+        """Stop the timer thread and drop all callbacks that are not due yet.
+
+        Args:
+            drain: If ``True``, the callbacks are not dropped. The timer
+                thread stops once it has run all of them, including the ones
+                that are scheduled in the meantime.
+        """
+        with self._condition:
+            if drain and self._heap:
+                self._draining = True
+                return
+            self._stopped = True
+            self._heap.clear()
+            self._condition.notify()
+
+    def _start_thread(self) -> None:
+        """Start the timer thread.
+
+        The caller must hold the timer's condition lock.
+        """
+        # NOTE: If the thread is *not* a daemon, a memory leak exists due to a CPython issue.
+        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-829910303
+        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-830092418
+        self._thread = threading.Thread(name=self._name, target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Wait for the deadlines and run the callbacks that are due."""
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if not self._heap:
+                        if self._draining:
+                            self._stopped = True
+                            break
+                        self._condition.wait()
+                        continue
+
+                    timeout = self._heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+
+                if self._stopped:
+                    _LOGGER.debug("Exiting the deadline timer thread.")
+                    return
+
+                now = time.monotonic()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap)[2])
+
+            # Run the callbacks without holding the lock, so that they can
+            # schedule new callbacks.
+            for callback in due:
+                try:
+                    callback()
+                except Exception:
+                    _LOGGER.exception("Error in a deadline timer callback.")
@@ -36,6 +36,9 @@ class PublishMessageWrapper:
 
     def __init__(self, message: gapic_types.PubsubMessage):
         self._message: gapic_types.PubsubMessage = message
+        # The serialized size of the message, computed on first use. Any
+        # change to the message must reset it.
+        self._size: Optional[int] = None
         self._create_span: Optional[trace.Span] = None
         self._flow_control_span: Optional[trace.Span] = None
         self._batching_span: Optional[trace.Span] = None
@@ -47,6 +50,17 @@ class PublishMessageWrapper:
     @message.setter  # type: ignore[no-redef]  # resetting message value is intentional here
     def message(self, message: gapic_types.PubsubMessage):
         self._message = message
+        self._size = None
+
+    @property
+    def ordering_key(self) -> str:
+        return self._message.ordering_key
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            self._size = self._message._pb.ByteSize()
+        return self._size
 
     @property
     def create_span(self):
@@ -89,6 +103,8 @@ class PublishMessageWrapper:
                 carrier=self._message,
                 setter=OpenTelemetryContextSetter(),
             )
+            # The trace context is added to the message attributes.
+            self._size = None
 
     def end_create_span(self, exc: Optional[BaseException] = None) -> None:
         assert self._create_span is not None
@@ -0,0 +1,364 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import asyncio
+import logging
+import time
+import typing
+from typing import Any, Callable, List, Optional, Sequence
+
+import google.api_core.exceptions
+from google.api_core import gapic_v1
+from google.auth import exceptions as auth_exceptions
+
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._batch.thread import (
+    _SERVER_PUBLISH_MAX_BYTES,
+    _request_size_increase,
+)
+from google.pubsub_v1 import types as gapic_types
+from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
+    PublishMessageWrapper,
+)
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.pubsub_v1 import types
+    from google.cloud.pubsub_v1.publisher.async_client import (
+        AsyncClient as PublisherAsyncClient,
+    )
+    from google.pubsub_v1.services.publisher.client import OptionalRetry
+
+_LOGGER = logging.getLogger(__name__)
+_CAN_COMMIT = (base.BatchStatus.ACCEPTING_MESSAGES, base.BatchStatus.STARTING)
+
+
+class Batch(base.Batch):
+    """A batch of messages that is published on an asyncio event loop.
+
+    This is the :mod:`asyncio` counterpart of
+    :class:`~.pubsub_v1.publisher._batch.thread.Batch`. Instead of starting a
+    new thread for each commit, the publish RPC is awaited in a task scheduled
+    on the running event loop, and the returned futures are
+    :class:`asyncio.Future` instances bound to that loop.
+
+    All methods must be called from the event loop thread, which is why no
+    locking is needed around the batch state.
+
+    Args:
+        client:
+            The publisher client used to create this batch.
+        topic:
+            The topic. The format for this is ``projects/{project}/topics/{topic}``.
+        settings:
+            The settings for batch publishing. These should be considered immutable
+            once the batch has been opened.
+        batch_done_callback:
+            Callback called when the response for a batch publish has been received.
+            Called with one boolean argument: successfully published or a permanent
+            error occurred. Temporary errors are not surfaced because they are retried
+            at a lower level.
+        commit_when_full:
+            Whether to commit the batch when the batch is full.
+        commit_retry:
+            Designation of what errors, if any, should be retried when commiting
+            the batch. If not provided, a default retry is used.
+        commit_timeout:
+            The timeout to apply when commiting the batch. If not provided, a default
+            timeout is used.
+    """
+
+    def __init__(
+        self,
+        client: "PublisherAsyncClient",
+        topic: str,
+        settings: "types.BatchSettings",
+        batch_done_callback: Optional[Callable[[bool], Any]] = None,
+        commit_when_full: bool = True,
+        commit_retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        commit_timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+    ):
+        self._client = client
+        self._topic = topic
+        self._settings = settings
+        self._batch_done_callback = batch_done_callback
+        self._commit_when_full = commit_when_full
+
+        # _futures list should remain unchanged after batch
+        # status changed from ACCEPTING_MESSAGES to any other.
+        self._futures: List[asyncio.Future] = []
+        self._message_wrappers: List[PublishMessageWrapper] = []
+        self._status = base.BatchStatus.ACCEPTING_MESSAGES
+
+        # The initial size is not zero, we need to account for the size overhead
+        # of the PublishRequest message itself.
+        self._base_request_size = gapic_types.PublishRequest(topic=topic)._pb.ByteSize()
+        self._size = self._base_request_size
+
+        self._commit_retry = commit_retry
+        self._commit_timeout = commit_timeout
+
+    @staticmethod
+    def make_lock() -> asyncio.Lock:
+        """Return an asyncio lock.
+
+        Returns:
+            A newly created lock.
+        """
+        return asyncio.Lock()
+
+    @property
+    def client(self) -> "PublisherAsyncClient":
+        """A publisher client."""
+        return self._client
+
+    @property
+    def message_wrappers(self) -> Sequence[PublishMessageWrapper]:
+        """The message wrappers currently in the batch."""
+        return self._message_wrappers
+
+    @property
+    def futures(self) -> Sequence[asyncio.Future]:
+        """The futures of the messages currently in the batch."""
+        return self._futures
+
+    @property
+    def settings(self) -> "types.BatchSettings":
+        """Return the batch settings.
+
+        Returns:
+            The batch settings. These are considered immutable once the batch has
+            been opened.
+        """
+        return self._settings
+
+    @property
+    def size(self) -> int:
+        """Return the total size of all of the messages currently in the batch.
+
+        The size includes any overhead of the actual ``PublishRequest`` that is
+        sent to the backend.
+
+        Returns:
+            The total size of all of the messages currently in the batch (including
+            the request overhead), in bytes.
+        """
+        return self._size
+
+    @property
+    def status(self) -> base.BatchStatus:
+        """Return the status of this batch.
+
+        Returns:
+            The status of this batch. All statuses are human-readable, all-lowercase
+            strings.
+        """
+        return self._status
+
+    def cancel(self, cancellation_reason: base.BatchCancellationReason) -> None:
+        """Complete pending futures with an exception.
+
+        This method must be called before publishing starts (ie: while the
+        batch is still accepting messages.)
+
+        Args:
+            The reason why this batch has been cancelled.
+        """
+        assert (
+            self._status == base.BatchStatus.ACCEPTING_MESSAGES
+        ), "Cancel should not be called after sending has started."
+
+        exc = RuntimeError(cancellation_reason.value)
+        for future in self._futures:
+            future.set_exception(exc)
+        self._status = base.BatchStatus.ERROR
+
+    def commit(self) -> None:
+        """Actually publish all of the messages on the active batch.
+
+        .. note::
+
+            This method is non-blocking. It lets the client run :meth:`_commit`
+            in a task on the running event loop.
+
+        If the current batch is **not** accepting messages, this method
+        does nothing.
+        """
+        if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+            return
+
+        self._status = base.BatchStatus.STARTING
+        self._client._start_batch_commit(self._topic, self._commit)
+
+    async def _commit(self) -> None:
+        """Actually publish all of the messages on the active batch.
+
+        This awaits the publish RPC and resolves the futures of all messages
+        in the batch with either the message IDs or the error.
+        """
+        if self._status in _CAN_COMMIT:
+            self._status = base.BatchStatus.IN_PROGRESS
+        else:
+            _LOGGER.debug(
+                "Batch is already in progress or has been cancelled, exiting commit"
+            )
+            return
+
+        # Sanity check: If there are no messages, no-op.
+        if not self._message_wrappers:
+            _LOGGER.debug("No messages to publish, exiting commit")
+            self._status = base.BatchStatus.SUCCESS
+            return
+
+        start = time.time()
+
+        try:
+            # Performs retries for errors defined by the retry configuration.
+            response = await self._client._gapic_publish(
+                topic=self._topic,
+                messages=[wrapper.message for wrapper in self._message_wrappers],
+                retry=self._commit_retry,
+                timeout=self._commit_timeout,
+            )
+        except (
+            google.api_core.exceptions.GoogleAPIError,
+            auth_exceptions.TransportError,
+        ) as exc:
+            # We failed to publish, even after retries, so set the exception on
+            # all futures and exit.
+            self._fail(exc)
+            return
+        except asyncio.CancelledError:
+            # The RPC was abandoned, e.g. because the event loop is shutting
+            # down. Cancel the futures, so that their callers do not hang.
+            self._fail(None)
+            raise
+        except BaseException as exc:
+            _LOGGER.exception("Unexpected error while publishing a batch.")
+            self._fail(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        end = time.time()
+        _LOGGER.debug("gRPC Publish took %s seconds.", end - start)
+
+        if len(response.message_ids) == len(self._futures):
+            self._status = base.BatchStatus.SUCCESS
+            for message_id, future in zip(response.message_ids, self._futures):
+                if not future.done():
+                    future.set_result(message_id)
+            batch_transport_succeeded = True
+        else:
+            # Sanity check: If the number of message IDs is not equal to
+            # the number of futures I have, then something went wrong.
+            self._status = base.BatchStatus.ERROR
+            exception = exceptions.PublishError(
+                "Some messages were not successfully published."
+            )
+
+            for future in self._futures:
+                if not future.done():
+                    future.set_exception(exception)
+
+            batch_transport_succeeded = False
+
+            _LOGGER.error(
+                "Only %s of %s messages were published.",
+                len(response.message_ids),
+                len(self._futures),
+            )
+
+        if self._batch_done_callback is not None:
+            self._batch_done_callback(batch_transport_succeeded)
+
+    def _fail(self, exc: Optional[BaseException]) -> None:
+        """Fail the batch, and all of its futures that are not done yet.
+
+        Args:
+            exc: The error to set on the futures, or :data:`None` to cancel
+                them.
+        """
+        self._status = base.BatchStatus.ERROR
+
+        if self._batch_done_callback is not None:
+            self._batch_done_callback(False)
+
+        for future in self._futures:
+            if future.done():
+                continue
+            if exc is None:
+                future.cancel()
+            else:
+                future.set_exception(exc)
+
+    def publish(self, wrapper: PublishMessageWrapper) -> Optional[asyncio.Future]:
+        """Publish a single message.
+
+        Add the given message to this object; this will cause it to be
+        published once the batch either has enough messages or a sufficient
+        period of time has elapsed. If the batch is full or the commit is
+        already in progress, the method does not do anything.
+
+        This method is called by :meth:`~.AsyncClient.publish`.
+
+        Args:
+            wrapper: The Pub/Sub message wrapper.
+
+        Returns:
+            An :class:`asyncio.Future` resolving to the message ID, or
+            :data:`None`. If :data:`None` is returned, that signals that the batch
+            cannot accept a message.
+
+        Raises:
+            pubsub_v1.publisher.exceptions.MessageTooLargeError: If publishing
+                the ``message`` would exceed the max size limit on the backend.
+        """
+        assert (
+            self._status != base.BatchStatus.ERROR
+        ), "Publish after stop() or publish error."
+
+        if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+            return None
+
+        size_increase = _request_size_increase(wrapper.size)
+
+        if (self._base_request_size + size_increase) > _SERVER_PUBLISH_MAX_BYTES:
+            err_msg = (
+                "The message being published would produce too large a publish "
+                "request that would exceed the maximum allowed size on the "
+                "backend ({} bytes).".format(_SERVER_PUBLISH_MAX_BYTES)
+            )
+            raise exceptions.MessageTooLargeError(err_msg)
+
+        new_size = self._size + size_increase
+        new_count = len(self._message_wrappers) + 1
+
+        size_limit = min(self.settings.max_bytes, _SERVER_PUBLISH_MAX_BYTES)
+        overflow = new_size > size_limit or new_count >= self.settings.max_messages
+
+        future = None
+        if not self._message_wrappers or not overflow:
+            self._message_wrappers.append(wrapper)
+            self._size = new_size
+
+            future = asyncio.get_running_loop().create_future()
+            self._futures.append(future)
+
+        if self._commit_when_full and overflow:
+            self.commit()
+
+        return future
@@ -29,6 +29,7 @@ from google.auth import exceptions as auth_exceptions
 from google.cloud.pubsub_v1.publisher import exceptions
 from google.cloud.pubsub_v1.publisher import futures
 from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._serialized import SerializedMessageWrapper
 from google.pubsub_v1 import types as gapic_types
 from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
     PublishMessageWrapper,
@@ -47,6 +48,25 @@ _SERVER_PUBLISH_MAX_BYTES = 10 * 1000 * 1000  # max accepted size of PublishRequ
 _raw_proto_pubbsub_message = gapic_types.PubsubMessage.pb()
 
 
+def _request_size_increase(message_size: int) -> int:
+    """Return by how much a message grows the size of a ``PublishRequest``.
+
+    Each message is encoded as a length-delimited ``messages`` field, i.e. a
+    one byte tag, the varint-encoded length of the message, and the message
+    itself. This is equivalent to, but much cheaper than, serializing a
+    ``PublishRequest`` with just that message.
+
+    Args:
+        message_size: The serialized size of the message, in bytes.
+    """
+    length_size = 1
+    value = message_size >> 7
+    while value:
+        length_size += 1
+        value >>= 7
+    return 1 + length_size + message_size
+
+
 class Batch(base.Batch):
     """A batch of messages.
 
@@ -118,8 +138,11 @@ class Batch(base.Batch):
         # status changed from ACCEPTING_MESSAGES to any other
         # in order to avoid race conditions
         self._futures: List[futures.Future] = []
+        # All futures share the outcome of the batch, which is set once.
+        self._result = futures._BatchResult()
         self._message_wrappers: List[PublishMessageWrapper] = []
         self._status = base.BatchStatus.ACCEPTING_MESSAGES
+        self._created = time.monotonic()
 
         # The initial size is not zero, we need to account for the size overhead
         # of the PublishRequest message itself.
@@ -152,6 +175,11 @@ class Batch(base.Batch):
         """The message wrappers currently in the batch."""
         return self._message_wrappers
 
+    @property
+    def futures(self) -> Sequence["pubsub_v1.publisher.futures.Future"]:
+        """The futures of the messages currently in the batch."""
+        return self._futures
+
     @property
     def settings(self) -> "types.BatchSettings":
         """Return the batch settings.
@@ -201,8 +229,7 @@ class Batch(base.Batch):
             ), "Cancel should not be called after sending has started."
 
             exc = RuntimeError(cancellation_reason.value)
-            for future in self._futures:
-                future.set_exception(exc)
+            self._result.set_exception(exc)
             self._status = base.BatchStatus.ERROR
 
     def commit(self) -> None:
@@ -210,11 +237,12 @@ class Batch(base.Batch):
 
         .. note::
 
-            This method is non-blocking. It opens a new thread, which calls
-            :meth:`_commit`, which does block.
+            This method is non-blocking. It hands :meth:`_commit`, which does
+            block, over to the client to run on a separate thread.
 
-        This synchronously sets the batch status to "starting", and then opens
-        a new thread, which handles actually sending the messages to Pub/Sub.
+        This synchronously sets the batch status to "starting", and then lets
+        the client run the commit on a new thread or on its commit executor,
+        which handles actually sending the messages to Pub/Sub.
 
         If the current batch is **not** accepting messages, this method
         does nothing.
@@ -231,14 +259,20 @@ class Batch(base.Batch):
         self._start_commit_thread()
 
     def _start_commit_thread(self) -> None:
-        """Start a new thread to actually handle the commit."""
-        # NOTE: If the thread is *not* a daemon, a memory leak exists due to a CPython issue.
-        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-829910303
-        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-830092418
-        commit_thread = threading.Thread(
-            name="Thread-CommitBatchPublisher", target=self._commit, daemon=True
-        )
-        commit_thread.start()
+        """Hand the commit over to the client.
+
+        The client runs :meth:`_commit` on a new thread or on its commit
+        executor, possibly after other batches of the same topic complete.
+        The batches of ordering keys may instead be published together with
+        those of other ordering keys, if the client coalesces them.
+        """
+        if self._message_wrappers and self._message_wrappers[0].ordering_key:
+            coalescer = self._client._get_batch_coalescer(self._topic)
+            if coalescer is not None:
+                coalescer.add(self)
+                return
+
+        self._client._start_batch_commit(self._topic, self._commit)
 
     def _start_publish_rpc_span(self) -> None:
         tracer = trace.get_tracer(self._OPEN_TELEMETRY_TRACER_NAME)
@@ -284,46 +318,47 @@ class Batch(base.Batch):
             This method blocks. The :meth:`commit` method is the non-blocking
             version, which calls this one.
         """
-        with self._state_lock:
-            if self._status in _CAN_COMMIT:
-                self._status = base.BatchStatus.IN_PROGRESS
-            else:
-                # If, in the intervening period between when this method was
-                # called and now, the batch started to be committed, or
-                # completed a commit, then no-op at this point.
-                _LOGGER.debug(
-                    "Batch is already in progress or has been cancelled, "
-                    "exiting commit"
-                )
-                return
+        if not self._begin_commit():
+            return
 
-        # Once in the IN_PROGRESS state, no other thread can publish additional
-        # messages or initiate a commit (those operations become a no-op), thus
-        # it is safe to release the state lock here. Releasing the lock avoids
-        # blocking other threads in case api.publish() below takes a long time
-        # to complete.
-        # https://github.com/googleapis/google-cloud-python/issues/8036
+        self._publish(0, time.monotonic())
 
-        # Sanity check: If there are no messages, no-op.
-        if not self._message_wrappers:
-            _LOGGER.debug("No messages to publish, exiting commit")
-            self._status = base.BatchStatus.SUCCESS
-            return
+    def _publish(self, attempt: int, first_start: float) -> None:
+        """Send the publish RPC of the batch, and complete its commit.
+
+        With scheduled retries, a failed RPC is not retried here. Instead, the
+        commit of the batch is started again by the client's retry scheduler
+        once the backoff has elapsed.
+
+        Args:
+            attempt: The number of retries of the RPC so far.
+            first_start: The :func:`time.monotonic` time at which the first
+                attempt of the RPC started.
+        """
+        retry = self._commit_retry
+        retry_scheduler = self._client._retry_scheduler
+        scheduled_retry = None
+        if retry_scheduler is not None:
+            scheduled_retry = retry_scheduler.scheduled_retry(retry)
+            if scheduled_retry is not None:
+                retry = None
+        if retry is not None:
+            retry = self._client._report_failed_attempts(self._topic, retry)
 
         # Begin the request to publish these messages.
         # Log how long the underlying request takes.
-        start = time.time()
+        start = time.monotonic()
 
-        batch_transport_succeeded = True
         try:
-            if self._client.open_telemetry_enabled:
+            if self._client.open_telemetry_enabled and attempt == 0:
                 self._start_publish_rpc_span()
 
-            # Performs retries for errors defined by the retry configuration.
-            response = self._client._gapic_publish(
-                topic=self._topic,
-                messages=[wrapper.message for wrapper in self._message_wrappers],
-                retry=self._commit_retry,
+            # Performs retries for errors defined by the retry configuration,
+            # unless they are scheduled.
+            response = self._client._publish_message_wrappers(
+                self._topic,
+                self._message_wrappers,
+                retry=retry,
                 timeout=self._commit_timeout,
             )
 
@@ -347,43 +382,119 @@ class Batch(base.Batch):
             google.api_core.exceptions.GoogleAPIError,
             auth_exceptions.TransportError,
         ) as exc:
-            # We failed to publish, even after retries, so set the exception on
-            # all futures and exit.
-            self._status = base.BatchStatus.ERROR
+            self._client._record_publish_rpc(
+                self._topic, start, time.monotonic() - start, exc
+            )
+            if scheduled_retry is not None:
+                assert retry_scheduler is not None
+                error = retry_scheduler.retry_later(
+                    scheduled_retry,
+                    attempt,
+                    first_start,
+                    exc,
+                    lambda: self._client._start_batch_commit(
+                        self._topic, lambda: self._publish(attempt + 1, first_start)
+                    ),
+                )
+                if error is None:
+                    return
+                exc = error
+            self._fail_commit(exc)
+            return
 
-            if self._client.open_telemetry_enabled:
-                if self._rpc_span:
-                    self._rpc_span.record_exception(
-                        exception=exc,
-                    )
-                    self._rpc_span.set_status(
-                        trace.Status(status_code=trace.StatusCode.ERROR)
-                    )
-                    self._rpc_span.end()
+        end = time.monotonic()
+        _LOGGER.debug("gRPC Publish took %s seconds.", end - start)
+        self._client._record_publish_rpc(self._topic, start, end - start)
+        if retry_scheduler is not None:
+            retry_scheduler.record_success()
+        self._complete_commit(response.message_ids, start, end)
 
-                for wrapper in self._message_wrappers:
-                    wrapper.end_create_span(exc=exc)
+    def _begin_commit(self) -> bool:
+        """Move the batch to the in-progress state, before its publish RPC.
 
-            batch_transport_succeeded = False
-            if self._batch_done_callback is not None:
-                # Failed to publish batch.
-                self._batch_done_callback(batch_transport_succeeded)
+        Returns:
+            Whether the batch has messages that must be published now. If not,
+            the commit is over.
+        """
+        with self._state_lock:
+            if self._status in _CAN_COMMIT:
+                self._status = base.BatchStatus.IN_PROGRESS
+            else:
+                # If, in the intervening period between when this method was
+                # called and now, the batch started to be committed, or
+                # completed a commit, then no-op at this point.
+                _LOGGER.debug(
+                    "Batch is already in progress or has been cancelled, "
+                    "exiting commit"
+                )
+                return False
+
+        # Once in the IN_PROGRESS state, no other thread can publish additional
+        # messages or initiate a commit (those operations become a no-op), thus
+        # it is safe to release the state lock here. Releasing the lock avoids
+        # blocking other threads in case api.publish() below takes a long time
+        # to complete.
+        # https://github.com/googleapis/google-cloud-python/issues/8036
+
+        # Sanity check: If there are no messages, no-op.
+        if not self._message_wrappers:
+            _LOGGER.debug("No messages to publish, exiting commit")
+            self._status = base.BatchStatus.SUCCESS
+            return False
 
-            for future in self._futures:
-                future.set_exception(exc)
+        return True
 
-            return
+    def _fail_commit(self, exc: Exception) -> None:
+        """Complete the commit of the batch after its publish RPC failed."""
+        # We failed to publish, even after retries, so set the exception on
+        # all futures and exit.
+        self._status = base.BatchStatus.ERROR
 
-        end = time.time()
-        _LOGGER.debug("gRPC Publish took %s seconds.", end - start)
+        if self._client.open_telemetry_enabled:
+            if self._rpc_span:
+                self._rpc_span.record_exception(
+                    exception=exc,
+                )
+                self._rpc_span.set_status(
+                    trace.Status(status_code=trace.StatusCode.ERROR)
+                )
+                self._rpc_span.end()
 
-        if len(response.message_ids) == len(self._futures):
+            for wrapper in self._message_wrappers:
+                wrapper.end_create_span(exc=exc)
+
+        if self._batch_done_callback is not None:
+            # Failed to publish batch.
+            self._batch_done_callback(False)
+
+        self._result.set_exception(exc)
+
+    def _complete_commit(
+        self, message_ids: Sequence[str], start: float, end: float
+    ) -> None:
+        """Complete the commit of the batch after its publish RPC returned.
+
+        Args:
+            message_ids: The IDs of the batch's messages, in order.
+            start: The :func:`time.monotonic` time at which the RPC started.
+            end: The :func:`time.monotonic` time at which the RPC completed.
+        """
+        batch_transport_succeeded = True
+
+        if len(message_ids) == len(self._futures):
             # Iterate over the futures on the queue and return the response
             # IDs. We are trusting that there is a 1:1 mapping, and raise
             # an exception if not.
             self._status = base.BatchStatus.SUCCESS
-            for message_id, future in zip(response.message_ids, self._futures):
-                future.set_result(message_id)
+            self._result.set_result(message_ids)
+            self._client._record_batch_commit(
+                self._topic,
+                self._settings,
+                len(self._message_wrappers),
+                self._size,
+                start - self._created,
+                end - start,
+            )
         else:
             # Sanity check: If the number of message IDs is not equal to
             # the number of futures I have, then something went wrong.
@@ -392,15 +503,14 @@ class Batch(base.Batch):
                 "Some messages were not successfully published."
             )
 
-            for future in self._futures:
-                future.set_exception(exception)
+            self._result.set_exception(exception)
 
             # Unknown error -> batch failed to be correctly transported/
             batch_transport_succeeded = False
 
             _LOGGER.error(
                 "Only %s of %s messages were published.",
-                len(response.message_ids),
+                len(message_ids),
                 len(self._futures),
             )
 
@@ -433,8 +543,9 @@ class Batch(base.Batch):
                 the ``message`` would exceed the max size limit on the backend.
         """
 
-        # Coerce the type, just in case.
-        if not isinstance(
+        # Coerce the type, just in case. Serialized messages are left as they
+        # are, they are only deserialized if really needed.
+        if not isinstance(wrapper, SerializedMessageWrapper) and not isinstance(
             wrapper.message, gapic_types.PubsubMessage
         ):  # pragma: NO COVER
             # For performance reasons, the message should be constructed by directly
@@ -453,9 +564,7 @@ class Batch(base.Batch):
             if self.status != base.BatchStatus.ACCEPTING_MESSAGES:
                 return None
 
-            size_increase = gapic_types.PublishRequest(
-                messages=[wrapper.message]
-            )._pb.ByteSize()
+            size_increase = _request_size_increase(wrapper.size)
 
             if (self._base_request_size + size_increase) > _SERVER_PUBLISH_MAX_BYTES:
                 err_msg = (
@@ -478,7 +587,7 @@ class Batch(base.Batch):
 
                 # Track the future on this batch (so that the result of the
                 # future can be set).
-                future = futures.Future()
+                future = self._result.new_future()
                 self._futures.append(future)
 
         # Try to commit, but it must be **without** the lock held, since
@@ -0,0 +1,211 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+import typing
+from typing import List
+
+import google.api_core.exceptions
+from google.auth import exceptions as auth_exceptions
+
+from google.cloud.pubsub_v1.publisher._batch.thread import _SERVER_PUBLISH_MAX_BYTES
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.pubsub_v1.publisher import _batch
+    from google.cloud.pubsub_v1.publisher.client import Client as PublisherClient
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BatchCoalescer(object):
+    """Publishes the batches of different ordering keys in shared publish RPCs.
+
+    The ordered sequencers of a topic each commit their own batches, one at a
+    time. Instead of a publish RPC per batch, the batches committed while an
+    RPC of the coalescer is waiting to start are packed into that RPC, as long
+    as they share the same retry and timeout settings, and the request stays
+    within the client's batch settings.
+
+    Each batch is completed on its own once the RPC returns, thus each
+    ordering key keeps its order. If the RPC fails, all of its batches fail,
+    which pauses all of their ordering keys.
+
+    Public methods are thread-safe.
+
+    Args:
+        client: The publisher client.
+        topic: The topic that the batches are published to.
+    """
+
+    def __init__(self, client: "PublisherClient", topic: str):
+        self._client = client
+        self._topic = topic
+        self._pending: List["_batch.thread.Batch"] = []
+        # Whether a commit of the coalescer is waiting to start.
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    def add(self, batch: "_batch.thread.Batch") -> None:
+        """Publish a batch that is ready to be committed.
+
+        Args:
+            batch: The batch, whose commit has been started.
+        """
+        with self._lock:
+            self._pending.append(batch)
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        self._client._start_batch_commit(self._topic, self._commit)
+
+    def _take_batches(self) -> List["_batch.thread.Batch"]:
+        """Take the pending batches that fit into a single publish RPC.
+
+        The caller must hold ``_lock``.
+        """
+        first = self._pending[0]
+        settings = self._client._batch_settings_for(self._topic)
+        max_bytes = min(settings.max_bytes, _SERVER_PUBLISH_MAX_BYTES)
+
+        batches = [first]
+        remaining = []
+        message_count = len(first.message_wrappers)
+        size = first.size
+        for batch in self._pending[1:]:
+            # All batches of a topic have the same request overhead.
+            new_size = size + batch.size - batch._base_request_size
+            new_count = message_count + len(batch.message_wrappers)
+            if (
+                batch._commit_retry is first._commit_retry
+                and batch._commit_timeout == first._commit_timeout
+                and new_size <= max_bytes
+                and new_count <= settings.max_messages
+            ):
+                batches.append(batch)
+                message_count = new_count
+                size = new_size
+            else:
+                remaining.append(batch)
+
+        self._pending = remaining
+        return batches
+
+    def _commit(self) -> None:
+        """Publish the pending batches that fit into a single publish RPC.
+
+        .. note::
+
+            This method blocks. It is run by the client, on a new thread or
+            on its commit executor.
+        """
+        with self._lock:
+            batches = self._take_batches()
+            more = bool(self._pending)
+            self._scheduled = more
+
+        if more:
+            self._client._start_batch_commit(self._topic, self._commit)
+
+        batches = [batch for batch in batches if batch._begin_commit()]
+        if not batches:
+            return
+
+        self._publish(batches, 0, time.monotonic())
+
+    def _publish(
+        self, batches: List["_batch.thread.Batch"], attempt: int, first_start: float
+    ) -> None:
+        """Send the publish RPC of the batches, and complete their commits.
+
+        With scheduled retries, a failed RPC is retried by the client's retry
+        scheduler, like the RPCs of single batches.
+
+        Args:
+            batches: The batches, whose commits have begun.
+            attempt: The number of retries of the RPC so far.
+            first_start: The :func:`time.monotonic` time at which the first
+                attempt of the RPC started.
+        """
+        first = batches[0]
+        retry = first._commit_retry
+        retry_scheduler = self._client._retry_scheduler
+        scheduled_retry = None
+        if retry_scheduler is not None:
+            scheduled_retry = retry_scheduler.scheduled_retry(retry)
+            if scheduled_retry is not None:
+                retry = None
+
+        # Begin the request to publish the messages of all batches.
+        start = time.monotonic()
+
+        try:
+            # Performs retries for errors defined by the retry configuration,
+            # unless they are scheduled.
+            response = self._client._publish_message_wrappers(
+                self._topic,
+                [wrapper for batch in batches for wrapper in batch.message_wrappers],
+                retry=retry,
+                timeout=first._commit_timeout,
+            )
+        except (
+            google.api_core.exceptions.GoogleAPIError,
+            auth_exceptions.TransportError,
+        ) as exc:
+            self._client._record_publish_rpc(
+                self._topic, start, time.monotonic() - start, exc
+            )
+            if scheduled_retry is not None:
+                assert retry_scheduler is not None
+                error = retry_scheduler.retry_later(
+                    scheduled_retry,
+                    attempt,
+                    first_start,
+                    exc,
+                    lambda: self._client._start_batch_commit(
+                        self._topic,
+                        lambda: self._publish(batches, attempt + 1, first_start),
+                    ),
+                )
+                if error is None:
+                    return
+                exc = error
+            for batch in batches:
+                batch._fail_commit(exc)
+            return
+
+        end = time.monotonic()
+        _LOGGER.debug(
+            "gRPC Publish of %s batches took %s seconds.", len(batches), end - start
+        )
+        self._client._record_publish_rpc(self._topic, start, end - start)
+        if retry_scheduler is not None:
+            retry_scheduler.record_success()
+
+        message_ids = list(response.message_ids)
+        if len(message_ids) != sum(len(batch.message_wrappers) for batch in batches):
+            # The message IDs cannot be matched with the batches, so all of
+            # them fail as if some of their messages were not published.
+            message_ids = []
+
+        offset = 0
+        for batch in batches:
+            count = len(batch.message_wrappers)
+            batch._complete_commit(message_ids[offset : offset + count], start, end)
+            offset += count
@@ -0,0 +1,184 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import math
+import threading
+import time
+from typing import List, Optional
+
+from google.cloud.pubsub_v1 import types
+
+
+# Batches are sized for this many times the messages expected to arrive
+# within the max latency, so that traffic bursts do not make every batch
+# full before its deadline.
+_BURST_HEADROOM = 2.0
+
+# Batches whose average fill ratio is above this are considered full.
+_FULL_RATIO = 0.9
+
+# The most a setting may change by, as a factor, in a single adjustment.
+_MAX_STEP = 2.0
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Return the given percentile of a non-empty list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(math.ceil(percent * len(ordered))) - 1)]
+
+
+def _limit_step(value: float, current: float) -> float:
+    """Limit how much a setting changes in a single adjustment."""
+    return min(max(value, current / _MAX_STEP), current * _MAX_STEP)
+
+
+class BatchSettingsTuner(object):
+    """Tunes the batch settings of a publisher client to the observed traffic.
+
+    The client reports each successfully committed batch. Once per adjust
+    interval, the tuner derives new batch settings from the batches committed
+    during the interval:
+
+    * If the 99th percentile of the publish latency, i.e. the time spent in
+      the batch plus the publish RPC, exceeds the target, all settings are
+      halved.
+    * Otherwise, the max latency is set to what remains of the target latency
+      after the 99th percentile of the publish RPC latency, and the max number
+      of messages and bytes to what is expected to arrive within that latency
+      (with room for bursts), or twice as much if the batches were full.
+
+    The settings never change by more than a factor of two at once, and are
+    kept within the configured bounds.
+
+    Public methods are thread-safe.
+
+    Args:
+        bounds: The bounds of the batch settings, and the target latency.
+        settings: The initial batch settings.
+    """
+
+    def __init__(
+        self, bounds: types.AdaptiveBatchSettings, settings: types.BatchSettings
+    ):
+        self._bounds = bounds
+        self._settings = self._clamp(
+            settings.max_bytes, settings.max_latency, settings.max_messages
+        )
+        self._lock = threading.Lock()
+        self._reset_window(time.monotonic())
+
+    @property
+    def settings(self) -> types.BatchSettings:
+        """The current batch settings."""
+        return self._settings
+
+    def record(
+        self,
+        settings: types.BatchSettings,
+        message_count: int,
+        byte_count: int,
+        age: float,
+        rpc_latency: float,
+    ) -> Optional[types.BatchSettings]:
+        """Record a successfully committed batch.
+
+        Args:
+            settings: The settings that the batch was created with.
+            message_count: The number of messages in the batch.
+            byte_count: The size of the batch's publish request.
+            age: The number of seconds from the creation of the batch to the
+                start of the publish RPC.
+            rpc_latency: The number of seconds the publish RPC took.
+
+        Returns:
+            The new batch settings if they have just been adjusted, or
+            :data:`None` otherwise.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._latencies.append(age + rpc_latency)
+            self._rpc_latencies.append(rpc_latency)
+            self._message_count += message_count
+            self._byte_count += byte_count
+            self._fill_ratio_sum += max(
+                message_count / settings.max_messages, byte_count / settings.max_bytes
+            )
+
+            elapsed = now - self._window_start
+            if elapsed < self._bounds.adjust_interval:
+                return None
+
+            new_settings = self._adjust(elapsed)
+            self._reset_window(now)
+
+            if new_settings == self._settings:
+                return None
+            self._settings = new_settings
+            return new_settings
+
+    def _reset_window(self, now: float) -> None:
+        """Start a new observation window.
+
+        The caller must hold ``_lock``, unless called from the initializer.
+        """
+        self._window_start = now
+        self._latencies: List[float] = []
+        self._rpc_latencies: List[float] = []
+        self._message_count = 0
+        self._byte_count = 0
+        self._fill_ratio_sum = 0.0
+
+    def _adjust(self, elapsed: float) -> types.BatchSettings:
+        """Compute the batch settings for the traffic of the current window.
+
+        The caller must hold ``_lock``.
+        """
+        current = self._settings
+        target_latency = self._bounds.target_latency
+
+        if _percentile(self._latencies, 0.99) > target_latency:
+            return self._clamp(
+                current.max_bytes / _MAX_STEP,
+                current.max_latency / _MAX_STEP,
+                current.max_messages / _MAX_STEP,
+            )
+
+        rpc_latency = _percentile(self._rpc_latencies, 0.99)
+        max_latency = _limit_step(target_latency - rpc_latency, current.max_latency)
+
+        arrival_rate = self._message_count / elapsed
+        max_messages = arrival_rate * max_latency * _BURST_HEADROOM
+        if self._fill_ratio_sum / len(self._latencies) > _FULL_RATIO:
+            max_messages = max(max_messages, current.max_messages * _MAX_STEP)
+        max_messages = _limit_step(max_messages, current.max_messages)
+
+        average_size = self._byte_count / self._message_count
+        max_bytes = _limit_step(average_size * max_messages, current.max_bytes)
+
+        return self._clamp(max_bytes, max_latency, max_messages)
+
+    def _clamp(
+        self, max_bytes: float, max_latency: float, max_messages: float
+    ) -> types.BatchSettings:
+        """Return batch settings with the given values kept within the bounds."""
+        bounds = self._bounds
+        return types.BatchSettings(
+            max_bytes=int(min(max(max_bytes, bounds.min_bytes), bounds.max_bytes)),
+            max_latency=min(max(max_latency, bounds.min_latency), bounds.max_latency),
+            max_messages=int(
+                min(max(max_messages, bounds.min_messages), bounds.max_messages)
+            ),
+        )
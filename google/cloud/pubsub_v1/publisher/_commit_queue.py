@@ -0,0 +1,216 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Deque, List, Optional
+
+from google.api_core import exceptions
+
+from google.cloud.pubsub_v1 import types
+
+
+CommitType = Callable[[], Any]
+
+# Errors that indicate that the service, or the path to it, is overloaded.
+# ``RetryError`` is raised when the retries of the publish RPC ran out of time.
+_OVERLOAD_ERRORS = (
+    exceptions.ResourceExhausted,
+    exceptions.DeadlineExceeded,
+    exceptions.RetryError,
+)
+
+# The factor by which the adaptive limit is decreased on overload.
+_DECREASE_FACTOR = 0.5
+
+# The weight of the latest publish latency in the usual publish latency.
+_LATENCY_WEIGHT = 0.1
+
+
+class CommitQueue(object):
+    """Limits the number of batch commits of a single topic that are in flight.
+
+    Commits that would exceed the limit are queued and handed out again, in
+    FIFO order, as the outstanding ones complete. The queue does not run the
+    commits itself, this is left to the client and its commit executor.
+
+    Public methods are thread-safe.
+
+    Args:
+        max_outstanding:
+            The maximum number of commits that may be in flight at the same
+            time. Zero means no limit.
+    """
+
+    def __init__(self, max_outstanding: int = 0):
+        self._limit = max_outstanding
+        self._outstanding = 0
+        self._pending: Deque[CommitType] = collections.deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The number of commits that may be in flight, or zero if unlimited."""
+        return self._limit
+
+    @property
+    def outstanding(self) -> int:
+        """The number of commits currently in flight."""
+        return self._outstanding
+
+    @property
+    def pending(self) -> int:
+        """The number of commits waiting for an in-flight commit to complete."""
+        return len(self._pending)
+
+    def put(self, commit: CommitType) -> bool:
+        """Add a commit to the queue.
+
+        Args:
+            commit: The callable that performs the commit.
+
+        Returns:
+            ``True`` if the commit may be started right away, in which case it
+            counts as in flight, or ``False`` if it has been queued.
+        """
+        with self._lock:
+            if not self._pending and self._below_limit(self._outstanding):
+                self._outstanding += 1
+                return True
+
+            self._pending.append(commit)
+            return False
+
+    def task_done(self) -> Optional[CommitType]:
+        """Mark an in-flight commit as completed.
+
+        Returns:
+            The next queued commit, which the caller must now start (it already
+            counts as in flight), or ``None`` if there is none.
+        """
+        with self._lock:
+            # The next commit takes over the completed commit's slot, unless
+            # the limit has been lowered in the meantime.
+            if self._pending and self._below_limit(self._outstanding - 1):
+                return self._pending.popleft()
+
+            self._outstanding -= 1
+            return None
+
+    def start_pending(self) -> List[CommitType]:
+        """Hand out the queued commits that fit under a raised limit.
+
+        Returns:
+            The commits that the caller must now start (they already count as
+            in flight).
+        """
+        with self._lock:
+            commits = []
+            while self._pending and self._below_limit(self._outstanding):
+                self._outstanding += 1
+                commits.append(self._pending.popleft())
+            return commits
+
+    def _below_limit(self, outstanding: int) -> bool:
+        """Whether one more commit may be in flight.
+
+        The caller must hold ``_lock``.
+        """
+        return self._limit <= 0 or outstanding < self._limit
+
+
+class AdaptiveCommitQueue(CommitQueue):
+    """A commit queue whose limit adapts to the health of the publish RPCs.
+
+    The limit follows an additive-increase/multiplicative-decrease scheme. It
+    grows by one for every ``limit`` publish RPCs that succeed without being
+    slow, as long as the limit is actually reached, and is halved when a
+    publish RPC fails because of overload or is more than
+    ``latency_tolerance`` times slower than usual. RPCs that were started
+    before the last decrease do not decrease the limit again, so that a
+    single slowdown only halves the limit once.
+
+    Args:
+        settings: The bounds of the limit.
+    """
+
+    def __init__(self, settings: types.AdaptiveConcurrencySettings):
+        super().__init__(
+            min(
+                max(
+                    settings.initial_outstanding_batches,
+                    settings.min_outstanding_batches,
+                ),
+                settings.max_outstanding_batches,
+            )
+        )
+        self._settings = settings
+        self._usual_latency: Optional[float] = None
+        self._healthy_rpcs = 0
+        self._last_decrease = float("-inf")
+
+    def record(
+        self, start: float, rpc_latency: float, error: Optional[Exception] = None
+    ) -> None:
+        """Adjust the limit to the outcome of a publish RPC.
+
+        Must be called before :meth:`task_done` for the RPC's commit.
+
+        Args:
+            start: The :func:`time.monotonic` time at which the RPC started.
+            rpc_latency: The number of seconds the RPC took.
+            error: The error that the RPC failed with, if any.
+        """
+        with self._lock:
+            if error is not None:
+                if isinstance(error, _OVERLOAD_ERRORS):
+                    self._decrease(start)
+                return
+
+            usual_latency = self._usual_latency
+            if usual_latency is None:
+                self._usual_latency = rpc_latency
+            else:
+                self._usual_latency += _LATENCY_WEIGHT * (rpc_latency - usual_latency)
+                if rpc_latency > usual_latency * self._settings.latency_tolerance:
+                    self._decrease(start)
+                    return
+
+            # Only grow a limit that is in use, so that it does not creep up
+            # to the maximum while traffic is low.
+            if self._pending or self._outstanding >= self._limit:
+                self._healthy_rpcs += 1
+                if self._healthy_rpcs >= self._limit:
+                    self._healthy_rpcs = 0
+                    self._limit = min(
+                        self._limit + 1, self._settings.max_outstanding_batches
+                    )
+
+    def _decrease(self, start: float) -> None:
+        """Decrease the limit because of an RPC started at the given time.
+
+        The caller must hold ``_lock``.
+        """
+        if start < self._last_decrease:
+            return
+
+        self._last_decrease = time.monotonic()
+        self._healthy_rpcs = 0
+        self._limit = max(
+            int(self._limit * _DECREASE_FACTOR),
+            self._settings.min_outstanding_batches,
+        )
@@ -0,0 +1,159 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from google.api_core import exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1._timer import DeadlineTimer
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryScheduler(object):
+    """Schedules the retries of failed publish RPCs on a timer.
+
+    Instead of sleeping through the backoff between the attempts of a publish
+    RPC, the thread that sent it hands the retry over to the scheduler and
+    moves on. The scheduler waits for the backoff on a single timer thread,
+    and then calls back, so that the RPC can be sent again.
+
+    The backoff follows the retry of the RPC, with full jitter: the delay
+    before the ``n``-th retry is picked uniformly from zero to
+    ``min(initial * multiplier ** n, maximum)`` seconds. Failed RPCs spend
+    tokens from a budget that is shared by all RPCs of the client, if their
+    error is retried, and RPCs are only retried while more than half of the
+    tokens are left.
+
+    Public methods are thread-safe.
+
+    Args:
+        settings: The size of the retry budget.
+        default_retry: The retry to use for RPCs with the default retry.
+    """
+
+    def __init__(
+        self, settings: types.ScheduledRetrySettings, default_retry: Any = None
+    ):
+        self._settings = settings
+        self._default_retry = default_retry
+        self._tokens = settings.max_tokens
+        self._lock = threading.Lock()
+        self._timer = DeadlineTimer(name="Thread-PubSubPublishRetry")
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens left in the retry budget."""
+        return self._tokens
+
+    def scheduled_retry(self, retry: Any) -> Optional[retries.Retry]:
+        """Return the retry whose backoff the scheduler waits for.
+
+        Args:
+            retry: The retry of a publish RPC.
+
+        Returns:
+            The retry, if the scheduler retries the RPC. The RPC must then be
+            sent without a retry. ``None`` if the RPC must be sent with the
+            given retry as usual, e.g. if it is not retried at all.
+        """
+        if retry is gapic_v1.method.DEFAULT:
+            retry = self._default_retry
+        if isinstance(retry, retries.Retry):
+            return retry
+        return None
+
+    def record_success(self) -> None:
+        """Return tokens to the retry budget after a successful RPC."""
+        with self._lock:
+            self._tokens = min(
+                self._tokens + self._settings.token_ratio, self._settings.max_tokens
+            )
+
+    def retry_later(
+        self,
+        retry: retries.Retry,
+        attempt: int,
+        first_start: float,
+        error: Exception,
+        callback: Callable[[], Any],
+    ) -> Optional[Exception]:
+        """Schedule the retry of a failed RPC, if it may be retried.
+
+        Args:
+            retry: The retry of the RPC, as returned by
+                :meth:`scheduled_retry`.
+            attempt: The number of retries of the RPC so far.
+            first_start: The :func:`time.monotonic` time at which the first
+                attempt of the RPC started.
+            error: The error that the RPC failed with.
+            callback: Called without arguments on the timer thread once the
+                backoff has elapsed. It must send the RPC again, without
+                blocking.
+
+        Returns:
+            ``None`` if the retry has been scheduled, or the error that the RPC
+            must fail with otherwise.
+        """
+        if not retry._predicate(error):
+            return error
+
+        with self._lock:
+            self._tokens = max(self._tokens - 1, 0.0)
+            within_budget = self._tokens > self._settings.max_tokens / 2
+
+        if retry._on_error is not None:
+            retry._on_error(error)
+
+        if not within_budget:
+            _LOGGER.debug("The publish retry budget is spent, not retrying.")
+            return error
+
+        try:
+            backoff = min(retry._initial * retry._multiplier**attempt, retry._maximum)
+        except OverflowError:
+            backoff = retry._maximum
+        delay = random.uniform(0.0, backoff)
+        if retry._deadline is not None:
+            remaining = first_start + retry._deadline - time.monotonic()
+            if remaining <= 0:
+                return exceptions.RetryError(
+                    "Timeout of {:.1f}s exceeded".format(retry._deadline), error
+                )
+            delay = min(delay, remaining)
+
+        if not self._timer.schedule(delay, callback):
+            _LOGGER.debug("The retry scheduler is stopped, not retrying.")
+            return error
+        _LOGGER.debug("Retrying the publish RPC in %s seconds.", delay)
+        return None
+
+    def stop(self) -> None:
+        """Stop the timer thread once the retries scheduled so far have been
+        sent.
+
+        Retries that the scheduled ones schedule in turn are still sent. The
+        RPCs that fail after the timer thread has stopped are not retried.
+        """
+        self._timer.stop(drain=True)
@@ -16,7 +16,7 @@ import enum
 import collections
 import threading
 import typing
-from typing import Deque, Iterable, Sequence
+from typing import Deque, Iterable, Sequence, Set
 
 from google.api_core import gapic_v1
 from google.cloud.pubsub_v1.publisher import futures
@@ -107,6 +107,9 @@ class OrderedSequencer(sequencer_base.Sequencer):
         self._ordered_batches: Deque["_batch.thread.Batch"] = collections.deque()
         # See _OrderedSequencerStatus for valid state transitions.
         self._state = _OrderedSequencerStatus.ACCEPTING_MESSAGES
+        # Batches whose max_latency expired while they were waiting behind the
+        # head batch. They are committed as soon as they reach the head.
+        self._overdue_batches: Set["_batch.thread.Batch"] = set()
 
     def is_finished(self) -> bool:
         """Whether the sequencer is finished and should be cleaned up.
@@ -143,6 +146,7 @@ class OrderedSequencer(sequencer_base.Sequencer):
                     # deque.
                     batch = self._ordered_batches.pop()
                     batch.cancel(batch_base.BatchCancellationReason.CLIENT_STOPPED)
+                self._overdue_batches.clear()
 
     def commit(self) -> None:
         """Commit the first batch, if unpaused.
@@ -162,6 +166,47 @@ class OrderedSequencer(sequencer_base.Sequencer):
                 # operation is idempotent.
                 self._ordered_batches[0].commit()
 
+    def commit_batch(self, batch: "_batch.thread.Batch") -> None:
+        """Commit the given batch once its ``max_latency`` has expired.
+
+        Only the first batch can be committed to preserve the message order.
+        If the batch is still waiting behind the first batch, it is instead
+        committed right after it reaches the head. If paused or stopped, this
+        method does nothing.
+
+        Args:
+            batch: The batch whose deadline has expired.
+        """
+        with self._state_lock:
+            if self._state in (
+                _OrderedSequencerStatus.PAUSED,
+                _OrderedSequencerStatus.STOPPED,
+            ):
+                return
+
+            if self._ordered_batches and self._ordered_batches[0] is batch:
+                batch.commit()
+            elif batch in self._ordered_batches:
+                self._overdue_batches.add(batch)
+
+    def flush(self) -> None:
+        """Commit all batches as soon as possible.
+
+        Commits the first batch, and every other batch as soon as it reaches
+        the head, without waiting for their ``max_latency``. If paused or
+        stopped, this method does nothing.
+        """
+        with self._state_lock:
+            if self._state in (
+                _OrderedSequencerStatus.PAUSED,
+                _OrderedSequencerStatus.STOPPED,
+            ):
+                return
+
+            if self._ordered_batches:
+                self._overdue_batches.update(self._ordered_batches)
+                self._ordered_batches[0].commit()
+
     def _batch_done_callback(self, success: bool) -> None:
         """Deal with completion of a batch.
 
@@ -169,7 +214,7 @@ class OrderedSequencer(sequencer_base.Sequencer):
         or a failure. (Temporary failures are retried infinitely when
         ordering keys are enabled.)
         """
-        ensure_cleanup_and_commit_timer_runs = False
+        finished = False
         with self._state_lock:
             assert self._state != _OrderedSequencerStatus.PAUSED, (
                 "This method should not be called after pause() because "
@@ -182,7 +227,7 @@ class OrderedSequencer(sequencer_base.Sequencer):
 
             # Message futures for the batch have been completed (either with a
             # result or an exception) already, so remove the batch.
-            self._ordered_batches.popleft()
+            self._overdue_batches.discard(self._ordered_batches.popleft())
 
             if success:
                 if len(self._ordered_batches) == 0:
@@ -192,13 +237,13 @@ class OrderedSequencer(sequencer_base.Sequencer):
                     # into accepting-messages state. Otherwise, the client
                     # must create a new OrderedSequencer.
                     self._state = _OrderedSequencerStatus.FINISHED
-                    # Ensure cleanup thread runs at some point.
-                    ensure_cleanup_and_commit_timer_runs = True
+                    # Let the client clean up this sequencer at some point.
+                    finished = True
                 elif len(self._ordered_batches) == 1:
-                    # Wait for messages and/or commit timeout
-                    # Ensure there's actually a commit timer thread that'll commit
-                    # after a delay.
-                    ensure_cleanup_and_commit_timer_runs = True
+                    # Wait for messages and/or commit timeout, unless the
+                    # batch's max_latency has already expired.
+                    if self._ordered_batches[0] in self._overdue_batches:
+                        self._ordered_batches[0].commit()
                 else:
                     # If there is more than one batch, we know that the next batch
                     # must be full and, therefore, ready to be committed.
@@ -207,8 +252,8 @@ class OrderedSequencer(sequencer_base.Sequencer):
                 # Unrecoverable error detected
                 self._pause()
 
-        if ensure_cleanup_and_commit_timer_runs:
-            self._client.ensure_cleanup_and_commit_timer_runs()
+        if finished:
+            self._client._sequencer_finished(self._topic, self._ordering_key)
 
     def _pause(self) -> None:
         """Pause this sequencer: set state to paused, cancel all batches, and
@@ -225,6 +270,7 @@ class OrderedSequencer(sequencer_base.Sequencer):
                 batch_base.BatchCancellationReason.PRIOR_ORDERED_MESSAGE_FAILED
             )
         self._ordered_batches.clear()
+        self._overdue_batches.clear()
 
     def unpause(self) -> None:
         """Unpause this sequencer.
@@ -255,7 +301,7 @@ class OrderedSequencer(sequencer_base.Sequencer):
         return self._client._batch_class(
             client=self._client,
             topic=self._topic,
-            settings=self._client.batch_settings,
+            settings=self._client._batch_settings_for(self._topic),
             batch_done_callback=self._batch_done_callback,
             commit_when_full=False,
             commit_retry=commit_retry,
@@ -317,12 +363,14 @@ class OrderedSequencer(sequencer_base.Sequencer):
                     commit_retry=retry, commit_timeout=timeout
                 )
                 self._ordered_batches.append(new_batch)
+                self._client._schedule_batch_commit(self, new_batch)
 
             batch = self._ordered_batches[-1]
             future = batch.publish(wrapper)
             while future is None:
                 batch = self._create_batch(commit_retry=retry, commit_timeout=timeout)
                 self._ordered_batches.append(batch)
+                self._client._schedule_batch_commit(self, batch)
                 future = batch.publish(wrapper)
 
             return future
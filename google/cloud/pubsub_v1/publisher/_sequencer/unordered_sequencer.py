@@ -87,6 +87,27 @@ class UnorderedSequencer(base.Sequencer):
             # batch.
             self._current_batch = None
 
+    def commit_batch(self, batch: "_batch.thread.Batch") -> None:
+        """Commit the given batch once its ``max_latency`` has expired.
+
+        If the batch is no longer the current batch, it has already been
+        committed because it got full, and this method does nothing.
+
+        Args:
+            batch: The batch whose deadline has expired.
+        """
+        if batch is self._current_batch:
+            self.commit()
+
+    def flush(self) -> None:
+        """Commit the current batch, if any, without waiting for its
+        ``max_latency``.
+
+        If stopped, this method does nothing.
+        """
+        if not self._stopped:
+            self.commit()
+
     def unpause(self) -> typing.NoReturn:
         """Not relevant for this class."""
         raise NotImplementedError
@@ -108,7 +129,7 @@ class UnorderedSequencer(base.Sequencer):
         return self._client._batch_class(
             client=self._client,
             topic=self._topic,
-            settings=self._client.batch_settings,
+            settings=self._client._batch_settings_for(self._topic),
             batch_done_callback=None,
             commit_when_full=True,
             commit_retry=commit_retry,
@@ -148,6 +169,7 @@ class UnorderedSequencer(base.Sequencer):
         if not self._current_batch:
             newbatch = self._create_batch(commit_retry=retry, commit_timeout=timeout)
             self._current_batch = newbatch
+            self._client._schedule_batch_commit(self, newbatch)
 
         batch = self._current_batch
         future = None
@@ -160,6 +182,7 @@ class UnorderedSequencer(base.Sequencer):
                 # At this point, we lose track of the old batch, but we don't
                 # care since it's already committed (because it was full.)
                 self._current_batch = batch
+                self._client._schedule_batch_commit(self, batch)
         return future
 
     # Used only for testing.
@@ -0,0 +1,205 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from typing import Iterable, List, Mapping, Sequence, Tuple, Union
+
+from google.pubsub_v1 import types as gapic_types
+from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
+    PublishMessageWrapper,
+)
+
+
+# The tags of the length-delimited fields that are serialized here, i.e. the
+# field number shifted left by three bits, and the wire type 2.
+_MESSAGE_DATA_TAG = b"\x0a"  # PubsubMessage.data = 1
+_REQUEST_TOPIC_TAG = b"\x0a"  # PublishRequest.topic = 1
+_REQUEST_MESSAGES_TAG = b"\x12"  # PublishRequest.messages = 2
+
+_MESSAGE_ORDERING_KEY_FIELD = 5  # PubsubMessage.ordering_key = 5
+
+# The number of bytes of the fixed-size wire types, 64-bit and 32-bit.
+_FIXED_WIRE_TYPE_SIZES = {1: 8, 5: 4}
+
+_raw_proto_pubbsub_message = gapic_types.PubsubMessage.pb()
+
+BufferType = Union[bytes, bytearray, memoryview]
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(buffer: memoryview, pos: int) -> Tuple[int, int]:
+    """Decode the protobuf varint at the given position of a buffer.
+
+    Returns:
+        The value of the varint, and the position right after it.
+
+    Raises:
+        ValueError: If the buffer ends within the varint.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(buffer):
+            raise ValueError("The serialized message is truncated.")
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def as_byte_view(buffer: BufferType) -> memoryview:
+    """Return a flat view of the bytes of a buffer, without copying them.
+
+    Raises:
+        TypeError: If the buffer is not contiguous.
+    """
+    try:
+        return memoryview(buffer).cast("B")
+    except TypeError:
+        raise TypeError("Buffers being published to Pub/Sub must be contiguous.")
+
+
+def read_ordering_key(message: BufferType) -> str:
+    """Return the ordering key of a serialized message.
+
+    Only the tags of the top-level fields are scanned, the other fields are
+    skipped without being decoded.
+
+    Raises:
+        ValueError: If the message is not a valid serialized message.
+    """
+    buffer = as_byte_view(message)
+    ordering_key = ""
+    pos = 0
+    while pos < len(buffer):
+        tag, pos = _decode_varint(buffer, pos)
+        field_number, wire_type = tag >> 3, tag & 0x7
+        if wire_type == 0:
+            _, pos = _decode_varint(buffer, pos)
+        elif wire_type == 2:
+            length, pos = _decode_varint(buffer, pos)
+            if field_number == _MESSAGE_ORDERING_KEY_FIELD:
+                # As when parsing, the last occurrence of the field wins.
+                ordering_key = bytes(buffer[pos : pos + length]).decode("utf-8")
+            pos += length
+        elif wire_type in _FIXED_WIRE_TYPE_SIZES:
+            pos += _FIXED_WIRE_TYPE_SIZES[wire_type]
+        else:
+            raise ValueError(
+                "The serialized message has an unsupported wire type {}.".format(
+                    wire_type
+                )
+            )
+    if pos > len(buffer):
+        raise ValueError("The serialized message is truncated.")
+    return ordering_key
+
+
+class SerializedMessageWrapper(PublishMessageWrapper):
+    """A message to publish, that is kept in its serialized form.
+
+    The serialized message is a sequence of buffers, which are only joined
+    when the publish request is serialized. The buffers are not copied until
+    then, so that the message data is copied once, straight into the request.
+    The message is only deserialized if it is needed as a
+    :class:`~.pubsub_v1.types.PubsubMessage`, e.g. by a transport other than
+    gRPC.
+
+    Args:
+        parts: The buffers that make up the serialized message, in order.
+        ordering_key: The ordering key of the message.
+    """
+
+    def __init__(self, parts: Sequence[Union[bytes, memoryview]], ordering_key: str):
+        super().__init__(None)  # type: ignore[arg-type]
+        self._parts = parts
+        self._ordering_key = ordering_key
+        self._size = sum(len(part) for part in parts)
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = gapic_types.PubsubMessage.deserialize(b"".join(self._parts))
+        return self._message
+
+    @property
+    def ordering_key(self) -> str:
+        return self._ordering_key
+
+    @property
+    def parts(self) -> Sequence[Union[bytes, memoryview]]:
+        return self._parts
+
+
+def wrap_buffer_message(
+    data: BufferType, ordering_key: str, attrs: Mapping[str, str]
+) -> SerializedMessageWrapper:
+    """Serialize a message around its data, without copying the data.
+
+    Args:
+        data: The message data.
+        ordering_key: The ordering key of the message.
+        attrs: The message attributes, which must be text strings.
+    """
+    data = as_byte_view(data)
+    parts: List[Union[bytes, memoryview]] = []
+    if len(data):
+        parts.append(_MESSAGE_DATA_TAG + _encode_varint(len(data)))
+        parts.append(data)
+
+    # The other fields are serialized as usual. Fields may come in any order,
+    # so they can simply follow the data.
+    if ordering_key or attrs:
+        parts.append(
+            _raw_proto_pubbsub_message(
+                ordering_key=ordering_key, attributes=attrs
+            ).SerializeToString()
+        )
+    return SerializedMessageWrapper(parts, ordering_key)
+
+
+def serialize_publish_request(
+    topic: str, wrappers: Iterable[PublishMessageWrapper]
+) -> bytes:
+    """Serialize the publish request for the messages of the wrappers.
+
+    The parts of serialized messages are copied into the request as they are,
+    the other messages are serialized.
+    """
+    encoded_topic = topic.encode("utf-8")
+    parts: List[Union[bytes, memoryview]] = [
+        _REQUEST_TOPIC_TAG,
+        _encode_varint(len(encoded_topic)),
+        encoded_topic,
+    ]
+    for wrapper in wrappers:
+        parts.append(_REQUEST_MESSAGES_TAG)
+        parts.append(_encode_varint(wrapper.size))
+        if isinstance(wrapper, SerializedMessageWrapper):
+            parts.extend(wrapper.parts)
+        else:
+            parts.append(wrapper.message._pb.SerializeToString())
+    return b"".join(parts)
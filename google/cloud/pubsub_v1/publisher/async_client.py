@@ -0,0 +1,588 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import asyncio
+import logging
+import os
+import typing
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+import warnings
+import weakref
+
+from google.api_core import gapic_v1
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import aio
+from google.cloud.pubsub_v1.publisher._commit_queue import CommitQueue
+from google.cloud.pubsub_v1.publisher._sequencer import ordered_sequencer
+from google.cloud.pubsub_v1.publisher._sequencer import unordered_sequencer
+from google.cloud.pubsub_v1.publisher.flow_controller import AsyncFlowController
+from google.cloud.pubsub_v1.publisher.flow_controller import RateLimiter
+from google.pubsub_v1 import types as gapic_types
+from google.pubsub_v1.services.publisher import async_client as publisher_async_client
+from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
+    PublishMessageWrapper,
+)
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.pubsub_v1.services.publisher.async_client import OptionalRetry
+    from google.pubsub_v1.types import pubsub as pubsub_types
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+_raw_proto_pubbsub_message = gapic_types.PubsubMessage.pb()
+
+SequencerType = Union[
+    ordered_sequencer.OrderedSequencer, unordered_sequencer.UnorderedSequencer
+]
+
+
+class AsyncClient(publisher_async_client.PublisherAsyncClient):
+    """An asyncio publisher client for Google Cloud Pub/Sub.
+
+    This is the :mod:`asyncio` counterpart of
+    :class:`~google.cloud.pubsub_v1.publisher.client.Client`. Batching, flow
+    control and message ordering all happen on the running event loop, and the
+    publish RPCs are sent over the ``grpc_asyncio`` transport. No threads are
+    started by the client.
+
+    The client must be used from a single event loop, and :meth:`publish`
+    must be awaited from a coroutine running on that loop.
+
+    Args:
+        batch_settings:
+            The settings for batch publishing.
+        publisher_options:
+            The options for the publisher client. Note that enabling message ordering
+            will override the publish retry timeout to be infinite. If given, the
+            ``retry`` option must be an instance of
+            :class:`google.api_core.retry_async.AsyncRetry`. OpenTelemetry tracing
+            is not supported by this client.
+        kwargs:
+            Any additional arguments provided are sent as keyword arguments to the
+            underlying
+            :class:`~google.pubsub_v1.services.publisher.async_client.PublisherAsyncClient`.
+
+    Example:
+
+    .. code-block:: python
+
+        from google.cloud.pubsub_v1 import publisher
+
+        async def main():
+            publisher_client = publisher.AsyncClient()
+            topic = publisher_client.topic_path('[PROJECT]', '[TOPIC]')
+
+            future = await publisher_client.publish(topic, b'data')
+            message_id = await future
+    """
+
+    def __init__(
+        self,
+        batch_settings: Union[types.BatchSettings, Sequence] = (),
+        publisher_options: Union[types.PublisherOptions, Sequence] = (),
+        **kwargs: Any,
+    ):
+        assert (
+            type(batch_settings) is types.BatchSettings or len(batch_settings) == 0
+        ), "batch_settings must be of type BatchSettings or an empty sequence."
+        assert (
+            type(publisher_options) is types.PublisherOptions
+            or len(publisher_options) == 0
+        ), "publisher_options must be of type PublisherOptions or an empty sequence."
+
+        # Sanity check: Is our goal to use the emulator?
+        # If so, create a grpc insecure channel with the emulator host
+        # as the target.
+        if os.environ.get("PUBSUB_EMULATOR_HOST"):
+            kwargs["client_options"] = {
+                "api_endpoint": os.environ.get("PUBSUB_EMULATOR_HOST")
+            }
+            # Configure credentials directly to transport, if provided.
+            if "transport" not in kwargs:
+                kwargs["credentials"] = AnonymousCredentials()
+
+        self.publisher_options = types.PublisherOptions(*publisher_options)
+        self._enable_message_ordering = self.publisher_options[0]
+
+        if self.publisher_options.max_outstanding_batches < 0:
+            raise ValueError("max_outstanding_batches must not be negative.")
+
+        super().__init__(**kwargs)
+        self._target = self._client._transport._host
+        self._batch_class = aio.Batch
+        self.batch_settings = types.BatchSettings(*batch_settings)
+        # topic => the batch settings that the topic uses instead
+        self._topic_batch_settings: Dict[str, types.BatchSettings] = dict(
+            self.publisher_options.topic_batch_settings or {}
+        )
+
+        # All of the batching state is only ever touched from the event loop,
+        # thus there is no need for a lock around it.
+        # (topic, ordering_key) => sequencers object
+        self._sequencers: Dict[Tuple[str, str], SequencerType] = {}
+        # The keys of the sequencers that have finished since the last
+        # cleanup, so that the cleanup does not need to visit all of them.
+        self._finished_sequencer_keys: Set[Tuple[str, str]] = set()
+        # The batches that have been opened and not been garbage collected
+        # yet, so that flush() can wait for the ones that are not done.
+        self._open_batches: "weakref.WeakSet[aio.Batch]" = weakref.WeakSet()
+        self._is_stopped = False
+        # Each batch is committed by a loop timer once its max_latency has
+        # expired. This one is scheduled to clean up finished sequencers.
+        self._cleanup_timer: Optional[asyncio.TimerHandle] = None
+        # topic => commit queue
+        self._commit_queues: Dict[str, CommitQueue] = {}
+
+        # The object controlling the message publishing flow
+        self._flow_controller = AsyncFlowController(self.publisher_options.flow_control)
+        # The object limiting the publish rate, if any.
+        self._rate_limiter: Optional[RateLimiter] = None
+        if self.publisher_options.rate_limit is not None:
+            self._rate_limiter = RateLimiter(self.publisher_options.rate_limit)
+
+        if self.publisher_options.enable_open_telemetry_tracing:
+            warnings.warn(
+                message="Open Telemetry tracing is not supported by the asyncio "
+                "publisher client. Disabling Open Telemetry tracing.",
+                category=RuntimeWarning,
+            )
+
+    @property
+    def target(self) -> str:
+        """Return the target (where the API is).
+
+        Returns:
+            The location of the API.
+        """
+        return self._target
+
+    @property
+    def open_telemetry_enabled(self) -> bool:
+        return False
+
+    def _get_or_create_sequencer(self, topic: str, ordering_key: str) -> SequencerType:
+        """Get an existing sequencer or create a new one given the (topic,
+        ordering_key) pair.
+        """
+        sequencer_key = (topic, ordering_key)
+        sequencer = self._sequencers.get(sequencer_key)
+        if sequencer is None:
+            if ordering_key == "":
+                sequencer = unordered_sequencer.UnorderedSequencer(self, topic)
+            else:
+                sequencer = ordered_sequencer.OrderedSequencer(
+                    self, topic, ordering_key
+                )
+            self._sequencers[sequencer_key] = sequencer
+
+        return sequencer
+
+    def resume_publish(self, topic: str, ordering_key: str) -> None:
+        """Resume publish on an ordering key that has had unrecoverable errors.
+
+        Args:
+            topic: The topic to publish messages to.
+            ordering_key: A string that identifies related messages for which
+                publish order should be respected.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call.
+            ValueError:
+                If the topic/ordering key combination has not been seen before
+                by this client.
+        """
+        if self._is_stopped:
+            raise RuntimeError("Cannot resume publish on a stopped publisher.")
+
+        if not self._enable_message_ordering:
+            raise ValueError(
+                "Cannot resume publish on a topic/ordering key if ordering "
+                "is not enabled."
+            )
+
+        sequencer = self._sequencers.get((topic, ordering_key))
+        if sequencer is None:
+            _LOGGER.debug(
+                "Error: The topic/ordering key combination has not been seen before."
+            )
+        else:
+            sequencer.unpause()
+
+    async def _gapic_publish(self, *args, **kwargs) -> "pubsub_types.PublishResponse":
+        """Call the GAPIC public API directly."""
+        return await super().publish(*args, **kwargs)
+
+    async def publish(  # type: ignore[override]
+        self,
+        topic: str,
+        data: bytes,
+        ordering_key: str = "",
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+        **attrs: Union[bytes, str],
+    ) -> "asyncio.Future[str]":
+        """Publish a single message.
+
+        Add the given message to a batch; this will cause it to be published
+        once the batch either has enough messages or a sufficient period of
+        time has elapsed.
+
+        Awaiting this method returns as soon as the message has been added to
+        a batch. With ``LimitExceededBehavior.BLOCK`` it suspends the calling
+        task until there is enough capacity in the flow controller.
+
+        Example:
+            >>> from google.cloud.pubsub_v1 import publisher
+            >>> client = publisher.AsyncClient()
+            >>> topic = client.topic_path('[PROJECT]', '[TOPIC]')
+            >>> data = b'The rain in Wales falls mainly on the snails.'
+            >>> future = await client.publish(topic, data, username='guido')
+            >>> message_id = await future
+
+        Args:
+            topic: The topic to publish messages to.
+            data: A bytestring representing the message body. This
+                must be a bytestring.
+            ordering_key: A string that identifies related messages for which
+                publish order should be respected. Message ordering must be
+                enabled for this client to use this feature.
+            retry:
+                Designation of what errors, if any, should be retried. If `ordering_key`
+                is specified, the total retry deadline will be changed to "infinity".
+                If given, it overides any retry passed into the client through
+                the ``publisher_options`` argument.
+            timeout:
+                The timeout for the RPC request. Can be used to override any timeout
+                passed in through ``publisher_options`` when instantiating the client.
+
+            attrs: A dictionary of attributes to be
+                sent as metadata. (These may be text strings or byte strings.)
+
+        Returns:
+            An awaitable :class:`asyncio.Future` that resolves to the message ID.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call.
+
+            pubsub_v1.publisher.exceptions.MessageTooLargeError: If publishing
+                the ``message`` would exceed the max size limit on the backend.
+        """
+        # Sanity check: Is the data being sent as a bytestring?
+        # If it is literally anything else, complain loudly about it.
+        if not isinstance(data, bytes):
+            raise TypeError(
+                "Data being published to Pub/Sub must be sent as a bytestring."
+            )
+
+        if not self._enable_message_ordering and ordering_key != "":
+            raise ValueError(
+                "Cannot publish a message with an ordering key when message "
+                "ordering is not enabled."
+            )
+
+        # Coerce all attributes to text strings.
+        for k, v in list(attrs.items()):
+            if isinstance(v, str):
+                continue
+            if isinstance(v, bytes):
+                attrs[k] = v.decode("utf-8")
+                continue
+            raise TypeError(
+                "All attributes being published to Pub/Sub must "
+                "be sent as text strings."
+            )
+
+        vanilla_pb = _raw_proto_pubbsub_message(
+            data=data, ordering_key=ordering_key, attributes=attrs
+        )
+        message = gapic_types.PubsubMessage.wrap(vanilla_pb)
+        wrapper = PublishMessageWrapper(message)
+        # Computed once, and reused by flow control and the batch.
+        message_size = wrapper.size
+
+        loop = asyncio.get_running_loop()
+
+        # Messages should go through flow control to prevent excessive
+        # queuing on the client side (depending on the settings). The rate
+        # limit is waited for first, so that waiting for it does not hold any
+        # flow control capacity.
+        try:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async(topic, 1, message_size)
+            await self._flow_controller.add(message, size=message_size)
+        except exceptions.FlowControlLimitError as exc:
+            future = loop.create_future()
+            future.set_exception(exc)
+            return future
+
+        if retry is gapic_v1.method.DEFAULT:  # if custom retry not passed in
+            retry = self.publisher_options.retry
+
+        if timeout is gapic_v1.method.DEFAULT:  # if custom timeout not passed in
+            timeout = self.publisher_options.timeout
+
+        try:
+            if self._is_stopped:
+                raise RuntimeError("Cannot publish on a stopped publisher.")
+
+            # Set retry timeout to "infinite" when message ordering is enabled.
+            # Note that this then also impacts messages added with an empty
+            # ordering key.
+            if self._enable_message_ordering:
+                if retry is gapic_v1.method.DEFAULT:
+                    # use the default retry for the publish GRPC method as a base
+                    transport = self._client._transport
+                    base_retry = transport._wrapped_methods[transport.publish]._retry
+                    retry = base_retry.with_deadline(2.0**32)
+                    timeout = 2.0**32
+                elif retry is not None:
+                    retry = retry.with_deadline(2.0**32)
+                    timeout = 2.0**32
+
+            # Delegate the publishing to the sequencer.
+            sequencer = self._get_or_create_sequencer(topic, ordering_key)
+            future = sequencer.publish(wrapper=wrapper, retry=retry, timeout=timeout)
+        except BaseException:
+            self._flow_controller.release(message, size=message_size)
+            raise
+
+        # A paused ordering key reports the error through a thread-based future.
+        if not asyncio.isfuture(future):
+            future = asyncio.wrap_future(future, loop=loop)
+
+        def on_publish_done(future):
+            self._flow_controller.release(message, size=message_size)
+
+        future.add_done_callback(on_publish_done)
+
+        return future
+
+    def ensure_cleanup_and_commit_timer_runs(self) -> None:
+        """Ensure that finished sequencers get cleaned up.
+
+        Schedules a cleanup of the finished sequencers on the event loop,
+        unless one is already scheduled. Batches do not depend on this, each
+        of them is committed once its own ``max_latency`` has expired.
+        """
+        self._ensure_cleanup_timer_runs(self.batch_settings.max_latency)
+
+    def _ensure_cleanup_timer_runs(self, delay: float) -> None:
+        """Schedule a cleanup of the finished sequencers after the given
+        number of seconds, unless one is already scheduled or the delay is
+        infinite."""
+        if self._is_stopped or self._cleanup_timer is not None:
+            return
+
+        if delay < float("inf"):
+            self._cleanup_timer = asyncio.get_running_loop().call_later(
+                delay, self._cleanup_sequencers
+            )
+
+    def _sequencer_finished(self, topic: str, ordering_key: str) -> None:
+        """Mark a sequencer as finished, so that it gets cleaned up.
+
+        Called by the ordered sequencers once all of their batches have been
+        published. The sequencer is removed by the next cleanup unless it
+        accepts new messages in the meantime, right away if batches have no
+        ``max_latency``.
+
+        Args:
+            topic: The topic of the sequencer.
+            ordering_key: The ordering key of the sequencer.
+        """
+        self._finished_sequencer_keys.add((topic, ordering_key))
+        max_latency = self._batch_settings_for(topic).max_latency
+        if max_latency < float("inf"):
+            self._ensure_cleanup_timer_runs(max_latency)
+        else:
+            self._cleanup_sequencers()
+
+    def _batch_settings_for(self, topic: str) -> types.BatchSettings:
+        """Return the settings of the new batches of a topic."""
+        return self._topic_batch_settings.get(topic, self.batch_settings)
+
+    def _schedule_batch_commit(
+        self, sequencer: SequencerType, batch: "aio.Batch"
+    ) -> None:
+        """Schedule the commit of a newly opened batch at its deadline.
+
+        Called by the sequencers whenever they open a new batch.
+
+        Args:
+            sequencer: The sequencer that owns the batch.
+            batch: The batch that has just been opened.
+        """
+        self._open_batches.add(batch)
+        max_latency = self._batch_settings_for(sequencer._topic).max_latency
+        if max_latency < float("inf"):
+            # Only a weak reference is kept until the deadline, so that the
+            # batches committed before it can be freed right away.
+            batch_ref = weakref.ref(batch)
+
+            def commit_at_deadline() -> None:
+                batch = batch_ref()
+                if batch is not None:
+                    self._commit_batch_at_deadline(sequencer, batch)
+
+            asyncio.get_running_loop().call_later(max_latency, commit_at_deadline)
+
+    def _commit_batch_at_deadline(
+        self, sequencer: SequencerType, batch: "aio.Batch"
+    ) -> None:
+        """Commit a batch whose ``max_latency`` has expired."""
+        if not self._is_stopped:
+            sequencer.commit_batch(batch)
+
+    def _cleanup_sequencers(self) -> None:
+        """Remove the sequencers that are finished."""
+        _LOGGER.debug("Cleaning up finished sequencers")
+        self._cleanup_timer = None
+        if self._is_stopped:
+            return
+
+        finished_sequencer_keys = self._finished_sequencer_keys
+        self._finished_sequencer_keys = set()
+        for sequencer_key in finished_sequencer_keys:
+            sequencer = self._sequencers.get(sequencer_key)
+            if sequencer is not None and sequencer.is_finished():
+                del self._sequencers[sequencer_key]
+
+    def _start_batch_commit(
+        self, topic: str, commit: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Start committing a batch of the given topic in a new task.
+
+        If the topic already has ``max_outstanding_batches`` commits in flight,
+        the commit is queued instead and run once one of them completes.
+
+        Args:
+            topic: The topic the batch is published to.
+            commit: The coroutine function that commits the batch.
+        """
+        loop = asyncio.get_running_loop()
+        max_outstanding = self.publisher_options.max_outstanding_batches
+        if max_outstanding == 0:
+            loop.create_task(commit())
+            return
+
+        commit_queue = self._commit_queues.get(topic)
+        if commit_queue is None:
+            commit_queue = CommitQueue(max_outstanding)
+            self._commit_queues[topic] = commit_queue
+
+        if commit_queue.put(commit):
+            loop.create_task(self._drain_commit_queue(commit_queue, commit))
+
+    async def _drain_commit_queue(
+        self,
+        commit_queue: CommitQueue,
+        commit: Optional[Callable[[], Awaitable[None]]],
+    ) -> None:
+        """Run a commit, followed by any commits queued up behind it."""
+        while commit is not None:
+            try:
+                await commit()
+            finally:
+                commit = commit_queue.task_done()
+
+    async def flush(self, timeout: Optional[float] = None) -> None:
+        """Publish all outstanding messages, and wait until they are published.
+
+        Commits the batches of all topics and ordering keys right away,
+        instead of waiting for their ``max_latency``, and waits until the
+        futures of all messages published before the call are done, either in
+        success or error. Unlike :meth:`stop`, the client can still be used
+        afterwards.
+
+        Args:
+            timeout:
+                The maximum number of seconds to wait for the messages to get
+                published. If ``None``, wait for as long as it takes.
+
+        Raises:
+            pubsub_v1.publisher.exceptions.TimeoutError:
+                If the messages are not all published within ``timeout``.
+        """
+        if not self._is_stopped:
+            for sequencer in self._sequencers.values():
+                sequencer.flush()
+
+        pending = [
+            future
+            for batch in list(self._open_batches)
+            for future in batch.futures
+            if not future.done()
+        ]
+        if not pending:
+            return
+
+        _, not_done = await asyncio.wait(pending, timeout=timeout)
+        if not_done:
+            raise exceptions.TimeoutError(
+                "{} messages were not published within {} seconds.".format(
+                    len(not_done), timeout
+                )
+            )
+
+    def stop(self) -> None:
+        """Immediately publish all outstanding messages.
+
+        Schedules the commit of all outstanding messages and prevents future
+        calls to `publish()`. Method should be invoked prior to deleting this
+        `AsyncClient()` object in order to ensure that no pending messages are
+        lost.
+
+        .. note::
+
+            This method is non-blocking. Await the futures returned by
+            `publish()` to make sure all publish requests completed, either
+            in success or error.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call.
+        """
+        if self._is_stopped:
+            raise RuntimeError("Cannot stop a publisher already stopped.")
+
+        self._is_stopped = True
+
+        if self._cleanup_timer is not None:
+            self._cleanup_timer.cancel()
+            self._cleanup_timer = None
+
+        for sequencer in self._sequencers.values():
+            sequencer.stop()
@@ -14,30 +14,67 @@
 
 from __future__ import absolute_import
 
+import concurrent.futures
+import contextlib
 import copy
+import functools
+import itertools
 import logging
 import os
 import threading
 import time
 import typing
-from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 import warnings
 import sys
+import weakref
 
 from google.api_core import gapic_v1
+from google.api_core import retry as retries
 from google.auth.credentials import AnonymousCredentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.pubsub_v1 import _raw_rpc
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher import exceptions
 from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher import _serialized
 from google.cloud.pubsub_v1.publisher._batch import thread
+from google.cloud.pubsub_v1.publisher._batch_coalescer import BatchCoalescer
+from google.cloud.pubsub_v1.publisher._batch_tuner import BatchSettingsTuner
+from google.cloud.pubsub_v1.publisher._commit_queue import (
+    AdaptiveCommitQueue,
+    CommitQueue,
+    CommitType,
+)
+from google.cloud.pubsub_v1.publisher._retry_scheduler import RetryScheduler
 from google.cloud.pubsub_v1.publisher._sequencer import ordered_sequencer
 from google.cloud.pubsub_v1.publisher._sequencer import unordered_sequencer
+from google.cloud.pubsub_v1._timer import DeadlineTimer
 from google.cloud.pubsub_v1.publisher.flow_controller import FlowController
+from google.cloud.pubsub_v1.publisher.flow_controller import (
+    FlowControlWaitStatistics,
+)
+from google.cloud.pubsub_v1.publisher.flow_controller import RateLimiter
 from google.pubsub_v1 import gapic_version as package_version
 from google.pubsub_v1 import types as gapic_types
 from google.pubsub_v1.services.publisher import client as publisher_client
+from google.pubsub_v1.services.publisher.transports.grpc import (
+    PublisherGrpcTransport,
+)
 from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
     PublishMessageWrapper,
 )
@@ -48,13 +85,21 @@ if typing.TYPE_CHECKING:  # pragma: NO COVER
     from google.cloud import pubsub_v1
     from google.cloud.pubsub_v1.publisher import _batch
     from google.pubsub_v1.services.publisher.client import OptionalRetry
-    from google.pubsub_v1.types import pubsub as pubsub_types
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
 _raw_proto_pubbsub_message = gapic_types.PubsubMessage.pb()
+_raw_proto_publish_request = gapic_types.PublishRequest.pb()
+
+# The number of locks that the sequencers are spread over, so that publishing
+# to different topics and ordering keys rarely contends for the same lock.
+_BATCH_LOCK_STRIPES = 32
+
+# The number of seconds after which finished sequencers are cleaned up, if
+# the batches of their topic have no max_latency to clean them up after.
+_SEQUENCER_CLEANUP_INTERVAL = 1.0
 
 SequencerType = Union[
     ordered_sequencer.OrderedSequencer, unordered_sequencer.UnorderedSequencer
@@ -142,24 +187,113 @@ class Client(publisher_client.PublisherClient):
         self.publisher_options = types.PublisherOptions(*publisher_options)
         self._enable_message_ordering = self.publisher_options[0]
 
+        if self.publisher_options.max_outstanding_batches < 0:
+            raise ValueError("max_outstanding_batches must not be negative.")
+
+        concurrency = self.publisher_options.adaptive_concurrency
+        if concurrency is not None and not (
+            1
+            <= concurrency.min_outstanding_batches
+            <= concurrency.max_outstanding_batches
+        ):
+            raise ValueError(
+                "adaptive_concurrency needs 1 <= min_outstanding_batches "
+                "<= max_outstanding_batches."
+            )
+
         # Add the metrics headers, and instantiate the underlying GAPIC
         # client.
         super().__init__(**kwargs)
         self._target = self._transport._host
+
+        # With the gRPC transport, publish requests are serialized by the
+        # client, and sent as they are. With other transports, the messages
+        # are published through the GAPIC public API.
+        self._raw_publish_rpc: Optional[Callable[..., Any]] = None
+        if isinstance(self._transport, PublisherGrpcTransport):
+            self._raw_publish_rpc = _raw_rpc.wrap_method(
+                self._transport,
+                self._transport.publish,
+                "/google.pubsub.v1.Publisher/Publish",
+                gapic_types.PublishResponse.pb().FromString,
+                kwargs.get("client_info", publisher_client.DEFAULT_CLIENT_INFO),
+            )
         self._batch_class = thread.Batch
         self.batch_settings = types.BatchSettings(*batch_settings)
+        # topic => the batch settings that the topic uses instead
+        self._topic_batch_settings: Dict[str, types.BatchSettings] = dict(
+            self.publisher_options.topic_batch_settings or {}
+        )
+
+        # With adaptive batching, the tuner replaces the batch settings as the
+        # traffic changes. Batches keep the settings they were created with.
+        self._batch_tuner: Optional[BatchSettingsTuner] = None
+        if self.publisher_options.adaptive_batching is not None:
+            self._batch_tuner = BatchSettingsTuner(
+                self.publisher_options.adaptive_batching, self.batch_settings
+            )
+            self.batch_settings = self._batch_tuner.settings
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
+        # Each sequencer, and its batches, is guarded by one of the striped
+        # batch locks, picked by its topic and ordering key. The client-wide
+        # _batch_lock guards the sequencers map and the stopped and cleanup
+        # state, and is always taken after a striped lock, if any. Taking all
+        # of the locks gives a consistent view of the client.
+        self._batch_locks = [
+            self._batch_class.make_lock() for _ in range(_BATCH_LOCK_STRIPES)
+        ]
         self._batch_lock = self._batch_class.make_lock()
         # (topic, ordering_key) => sequencers object
         self._sequencers: Dict[Tuple[str, str], SequencerType] = {}
+        # The keys of the sequencers that have finished since the last
+        # cleanup, so that the cleanup does not need to visit all of them.
+        self._finished_sequencer_keys: Set[Tuple[str, str]] = set()
+        # The batches that have been opened and not been garbage collected
+        # yet, so that flush() can wait for the ones that are not done.
+        self._open_batches: "weakref.WeakSet[thread.Batch]" = weakref.WeakSet()
         self._is_stopped = False
-        # Thread created to commit all sequencers after a timeout.
-        self._commit_thread: Optional[threading.Thread] = None
+        # A single timer thread commits every batch once its max_latency has
+        # expired, and periodically cleans up finished sequencers.
+        self._commit_timer = DeadlineTimer(name="Thread-PubSubBatchCommitter")
+        self._cleanup_scheduled = False
+
+        # Batches are committed on the commit executor, or on a new thread
+        # each if there is none. The number of batches of a topic that are
+        # committed at the same time is limited by the topic's commit queue.
+        self._commit_executor = self.publisher_options.commit_executor
+        # topic => commit queue
+        self._commit_queues: Dict[str, CommitQueue] = {}
+        self._commit_queues_lock = threading.Lock()
+        # topic => coalescer of the batches of its ordering keys
+        self._batch_coalescers: Dict[str, BatchCoalescer] = {}
+        # The retry of ordered publishing, derived from the given retry. It is
+        # reused, so that batches of different ordering keys can share RPCs.
+        self._ordered_retry: Tuple[Any, "OptionalRetry"] = (None, None)
+
+        # With scheduled retries, the commit of a failed batch is started
+        # again once its backoff has elapsed, instead of the commit sleeping
+        # through the backoff.
+        self._retry_scheduler: Optional[RetryScheduler] = None
+        if self.publisher_options.scheduled_retries is not None:
+            transport = self._transport
+            self._retry_scheduler = RetryScheduler(
+                self.publisher_options.scheduled_retries,
+                transport._wrapped_methods[transport.publish]._retry,
+            )
 
         # The object controlling the message publishing flow
         self._flow_controller = FlowController(self.publisher_options.flow_control)
+        # The object limiting the publish rate, if any.
+        self._rate_limiter: Optional[RateLimiter] = None
+        if self.publisher_options.rate_limit is not None:
+            self._rate_limiter = RateLimiter(self.publisher_options.rate_limit)
+        # Whether published messages need to be released from flow control.
+        self._flow_control_enabled = (
+            self.publisher_options.flow_control.limit_exceeded_behavior
+            != types.LimitExceededBehavior.IGNORE
+        )
 
         self._open_telemetry_enabled = (
             self.publisher_options.enable_open_telemetry_tracing
@@ -237,9 +371,26 @@ class Client(publisher_client.PublisherClient):
     def open_telemetry_enabled(self) -> bool:
         return self._open_telemetry_enabled
 
+    @property
+    def flow_control_wait_statistics(self) -> FlowControlWaitStatistics:
+        """Return statistics of the time spent waiting for flow control.
+
+        Only messages published with
+        :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.BLOCK`
+        flow control, that had to wait for capacity, are counted.
+
+        Returns:
+            The number of threads waiting right now, and the number and
+            duration of the waits so far.
+        """
+        return self._flow_controller.wait_statistics
+
     def _get_or_create_sequencer(self, topic: str, ordering_key: str) -> SequencerType:
         """Get an existing sequencer or create a new one given the (topic,
         ordering_key) pair.
+
+        The batch lock of the (topic, ordering_key) pair must be held before
+        calling this method.
         """
         sequencer_key = (topic, ordering_key)
         sequencer = self._sequencers.get(sequencer_key)
@@ -250,10 +401,29 @@ class Client(publisher_client.PublisherClient):
                 sequencer = ordered_sequencer.OrderedSequencer(
                     self, topic, ordering_key
                 )
-            self._sequencers[sequencer_key] = sequencer
+            with self._batch_lock:
+                self._sequencers[sequencer_key] = sequencer
 
         return sequencer
 
+    def _batch_lock_for(self, topic: str, ordering_key: str) -> Any:
+        """Return the batch lock that guards the given sequencer."""
+        return self._batch_locks[hash((topic, ordering_key)) % len(self._batch_locks)]
+
+    def _sequencer_batch_lock(self, sequencer: SequencerType) -> Any:
+        """Return the batch lock that guards an existing sequencer."""
+        ordering_key = getattr(sequencer, "_ordering_key", "")
+        return self._batch_lock_for(sequencer._topic, ordering_key)
+
+    @contextlib.contextmanager
+    def _all_batch_locks(self):
+        """Hold all of the batch locks, for a consistent view of the client."""
+        with contextlib.ExitStack() as stack:
+            for lock in self._batch_locks:
+                stack.enter_context(lock)
+            stack.enter_context(self._batch_lock)
+            yield
+
     def resume_publish(self, topic: str, ordering_key: str) -> None:
         """Resume publish on an ordering key that has had unrecoverable errors.
 
@@ -270,7 +440,7 @@ class Client(publisher_client.PublisherClient):
                 If the topic/ordering key combination has not been seen before
                 by this client.
         """
-        with self._batch_lock:
+        with self._batch_lock_for(topic, ordering_key):
             if self._is_stopped:
                 raise RuntimeError("Cannot resume publish on a stopped publisher.")
 
@@ -290,14 +460,207 @@ class Client(publisher_client.PublisherClient):
             else:
                 sequencer.unpause()
 
-    def _gapic_publish(self, *args, **kwargs) -> "pubsub_types.PublishResponse":
-        """Call the GAPIC public API directly."""
-        return super().publish(*args, **kwargs)
+    def _gapic_publish(
+        self,
+        topic: str,
+        messages: Sequence[gapic_types.PubsubMessage],
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+    ) -> Any:
+        """Publish the messages in a single publish RPC.
+
+        With the gRPC transport, the request is built from the raw protobuf
+        messages, and the raw protobuf response is returned. Otherwise, the
+        GAPIC public API is called directly.
+        """
+        if self._raw_publish_rpc is None:
+            return super().publish(
+                topic=topic, messages=messages, retry=retry, timeout=timeout
+            )
+
+        request = _raw_proto_publish_request(
+            topic=topic, messages=[message._pb for message in messages]
+        )
+        return self._raw_publish(
+            topic, request.SerializeToString(), retry=retry, timeout=timeout
+        )
+
+    def _raw_publish(
+        self,
+        topic: str,
+        request: bytes,
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+    ) -> Any:
+        """Send a serialized publish request over gRPC.
+
+        The request is serialized once, and the same bytes are sent again on
+        every retry.
+
+        Returns:
+            The raw protobuf ``PublishResponse``.
+        """
+        assert self._raw_publish_rpc is not None
+        self._validate_universe_domain()
+        return self._raw_publish_rpc(
+            request,
+            retry=retry,
+            timeout=timeout,
+            metadata=_raw_rpc.routing_metadata("topic", topic),
+        )
+
+    def _publish_message_wrappers(
+        self,
+        topic: str,
+        wrappers: Sequence[PublishMessageWrapper],
+        retry: "OptionalRetry",
+        timeout: "types.OptionalTimeout",
+    ) -> Any:
+        """Publish the messages of the wrappers in a single publish RPC.
+
+        If any of the messages is serialized, the publish request is
+        serialized directly, so that the serialized messages are copied into
+        the request without deserializing them.
+        """
+        if self._raw_publish_rpc is not None and any(
+            isinstance(wrapper, _serialized.SerializedMessageWrapper)
+            for wrapper in wrappers
+        ):
+            request = _serialized.serialize_publish_request(topic, wrappers)
+            return self._raw_publish(topic, request, retry=retry, timeout=timeout)
+
+        return self._gapic_publish(
+            topic=topic,
+            messages=[wrapper.message for wrapper in wrappers],
+            retry=retry,
+            timeout=timeout,
+        )
+
+    def _check_message(
+        self, ordering_key: str, attrs: Mapping[str, Union[bytes, str]]
+    ) -> None:
+        """Validate the ordering key and the attributes of a message.
+
+        Byte string attribute values in ``attrs`` are decoded in place, unless
+        the attributes are :class:`~.pubsub_v1.types.PublishAttributes`, which
+        are already validated.
+
+        Raises:
+            TypeError: If any of the attributes has a wrong type.
+            ValueError: If an ordering key is given, but message ordering is
+                not enabled.
+        """
+        if not self._enable_message_ordering and ordering_key != "":
+            raise ValueError(
+                "Cannot publish a message with an ordering key when message "
+                "ordering is not enabled."
+            )
+
+        if type(attrs) is not types.PublishAttributes:
+            # Coerce all attributes to text strings. Only the values of
+            # existing keys are replaced, so the dict can be iterated as is.
+            for k, v in attrs.items():
+                if isinstance(v, str):
+                    continue
+                if isinstance(v, bytes):
+                    attrs[k] = v.decode("utf-8")  # type: ignore[index]
+                    continue
+                raise TypeError(
+                    "All attributes being published to Pub/Sub must "
+                    "be sent as text strings."
+                )
+
+    def _create_message(
+        self,
+        data: "_serialized.BufferType",
+        ordering_key: str,
+        attrs: Mapping[str, Union[bytes, str]],
+    ) -> gapic_types.PubsubMessage:
+        """Validate the message contents and create the Pub/Sub message.
+
+        Data in a ``bytearray`` or ``memoryview`` is copied into the message.
+
+        Raises:
+            TypeError: If the data or any of the attributes has a wrong type.
+            ValueError: If an ordering key is given, but message ordering is
+                not enabled.
+        """
+        if isinstance(data, (bytearray, memoryview)):
+            data = _serialized.as_byte_view(data).tobytes()
+
+        # Sanity check: Is the data being sent as a bytestring?
+        # If it is literally anything else, complain loudly about it.
+        if not isinstance(data, bytes):
+            raise TypeError(
+                "Data being published to Pub/Sub must be sent as a bytestring."
+            )
+
+        self._check_message(ordering_key, attrs)
+
+        # Create the Pub/Sub message object. For performance reasons, the message
+        # should be constructed by directly using the raw protobuf class, and only
+        # then wrapping it into the higher-level PubsubMessage class.
+        vanilla_pb = _raw_proto_pubbsub_message(
+            data=data, ordering_key=ordering_key, attributes=attrs
+        )
+        return gapic_types.PubsubMessage.wrap(vanilla_pb)
+
+    def _create_message_wrapper(
+        self,
+        data: "_serialized.BufferType",
+        ordering_key: str,
+        attrs: Mapping[str, Union[bytes, str]],
+    ) -> PublishMessageWrapper:
+        """Validate the message contents and wrap the message to publish.
+
+        Data in a ``bytearray`` or ``memoryview`` is not copied, but kept in
+        a serialized message, until the publish request is serialized.
+
+        Raises:
+            TypeError: If the data or any of the attributes has a wrong type.
+            ValueError: If an ordering key is given, but message ordering is
+                not enabled.
+        """
+        if isinstance(data, (bytearray, memoryview)):
+            self._check_message(ordering_key, attrs)
+            return _serialized.wrap_buffer_message(
+                data, ordering_key, attrs  # type: ignore[arg-type]
+            )
+        return PublishMessageWrapper(self._create_message(data, ordering_key, attrs))
+
+    def _ordered_retry_and_timeout(
+        self, retry: "OptionalRetry", timeout: "types.OptionalTimeout"
+    ) -> Tuple["OptionalRetry", "types.OptionalTimeout"]:
+        """Return the retry and timeout to use for the publish RPC.
+
+        Set retry timeout to "infinite" when message ordering is enabled.
+        Note that this then also impacts messages added with an empty
+        ordering key.
+        """
+        if self._enable_message_ordering and retry is not None:
+            given_retry, ordered_retry = self._ordered_retry
+            if retry is not given_retry:
+                if retry is gapic_v1.method.DEFAULT:
+                    # use the default retry for the publish GRPC method as a base
+                    transport = self._transport
+                    base_retry = transport._wrapped_methods[transport.publish]._retry
+                    ordered_retry = base_retry.with_deadline(2.0**32)
+                else:
+                    ordered_retry = retry.with_deadline(2.0**32)
+                self._ordered_retry = (retry, ordered_retry)
+
+            retry = ordered_retry
+            # timeout needs to be overridden and set to infinite in
+            # addition to the retry deadline since both determine
+            # the duration for which retries are attempted.
+            timeout = 2.0**32
+
+        return retry, timeout
 
     def publish(  # type: ignore[override]
         self,
         topic: str,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         ordering_key: str = "",
         retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
         timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
@@ -333,7 +696,10 @@ class Client(publisher_client.PublisherClient):
         Args:
             topic: The topic to publish messages to.
             data: A bytestring representing the message body. This
-                must be a bytestring.
+                must be a bytestring, or a contiguous ``bytearray`` or
+                ``memoryview``. The latter are not copied until the message
+                is serialized into the publish request, thus they must not be
+                modified until the returned future is done.
             ordering_key: A string that identifies related messages for which
                 publish order should be respected. Message ordering must be
                 enabled for this client to use this feature.
@@ -363,80 +729,131 @@ class Client(publisher_client.PublisherClient):
             pubsub_v1.publisher.exceptions.MessageTooLargeError: If publishing
                 the ``message`` would exceed the max size limit on the backend.
         """
-        # Sanity check: Is the data being sent as a bytestring?
-        # If it is literally anything else, complain loudly about it.
-        if not isinstance(data, bytes):
-            raise TypeError(
-                "Data being published to Pub/Sub must be sent as a bytestring."
+        if self._open_telemetry_enabled:
+            return self._publish_traced(
+                topic, data, ordering_key, retry, timeout, attrs
             )
 
-        if not self._enable_message_ordering and ordering_key != "":
-            raise ValueError(
-                "Cannot publish a message with an ordering key when message "
-                "ordering is not enabled."
-            )
+        wrapper = self._create_message_wrapper(data, ordering_key, attrs)
+        return self._publish_wrapper(topic, ordering_key, wrapper, retry, timeout)
 
-        # Coerce all attributes to text strings.
-        for k, v in copy.copy(attrs).items():
-            if isinstance(v, str):
-                continue
-            if isinstance(v, bytes):
-                attrs[k] = v.decode("utf-8")
-                continue
-            raise TypeError(
-                "All attributes being published to Pub/Sub must "
-                "be sent as text strings."
-            )
+    def _publish_wrapper(
+        self,
+        topic: str,
+        ordering_key: str,
+        wrapper: PublishMessageWrapper,
+        retry: "OptionalRetry",
+        timeout: "types.OptionalTimeout",
+    ) -> "pubsub_v1.publisher.futures.Future":
+        """Publish a single message, without recording any tracing spans.
 
-        # Create the Pub/Sub message object. For performance reasons, the message
-        # should be constructed by directly using the raw protobuf class, and only
-        # then wrapping it into the higher-level PubsubMessage class.
-        vanilla_pb = _raw_proto_pubbsub_message(
-            data=data, ordering_key=ordering_key, attributes=attrs
-        )
-        message = gapic_types.PubsubMessage.wrap(vanilla_pb)
+        This is the part of :meth:`publish` that follows the creation of the
+        message.
+        """
+        # The size of the message is known, thus flow control does not need
+        # the message itself.
+        size = wrapper.size
+
+        # Messages should go through flow control to prevent excessive
+        # queuing on the client side (depending on the settings). The rate
+        # limit is waited for first, so that waiting for it does not hold any
+        # flow control capacity.
+        try:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(topic, 1, size)
+            self._flow_controller.add(None, size=size)
+        except exceptions.FlowControlLimitError as exc:
+            future = futures.Future()
+            future.set_exception(exc)
+            return future
+
+        if retry is gapic_v1.method.DEFAULT:  # if custom retry not passed in
+            retry = self.publisher_options.retry
+
+        if timeout is gapic_v1.method.DEFAULT:  # if custom timeout not passed in
+            timeout = self.publisher_options.timeout
+
+        with self._batch_lock_for(topic, ordering_key):
+            try:
+                if self._is_stopped:
+                    raise RuntimeError("Cannot publish on a stopped publisher.")
+
+                retry, timeout = self._ordered_retry_and_timeout(retry, timeout)
+
+                # Delegate the publishing to the sequencer.
+                sequencer = self._get_or_create_sequencer(topic, ordering_key)
+                future = sequencer.publish(
+                    wrapper=wrapper, retry=retry, timeout=timeout
+                )
+            except BaseException:
+                self._flow_controller.release(None, size=size)
+                raise
+
+        # Without flow control limits, there is nothing to release once the
+        # message is published, so the callback is not worth adding.
+        if self._flow_control_enabled:
+            future.add_done_callback(functools.partial(self._release_published, size))
+        return future
+
+    def _publish_traced(
+        self,
+        topic: str,
+        data: "_serialized.BufferType",
+        ordering_key: str,
+        retry: "OptionalRetry",
+        timeout: "types.OptionalTimeout",
+        attrs: Dict[str, Union[bytes, str]],
+    ) -> "pubsub_v1.publisher.futures.Future":
+        """Publish a single message, and record the OpenTelemetry spans of it.
+
+        This is the variant of :meth:`publish` that is used when tracing is
+        enabled.
+        """
+        message = self._create_message(data, ordering_key, attrs)
 
         wrapper: PublishMessageWrapper = PublishMessageWrapper(message)
-        if self._open_telemetry_enabled:
-            wrapper.start_create_span(topic=topic, ordering_key=ordering_key)
+        wrapper.start_create_span(topic=topic, ordering_key=ordering_key)
 
         # Messages should go through flow control to prevent excessive
         # queuing on the client side (depending on the settings).
         try:
-            if self._open_telemetry_enabled:
-                if wrapper:
-                    wrapper.start_publisher_flow_control_span()
-                else:  # pragma: NO COVER
-                    warnings.warn(
-                        message="PubSubMessageWrapper is None. Not starting publisher flow control span.",
-                        category=RuntimeWarning,
-                    )
-            self._flow_controller.add(message)
-            if self._open_telemetry_enabled:
-                if wrapper:
-                    wrapper.end_publisher_flow_control_span()
-                else:  # pragma: NO COVER
-                    warnings.warn(
-                        message="PubSubMessageWrapper is None. Not ending publisher flow control span.",
-                        category=RuntimeWarning,
-                    )
+            if wrapper:
+                wrapper.start_publisher_flow_control_span()
+            else:  # pragma: NO COVER
+                warnings.warn(
+                    message="PubSubMessageWrapper is None. Not starting publisher flow control span.",
+                    category=RuntimeWarning,
+                )
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(topic, 1, wrapper.size)
+            self._flow_controller.add(message, size=wrapper.size)
+            if wrapper:
+                wrapper.end_publisher_flow_control_span()
+            else:  # pragma: NO COVER
+                warnings.warn(
+                    message="PubSubMessageWrapper is None. Not ending publisher flow control span.",
+                    category=RuntimeWarning,
+                )
         except exceptions.FlowControlLimitError as exc:
-            if self._open_telemetry_enabled:
-                if wrapper:
-                    wrapper.end_publisher_flow_control_span(exc)
-                    wrapper.end_create_span(exc)
-                else:  # pragma: NO COVER
-                    warnings.warn(
-                        message="PubSubMessageWrapper is None. Not ending publisher create and flow control spans on FlowControlLimitError.",
-                        category=RuntimeWarning,
-                    )
+            if wrapper:
+                wrapper.end_publisher_flow_control_span(exc)
+                wrapper.end_create_span(exc)
+            else:  # pragma: NO COVER
+                warnings.warn(
+                    message="PubSubMessageWrapper is None. Not ending publisher create and flow control spans on FlowControlLimitError.",
+                    category=RuntimeWarning,
+                )
 
             future = futures.Future()
             future.set_exception(exc)
             return future
 
+        # The message is not modified anymore, its size can be reused by
+        # flow control and the batch.
+        message_size = wrapper.size
+
         def on_publish_done(future):
-            self._flow_controller.release(message)
+            self._flow_controller.release(message, size=message_size)
 
         if retry is gapic_v1.method.DEFAULT:  # if custom retry not passed in
             retry = self.publisher_options.retry
@@ -444,37 +861,19 @@ class Client(publisher_client.PublisherClient):
         if timeout is gapic_v1.method.DEFAULT:  # if custom timeout not passed in
             timeout = self.publisher_options.timeout
 
-        if self._open_telemetry_enabled:
-            if wrapper:
-                wrapper.start_publisher_batching_span()
-            else:  # pragma: NO COVER
-                warnings.warn(
-                    message="PublishMessageWrapper is None. Hence, not starting publisher batching span",
-                    category=RuntimeWarning,
-                )
-        with self._batch_lock:
+        if wrapper:
+            wrapper.start_publisher_batching_span()
+        else:  # pragma: NO COVER
+            warnings.warn(
+                message="PublishMessageWrapper is None. Hence, not starting publisher batching span",
+                category=RuntimeWarning,
+            )
+        with self._batch_lock_for(topic, ordering_key):
             try:
                 if self._is_stopped:
                     raise RuntimeError("Cannot publish on a stopped publisher.")
 
-                # Set retry timeout to "infinite" when message ordering is enabled.
-                # Note that this then also impacts messages added with an empty
-                # ordering key.
-                if self._enable_message_ordering:
-                    if retry is gapic_v1.method.DEFAULT:
-                        # use the default retry for the publish GRPC method as a base
-                        transport = self._transport
-                        base_retry = transport._wrapped_methods[
-                            transport.publish
-                        ]._retry
-                        retry = base_retry.with_deadline(2.0**32)
-                        # timeout needs to be overridden and set to infinite in
-                        # addition to the retry deadline since both determine
-                        # the duration for which retries are attempted.
-                        timeout = 2.0**32
-                    elif retry is not None:
-                        retry = retry.with_deadline(2.0**32)
-                        timeout = 2.0**32
+                retry, timeout = self._ordered_retry_and_timeout(retry, timeout)
 
                 # Delegate the publishing to the sequencer.
                 sequencer = self._get_or_create_sequencer(topic, ordering_key)
@@ -487,85 +886,777 @@ class Client(publisher_client.PublisherClient):
                 # the batch. If they're thrown, record them in publisher
                 # batching and create span, end the spans and bubble the
                 # exception up.
-                if self._open_telemetry_enabled:
-                    if wrapper:
-                        wrapper.end_publisher_batching_span(be)
-                        wrapper.end_create_span(be)
-                    else:  # pragma: NO COVER
-                        warnings.warn(
-                            message="PublishMessageWrapper is None. Hence, not recording exception and ending publisher batching span and create span",
-                            category=RuntimeWarning,
-                        )
-                raise be
-
-            if self._open_telemetry_enabled:
                 if wrapper:
-                    wrapper.end_publisher_batching_span()
+                    wrapper.end_publisher_batching_span(be)
+                    wrapper.end_create_span(be)
                 else:  # pragma: NO COVER
                     warnings.warn(
-                        message="PublishMessageWrapper is None. Hence, not ending publisher batching span",
+                        message="PublishMessageWrapper is None. Hence, not recording exception and ending publisher batching span and create span",
                         category=RuntimeWarning,
                     )
+                raise be
 
-            # Create a timer thread if necessary to enforce the batching
-            # timeout.
-            self._ensure_commit_timer_runs_no_lock()
+            if wrapper:
+                wrapper.end_publisher_batching_span()
+            else:  # pragma: NO COVER
+                warnings.warn(
+                    message="PublishMessageWrapper is None. Hence, not ending publisher batching span",
+                    category=RuntimeWarning,
+                )
 
             return future
 
+    def publish_many(
+        self,
+        topic: str,
+        messages: Iterable[
+            Tuple[Union[bytes, bytearray, memoryview], Mapping[str, Union[bytes, str]]]
+        ],
+        ordering_key: str = "",
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+    ) -> List["pubsub_v1.publisher.futures.Future"]:
+        """Publish several messages to the same topic.
+
+        This is equivalent to calling :meth:`publish` for each of the messages,
+        in order, but the flow control and the batches are only updated once
+        for all the messages that fit into the flow control limits, instead of
+        once per message.
+
+        This method may block if LimitExceededBehavior.BLOCK is used in the
+        flow control settings.
+
+        Example:
+            >>> from google.cloud import pubsub_v1
+            >>> client = pubsub_v1.PublisherClient()
+            >>> topic = client.topic_path('[PROJECT]', '[TOPIC]')
+            >>> messages = [(b'spam', {}), (b'eggs', {'username': 'guido'})]
+            >>> futures = client.publish_many(topic, messages)
+
+        Args:
+            topic: The topic to publish messages to.
+            messages: The ``(data, attributes)`` pairs to publish. The data
+                must be a bytestring, or a buffer as accepted by
+                :meth:`publish`, and the attributes a mapping of text strings
+                or byte strings.
+            ordering_key: A string that identifies related messages for which
+                publish order should be respected. Message ordering must be
+                enabled for this client to use this feature.
+            retry:
+                Designation of what errors, if any, should be retried. If `ordering_key`
+                is specified, the total retry deadline will be changed to "infinity".
+                If given, it overides any retry passed into the client through
+                the ``publisher_options`` argument.
+            timeout:
+                The timeout for the RPC request. Can be used to override any timeout
+                passed in through ``publisher_options`` when instantiating the client.
+
+        Returns:
+            A list with a :class:`~google.cloud.pubsub_v1.publisher.futures.Future`
+            instance for each of the messages, in the same order. Messages that
+            were rejected by flow control, or that would exceed the max size
+            limit on the backend, get a future that is already failed.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call.
+        """
+        if self._open_telemetry_enabled:
+            # The tracing spans are recorded for each message separately.
+            return [
+                self.publish(
+                    topic,
+                    data,
+                    ordering_key=ordering_key,
+                    retry=retry,
+                    timeout=timeout,
+                    **attrs,
+                )
+                for data, attrs in messages
+            ]
+
+        wrappers = [
+            self._create_message_wrapper(
+                data,
+                ordering_key,
+                attrs if type(attrs) is types.PublishAttributes else dict(attrs),
+            )
+            for data, attrs in messages
+        ]
+        sizes = [wrapper.size for wrapper in wrappers]
+
+        if retry is gapic_v1.method.DEFAULT:  # if custom retry not passed in
+            retry = self.publisher_options.retry
+
+        if timeout is gapic_v1.method.DEFAULT:  # if custom timeout not passed in
+            timeout = self.publisher_options.timeout
+
+        # The whole bulk is rate limited at once.
+        if self._rate_limiter is not None:
+            try:
+                self._rate_limiter.acquire(topic, len(sizes), sum(sizes))
+            except exceptions.RateLimitExceededError as exc:
+                result = [futures.Future() for _ in wrappers]
+                for future in result:
+                    future.set_exception(exc)
+                return result
+
+        result: List[futures.Future] = []
+        start = 0
+        while start < len(wrappers):
+            added = self._flow_controller.add_many(itertools.islice(sizes, start, None))
+
+            if not added:
+                # Let the next message block, or fail, as configured. The
+                # messages added so far are already batched and will release
+                # their capacity once published.
+                try:
+                    self._flow_controller.add(None, size=sizes[start])
+                except exceptions.FlowControlLimitError as exc:
+                    future = futures.Future()
+                    future.set_exception(exc)
+                    result.append(future)
+                    start += 1
+                    continue
+                added = 1
+
+            end = start + added
+            result.extend(
+                self._publish_wrappers(
+                    topic,
+                    ordering_key,
+                    wrappers[start:end],
+                    sizes[start:end],
+                    retry,
+                    timeout,
+                )
+            )
+            start = end
+
+        return result
+
+    def publish_serialized(
+        self,
+        topic: str,
+        message: Union[bytes, bytearray, memoryview],
+        ordering_key: str = "",
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+    ) -> "pubsub_v1.publisher.futures.Future":
+        """Publish a message that is already serialized.
+
+        The serialized :class:`~.pubsub_v1.types.PubsubMessage` is copied as
+        it is into the publish request, it is neither deserialized nor
+        validated by the client. This is cheaper than :meth:`publish` for
+        producers that already hold serialized messages, e.g. in large shared
+        buffers.
+
+        This method may block if LimitExceededBehavior.BLOCK is used in the
+        flow control settings.
+
+        Example:
+            >>> from google.cloud import pubsub_v1
+            >>> client = pubsub_v1.PublisherClient()
+            >>> topic = client.topic_path('[PROJECT]', '[TOPIC]')
+            >>> message = pubsub_v1.types.PubsubMessage(data=b'spam')
+            >>> serialized = pubsub_v1.types.PubsubMessage.serialize(message)
+            >>> response = client.publish_serialized(topic, serialized)
+
+        Args:
+            topic: The topic to publish messages to.
+            message: The serialized message, as a bytestring, or a contiguous
+                ``bytearray`` or ``memoryview``. Buffers are not copied until
+                the message is serialized into the publish request, thus they
+                must not be modified until the returned future is done.
+            ordering_key: The ordering key of the serialized message, if it
+                has one. Messages are sequenced by this key, which must match
+                the one in the message. Message ordering must be enabled for
+                this client to use this feature.
+            retry:
+                Designation of what errors, if any, should be retried. If `ordering_key`
+                is specified, the total retry deadline will be changed to "infinity".
+                If given, it overides any retry passed into the client through
+                the ``publisher_options`` argument.
+            timeout:
+                The timeout for the RPC request. Can be used to override any timeout
+                passed in through ``publisher_options`` when instantiating the client.
+
+        Returns:
+            A :class:`~google.cloud.pubsub_v1.publisher.futures.Future`
+            instance that conforms to Python Standard library's
+            :class:`~concurrent.futures.Future` interface (but not an
+            instance of that class).
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call.
+
+            pubsub_v1.publisher.exceptions.MessageTooLargeError: If publishing
+                the ``message`` would exceed the max size limit on the backend.
+
+            ValueError: If ``ordering_key`` differs from the ordering key in
+                the message.
+        """
+        if not isinstance(message, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                "Serialized messages being published to Pub/Sub must be sent "
+                "as a bytestring or a buffer."
+            )
+        if not isinstance(message, bytes):
+            message = _serialized.as_byte_view(message)
+
+        encoded_ordering_key = _serialized.read_ordering_key(message)
+        if encoded_ordering_key != ordering_key:
+            raise ValueError(
+                "The ordering key {!r} does not match the ordering key {!r} of "
+                "the serialized message.".format(ordering_key, encoded_ordering_key)
+            )
+
+        if self._open_telemetry_enabled:
+            # The trace context is added to the message attributes, thus the
+            # message must be deserialized.
+            pubsub_message = gapic_types.PubsubMessage.deserialize(bytes(message))
+            return self._publish_traced(
+                topic,
+                pubsub_message.data,
+                ordering_key,
+                retry,
+                timeout,
+                dict(pubsub_message.attributes),
+            )
+
+        self._check_message(ordering_key, {})
+        wrapper = _serialized.SerializedMessageWrapper((message,), ordering_key)
+        return self._publish_wrapper(topic, ordering_key, wrapper, retry, timeout)
+
+    def publish_fanout(
+        self,
+        topics: Iterable[str],
+        data: Union[bytes, bytearray, memoryview],
+        ordering_key: str = "",
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+        **attrs: Union[bytes, str],
+    ) -> "pubsub_v1.publisher.futures.Future":
+        """Publish the same message to several topics.
+
+        This is equivalent to calling :meth:`publish` for each of the topics,
+        but the message is only validated and serialized once, and the
+        serialized message is shared by the batches of all topics. The message
+        also goes through flow control once, i.e. it is only counted once
+        towards the flow control limits, until it is published to all topics.
+
+        This method may block if LimitExceededBehavior.BLOCK is used in the
+        flow control or rate limit settings.
+
+        Example:
+            >>> from google.cloud import pubsub_v1
+            >>> client = pubsub_v1.PublisherClient()
+            >>> topics = [
+            ...     client.topic_path('[PROJECT]', '[TOPIC1]'),
+            ...     client.topic_path('[PROJECT]', '[TOPIC2]'),
+            ... ]
+            >>> future = client.publish_fanout(topics, b'spam', username='guido')
+
+        Args:
+            topics: The topics to publish the message to.
+            data: A bytestring representing the message body, or a buffer as
+                accepted by :meth:`publish`.
+            ordering_key: A string that identifies related messages for which
+                publish order should be respected, on each of the topics.
+                Message ordering must be enabled for this client to use this
+                feature.
+            retry:
+                Designation of what errors, if any, should be retried. If `ordering_key`
+                is specified, the total retry deadline will be changed to "infinity".
+                If given, it overides any retry passed into the client through
+                the ``publisher_options`` argument.
+            timeout:
+                The timeout for the RPC request. Can be used to override any timeout
+                passed in through ``publisher_options`` when instantiating the client.
+
+            attrs: A dictionary of attributes to be
+                sent as metadata. (These may be text strings or byte strings.)
+
+        Returns:
+            A :class:`~google.cloud.pubsub_v1.publisher.futures.Future` that
+            resolves to the list of message IDs, one for each of the topics,
+            in the same order, once the message is published to all of them.
+            If publishing to any of the topics fails, the future fails with
+            the first such error.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call.
+
+            ValueError: If no topics are given.
+        """
+        topics = list(topics)
+        if not topics:
+            raise ValueError("At least one topic is required.")
+
+        if self._open_telemetry_enabled:
+            # The tracing spans are recorded for each topic separately.
+            return futures._gather(
+                [
+                    self._publish_traced(
+                        topic, data, ordering_key, retry, timeout, attrs
+                    )
+                    for topic in topics
+                ]
+            )
+
+        wrapper = self._create_message_wrapper(data, ordering_key, attrs)
+        if not isinstance(wrapper, _serialized.SerializedMessageWrapper):
+            # Serialize the message once, for the publish requests of all
+            # topics.
+            wrapper = _serialized.SerializedMessageWrapper(
+                (wrapper.message._pb.SerializeToString(),), ordering_key
+            )
+        size = wrapper.size
+
+        # Every topic counts towards the rate limits, but flow control only
+        # holds the shared message once.
+        try:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire_fanout(topics, 1, size)
+            self._flow_controller.add(None, size=size)
+        except exceptions.FlowControlLimitError as exc:
+            future = futures.Future()
+            future.set_exception(exc)
+            return future
+
+        if retry is gapic_v1.method.DEFAULT:  # if custom retry not passed in
+            retry = self.publisher_options.retry
+
+        if timeout is gapic_v1.method.DEFAULT:  # if custom timeout not passed in
+            timeout = self.publisher_options.timeout
+
+        retry, timeout = self._ordered_retry_and_timeout(retry, timeout)
+
+        publish_futures: List[futures.Future] = []
+        try:
+            for topic in topics:
+                with self._batch_lock_for(topic, ordering_key):
+                    if self._is_stopped:
+                        raise RuntimeError("Cannot publish on a stopped publisher.")
+
+                    sequencer = self._get_or_create_sequencer(topic, ordering_key)
+                    try:
+                        future = sequencer.publish(
+                            wrapper=wrapper, retry=retry, timeout=timeout
+                        )
+                    except exceptions.MessageTooLargeError as exc:
+                        future = futures.Future()
+                        future.set_exception(exc)
+                publish_futures.append(future)
+        except BaseException:
+            # The message stays in flow control until it is published to the
+            # topics it has already been added to.
+            if not publish_futures:
+                self._flow_controller.release(None, size=size)
+            elif self._flow_control_enabled:
+                futures._gather(publish_futures).add_done_callback(
+                    functools.partial(self._release_published, size)
+                )
+            raise
+
+        result = futures._gather(publish_futures)
+        if self._flow_control_enabled:
+            result.add_done_callback(functools.partial(self._release_published, size))
+        return result
+
+    def _publish_wrappers(
+        self,
+        topic: str,
+        ordering_key: str,
+        wrappers: Sequence[PublishMessageWrapper],
+        sizes: Sequence[int],
+        retry: "OptionalRetry",
+        timeout: "types.OptionalTimeout",
+    ) -> List[futures.Future]:
+        """Add messages that already went through flow control to the batches.
+
+        All the messages are added while holding the batch lock of the topic
+        and ordering key once.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call. The messages are released from flow control.
+        """
+        result: List[futures.Future] = []
+
+        with self._batch_lock_for(topic, ordering_key):
+            try:
+                if self._is_stopped:
+                    raise RuntimeError("Cannot publish on a stopped publisher.")
+
+                retry, timeout = self._ordered_retry_and_timeout(retry, timeout)
+                sequencer = self._get_or_create_sequencer(topic, ordering_key)
+
+                for wrapper, size in zip(wrappers, sizes):
+                    try:
+                        future = sequencer.publish(
+                            wrapper=wrapper, retry=retry, timeout=timeout
+                        )
+                    except exceptions.MessageTooLargeError as exc:
+                        self._flow_controller.release(None, size=size)
+                        future = futures.Future()
+                        future.set_exception(exc)
+                    else:
+                        if self._flow_control_enabled:
+                            future.add_done_callback(
+                                functools.partial(self._release_published, size)
+                            )
+                    result.append(future)
+            except BaseException:
+                for size in sizes[len(result) :]:
+                    self._flow_controller.release(None, size=size)
+                raise
+
+        return result
+
+    def _release_published(self, size: int, future: futures.Future) -> None:
+        """Release a message from flow control once its publish is done."""
+        self._flow_controller.release(None, size=size)
+
     def ensure_cleanup_and_commit_timer_runs(self) -> None:
-        """Ensure a cleanup/commit timer thread is running.
+        """Ensure that finished sequencers get cleaned up.
 
-        If a cleanup/commit timer thread is already running, this does nothing.
+        Schedules a cleanup of the finished sequencers on the commit timer,
+        unless one is already scheduled. Batches do not depend on this, each
+        of them is committed by the commit timer once its own ``max_latency``
+        has expired.
         """
         with self._batch_lock:
-            self._ensure_commit_timer_runs_no_lock()
+            self._ensure_cleanup_timer_runs_no_lock(self.batch_settings.max_latency)
 
-    def _ensure_commit_timer_runs_no_lock(self) -> None:
-        """Ensure a commit timer thread is running, without taking
+    def _ensure_cleanup_timer_runs_no_lock(self, delay: float) -> None:
+        """Ensure a cleanup of finished sequencers is scheduled, without taking
         _batch_lock.
 
         _batch_lock must be held before calling this method.
+
+        Args:
+            delay: The number of seconds after which to clean up, if no
+                cleanup is scheduled yet. Nothing is scheduled if it is
+                infinite.
         """
-        if not self._commit_thread and self.batch_settings.max_latency < float("inf"):
-            self._start_commit_thread()
+        if self._is_stopped or self._cleanup_scheduled:
+            return
 
-    def _start_commit_thread(self) -> None:
-        """Start a new thread to actually wait and commit the sequencers."""
-        # NOTE: If the thread is *not* a daemon, a memory leak exists due to a CPython issue.
-        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-829910303
-        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-830092418
-        self._commit_thread = threading.Thread(
-            name="Thread-PubSubBatchCommitter",
-            target=self._wait_and_commit_sequencers,
-            daemon=True,
-        )
-        self._commit_thread.start()
+        if delay < float("inf"):
+            self._cleanup_scheduled = True
+            self._commit_timer.schedule(delay, self._cleanup_sequencers)
 
-    def _wait_and_commit_sequencers(self) -> None:
-        """Wait up to the batching timeout, and commit all sequencers."""
-        # Sleep for however long we should be waiting.
-        time.sleep(self.batch_settings.max_latency)
-        _LOGGER.debug("Commit thread is waking up")
+    def _sequencer_finished(self, topic: str, ordering_key: str) -> None:
+        """Mark a sequencer as finished, so that it gets cleaned up.
+
+        Called by the ordered sequencers, without holding any lock, once all
+        of their batches have been published. The sequencer is removed by the
+        next cleanup on the commit timer, unless it accepts new messages in
+        the meantime. The cleanup takes all of the batch locks, thus it is
+        never done right away, but after the ``max_latency`` of the topic's
+        batches, or after a second if they have none.
+
+        Args:
+            topic: The topic of the sequencer.
+            ordering_key: The ordering key of the sequencer.
+        """
+        delay = self._batch_settings_for(topic).max_latency
+        if delay == float("inf"):
+            delay = _SEQUENCER_CLEANUP_INTERVAL
 
         with self._batch_lock:
+            self._finished_sequencer_keys.add((topic, ordering_key))
+            self._ensure_cleanup_timer_runs_no_lock(delay)
+
+    def _batch_settings_for(self, topic: str) -> types.BatchSettings:
+        """Return the settings of the new batches of a topic."""
+        return self._topic_batch_settings.get(topic, self.batch_settings)
+
+    def _schedule_batch_commit(
+        self, sequencer: SequencerType, batch: "_batch.thread.Batch"
+    ) -> None:
+        """Schedule the commit of a newly opened batch at its deadline.
+
+        Called by the sequencers, with their batch lock held, whenever they
+        open a new batch.
+
+        Args:
+            sequencer: The sequencer that owns the batch.
+            batch: The batch that has just been opened.
+        """
+        self._open_batches.add(batch)
+        max_latency = self._batch_settings_for(sequencer._topic).max_latency
+        if max_latency < float("inf"):
+            # Only a weak reference is kept until the deadline, so that the
+            # batches committed before it can be freed right away.
+            batch_ref = weakref.ref(batch)
+
+            def commit_at_deadline() -> None:
+                batch = batch_ref()
+                if batch is not None:
+                    self._commit_batch_at_deadline(sequencer, batch)
+
+            self._commit_timer.schedule(max_latency, commit_at_deadline)
+
+    def _commit_batch_at_deadline(
+        self, sequencer: SequencerType, batch: "_batch.thread.Batch"
+    ) -> None:
+        """Commit a batch whose ``max_latency`` has expired."""
+        with self._sequencer_batch_lock(sequencer):
             if self._is_stopped:
                 return
-            self._commit_sequencers()
-            self._commit_thread = None
-
-    def _commit_sequencers(self) -> None:
-        """Clean up finished sequencers and commit the rest."""
-        finished_sequencer_keys = [
-            key
-            for key, sequencer in self._sequencers.items()
-            if sequencer.is_finished()
-        ]
+            sequencer.commit_batch(batch)
+
+    def _cleanup_sequencers(self) -> None:
+        """Remove the sequencers that are finished."""
+        _LOGGER.debug("Cleaning up finished sequencers")
+        with self._all_batch_locks():
+            self._cleanup_scheduled = False
+            if self._is_stopped:
+                return
+            self._remove_finished_sequencers()
+
+    def _remove_finished_sequencers(self) -> None:
+        """Clean up finished sequencers.
+
+        Only the sequencers that finished since the last cleanup are visited.
+        Those that accepted new messages in the meantime are kept, and marked
+        as finished again once they are done with them.
+
+        All of the batch locks must be held before calling this method.
+        """
+        finished_sequencer_keys = self._finished_sequencer_keys
+        self._finished_sequencer_keys = set()
         for sequencer_key in finished_sequencer_keys:
-            del self._sequencers[sequencer_key]
+            sequencer = self._sequencers.get(sequencer_key)
+            if sequencer is not None and sequencer.is_finished():
+                del self._sequencers[sequencer_key]
 
-        for sequencer in self._sequencers.values():
-            sequencer.commit()
+    def _record_batch_commit(
+        self,
+        topic: str,
+        settings: types.BatchSettings,
+        message_count: int,
+        byte_count: int,
+        age: float,
+        rpc_latency: float,
+    ) -> None:
+        """Let adaptive batching, if enabled, learn from a committed batch.
+
+        Called by the batches after each successful publish RPC.
+
+        Args:
+            topic: The topic the batch was published to.
+            settings: The settings that the batch was created with.
+            message_count: The number of messages in the batch.
+            byte_count: The size of the batch's publish request.
+            age: The number of seconds from the creation of the batch to the
+                start of the publish RPC.
+            rpc_latency: The number of seconds the publish RPC took.
+        """
+        # The batches of the topics with their own settings do not count.
+        if self._batch_tuner is None or topic in self._topic_batch_settings:
+            return
+
+        new_settings = self._batch_tuner.record(
+            settings, message_count, byte_count, age, rpc_latency
+        )
+        if new_settings is not None:
+            _LOGGER.debug("Adjusted the batch settings to %s.", new_settings)
+            self.batch_settings = new_settings
+
+    def _record_publish_rpc(
+        self,
+        topic: str,
+        start: float,
+        rpc_latency: float,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Let adaptive concurrency, if enabled, learn from a publish RPC.
+
+        Called by the batches after each publish RPC, successful or not, while
+        their commit still counts as in flight.
+
+        Args:
+            topic: The topic the batch was published to.
+            start: The :func:`time.monotonic` time at which the RPC started.
+            rpc_latency: The number of seconds the RPC took.
+            error: The error that the RPC failed with, if any.
+        """
+        commit_queue = self._commit_queues.get(topic)
+        if not isinstance(commit_queue, AdaptiveCommitQueue):
+            return
+
+        commit_queue.record(start, rpc_latency, error)
+        # A raised limit makes room for queued commits right away.
+        for commit in commit_queue.start_pending():
+            self._submit_commit(
+                functools.partial(self._drain_commit_queue, commit_queue, commit)
+            )
+
+    def _report_failed_attempts(self, topic: str, retry: "OptionalRetry") -> Any:
+        """Return the retry to send a publish RPC with, so that adaptive
+        concurrency, if enabled, learns from each of its failed attempts.
+
+        Without this, the commit queue would only see the error of the last
+        attempt, once the retry has given up.
+
+        Args:
+            topic: The topic the batch is published to.
+            retry: The retry of the publish RPC.
+
+        Returns:
+            A copy of the retry that reports each failed attempt, or the given
+            retry if there is nothing to report to.
+        """
+        if not isinstance(self._commit_queues.get(topic), AdaptiveCommitQueue):
+            return retry
+
+        if retry is gapic_v1.method.DEFAULT:
+            transport = self._transport
+            retry = transport._wrapped_methods[transport.publish]._retry
+        if not isinstance(retry, retries.Retry):
+            return retry
+
+        given_on_error = retry._on_error
+        attempt_start = time.monotonic()
+
+        def on_error(exc: Exception) -> None:
+            nonlocal attempt_start
+            self._record_publish_rpc(
+                topic, attempt_start, time.monotonic() - attempt_start, exc
+            )
+            # Taken after a decrease, so that the next attempt can decrease
+            # the limit again if it fails, too.
+            attempt_start = time.monotonic()
+            if given_on_error is not None:
+                given_on_error(exc)
+
+        reporting_retry = copy.copy(retry)
+        reporting_retry._on_error = on_error
+        return reporting_retry
+
+    def _get_batch_coalescer(self, topic: str) -> Optional[BatchCoalescer]:
+        """Return the coalescer of the ordered batches of the given topic.
+
+        Returns:
+            The coalescer, or ``None`` if the batches of different ordering
+            keys are not coalesced.
+        """
+        if (
+            not self.publisher_options.coalesce_ordering_keys
+            or self._open_telemetry_enabled
+        ):
+            return None
+
+        with self._commit_queues_lock:
+            coalescer = self._batch_coalescers.get(topic)
+            if coalescer is None:
+                coalescer = BatchCoalescer(self, topic)
+                self._batch_coalescers[topic] = coalescer
+            return coalescer
+
+    def _start_batch_commit(self, topic: str, commit: CommitType) -> None:
+        """Start committing a batch of the given topic.
+
+        The commit is run on the commit executor, or on a new thread if none
+        is configured. If the topic already has as many commits in flight as
+        its commit queue allows, the commit is queued instead and run once one
+        of them completes.
+
+        Args:
+            topic: The topic the batch is published to.
+            commit: The blocking callable that commits the batch.
+        """
+        concurrency = self.publisher_options.adaptive_concurrency
+        max_outstanding = self.publisher_options.max_outstanding_batches
+        if concurrency is None and max_outstanding == 0:
+            self._submit_commit(commit)
+            return
+
+        with self._commit_queues_lock:
+            commit_queue = self._commit_queues.get(topic)
+            if commit_queue is None:
+                if concurrency is not None:
+                    commit_queue = AdaptiveCommitQueue(concurrency)
+                else:
+                    commit_queue = CommitQueue(max_outstanding)
+                self._commit_queues[topic] = commit_queue
+
+        if commit_queue.put(commit):
+            self._submit_commit(lambda: self._drain_commit_queue(commit_queue, commit))
+
+    def _drain_commit_queue(
+        self, commit_queue: CommitQueue, commit: Optional[CommitType]
+    ) -> None:
+        """Run a commit, followed by any commits queued up behind it."""
+        while commit is not None:
+            try:
+                commit()
+            finally:
+                commit = commit_queue.task_done()
+
+    def _submit_commit(self, commit: CommitType) -> None:
+        """Run a commit on the commit executor or on a new thread."""
+        if self._commit_executor is not None:
+            self._commit_executor.submit(commit)
+            return
+
+        # NOTE: If the thread is *not* a daemon, a memory leak exists due to a CPython issue.
+        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-829910303
+        # https://github.com/googleapis/python-pubsub/issues/395#issuecomment-830092418
+        commit_thread = threading.Thread(
+            name="Thread-CommitBatchPublisher", target=commit, daemon=True
+        )
+        commit_thread.start()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Publish all outstanding messages, and wait until they are published.
+
+        Commits the batches of all topics and ordering keys right away,
+        instead of waiting for their ``max_latency``, and blocks until the
+        futures of all messages published before the call are done, either in
+        success or error. Unlike :meth:`stop`, the client can still be used
+        afterwards.
+
+        Messages that are published while this method waits are batched as
+        usual, and are not waited for.
+
+        Args:
+            timeout:
+                The maximum number of seconds to wait for the messages to get
+                published. If ``None``, wait for as long as it takes.
+
+        Raises:
+            pubsub_v1.publisher.exceptions.TimeoutError:
+                If the messages are not all published within ``timeout``.
+        """
+        with self._all_batch_locks():
+            if not self._is_stopped:
+                for sequencer in self._sequencers.values():
+                    sequencer.flush()
+
+            pending = [
+                future
+                for batch in list(self._open_batches)
+                for future in batch.futures
+                if not future.done()
+            ]
+
+        _, not_done = concurrent.futures.wait(pending, timeout=timeout)
+        if not_done:
+            raise exceptions.TimeoutError(
+                "{} messages were not published within {} seconds.".format(
+                    len(not_done), timeout
+                )
+            )
 
     def stop(self) -> None:
         """Immediately publish all outstanding messages.
@@ -586,11 +1677,15 @@ class Client(publisher_client.PublisherClient):
                 If called after publisher has been stopped by a `stop()` method
                 call.
         """
-        with self._batch_lock:
+        with self._all_batch_locks():
             if self._is_stopped:
                 raise RuntimeError("Cannot stop a publisher already stopped.")
 
             self._is_stopped = True
+            self._commit_timer.stop()
+            # The batches that are being committed may still need to retry.
+            if self._retry_scheduler is not None:
+                self._retry_scheduler.stop()
 
             for sequencer in self._sequencers.values():
                 sequencer.stop()
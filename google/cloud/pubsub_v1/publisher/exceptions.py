@@ -42,10 +42,15 @@ class FlowControlLimitError(Exception):
     """An action resulted in exceeding the flow control limits."""
 
 
+class RateLimitExceededError(FlowControlLimitError):
+    """Publishing a message would exceed the client's publish rate limits."""
+
+
 __all__ = (
     "FlowControlLimitError",
     "MessageTooLargeError",
     "PublishError",
+    "RateLimitExceededError",
     "TimeoutError",
     "PublishToPausedOrderingKeyException",
 )
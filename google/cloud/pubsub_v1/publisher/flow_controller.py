@@ -12,10 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from collections import Counter
+from collections import deque
 from collections import OrderedDict
 import logging
 import threading
-from typing import Dict, Optional, Type
+import time
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 import warnings
 
 from google.cloud.pubsub_v1 import types
@@ -28,13 +42,42 @@ _LOGGER = logging.getLogger(__name__)
 MessageType = Type[types.PubsubMessage]  # type: ignore
 
 
+class FlowControlWaitStatistics(NamedTuple):
+    """Statistics of the time spent waiting for flow control capacity."""
+
+    waiting: int
+    "The number of threads that are currently waiting."
+
+    wait_count: int
+    "The number of messages that had to wait before they were added."
+
+    total_wait_time: float
+    "The total number of seconds that those messages waited."
+
+    max_wait_time: float
+    "The longest number of seconds that one of those messages waited."
+
+
 class _QuantityReservation:
     """A (partial) reservation of quantifiable resources."""
 
-    def __init__(self, bytes_reserved: int, bytes_needed: int, has_slot: bool):
+    def __init__(
+        self,
+        bytes_reserved: int,
+        bytes_needed: int,
+        has_slot: bool,
+        wakeup: Optional[threading.Condition] = None,
+    ):
         self.bytes_reserved = bytes_reserved
         self.bytes_needed = bytes_needed
         self.has_slot = has_slot
+        # The condition that the waiting thread is woken up with once the
+        # reservation is satisfied.
+        self.wakeup = wakeup
+
+    def is_satisfied(self) -> bool:
+        """Whether all of the needed resources have been reserved."""
+        return self.bytes_reserved >= self.bytes_needed and self.has_slot
 
     def __repr__(self):
         return (
@@ -72,10 +115,28 @@ class FlowController(object):
         # waiting threads to add, etc.).
         self._operational_lock = threading.Lock()
 
-        # The condition for blocking the flow if capacity is exceeded.
-        self._has_capacity = threading.Condition(lock=self._operational_lock)
+        # Statistics of the threads that waited to add a message.
+        self._wait_count = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def wait_statistics(self) -> FlowControlWaitStatistics:
+        """Statistics of the time spent waiting for flow control capacity.
+
+        Only messages that were added with
+        :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.BLOCK` and
+        had to wait are counted.
+        """
+        with self._operational_lock:
+            return FlowControlWaitStatistics(
+                waiting=len(self._waiting),
+                wait_count=self._wait_count,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
 
-    def add(self, message: MessageType) -> None:
+    def add(self, message: Optional[MessageType], size: Optional[int] = None) -> None:
         """Add a message to flow control.
 
         Adding a message updates the internal load statistics, and an action is
@@ -83,7 +144,11 @@ class FlowController(object):
 
         Args:
             message:
-                The message entering the flow control.
+                The message entering the flow control. It may be ``None`` if
+                the size is given.
+            size:
+                The serialized size of the message, in bytes, if the caller
+                already knows it. It is computed from the message otherwise.
 
         Raises:
             :exception:`~pubsub_v1.publisher.exceptions.FlowControlLimitError`:
@@ -96,10 +161,13 @@ class FlowController(object):
         if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE:
             return
 
+        if size is None:
+            size = message._pb.ByteSize()  # type: ignore[union-attr]
+
         with self._operational_lock:
-            if not self._would_overflow(message):
+            if not self._would_overflow(size):
                 self._message_count += 1
-                self._total_bytes += message._pb.ByteSize()
+                self._total_bytes += size
                 return
 
             # Adding a message would overflow, react.
@@ -112,7 +180,7 @@ class FlowController(object):
                 # load if we accepted the message.
                 load_info = self._load_info(
                     message_count=self._message_count + 1,
-                    total_bytes=self._total_bytes + message._pb.ByteSize(),
+                    total_bytes=self._total_bytes + size,
                 )
                 error_msg = "Flow control limits would be exceeded - {}.".format(
                     load_info
@@ -126,13 +194,8 @@ class FlowController(object):
 
             # Sanity check - if a message exceeds total flow control limits all
             # by itself, it would block forever, thus raise error.
-            if (
-                message._pb.ByteSize() > self._settings.byte_limit
-                or self._settings.message_limit < 1
-            ):
-                load_info = self._load_info(
-                    message_count=1, total_bytes=message._pb.ByteSize()
-                )
+            if size > self._settings.byte_limit or self._settings.message_limit < 1:
+                load_info = self._load_info(message_count=1, total_bytes=size)
                 error_msg = (
                     "Total flow control limits too low for the message, "
                     "would block forever - {}.".format(load_info)
@@ -140,13 +203,18 @@ class FlowController(object):
                 raise exceptions.FlowControlLimitError(error_msg)
 
             current_thread = threading.current_thread()
+            wait_start = time.monotonic()
 
-            while self._would_overflow(message):
-                if current_thread not in self._waiting:
+            while self._would_overflow(size):
+                reservation = self._waiting.get(current_thread)
+                if reservation is None:
+                    # Each thread waits on its own condition, so that it is
+                    # only woken up once its reservation is satisfied.
                     reservation = _QuantityReservation(
                         bytes_reserved=0,
-                        bytes_needed=message._pb.ByteSize(),
+                        bytes_needed=size,
                         has_slot=False,
+                        wakeup=threading.Condition(lock=self._operational_lock),
                     )
                     self._waiting[current_thread] = reservation  # Will be placed last.
 
@@ -155,7 +223,8 @@ class FlowController(object):
                     "{}.".format(self._load_info())
                 )
 
-                self._has_capacity.wait()
+                assert reservation.wakeup is not None
+                reservation.wakeup.wait()
 
                 _LOGGER.debug(
                     "Woke up from waiting on free capacity in the flow - "
@@ -164,25 +233,76 @@ class FlowController(object):
 
             # Message accepted, increase the load and remove thread stats.
             self._message_count += 1
-            self._total_bytes += message._pb.ByteSize()
+            self._total_bytes += size
             self._reserved_bytes -= self._waiting[current_thread].bytes_reserved
             self._reserved_slots -= 1
             del self._waiting[current_thread]
 
-    def release(self, message: MessageType) -> None:
+            wait_time = time.monotonic() - wait_start
+            self._wait_count += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    def add_many(self, sizes: Iterable[int]) -> int:
+        """Add messages to flow control for as long as they fit.
+
+        Unlike :meth:`add`, this method never blocks nor raises an error. The
+        messages are added in order, all under a single lock acquisition,
+        until one of them would exceed the flow control limits, or right away
+        if other threads are already waiting to add their messages.
+
+        Args:
+            sizes:
+                The serialized sizes of the messages entering the flow
+                control, in bytes.
+
+        Returns:
+            The number of messages added, i.e. the length of the leading part
+            of ``sizes`` that was accepted. The remaining messages must be
+            added with :meth:`add`, which reacts to the limits being exceeded
+            as configured.
+        """
+        if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE:
+            return sum(1 for _ in sizes)
+
+        added = 0
+        with self._operational_lock:
+            # Threads that are already blocked have precedence.
+            if self._waiting:
+                return 0
+
+            for size in sizes:
+                if self._would_overflow(size):
+                    break
+                self._message_count += 1
+                self._total_bytes += size
+                added += 1
+
+        return added
+
+    def release(
+        self, message: Optional[MessageType], size: Optional[int] = None
+    ) -> None:
         """Release a mesage from flow control.
 
         Args:
             message:
-                The message entering the flow control.
+                The message leaving the flow control. It may be ``None`` if
+                the size is given.
+            size:
+                The serialized size of the message, in bytes, as passed to
+                :meth:`add`. It is computed from the message if not given.
         """
         if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE:
             return
 
+        if size is None:
+            size = message._pb.ByteSize()  # type: ignore[union-attr]
+
         with self._operational_lock:
             # Releasing a message decreases the load.
             self._message_count -= 1
-            self._total_bytes -= message._pb.ByteSize()
+            self._total_bytes -= size
 
             if self._message_count < 0 or self._total_bytes < 0:
                 warnings.warn(
@@ -194,11 +314,7 @@ class FlowController(object):
                 self._total_bytes = max(0, self._total_bytes)
 
             self._distribute_available_capacity()
-
-            # If at least one thread waiting to add() can be unblocked, wake them up.
-            if self._ready_to_unblock():
-                _LOGGER.debug("Notifying threads waiting to add messages to flow.")
-                self._has_capacity.notify_all()
+            self._wake_up_satisfied()
 
     def _distribute_available_capacity(self) -> None:
         """Distribute available capacity among the waiting threads in FIFO order.
@@ -240,29 +356,30 @@ class FlowController(object):
             self._reserved_bytes += can_give
             available_bytes -= can_give
 
-    def _ready_to_unblock(self) -> bool:
-        """Determine if any of the threads waiting to add a message can proceed.
+    def _wake_up_satisfied(self) -> None:
+        """Wake up the waiting threads whose reservations are satisfied.
+
+        The other threads are left asleep. Since the capacity is distributed
+        in FIFO order, the threads that got a message slot are at the front of
+        the queue, and the search stops at the first one without.
 
         The method assumes that the caller has obtained ``_operational_lock``.
         """
-        if self._waiting:
-            # It's enough to only check the head of the queue, because FIFO
-            # distribution of any free capacity.
-            first_reservation = next(iter(self._waiting.values()))
-            return (
-                first_reservation.bytes_reserved >= first_reservation.bytes_needed
-                and first_reservation.has_slot
-            )
+        for reservation in self._waiting.values():
+            if not reservation.has_slot:
+                break
 
-        return False
+            if reservation.is_satisfied() and reservation.wakeup is not None:
+                _LOGGER.debug("Notifying a thread waiting to add a message to flow.")
+                reservation.wakeup.notify()
 
-    def _would_overflow(self, message: MessageType) -> bool:
+    def _would_overflow(self, message_size: int) -> bool:
         """Determine if accepting a message would exceed flow control limits.
 
         The method assumes that the caller has obtained ``_operational_lock``.
 
         Args:
-            message: The message entering the flow control.
+            message_size: The size of the message entering the flow control.
         """
         reservation = self._waiting.get(threading.current_thread())
 
@@ -273,7 +390,7 @@ class FlowController(object):
             enough_reserved = False
             has_slot = False
 
-        bytes_taken = self._total_bytes + self._reserved_bytes + message._pb.ByteSize()
+        bytes_taken = self._total_bytes + self._reserved_bytes + message_size
         size_overflow = bytes_taken > self._settings.byte_limit and not enough_reserved
 
         msg_count_overflow = not has_slot and (
@@ -311,3 +428,405 @@ class FlowController(object):
             f"bytes: {total_bytes} / {self._settings.byte_limit} "
             f"(reserved: {self._reserved_bytes})"
         )
+
+
+class AsyncFlowController(object):
+    """A flow controller for publishers running on an asyncio event loop.
+
+    The accounting is the same as in :class:`FlowController`, but with
+    ``LimitExceededBehavior.BLOCK`` the :meth:`add` coroutine suspends the
+    calling task instead of blocking the thread. Waiting tasks are admitted
+    strictly in FIFO order as capacity gets released.
+
+    All methods must be called from the event loop thread.
+
+    Args:
+        settings: Desired flow control configuration.
+    """
+
+    def __init__(self, settings: types.PublishFlowControl):
+        self._settings = settings
+
+        # Load statistics. They represent the number of messages added, but not
+        # yet released (and their total size).
+        self._message_count = 0
+        self._total_bytes = 0
+
+        # A FIFO queue of tasks blocked on adding a message, together with the
+        # size of the message each of them wants to add.
+        self._waiting: Deque[Tuple["asyncio.Future[None]", int]] = deque()
+
+    async def add(self, message: MessageType, size: Optional[int] = None) -> None:
+        """Add a message to flow control.
+
+        Adding a message updates the internal load statistics, and an action is
+        taken if these limits are exceeded (depending on the flow control settings).
+
+        Args:
+            message:
+                The message entering the flow control.
+            size:
+                The serialized size of the message, in bytes, if the caller
+                already knows it. It is computed from the message otherwise.
+
+        Raises:
+            :exception:`~pubsub_v1.publisher.exceptions.FlowControlLimitError`:
+                Raised when the desired action is
+                :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.ERROR` and
+                the message would exceed flow control limits, or when the desired action
+                is :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.BLOCK` and
+                the message would block forever against the flow control limits.
+        """
+        if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        message_size = message._pb.ByteSize() if size is None else size
+
+        # Tasks that are already waiting have precedence over the new message.
+        if not self._waiting and not self._would_overflow(message_size):
+            self._message_count += 1
+            self._total_bytes += message_size
+            return
+
+        if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.ERROR:
+            load_info = self._load_info(
+                message_count=self._message_count + 1,
+                total_bytes=self._total_bytes + message_size,
+            )
+            error_msg = "Flow control limits would be exceeded - {}.".format(load_info)
+            raise exceptions.FlowControlLimitError(error_msg)
+
+        assert (
+            self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.BLOCK
+        )
+
+        # Sanity check - if a message exceeds total flow control limits all
+        # by itself, it would block forever, thus raise error.
+        if message_size > self._settings.byte_limit or self._settings.message_limit < 1:
+            load_info = self._load_info(message_count=1, total_bytes=message_size)
+            error_msg = (
+                "Total flow control limits too low for the message, "
+                "would block forever - {}.".format(load_info)
+            )
+            raise exceptions.FlowControlLimitError(error_msg)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiting.append((waiter, message_size))
+
+        _LOGGER.debug(
+            "Waiting until there is enough free capacity in the flow - "
+            "{}.".format(self._load_info())
+        )
+
+        try:
+            # The load is increased on our behalf by the task that wakes us up.
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Capacity was granted just before the cancellation, give it back.
+                self._message_count -= 1
+                self._total_bytes -= message_size
+            self._admit_waiting()
+            raise
+
+    def release(self, message: MessageType, size: Optional[int] = None) -> None:
+        """Release a mesage from flow control.
+
+        Args:
+            message:
+                The message entering the flow control.
+            size:
+                The serialized size of the message, in bytes, as passed to
+                :meth:`add`. It is computed from the message if not given.
+        """
+        if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        if size is None:
+            size = message._pb.ByteSize()
+
+        # Releasing a message decreases the load.
+        self._message_count -= 1
+        self._total_bytes -= size
+
+        if self._message_count < 0 or self._total_bytes < 0:
+            warnings.warn(
+                "Releasing a message that was never added or already released.",
+                category=RuntimeWarning,
+                stacklevel=2,
+            )
+            self._message_count = max(0, self._message_count)
+            self._total_bytes = max(0, self._total_bytes)
+
+        self._admit_waiting()
+
+    def _admit_waiting(self) -> None:
+        """Wake up the waiting tasks, in FIFO order, that now fit into the flow."""
+        while self._waiting:
+            waiter, message_size = self._waiting[0]
+            if waiter.done():  # The waiting task has been cancelled.
+                self._waiting.popleft()
+                continue
+
+            if self._would_overflow(message_size):
+                break
+
+            self._waiting.popleft()
+            self._message_count += 1
+            self._total_bytes += message_size
+            waiter.set_result(None)
+
+    def _would_overflow(self, message_size: int) -> bool:
+        """Determine if accepting a message would exceed flow control limits.
+
+        Args:
+            message_size: The size of the message entering the flow control.
+        """
+        size_overflow = self._total_bytes + message_size > self._settings.byte_limit
+        msg_count_overflow = self._message_count + 1 > self._settings.message_limit
+        return size_overflow or msg_count_overflow
+
+    def _load_info(
+        self, message_count: Optional[int] = None, total_bytes: Optional[int] = None
+    ) -> str:
+        """Return the current flow control load information.
+
+        Args:
+            message_count:
+                The value to override the current message count with.
+            total_bytes:
+                The value to override the current total bytes with.
+        """
+        if message_count is None:
+            message_count = self._message_count
+
+        if total_bytes is None:
+            total_bytes = self._total_bytes
+
+        return (
+            f"messages: {message_count} / {self._settings.message_limit} "
+            f"(waiting: {len(self._waiting)}), "
+            f"bytes: {total_bytes} / {self._settings.byte_limit}"
+        )
+
+
+class _TokenBucket(object):
+    """A token bucket that may go into debt.
+
+    Tokens are added at a constant rate, up to the capacity of the bucket.
+    Taking more tokens than there are leaves the bucket in debt, which the
+    next takers have to wait out, so that they are spread evenly over time.
+
+    The bucket is not thread-safe.
+
+    Args:
+        rate: The number of tokens added per second.
+        burst_seconds: How many seconds worth of tokens the bucket holds.
+        now: The current :func:`time.monotonic` time.
+    """
+
+    def __init__(self, rate: float, burst_seconds: float, now: float):
+        self._rate = rate
+        self._capacity = rate * burst_seconds
+        self._tokens = self._capacity
+        self._updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Return how many seconds to wait until the tokens can be taken."""
+        self._tokens = min(
+            self._tokens + (now - self._updated) * self._rate, self._capacity
+        )
+        self._updated = now
+        return max(amount - self._tokens, 0.0) / self._rate
+
+    def take(self, amount: float) -> None:
+        """Take tokens from the bucket, going into debt if there are too few.
+
+        Must be called right after :meth:`delay`.
+        """
+        self._tokens -= amount
+
+
+class RateLimiter(object):
+    """Limits the rate at which the publisher client publishes messages.
+
+    There is a token bucket for the messages and one for the bytes of the
+    whole client, and the same per topic, as configured. A message takes its
+    tokens from all buckets that apply to it right away, and then waits until
+    none of them is in debt anymore. Thus, publishers that are over the limit
+    are delayed in the order in which they arrived, and by just as much as
+    needed.
+
+    Public methods are thread-safe.
+
+    Args:
+        settings: Desired rate limit configuration.
+
+    Raises:
+        ValueError: If a rate or the burst duration is not positive.
+    """
+
+    def __init__(self, settings: types.PublishRateLimit):
+        rates = (
+            settings.messages_per_second,
+            settings.bytes_per_second,
+            settings.topic_messages_per_second,
+            settings.topic_bytes_per_second,
+        )
+        if any(rate is not None and rate <= 0 for rate in rates):
+            raise ValueError("The rates of rate_limit must be positive.")
+        if settings.burst_seconds <= 0:
+            raise ValueError("The burst_seconds of rate_limit must be positive.")
+
+        self._settings = settings
+        now = time.monotonic()
+        self._buckets: List[Tuple[_TokenBucket, bool]] = []
+        if settings.messages_per_second is not None:
+            bucket = _TokenBucket(
+                settings.messages_per_second, settings.burst_seconds, now
+            )
+            self._buckets.append((bucket, False))
+        if settings.bytes_per_second is not None:
+            bucket = _TokenBucket(
+                settings.bytes_per_second, settings.burst_seconds, now
+            )
+            self._buckets.append((bucket, True))
+        # topic => the token buckets of the topic, and whether they count bytes
+        self._topic_buckets: Dict[str, List[Tuple[_TokenBucket, bool]]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, topic: str, message_count: int, byte_count: int) -> float:
+        """Take the tokens for publishing messages to a topic.
+
+        Args:
+            topic: The topic the messages are published to.
+            message_count: The number of messages.
+            byte_count: The total size of the messages, in bytes.
+
+        Returns:
+            The number of seconds that the caller must wait before publishing
+            the messages.
+
+        Raises:
+            :exception:`~pubsub_v1.publisher.exceptions.RateLimitExceededError`:
+                Raised when the desired action is
+                :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.ERROR`
+                and the messages do not fit into the rate limits right now. No
+                tokens are taken then.
+        """
+        return self._reserve([topic], message_count, byte_count)
+
+    def _reserve(
+        self, topics: Sequence[str], message_count: int, byte_count: int
+    ) -> float:
+        """Take the tokens for publishing the same messages to each of the
+        topics, all at once.
+
+        See :meth:`reserve`. If the messages do not fit into the rate limits
+        of one of the topics, no tokens are taken for any of them.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.IGNORE:
+            return 0.0
+
+        with self._lock:
+            # The client-wide buckets count the messages once per topic.
+            demands = [(self._buckets, len(topics))]
+            for topic, times in Counter(topics).items():
+                topic_buckets = self._topic_buckets.get(topic)
+                if topic_buckets is None:
+                    topic_buckets = self._create_topic_buckets()
+                    self._topic_buckets[topic] = topic_buckets
+                demands.append((topic_buckets, times))
+
+            now = time.monotonic()
+            delay = 0.0
+            for buckets, times in demands:
+                for bucket, counts_bytes in buckets:
+                    amount = byte_count if counts_bytes else message_count
+                    delay = max(delay, bucket.delay(amount * times, now))
+
+            if delay > 0 and behavior == types.LimitExceededBehavior.ERROR:
+                raise exceptions.RateLimitExceededError(
+                    "Publish rate limits would be exceeded - messages: {}, "
+                    "bytes: {}, retry in {:.3f}s.".format(
+                        message_count * len(topics), byte_count * len(topics), delay
+                    )
+                )
+
+            for buckets, times in demands:
+                for bucket, counts_bytes in buckets:
+                    amount = byte_count if counts_bytes else message_count
+                    bucket.take(amount * times)
+
+        return delay
+
+    def acquire(self, topic: str, message_count: int, byte_count: int) -> None:
+        """Wait until messages may be published to a topic.
+
+        Takes the tokens like :meth:`reserve`, and blocks the calling thread
+        for as long as needed.
+        """
+        delay = self.reserve(topic, message_count, byte_count)
+        if delay > 0:
+            _LOGGER.debug("Delaying the publish by %s seconds to stay in rate.", delay)
+            time.sleep(delay)
+
+    def acquire_fanout(
+        self, topics: Sequence[str], message_count: int, byte_count: int
+    ) -> None:
+        """Wait until the same messages may be published to several topics.
+
+        The tokens of all topics are taken at once. Thus with
+        :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.ERROR`,
+        either the tokens of all topics are taken, or none.
+
+        Args:
+            topics: The topics the messages are published to.
+            message_count: The number of messages.
+            byte_count: The total size of the messages, in bytes.
+
+        Raises:
+            :exception:`~pubsub_v1.publisher.exceptions.RateLimitExceededError`:
+                Raised when the desired action is
+                :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.ERROR`
+                and the messages do not fit into the rate limits of one of the
+                topics right now.
+        """
+        delay = self._reserve(topics, message_count, byte_count)
+        if delay > 0:
+            _LOGGER.debug("Delaying the publish by %s seconds to stay in rate.", delay)
+            time.sleep(delay)
+
+    async def acquire_async(
+        self, topic: str, message_count: int, byte_count: int
+    ) -> None:
+        """Wait until messages may be published to a topic.
+
+        Takes the tokens like :meth:`reserve`, and suspends the calling task
+        for as long as needed.
+        """
+        delay = self.reserve(topic, message_count, byte_count)
+        if delay > 0:
+            _LOGGER.debug("Delaying the publish by %s seconds to stay in rate.", delay)
+            await asyncio.sleep(delay)
+
+    def _create_topic_buckets(self) -> List[Tuple[_TokenBucket, bool]]:
+        """Create the token buckets of a topic.
+
+        The caller must hold ``_lock``.
+        """
+        settings = self._settings
+        now = time.monotonic()
+        buckets = []
+        if settings.topic_messages_per_second is not None:
+            bucket = _TokenBucket(
+                settings.topic_messages_per_second, settings.burst_seconds, now
+            )
+            buckets.append((bucket, False))
+        if settings.topic_bytes_per_second is not None:
+            bucket = _TokenBucket(
+                settings.topic_bytes_per_second, settings.burst_seconds, now
+            )
+            buckets.append((bucket, True))
+        return buckets
@@ -14,8 +14,10 @@
 
 from __future__ import absolute_import
 
+from concurrent.futures import _base
+import threading
 import typing
-from typing import Any, Callable, Union
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 from google.cloud.pubsub_v1 import futures
 
@@ -81,3 +83,183 @@ class Future(futures.Future):
                 callables are called in the order that they were added.
         """
         return super().add_done_callback(callback)  # type: ignore
+
+
+class _BatchResult(object):
+    """The shared outcome of publishing a batch of messages.
+
+    Instead of allocating a full :class:`Future`, with its own condition
+    variable, for each message of a batch, the batch hands out lightweight
+    :class:`_MessageFuture` views that all wait on the single condition of
+    this object, and read their message ID from the array of message IDs
+    returned by the backend.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._state = _base.PENDING
+        self._message_ids: Optional[Sequence[str]] = None
+        self._exception: Optional[BaseException] = None
+        self._size = 0
+        # The futures with waiters or done callbacks to notify on completion.
+        self._observed: List["_MessageFuture"] = []
+
+    def new_future(self) -> "_MessageFuture":
+        """Return the future of the next message added to the batch."""
+        future = _MessageFuture(self, self._size)
+        self._size += 1
+        return future
+
+    def done(self) -> bool:
+        """Return ``True`` if the outcome of the batch is known."""
+        return self._state == _base.FINISHED
+
+    def set_result(self, message_ids: Sequence[str]) -> None:
+        """Resolve the futures of all messages with their message IDs.
+
+        Args:
+            message_ids:
+                The IDs of the published messages, in the order in which the
+                futures have been created.
+        """
+        with self._condition:
+            self._check_pending()
+            self._message_ids = message_ids
+            self._state = _base.FINISHED
+            for future in self._observed:
+                for waiter in future._waiters:
+                    waiter.add_result(future)
+            self._condition.notify_all()
+        self._invoke_callbacks()
+
+    def set_exception(self, exception: BaseException) -> None:
+        """Fail the futures of all messages with the same exception.
+
+        Args:
+            exception: The reason why the batch failed.
+        """
+        with self._condition:
+            self._check_pending()
+            self._exception = exception
+            self._state = _base.FINISHED
+            for future in self._observed:
+                for waiter in future._waiters:
+                    waiter.add_exception(future)
+            self._condition.notify_all()
+        self._invoke_callbacks()
+
+    def _check_pending(self) -> None:
+        if self._state != _base.PENDING:
+            raise _base.InvalidStateError(
+                "{}: the batch result is already set".format(self._state)
+            )
+
+    def _invoke_callbacks(self) -> None:
+        for future in self._observed:
+            future._invoke_callbacks()
+
+
+class _MessageFuture(Future):
+    """The future of a single message, backed by the result of its batch.
+
+    The state of :class:`~concurrent.futures.Future` is exposed through
+    properties that read from the shared :class:`_BatchResult`, thus the
+    inherited methods, as well as :func:`concurrent.futures.wait` and
+    :func:`concurrent.futures.as_completed`, work unchanged. The lists of
+    waiters and done callbacks are only created when they are needed.
+
+    Args:
+        batch_result: The shared outcome of the batch.
+        index: The position of the message in the batch.
+    """
+
+    # Deliberately not calling the superclass initializer, which would
+    # allocate a condition and the lists that this class is meant to avoid.
+    def __init__(self, batch_result: _BatchResult, index: int):
+        self._batch_result = batch_result
+        self._index = index
+        self._waiters_list: Optional[list] = None
+        self._done_callbacks_list: Optional[list] = None
+
+    @property
+    def _condition(self) -> threading.Condition:
+        return self._batch_result._condition
+
+    @property
+    def _state(self) -> str:
+        return self._batch_result._state
+
+    @property
+    def _result(self) -> Optional[str]:
+        message_ids = self._batch_result._message_ids
+        return None if message_ids is None else message_ids[self._index]
+
+    @property
+    def _exception(self) -> Optional[BaseException]:
+        return self._batch_result._exception
+
+    @property
+    def _waiters(self) -> list:
+        # Only accessed while holding the shared condition.
+        if self._waiters_list is None:
+            self._waiters_list = []
+            self._observe()
+        return self._waiters_list
+
+    @property
+    def _done_callbacks(self) -> list:
+        # Only accessed while holding the shared condition.
+        if self._done_callbacks_list is None:
+            self._done_callbacks_list = []
+            self._observe()
+        return self._done_callbacks_list
+
+    def _observe(self) -> None:
+        if self._waiters_list is None or self._done_callbacks_list is None:
+            # Only register once, the first of the two lists was just created.
+            self._batch_result._observed.append(self)
+
+    def _invoke_callbacks(self) -> None:
+        if self._done_callbacks_list:
+            super()._invoke_callbacks()
+
+    def set_result(self, result: Any):
+        """Not supported, the result is set by the batch for all of its messages."""
+        raise NotImplementedError("The result is set by the batch.")
+
+    def set_exception(self, exception: Optional[BaseException]):
+        """Not supported, the result is set by the batch for all of its messages."""
+        raise NotImplementedError("The result is set by the batch.")
+
+
+def _gather(publish_futures: Sequence[Future]) -> Future:
+    """Return a future that is done once all of the given futures are done.
+
+    The future resolves to the list of the message IDs of the given futures,
+    in the same order, or fails with the exception of the first of the given
+    futures that failed.
+
+    Args:
+        publish_futures: The futures to wait for. Must not be empty.
+    """
+    result = Future()
+    lock = threading.Lock()
+    remaining = len(publish_futures)
+
+    def on_done(_):
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining:
+                return
+
+        for future in publish_futures:
+            exception = future.exception()
+            if exception is not None:
+                result.set_exception(exception)
+                return
+        result.set_result([future.result() for future in publish_futures])
+
+    for future in publish_futures:
+        future.add_done_callback(on_done)
+    return result
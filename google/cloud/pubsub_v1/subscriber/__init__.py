@@ -14,7 +14,8 @@
 
 from __future__ import absolute_import
 
+from google.cloud.pubsub_v1.subscriber.async_client import AsyncClient
 from google.cloud.pubsub_v1.subscriber.client import Client
 
 
-__all__ = ("Client",)
+__all__ = ("AsyncClient", "Client")
@@ -0,0 +1,1128 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+from __future__ import division
+
+import asyncio
+import collections
+import inspect
+import itertools
+import logging
+import random
+import time
+import typing
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+import uuid
+
+from google.api_core import exceptions
+from google.api_core.retry import exponential_sleep_generator
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
+from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
+from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
+from google.cloud.pubsub_v1.subscriber._protocol import histogram
+from google.cloud.pubsub_v1.subscriber._protocol import leaser
+from google.cloud.pubsub_v1.subscriber._protocol import messages_on_hold
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+from google.cloud.pubsub_v1.subscriber.exceptions import (
+    AcknowledgeError,
+    AcknowledgeStatus,
+)
+import google.cloud.pubsub_v1.subscriber.message
+from google.pubsub_v1 import types as gapic_types
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.pubsub_v1.subscriber import async_client
+
+
+_LOGGER = logging.getLogger(__name__)
+_CALLBACK_EXCEPTION_LOGGER = logging.getLogger("callback-exceptions")
+
+_MIN_STREAM_REOPEN_DELAY = 0.1
+"""The time to wait before reopening a stream that has just been reopened."""
+
+_MAX_STREAM_REOPEN_DELAY = 10
+"""The maximum time to wait before reopening a stream that keeps failing."""
+
+MessageCallback = Callable[
+    ["google.cloud.pubsub_v1.subscriber.message.Message"],
+    Union[Awaitable[Any], Any],
+]
+
+AckRequestType = Union[requests.AckRequest, requests.ModAckRequest]
+
+
+class _RequestQueue(object):
+    """The queue through which the messages send their requests to the manager.
+
+    Messages put their ack, nack and other requests into it, just like into the
+    queue of a scheduler. Requests put from a thread other than the one running
+    the event loop are handed over to the loop.
+
+    Args:
+        loop: The event loop on which the requests are processed.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    def put(self, item: Any) -> None:
+        """Put a request into the queue, without blocking."""
+        try:
+            running_loop: Optional[
+                asyncio.AbstractEventLoop
+            ] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._queue.put_nowait(item)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+
+    async def get_many(self, max_items: int, max_latency: float) -> List[Any]:
+        """Get the next batch of requests.
+
+        Waits for the first request, and then for up to ``max_latency``
+        seconds for more of them.
+
+        Args:
+            max_items: The maximum number of requests to return.
+            max_latency: The maximum time to wait for more requests.
+
+        Returns:
+            At least one request.
+        """
+        items = [await self._queue.get()]
+        deadline = self._loop.time() + max_latency
+
+        while len(items) < max_items:
+            try:
+                items.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return items
+
+
+class AsyncStreamingPullManager(object):
+    """The asyncio streaming pull manager pulls messages from Pub/Sub on the
+    event loop, leases them, and awaits the callback for each of them.
+
+    This is the :mod:`asyncio` counterpart of
+    :class:`~.streaming_pull_manager.StreamingPullManager`. Reading the stream,
+    maintaining the leases, and sending the acks and modacks all run as tasks
+    on the event loop that opened the manager, and so does each invocation of
+    the callback. No threads are started.
+
+    Args:
+        client:
+            The subscriber client used to create this instance.
+        subscription:
+            The name of the subscription. The canonical format for this is
+            ``projects/{project}/subscriptions/{subscription}``.
+        flow_control:
+            The flow control settings.
+        use_legacy_flow_control:
+            If set to ``True``, flow control at the Cloud Pub/Sub server is disabled,
+            though client-side flow control is still enabled. If set to ``False``
+            (default), both server-side and client-side flow control are enabled.
+        await_callbacks_on_shutdown:
+            If ``True``, the shutdown waits for the running callbacks to finish
+            before stopping the remaining tasks. If ``False`` (default), the
+            running callbacks are cancelled, and their messages are nacked.
+    """
+
+    def __init__(
+        self,
+        client: "async_client.AsyncClient",
+        subscription: str,
+        flow_control: types.FlowControl = types.FlowControl(),
+        use_legacy_flow_control: bool = False,
+        await_callbacks_on_shutdown: bool = False,
+    ):
+        self._client = client
+        self._subscription = subscription
+        self._exactly_once_enabled = False
+        self._flow_control = flow_control
+        self._use_legacy_flow_control = use_legacy_flow_control
+        self._await_callbacks_on_shutdown = await_callbacks_on_shutdown
+        self._ack_histogram = histogram.Histogram()
+        self._last_histogram_size = 0
+        self._stream_metadata = [
+            ("x-goog-request-params", "subscription=" + subscription)
+        ]
+
+        # The stream ACK deadline is bound the same way as by the threaded
+        # manager.
+        max_extension = self._flow_control.max_duration_per_lease_extension
+        if max_extension == 0:
+            self._stream_ack_deadline = (
+                streaming_pull_manager._DEFAULT_STREAM_ACK_DEADLINE
+            )
+        else:
+            self._stream_ack_deadline = min(
+                max(max_extension, streaming_pull_manager._MIN_STREAM_ACK_DEADLINE),
+                streaming_pull_manager._MAX_STREAM_ACK_DEADLINE,
+            )
+
+        self._ack_deadline = max(
+            min(
+                self._flow_control.min_duration_per_lease_extension,
+                histogram.MAX_ACK_DEADLINE,
+            ),
+            histogram.MIN_ACK_DEADLINE,
+        )
+
+        self._callback: Optional[MessageCallback] = None
+        self._on_callback_error: Optional[Callable[[BaseException], Any]] = None
+        self._closing = False
+        self._closed = False
+        self._close_callbacks: List[
+            Callable[["AsyncStreamingPullManager", Any], Any]
+        ] = []
+        self._send_new_ack_deadline = False
+
+        # All streams (initial and re-opened) use the same client id, so that
+        # the server can establish affinity across them.
+        self._client_id = str(uuid.uuid4())
+
+        # A collection for the messages that have been received from the server,
+        # but not yet sent to the user callback.
+        self._messages_on_hold = messages_on_hold.MessagesOnHold()
+
+        # The total number of bytes consumed by the messages currently on hold
+        self._on_hold_bytes = 0
+
+        # Set while the load allows for reading more responses from the stream.
+        self._resumed: Optional[asyncio.Event] = None
+
+        # The objects created in ``.open()``. The leaser only does the
+        # bookkeeping of the leased messages, its thread is never started.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_queue: Optional[_RequestQueue] = None
+        self._leaser: Optional[leaser.Leaser] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._lease_maintainer: Optional[asyncio.Task] = None
+        # callback task => the message it was started for
+        self._callback_tasks: Dict[
+            asyncio.Task, "google.cloud.pubsub_v1.subscriber.message.Message"
+        ] = {}
+        self._retry_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def is_active(self) -> bool:
+        """``True`` if this manager is actively streaming.
+
+        Note that ``False`` does not indicate this is complete shut down,
+        just that it stopped getting new messages.
+        """
+        return self._consumer is not None and not self._consumer.done()
+
+    @property
+    def flow_control(self) -> types.FlowControl:
+        """The active flow control settings."""
+        return self._flow_control
+
+    @property
+    def ack_histogram(self) -> histogram.Histogram:
+        """The histogram tracking time-to-acknowledge."""
+        return self._ack_histogram
+
+    @property
+    def ack_deadline(self) -> float:
+        """Return the current ACK deadline based on historical data without updating it.
+
+        Returns:
+            The ack deadline.
+        """
+        return self._ack_deadline
+
+    def _obtain_ack_deadline(self, maybe_update: bool) -> float:
+        """Return the current ACK deadline, and update it first if requested.
+
+        The deadline is only recomputed if the histogram with past
+        time-to-ack data has gained a significant amount of new information.
+        See :meth:`.StreamingPullManager._obtain_ack_deadline`.
+
+        Args:
+            maybe_update:
+                If ``True``, also update the current ACK deadline before returning it if
+                enough new ACK data has been gathered.
+
+        Returns:
+            The current ACK deadline in seconds to use.
+        """
+        if not maybe_update:
+            return self._ack_deadline
+
+        target_size = min(
+            self._last_histogram_size * 2, self._last_histogram_size + 100
+        )
+        hist_size = len(self.ack_histogram)
+
+        if hist_size > target_size:
+            self._last_histogram_size = hist_size
+            self._ack_deadline = self.ack_histogram.percentile(percent=99)
+
+        if self.flow_control.max_duration_per_lease_extension > 0:
+            # The setting in flow control could be too low, adjust if needed.
+            flow_control_setting = max(
+                self.flow_control.max_duration_per_lease_extension,
+                histogram.MIN_ACK_DEADLINE,
+            )
+            self._ack_deadline = min(self._ack_deadline, flow_control_setting)
+
+        # If the user explicitly sets a min ack_deadline, respect it.
+        if self.flow_control.min_duration_per_lease_extension > 0:
+            # The setting in flow control could be too high, adjust if needed.
+            flow_control_setting = min(
+                self.flow_control.min_duration_per_lease_extension,
+                histogram.MAX_ACK_DEADLINE,
+            )
+            self._ack_deadline = max(self._ack_deadline, flow_control_setting)
+        elif self._exactly_once_enabled:
+            # Higher minimum ack_deadline for subscriptions with
+            # exactly-once delivery enabled.
+            self._ack_deadline = max(
+                self._ack_deadline,
+                streaming_pull_manager._MIN_ACK_DEADLINE_SECS_WHEN_EXACTLY_ONCE_ENABLED,
+            )
+        # If we have updated the ack_deadline and it is longer than the stream_ack_deadline
+        # set the stream_ack_deadline to the new ack_deadline.
+        if self._ack_deadline > self._stream_ack_deadline:
+            self._stream_ack_deadline = self._ack_deadline
+        return self._ack_deadline
+
+    @property
+    def load(self) -> float:
+        """Return the current load.
+
+        The load is represented as a float, where 1.0 represents having
+        hit one of the flow control limits, and values between 0.0 and 1.0
+        represent how close we are to them. Messages on hold do not count
+        towards it.
+
+        Returns:
+            The load value.
+        """
+        if self._leaser is None:
+            return 0.0
+
+        return max(
+            [
+                (self._leaser.message_count - self._messages_on_hold.size)
+                / self._flow_control.max_messages,
+                (self._leaser.bytes - self._on_hold_bytes)
+                / self._flow_control.max_bytes,
+            ]
+        )
+
+    def add_close_callback(
+        self, callback: Callable[["AsyncStreamingPullManager", Any], Any]
+    ) -> None:
+        """Schedules a callable when the manager closes.
+
+        Args:
+            The method to call.
+        """
+        self._close_callbacks.append(callback)
+
+    def _exactly_once_delivery_enabled(self) -> bool:
+        """Whether exactly-once delivery is enabled for the subscription."""
+        return self._exactly_once_enabled
+
+    def maybe_pause_consumer(self) -> None:
+        """Check the current load and stop reading the stream if needed."""
+        assert self._resumed is not None
+        if self.load >= streaming_pull_manager._MAX_LOAD and self._resumed.is_set():
+            _LOGGER.debug(
+                "Message backlog over load at %.2f, initiating client-side flow control",
+                self.load,
+            )
+            self._resumed.clear()
+
+    def maybe_resume_consumer(self) -> None:
+        """Release the held messages, and resume reading the stream if the load
+        allows for it."""
+        assert self._resumed is not None
+        if self._resumed.is_set():
+            return
+
+        self._maybe_release_messages()
+
+        if self.load < streaming_pull_manager._RESUME_THRESHOLD:
+            _LOGGER.debug(
+                "Current load is %.2f, suspending client-side flow control.",
+                self.load,
+            )
+            self._resumed.set()
+
+    def _maybe_release_messages(self) -> None:
+        """Release (some of) the held messages if the current load allows for it.
+
+        Each released message is scheduled to be passed to the callback.
+        """
+        released_ack_ids = []
+        while self.load < streaming_pull_manager._MAX_LOAD:
+            msg = self._messages_on_hold.get()
+            if not msg:
+                break
+            self._schedule_message_on_hold(msg)
+            released_ack_ids.append(msg.ack_id)
+
+        assert self._leaser is not None
+        self._leaser.start_lease_expiry_timer(released_ack_ids)
+
+    def _activate_ordering_keys(self, ordering_keys: Iterable[str]) -> None:
+        """Schedule the next held message of each of the given ordering keys."""
+        if self._closing:
+            return  # We are shutting down, don't try to dispatch any more messages.
+
+        self._messages_on_hold.activate_ordering_keys(
+            ordering_keys, self._schedule_message_on_hold
+        )
+
+    def _schedule_message_on_hold(
+        self, msg: "google.cloud.pubsub_v1.subscriber.message.Message"
+    ) -> None:
+        """Start a task awaiting the callback for a message released from hold.
+
+        Args:
+            msg: The message to send to the callback.
+        """
+        self._on_hold_bytes = max(self._on_hold_bytes - msg.size, 0)
+
+        assert self._loop is not None
+        task = self._loop.create_task(self._run_callback(msg))
+        self._callback_tasks[task] = msg
+        task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task) -> None:
+        del self._callback_tasks[task]
+
+    async def _run_callback(
+        self, message: "google.cloud.pubsub_v1.subscriber.message.Message"
+    ) -> None:
+        """Run the callback for a message, and nack it if the callback fails.
+
+        Args:
+            message: The Pub/Sub message.
+        """
+        assert self._callback is not None
+        assert self._on_callback_error is not None
+        try:
+            result = self._callback(message)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as exc:
+            _CALLBACK_EXCEPTION_LOGGER.exception(
+                "Message (id=%s, ack_id=%s, ordering_key=%s)'s callback threw "
+                "exception, nacking message.",
+                message.message_id,
+                message.ack_id,
+                message.ordering_key,
+            )
+            message.nack()
+            self._on_callback_error(exc)
+
+    def _start_retry(self, coro: Coroutine[Any, Any, None]) -> None:
+        assert self._loop is not None
+        task = self._loop.create_task(coro)
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    def open(
+        self,
+        callback: MessageCallback,
+        on_callback_error: Callable[[BaseException], Any],
+    ) -> None:
+        """Begin consuming messages.
+
+        Must be called from a coroutine running on the event loop that the
+        manager then uses.
+
+        Args:
+            callback:
+                A callback that will be called for each message received on the
+                stream. If it returns an awaitable, the awaitable is awaited.
+            on_callback_error:
+                A callable that will be called if an exception is raised in
+                the provided `callback`.
+        """
+        if self.is_active:
+            raise ValueError("This manager is already open.")
+
+        if self._closed:
+            raise ValueError("This manager has been closed and can not be re-used.")
+
+        self._callback = callback
+        self._on_callback_error = on_callback_error
+
+        self._loop = asyncio.get_running_loop()
+        self._request_queue = _RequestQueue(self._loop)
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._leaser = leaser.Leaser(self)  # type: ignore[arg-type]
+
+        _LOGGER.debug(
+            "Creating a stream, default ACK deadline set to %s seconds.",
+            self._stream_ack_deadline,
+        )
+
+        self._dispatcher = self._loop.create_task(self._dispatch())
+        self._consumer = self._loop.create_task(self._consume())
+        self._lease_maintainer = self._loop.create_task(self._maintain_leases())
+
+    def close(self, reason: Any = None) -> None:
+        """Stop consuming messages and shutdown all tasks.
+
+        This method is idempotent. Additional calls will have no effect.
+
+        The method does not block, it starts the shutdown as a task on the event
+        loop. It may be called from any thread.
+
+        Args:
+            reason:
+                The reason to close this. If ``None``, this is considered
+                an "intentional" shutdown. This is passed to the callbacks
+                specified via :meth:`add_close_callback`.
+        """
+        assert self._loop is not None
+        self._loop.call_soon_threadsafe(self._start_shutdown, reason)
+
+    def _start_shutdown(self, reason: Any) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        assert self._loop is not None
+        self._loop.create_task(self._shutdown(reason))
+
+    async def _shutdown(self, reason: Any = None) -> None:
+        """Run the actual shutdown sequence (stop the stream and all tasks).
+
+        Args:
+            reason:
+                The reason to close the stream. If ``None``, this is considered
+                an "intentional" shutdown.
+        """
+        # Stop consuming messages.
+        assert self._consumer is not None
+        self._consumer.cancel()
+        await asyncio.gather(self._consumer, return_exceptions=True)
+
+        _LOGGER.debug("Stopping callbacks.")
+        callback_tasks = dict(self._callback_tasks)
+        if not self._await_callbacks_on_shutdown:
+            for task in callback_tasks:
+                task.cancel()
+        await asyncio.gather(*callback_tasks, return_exceptions=True)
+        # The messages of the cancelled callbacks are redelivered.
+        for task, msg in callback_tasks.items():
+            if task.cancelled():
+                msg.nack()
+
+        _LOGGER.debug("Stopping lease maintainer.")
+        assert self._lease_maintainer is not None
+        self._lease_maintainer.cancel()
+        await asyncio.gather(self._lease_maintainer, return_exceptions=True)
+
+        held_messages = self._messages_on_hold._messages_on_hold
+        _LOGGER.debug(
+            "NACK-ing all not-yet-dispatched messages (total: %s).", len(held_messages)
+        )
+        for msg in held_messages:
+            msg.nack()
+
+        # The dispatcher sends all requests that have been queued so far.
+        _LOGGER.debug("Stopping dispatcher.")
+        assert self._request_queue is not None
+        assert self._dispatcher is not None
+        self._request_queue.put(helper_threads.STOP)
+        await asyncio.gather(self._dispatcher, return_exceptions=True)
+
+        for task in list(self._retry_tasks):
+            task.cancel()
+        await asyncio.gather(*self._retry_tasks, return_exceptions=True)
+
+        self._closed = True
+        _LOGGER.debug("Finished stopping manager.")
+
+        for callback in self._close_callbacks:
+            callback(self, reason)
+
+    def _get_initial_request(self) -> gapic_types.StreamingPullRequest:
+        """Return the initial request for the RPC.
+
+        Returns:
+            A request suitable for being the first request on the stream (and not
+            suitable for any other purpose).
+        """
+        return gapic_types.StreamingPullRequest(
+            stream_ack_deadline_seconds=self._stream_ack_deadline,
+            modify_deadline_ack_ids=[],
+            modify_deadline_seconds=[],
+            subscription=self._subscription,
+            client_id=self._client_id,
+            max_outstanding_messages=(
+                0 if self._use_legacy_flow_control else self._flow_control.max_messages
+            ),
+            max_outstanding_bytes=(
+                0 if self._use_legacy_flow_control else self._flow_control.max_bytes
+            ),
+        )
+
+    async def _stream_requests(self):
+        """Yield the requests sent on a stream: the initial request, and then a
+        heartbeat request periodically."""
+        yield self._get_initial_request()
+
+        while True:
+            await asyncio.sleep(heartbeater._DEFAULT_PERIOD)
+
+            if self._send_new_ack_deadline:
+                self._send_new_ack_deadline = False
+                _LOGGER.debug(
+                    "Sending new ack_deadline of %d seconds.", self._stream_ack_deadline
+                )
+                yield gapic_types.StreamingPullRequest(
+                    stream_ack_deadline_seconds=self._stream_ack_deadline
+                )
+            else:
+                yield gapic_types.StreamingPullRequest()
+
+    async def _consume(self) -> None:
+        """Read the responses from the stream, and reopen it when it ends
+        without a terminating error."""
+        reopen_delays = exponential_sleep_generator(
+            initial=_MIN_STREAM_REOPEN_DELAY, maximum=_MAX_STREAM_REOPEN_DELAY
+        )
+        assert self._resumed is not None
+
+        while True:
+            try:
+                stream = await self._client.streaming_pull(
+                    requests=self._stream_requests(),
+                    metadata=self._stream_metadata,
+                )
+                async for response in stream:
+                    await self._on_response(response)
+                    reopen_delays = exponential_sleep_generator(
+                        initial=_MIN_STREAM_REOPEN_DELAY,
+                        maximum=_MAX_STREAM_REOPEN_DELAY,
+                    )
+                    await self._resumed.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                error = streaming_pull_manager._wrap_as_exception(exc)
+                if self._should_terminate(error):
+                    _LOGGER.info(
+                        "Streaming pull terminating after receiving "
+                        "non-recoverable error: %s",
+                        error,
+                    )
+                    self._start_shutdown(error)
+                    return
+
+            delay = next(reopen_delays)
+            _LOGGER.debug("Reopening the stream in %s seconds.", delay)
+            await asyncio.sleep(delay)
+
+    def _should_terminate(self, exception: BaseException) -> bool:
+        """Determine if an error on the stream should terminate the manager.
+
+        Returns:
+            ``True`` for non-API errors and non-retryable API errors
+            (permission denied, unauthorized, etc.), ``False`` if the stream
+            should be reopened.
+        """
+        is_api_error = isinstance(exception, exceptions.GoogleAPICallError)
+        return not is_api_error or isinstance(
+            exception, streaming_pull_manager._TERMINATING_STREAM_ERRORS
+        )
+
+    async def _on_response(self, response: gapic_types.StreamingPullResponse) -> None:
+        """Process all received Pub/Sub messages.
+
+        Modacks the messages right away to tell the server that they have been
+        received, and then puts them on hold until the load allows for sending
+        them to the callback.
+        """
+        # IMPORTANT: Circumvent the wrapper class and operate on the raw underlying
+        # protobuf message to significantly gain on attribute access performance.
+        received_messages = response._pb.received_messages
+
+        _LOGGER.debug(
+            "Processing %s received message(s), currently on hold %s (bytes %s).",
+            len(received_messages),
+            self._messages_on_hold.size,
+            self._on_hold_bytes,
+        )
+
+        exactly_once_enabled = (
+            response.subscription_properties.exactly_once_delivery_enabled
+        )
+        if exactly_once_enabled != self._exactly_once_enabled:
+            self._exactly_once_enabled = exactly_once_enabled
+            # Update ack_deadline, whose minimum depends on exactly-once delivery.
+            self._obtain_ack_deadline(maybe_update=True)
+            self._send_new_ack_deadline = True
+
+        expired_ack_ids = await self._send_lease_modacks(
+            [message.ack_id for message in received_messages],
+            self.ack_deadline,
+            warn_on_invalid=False,
+        )
+
+        if self._closing:
+            _LOGGER.debug("The manager is shutting down. Stopping further processing.")
+            return
+
+        assert self._leaser is not None
+        assert self._request_queue is not None
+        received_timestamp = time.time()
+        for received_message in received_messages:
+            if received_message.ack_id in expired_ack_ids:
+                continue
+            message = google.cloud.pubsub_v1.subscriber.message.Message(
+                received_message.message,
+                received_message.ack_id,
+                received_message.delivery_attempt,
+                self._request_queue,
+                self._exactly_once_delivery_enabled,
+                received_timestamp,
+            )
+            self._messages_on_hold.put(message)
+            self._on_hold_bytes += message.size
+            self._leaser.add(
+                [
+                    requests.LeaseRequest(
+                        ack_id=message.ack_id,
+                        byte_size=message.size,
+                        ordering_key=message.ordering_key,
+                    )
+                ]
+            )
+
+        self._maybe_release_messages()
+        self.maybe_pause_consumer()
+
+    async def _maintain_leases(self) -> None:
+        """Periodically extend the leases of all leased messages.
+
+        Like :meth:`.Leaser.maintain_leases`, this drops the messages that
+        have been leased for too long, modacks the rest, and waits for a random
+        part of the deadline before repeating.
+        """
+        assert self._leaser is not None
+        while True:
+            deadline = self._obtain_ack_deadline(maybe_update=True)
+            _LOGGER.debug("The current deadline value is %d seconds.", deadline)
+
+            leased_messages = dict(self._leaser._leased_messages)
+
+            # Drop any leases that are beyond the max lease time.
+            cutoff = time.time() - self._flow_control.max_lease_duration
+            to_drop = [
+                requests.DropRequest(ack_id, item.size, item.ordering_key)
+                for ack_id, item in leased_messages.items()
+                if item.sent_time < cutoff
+            ]
+            if to_drop:
+                _LOGGER.warning(
+                    "Dropping %s items because they were leased too long.", len(to_drop)
+                )
+                self._drop(to_drop)
+                for item in to_drop:
+                    leased_messages.pop(item.ack_id)
+
+            start_time = time.time()
+            if leased_messages:
+                _LOGGER.debug("Renewing lease for %d ack IDs.", len(leased_messages))
+                expired_ack_ids = await self._send_lease_modacks(
+                    list(leased_messages), deadline
+                )
+                # If exactly once delivery is enabled, drop all expired
+                # ack_ids from lease management.
+                self._drop(
+                    [
+                        requests.DropRequest(
+                            ack_id,
+                            leased_messages[ack_id].size,
+                            leased_messages[ack_id].ordering_key,
+                        )
+                        for ack_id in expired_ack_ids
+                        if ack_id in leased_messages
+                    ]
+                )
+
+            snooze = random.uniform(
+                dispatcher._MAX_BATCH_LATENCY,
+                deadline * 0.9 - (time.time() - start_time),
+            )
+            _LOGGER.debug("Snoozing lease management for %f seconds.", snooze)
+            await asyncio.sleep(snooze)
+
+    async def _send_lease_modacks(
+        self, ack_ids: Sequence[str], ack_deadline: float, warn_on_invalid=True
+    ) -> Set[str]:
+        """Modack the given messages.
+
+        Returns:
+            The ack IDs that have expired already. Always empty unless
+            exactly-once delivery is enabled.
+        """
+        if not ack_ids:
+            return set()
+
+        if not self._exactly_once_enabled:
+            await self._modify_ack_deadline(
+                [
+                    requests.ModAckRequest(ack_id, ack_deadline, None)
+                    for ack_id in ack_ids
+                ]
+            )
+            return set()
+
+        items = [
+            requests.ModAckRequest(ack_id, ack_deadline, futures.Future())
+            for ack_id in ack_ids
+        ]
+        await self._modify_ack_deadline(items)
+
+        expired_ack_ids = set()
+        for req in items:
+            assert req.future is not None
+            try:
+                await asyncio.wrap_future(req.future)
+            except AcknowledgeError as ack_error:
+                if (
+                    ack_error.error_code != AcknowledgeStatus.INVALID_ACK_ID
+                    or warn_on_invalid
+                ):
+                    _LOGGER.warning(
+                        "AcknowledgeError when lease-modacking a message.",
+                        exc_info=True,
+                    )
+                if ack_error.error_code == AcknowledgeStatus.INVALID_ACK_ID:
+                    expired_ack_ids.add(req.ack_id)
+        return expired_ack_ids
+
+    async def _dispatch(self) -> None:
+        """Send the requests put into the request queue, in batches."""
+        assert self._request_queue is not None
+        while True:
+            items = await self._request_queue.get_many(
+                dispatcher._MAX_BATCH_SIZE, dispatcher._MAX_BATCH_LATENCY
+            )
+            try:
+                stop_index = items.index(helper_threads.STOP)
+            except ValueError:
+                await self._dispatch_requests(items)
+            else:
+                await self._dispatch_requests(items[:stop_index])
+                return
+
+    async def _dispatch_requests(self, items: Sequence[Any]) -> None:
+        """Map the queued requests to the appropriate RPCs.
+
+        Args:
+            items: Queued requests to dispatch.
+        """
+        # ack_ids seen so far, per request type
+        seen_ack_ids: Dict[type, Set[str]] = collections.defaultdict(set)
+        batched: Dict[type, List[Any]] = collections.defaultdict(list)
+
+        # Messages acked or nacked together (see message.ack_many()) put a
+        # list of requests into the queue.
+        items = list(
+            itertools.chain.from_iterable(
+                item if isinstance(item, list) else (item,) for item in items
+            )
+        )
+
+        for item in items:
+            item_type = type(item)
+            if item.ack_id in seen_ack_ids[item_type]:
+                future = getattr(item, "future", None)
+                if future is None:
+                    continue
+                if self._exactly_once_enabled:
+                    future.set_exception(
+                        ValueError(f"Duplicate ack_id for {item_type}")
+                    )
+                else:
+                    future.set_result(AcknowledgeStatus.SUCCESS)
+                continue
+            seen_ack_ids[item_type].add(item.ack_id)
+            batched[item_type].append(item)
+
+        _LOGGER.debug("Handling %d batched requests", len(items))
+
+        if batched[requests.LeaseRequest]:
+            assert self._leaser is not None
+            self._leaser.add(batched[requests.LeaseRequest])
+            self.maybe_pause_consumer()
+
+        if batched[requests.ModAckRequest]:
+            await self._modify_ack_deadline(batched[requests.ModAckRequest])
+
+        # Note: Drop and ack *must* be after lease. It's possible to get both
+        # the lease and the ack/drop request in the same batch.
+        if batched[requests.AckRequest]:
+            await self._acknowledge(batched[requests.AckRequest])
+
+        if batched[requests.NackRequest]:
+            nack_requests = batched[requests.NackRequest]
+            await self._modify_ack_deadline(
+                [
+                    requests.ModAckRequest(
+                        ack_id=item.ack_id, seconds=0, future=item.future
+                    )
+                    for item in nack_requests
+                ]
+            )
+            self._drop(nack_requests)
+
+        if batched[requests.DropRequest]:
+            self._drop(batched[requests.DropRequest])
+
+    def _drop(
+        self,
+        items: Sequence[
+            Union[requests.AckRequest, requests.DropRequest, requests.NackRequest]
+        ],
+    ) -> None:
+        """Remove the given messages from lease management."""
+        if not items:
+            return
+        assert self._leaser is not None
+        self._leaser.remove(items)
+        self._activate_ordering_keys(k.ordering_key for k in items if k.ordering_key)
+        self.maybe_resume_consumer()
+
+    async def _acknowledge(self, items: Sequence[requests.AckRequest]) -> None:
+        """Acknowledge the given messages, and retry the transient failures.
+
+        Args:
+            items: The items to acknowledge.
+        """
+        for item in items:
+            if item.time_to_ack is not None:
+                self.ack_histogram.add(item.time_to_ack)
+
+        requests_to_retry = await self._send_acks(items)
+        if requests_to_retry:
+            self._start_retry(self._retry(self._send_acks, requests_to_retry))
+
+    async def _send_acks(
+        self, items: Sequence[requests.AckRequest]
+    ) -> List[requests.AckRequest]:
+        """Send the acknowledge RPCs for the given messages.
+
+        Returns:
+            The requests to retry.
+        """
+        requests_to_retry: List[requests.AckRequest] = []
+        items_iter = iter(items)
+        while True:
+            chunk = list(itertools.islice(items_iter, dispatcher._ACK_IDS_BATCH_SIZE))
+            if not chunk:
+                return requests_to_retry
+
+            ack_reqs_dict = {req.ack_id: req for req in chunk}
+            requests_completed, chunk_to_retry = await self._send_unary(
+                "ack",
+                self._client.acknowledge(
+                    subscription=self._subscription, ack_ids=list(ack_reqs_dict)
+                ),
+                ack_reqs_dict,
+            )
+            self._drop(requests_completed)
+            requests_to_retry.extend(chunk_to_retry)
+
+    async def _modify_ack_deadline(
+        self, items: Sequence[requests.ModAckRequest]
+    ) -> None:
+        """Modify the ack deadline for the given messages, and retry the
+        transient failures.
+
+        Args:
+            items: The items to modify.
+        """
+        requests_to_retry = await self._send_modacks(items)
+        if requests_to_retry:
+            self._start_retry(self._retry(self._send_modacks, requests_to_retry))
+
+    async def _send_modacks(
+        self, items: Sequence[requests.ModAckRequest]
+    ) -> List[requests.ModAckRequest]:
+        """Send the modify ack deadline RPCs for the given messages, one per
+        deadline.
+
+        Returns:
+            The requests to retry.
+        """
+        deadline_to_requests: Dict[
+            float, List[requests.ModAckRequest]
+        ] = collections.defaultdict(list)
+        for item in items:
+            deadline_to_requests[item.seconds].append(item)
+
+        requests_to_retry: List[requests.ModAckRequest] = []
+        for deadline, deadline_items in deadline_to_requests.items():
+            items_iter = iter(deadline_items)
+            while True:
+                chunk = list(
+                    itertools.islice(items_iter, dispatcher._ACK_IDS_BATCH_SIZE)
+                )
+                if not chunk:
+                    break
+
+                ack_reqs_dict = {req.ack_id: req for req in chunk}
+                _, chunk_to_retry = await self._send_unary(
+                    "modack",
+                    self._client.modify_ack_deadline(
+                        subscription=self._subscription,
+                        ack_ids=list(ack_reqs_dict),
+                        ack_deadline_seconds=deadline,
+                    ),
+                    ack_reqs_dict,
+                )
+                requests_to_retry.extend(chunk_to_retry)
+
+        return requests_to_retry
+
+    async def _send_unary(
+        self,
+        req_type: str,
+        rpc: Awaitable[None],
+        ack_reqs_dict: Dict[str, Any],
+    ) -> Any:
+        """Await an ack or modack RPC, and complete the futures of its requests.
+
+        Returns:
+            The requests completed, and the requests to retry.
+        """
+        error_status = None
+        ack_errors_dict = None
+        try:
+            await rpc
+        except exceptions.GoogleAPICallError as exc:
+            _LOGGER.debug(
+                "Exception while sending unary RPC. This is typically "
+                "non-fatal as stream requests are best-effort.",
+                exc_info=True,
+            )
+            error_status = streaming_pull_manager._get_status(exc)
+            ack_errors_dict = streaming_pull_manager._get_ack_errors(exc)
+        except exceptions.RetryError as exc:
+            # Makes sure to complete futures so they don't wait forever.
+            for req in ack_reqs_dict.values():
+                if req.future:
+                    if self._exactly_once_enabled:
+                        req.future.set_exception(
+                            AcknowledgeError(
+                                AcknowledgeStatus.OTHER,
+                                f"RetryError while sending {req_type} RPC.",
+                            )
+                        )
+                    else:
+                        req.future.set_result(AcknowledgeStatus.SUCCESS)
+
+            _LOGGER.debug(
+                "RetryError while sending %s RPC. Waiting on a transient "
+                "error resolution for too long, will now trigger shutdown.",
+                req_type,
+            )
+            self._start_shutdown(exc)
+            return list(ack_reqs_dict.values()), []
+
+        if self._exactly_once_enabled:
+            return streaming_pull_manager._process_requests(
+                error_status,
+                ack_reqs_dict,
+                ack_errors_dict,
+                self.ack_histogram,
+                req_type,
+            )
+
+        # When exactly-once delivery is NOT enabled, acks/modacks are considered
+        # best-effort. So, they always succeed even if the RPC fails.
+        for req in ack_reqs_dict.values():
+            if req.future:
+                req.future.set_result(AcknowledgeStatus.SUCCESS)
+        return list(ack_reqs_dict.values()), []
+
+    async def _retry(
+        self,
+        send: Callable[[Sequence[Any]], Awaitable[List[Any]]],
+        requests_to_retry: List[AckRequestType],
+    ) -> None:
+        """Resend failed acks or modacks with an exponential backoff until none
+        of them fail with a transient error anymore."""
+        retry_delay_gen = exponential_sleep_generator(
+            initial=dispatcher._MIN_EXACTLY_ONCE_DELIVERY_ACK_MODACK_RETRY_DURATION_SECS,
+            maximum=dispatcher._MAX_EXACTLY_ONCE_DELIVERY_ACK_MODACK_RETRY_DURATION_SECS,
+        )
+        try:
+            while requests_to_retry:
+                time_to_wait = next(retry_delay_gen)
+                _LOGGER.debug(
+                    "Retrying %d request(s) after delay of %s seconds",
+                    len(requests_to_retry),
+                    time_to_wait,
+                )
+                await asyncio.sleep(time_to_wait)
+                requests_to_retry = await send(requests_to_retry)
+        except asyncio.CancelledError:
+            # The manager is shutting down, complete the futures so that they
+            # are not awaited forever.
+            for req in requests_to_retry:
+                if req.future and not req.future.done():
+                    req.future.set_exception(
+                        AcknowledgeError(
+                            AcknowledgeStatus.OTHER,
+                            "The subscriber was shut down before the request succeeded.",
+                        )
+                    )
+            raise
@@ -0,0 +1,112 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import functools
+import threading
+import typing
+from typing import Any, Callable, List
+
+from google.cloud.pubsub_v1._timer import DeadlineTimer
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.pubsub_v1 import subscriber
+
+
+_TIMER_NAME = "Thread-CallbackBatcher"
+
+
+class CallbackBatcher(object):
+    """Collects the messages released to the user callback into batches.
+
+    A batch is handed over once it holds ``max_batch_size`` messages, or once
+    ``max_batch_latency`` seconds have passed since its first message was
+    added, whichever comes first. The latency is waited for on a single timer
+    thread, which is only started when it is first needed.
+
+    Public methods are thread-safe.
+
+    Args:
+        schedule:
+            Called with each batch, a list of messages. It must not block.
+        max_batch_size:
+            The maximum number of messages in a batch.
+        max_batch_latency:
+            The maximum number of seconds to wait for a batch to fill up.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[List["subscriber.message.Message"]], Any],
+        max_batch_size: int,
+        max_batch_latency: float,
+    ):
+        self._schedule = schedule
+        self._max_batch_size = max_batch_size
+        self._max_batch_latency = max_batch_latency
+        self._lock = threading.Lock()
+        self._messages: List["subscriber.message.Message"] = []
+        # Incremented whenever a batch is handed over, so that the timer of a
+        # batch that has already been handed over does nothing.
+        self._batch_number = 0
+        self._timer = DeadlineTimer(name=_TIMER_NAME)
+
+    def add(self, message: "subscriber.message.Message") -> None:
+        """Add a message to the current batch.
+
+        Args:
+            message: The message to pass to the callback.
+        """
+        with self._lock:
+            self._messages.append(message)
+            if len(self._messages) < self._max_batch_size:
+                if len(self._messages) == 1:
+                    self._timer.schedule(
+                        self._max_batch_latency,
+                        functools.partial(self._on_timer, self._batch_number),
+                    )
+                return
+            batch = self._take_batch()
+
+        self._schedule(batch)
+
+    def stop(self) -> List["subscriber.message.Message"]:
+        """Stop batching messages.
+
+        Returns:
+            The messages of the batch that had not been handed over yet.
+        """
+        self._timer.stop()
+        with self._lock:
+            return self._take_batch()
+
+    def _take_batch(self) -> List["subscriber.message.Message"]:
+        """Return the current batch and start a new one.
+
+        The caller must hold the lock.
+        """
+        batch = self._messages
+        self._messages = []
+        self._batch_number += 1
+        return batch
+
+    def _on_timer(self, batch_number: int) -> None:
+        """Hand over a batch once its latency has elapsed."""
+        with self._lock:
+            if batch_number != self._batch_number or not self._messages:
+                return
+            batch = self._take_batch()
+
+        self._schedule(batch)
@@ -136,6 +136,14 @@ class Dispatcher(object):
         drop_ids = set()
         exactly_once_delivery_enabled = self._manager._exactly_once_delivery_enabled()
 
+        # Messages acked or nacked together (see message.ack_many()) put a
+        # list of requests into the queue.
+        items = list(
+            itertools.chain.from_iterable(
+                item if isinstance(item, list) else (item,) for item in items
+            )
+        )
+
         for item in items:
             if isinstance(item, requests.LeaseRequest):
                 if (
@@ -19,7 +19,9 @@ import functools
 import inspect
 import itertools
 import logging
+import math
 import threading
+import time
 import typing
 from typing import (
     Any,
@@ -39,6 +41,7 @@ import grpc  # type: ignore
 from google.api_core import bidi
 from google.api_core import exceptions
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import callback_batcher
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
 from google.cloud.pubsub_v1.subscriber._protocol import histogram
@@ -54,6 +57,7 @@ from google.cloud.pubsub_v1.open_telemetry.subscribe_opentelemetry import (
 )
 import google.cloud.pubsub_v1.subscriber.message
 from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber.scheduler import ProcessScheduler
 from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
 from google.pubsub_v1 import types as gapic_types
 from grpc_status import rpc_status  # type: ignore
@@ -192,6 +196,39 @@ def _wrap_callback_errors(
         on_callback_error(exc)
 
 
+def _wrap_batch_callback_errors(
+    callback: Callable[
+        [List["google.cloud.pubsub_v1.subscriber.message.Message"]], Any
+    ],
+    on_callback_error: Callable[[BaseException], Any],
+    messages: List["google.cloud.pubsub_v1.subscriber.message.Message"],
+):
+    """Wraps a user batch callback so that if an exception occurs all messages
+    of the batch are nacked.
+
+    Args:
+        callback: The user batch callback.
+        messages: The Pub/Sub messages of the batch.
+    """
+    _CALLBACK_DELIVERY_LOGGER.debug(
+        "Batch of %d message(s) received by subscriber callback", len(messages)
+    )
+
+    try:
+        for message in messages:
+            if message.opentelemetry_data:
+                message.opentelemetry_data.end_subscribe_concurrency_control_span()
+        callback(messages)
+    except BaseException as exc:
+        _CALLBACK_EXCEPTION_LOGGER.exception(
+            "Batch callback of %d message(s) threw exception, nacking messages.",
+            len(messages),
+        )
+
+        google.cloud.pubsub_v1.subscriber.message.nack_many(messages)
+        on_callback_error(exc)
+
+
 def _get_status(
     exc: exceptions.GoogleAPICallError,
 ) -> Optional["status_pb2.Status"]:
@@ -332,6 +369,18 @@ class StreamingPullManager(object):
             This setting affects when the on close callbacks get invoked, and
             consequently, when the StreamingPullFuture associated with the stream gets
             resolved.
+        max_batch_size:
+            If set, the callback passed to :meth:`open` is called with lists of
+            up to this many messages, instead of with each message.
+        max_batch_latency:
+            The maximum number of seconds to wait for a batch of messages to fill
+            up before it is passed to the callback. Only used if
+            ``max_batch_size`` is set.
+        num_streams:
+            The number of streaming pull RPCs to open on the subscription. The
+            streams share the leaser, flow control, ack deadline histogram and
+            scheduler, while the server-side flow control limits are divided
+            between them.
     """
 
     def __init__(
@@ -342,6 +391,9 @@ class StreamingPullManager(object):
         scheduler: Optional[ThreadScheduler] = None,
         use_legacy_flow_control: bool = False,
         await_callbacks_on_shutdown: bool = False,
+        max_batch_size: Optional[int] = None,
+        max_batch_latency: float = 0.0,
+        num_streams: int = 1,
     ):
         self._client = client
         self._subscription = subscription
@@ -349,6 +401,9 @@ class StreamingPullManager(object):
         self._flow_control = flow_control
         self._use_legacy_flow_control = use_legacy_flow_control
         self._await_callbacks_on_shutdown = await_callbacks_on_shutdown
+        self._max_batch_size = max_batch_size
+        self._max_batch_latency = max_batch_latency
+        self._num_streams = num_streams
         self._ack_histogram = histogram.Histogram()
         self._last_histogram_size = 0
         self._stream_metadata = [
@@ -384,7 +439,7 @@ class StreamingPullManager(object):
             histogram.MIN_ACK_DEADLINE,
         )
 
-        self._rpc: Optional[bidi.ResumableBidiRpc] = None
+        self._rpcs: List[bidi.ResumableBidiRpc] = []
         self._callback: Optional[functools.partial] = None
         self._closing = threading.Lock()
         self._closed = False
@@ -435,8 +490,12 @@ class StreamingPullManager(object):
         # The threads created in ``.open()``.
         self._dispatcher: Optional[dispatcher.Dispatcher] = None
         self._leaser: Optional[leaser.Leaser] = None
-        self._consumer: Optional[bidi.BackgroundConsumer] = None
+        # One consumer per stream, in the same order as ``self._rpcs``.
+        self._consumers: List[bidi.BackgroundConsumer] = []
         self._heartbeater: Optional[heartbeater.Heartbeater] = None
+        # Collects the released messages into batches, if the callback takes
+        # batches of messages.
+        self._callback_batcher: Optional[callback_batcher.CallbackBatcher] = None
 
     @property
     def is_active(self) -> bool:
@@ -445,7 +504,7 @@ class StreamingPullManager(object):
         Note that ``False`` does not indicate this is complete shut down,
         just that it stopped getting new messages.
         """
-        return self._consumer is not None and self._consumer.is_active
+        return any(consumer.is_active for consumer in self._consumers)
 
     @property
     def flow_control(self) -> types.FlowControl:
@@ -603,13 +662,17 @@ class StreamingPullManager(object):
         """Check the current load and pause the consumer if needed."""
         with self._pause_resume_lock:
             if self.load >= _MAX_LOAD:
-                if self._consumer is not None and not self._consumer.is_paused:
+                consumers_to_pause = [
+                    consumer for consumer in self._consumers if not consumer.is_paused
+                ]
+                if consumers_to_pause:
                     _FLOW_CONTROL_LOGGER.debug(
                         "Message backlog over load at %.2f (threshold %.2f), initiating client-side flow control",
                         self.load,
                         _RESUME_THRESHOLD,
                     )
-                    self._consumer.pause()
+                for consumer in consumers_to_pause:
+                    consumer.pause()
 
     def maybe_resume_consumer(self) -> None:
         """Check the load and held messages and resume the consumer if needed.
@@ -624,7 +687,10 @@ class StreamingPullManager(object):
             # In order to not thrash too much, require us to have passed below
             # the resume threshold (80% by default) of each flow control setting
             # before restarting.
-            if self._consumer is None or not self._consumer.is_paused:
+            paused_consumers = [
+                consumer for consumer in self._consumers if consumer.is_paused
+            ]
+            if not paused_consumers:
                 return
 
             _LOGGER.debug("Current load: %.2f", self.load)
@@ -639,7 +705,8 @@ class StreamingPullManager(object):
                     self.load,
                     _RESUME_THRESHOLD,
                 )
-                self._consumer.resume()
+                for consumer in paused_consumers:
+                    consumer.resume()
             else:
                 _FLOW_CONTROL_LOGGER.debug(
                     "Current load is %.2f (threshold %.2f), retaining client-side flow control.",
@@ -703,7 +770,10 @@ class StreamingPullManager(object):
         assert self._callback is not None
         if msg.opentelemetry_data:
             msg.opentelemetry_data.start_subscribe_concurrency_control_span()
-        self._scheduler.schedule(self._callback, msg)
+        if self._callback_batcher is not None:
+            self._callback_batcher.add(msg)
+        else:
+            self._scheduler.schedule(self._callback, msg)
 
     def send_unary_ack(
         self, ack_ids, ack_reqs_dict
@@ -719,7 +789,9 @@ class StreamingPullManager(object):
         error_status = None
         ack_errors_dict = None
         try:
-            self._client.acknowledge(subscription=self._subscription, ack_ids=ack_ids)
+            self._client._raw_acknowledge(
+                subscription=self._subscription, ack_ids=ack_ids
+            )
         except exceptions.GoogleAPICallError as exc:
             _LOGGER.debug(
                 "Exception while sending unary RPC. This is typically "
@@ -801,14 +873,14 @@ class StreamingPullManager(object):
                     deadline_to_ack_ids[deadline].append(ack_id)
 
                 for deadline, ack_ids in deadline_to_ack_ids.items():
-                    self._client.modify_ack_deadline(
+                    self._client._raw_modify_ack_deadline(
                         subscription=self._subscription,
                         ack_ids=ack_ids,
                         ack_deadline_seconds=deadline,
                     )
             else:
                 # We can send all requests with the default deadline.
-                self._client.modify_ack_deadline(
+                self._client._raw_modify_ack_deadline(
                     subscription=self._subscription,
                     ack_ids=modify_deadline_ack_ids,
                     ack_deadline_seconds=default_deadline,
@@ -872,7 +944,7 @@ class StreamingPullManager(object):
         return requests_completed, requests_to_retry
 
     def heartbeat(self) -> bool:
-        """Sends a heartbeat request over the streaming pull RPC.
+        """Sends a heartbeat request over each active streaming pull RPC.
 
         The request is empty by default, but may contain the current ack_deadline
         if the self._exactly_once_enabled flag has changed.
@@ -880,7 +952,8 @@ class StreamingPullManager(object):
         Returns:
             If a heartbeat request has actually been sent.
         """
-        if self._rpc is not None and self._rpc.is_active:
+        active_rpcs = [rpc for rpc in self._rpcs if rpc.is_active]
+        if active_rpcs:
             send_new_ack_deadline = False
             with self._exactly_once_enabled_lock:
                 send_new_ack_deadline = self._send_new_ack_deadline
@@ -896,7 +969,8 @@ class StreamingPullManager(object):
             else:
                 request = gapic_types.StreamingPullRequest()
 
-            self._rpc.send(request)
+            for rpc in active_rpcs:
+                rpc.send(request)
             return True
 
         return False
@@ -911,7 +985,8 @@ class StreamingPullManager(object):
         Args:
             callback:
                 A callback that will be called for each message received on the
-                stream.
+                stream, or for each batch of messages if ``max_batch_size`` is
+                set.
             on_callback_error:
                 A callable that will be called if an exception is raised in
                 the provided `callback`.
@@ -922,30 +997,49 @@ class StreamingPullManager(object):
         if self._closed:
             raise ValueError("This manager has been closed and can not be re-used.")
 
-        self._callback = functools.partial(
-            _wrap_callback_errors, callback, on_callback_error
-        )
+        # Only the user callback runs in the worker processes, the error
+        # handling below stays in this process.
+        if isinstance(self._scheduler, ProcessScheduler):
+            callback = self._scheduler.wrap_callback(callback)
+
+        if self._max_batch_size is None:
+            self._callback = functools.partial(
+                _wrap_callback_errors, callback, on_callback_error
+            )
+        else:
+            self._callback = functools.partial(
+                _wrap_batch_callback_errors, callback, on_callback_error
+            )
+            assert self._scheduler is not None
+            self._callback_batcher = callback_batcher.CallbackBatcher(
+                functools.partial(self._scheduler.schedule, self._callback),
+                max_batch_size=self._max_batch_size,
+                max_batch_latency=self._max_batch_latency,
+            )
 
-        # Create the RPC
+        # Create the RPCs
         stream_ack_deadline_seconds = self._stream_ack_deadline
 
         get_initial_request = functools.partial(
             self._get_initial_request, stream_ack_deadline_seconds
         )
-        self._rpc = bidi.ResumableBidiRpc(
-            start_rpc=self._client.streaming_pull,
-            initial_request=get_initial_request,
-            should_recover=self._should_recover,
-            should_terminate=self._should_terminate,
-            metadata=self._stream_metadata,
-            throttle_reopen=True,
-        )
-        self._rpc.add_done_callback(self._on_rpc_done)
+        self._rpcs = []
+        for _ in range(self._num_streams):
+            rpc = bidi.ResumableBidiRpc(
+                start_rpc=self._client.streaming_pull,
+                initial_request=get_initial_request,
+                should_recover=self._should_recover,
+                should_terminate=self._should_terminate,
+                metadata=self._stream_metadata,
+                throttle_reopen=True,
+            )
+            rpc.add_done_callback(self._on_rpc_done)
+            self._rpcs.append(rpc)
 
         _LOGGER.debug(
-            "Creating a stream, default ACK deadline set to {} seconds.".format(
-                self._stream_ack_deadline
-            )
+            "Creating %d stream(s), default ACK deadline set to %d seconds.",
+            self._num_streams,
+            self._stream_ack_deadline,
         )
 
         # Create references to threads
@@ -953,16 +1047,21 @@ class StreamingPullManager(object):
         scheduler_queue = self._scheduler.queue
         self._dispatcher = dispatcher.Dispatcher(self, scheduler_queue)
 
-        # `on_fatal_exception` is only available in more recent library versions.
-        # For backwards compatibility reasons, we only pass it when `google-api-core` supports it.
-        if _SHOULD_USE_ON_FATAL_ERROR_CALLBACK:
-            self._consumer = bidi.BackgroundConsumer(
-                self._rpc,
-                self._on_response,
-                on_fatal_exception=self._on_fatal_exception,
-            )
-        else:
-            self._consumer = bidi.BackgroundConsumer(self._rpc, self._on_response)
+        # All streams deliver their messages to the same _on_response(), which
+        # puts them on hold and leases them for the whole manager.
+        self._consumers = []
+        for rpc in self._rpcs:
+            # `on_fatal_exception` is only available in more recent library versions.
+            # For backwards compatibility reasons, we only pass it when `google-api-core` supports it.
+            if _SHOULD_USE_ON_FATAL_ERROR_CALLBACK:
+                consumer = bidi.BackgroundConsumer(
+                    rpc,
+                    self._on_response,
+                    on_fatal_exception=self._on_fatal_exception,
+                )
+            else:
+                consumer = bidi.BackgroundConsumer(rpc, self._on_response)
+            self._consumers.append(consumer)
 
         self._leaser = leaser.Leaser(self)
         self._heartbeater = heartbeater.Heartbeater(self)
@@ -971,7 +1070,8 @@ class StreamingPullManager(object):
         self._dispatcher.start()
 
         # Start consuming messages.
-        self._consumer.start()
+        for consumer in self._consumers:
+            consumer.start()
 
         # Start the lease maintainer thread.
         self._leaser.start()
@@ -1014,18 +1114,29 @@ class StreamingPullManager(object):
                 return
 
             # Stop consuming messages.
-            if self.is_active:
-                _LOGGER.debug("Stopping consumer.")
-                assert self._consumer is not None
-                self._consumer.stop()
-            self._consumer = None
+            for consumer in self._consumers:
+                if consumer.is_active:
+                    _LOGGER.debug("Stopping consumer.")
+                    consumer.stop()
+            self._consumers = []
+
+            # Messages in a batch that has not been passed to the callback
+            # yet are dropped like the ones waiting in the scheduler.
+            dropped_messages = []
+            if self._callback_batcher is not None:
+                dropped_messages.extend(self._callback_batcher.stop())
 
             # Shutdown all helper threads
             _LOGGER.debug("Stopping scheduler.")
             assert self._scheduler is not None
-            dropped_messages = self._scheduler.shutdown(
+            for dropped in self._scheduler.shutdown(
                 await_msg_callbacks=self._await_callbacks_on_shutdown
-            )
+            ):
+                # Batches of messages are scheduled as lists.
+                if isinstance(dropped, list):
+                    dropped_messages.extend(dropped)
+                else:
+                    dropped_messages.append(dropped)
             self._scheduler = None
 
             # Leaser and dispatcher reference each other through the shared
@@ -1063,7 +1174,7 @@ class StreamingPullManager(object):
             self._heartbeater.stop()
             self._heartbeater = None
 
-            self._rpc = None
+            self._rpcs = []
             self._closed = True
             _LOGGER.debug("Finished stopping manager.")
 
@@ -1086,6 +1197,19 @@ class StreamingPullManager(object):
             A request suitable for being the first request on the stream (and not
             suitable for any other purpose).
         """
+        # Each stream gets an equal share of the server-side flow control limits,
+        # so that the server spreads the outstanding messages across the streams.
+        if self._use_legacy_flow_control:
+            max_outstanding_messages = 0
+            max_outstanding_bytes = 0
+        else:
+            max_outstanding_messages = math.ceil(
+                self._flow_control.max_messages / self._num_streams
+            )
+            max_outstanding_bytes = math.ceil(
+                self._flow_control.max_bytes / self._num_streams
+            )
+
         # Put the request together.
         # We need to set streaming ack deadline, but it's not useful since we'll modack to send receipt
         # anyway. Set to some big-ish value in case we modack late.
@@ -1095,12 +1219,8 @@ class StreamingPullManager(object):
             modify_deadline_seconds=[],
             subscription=self._subscription,
             client_id=self._client_id,
-            max_outstanding_messages=(
-                0 if self._use_legacy_flow_control else self._flow_control.max_messages
-            ),
-            max_outstanding_bytes=(
-                0 if self._use_legacy_flow_control else self._flow_control.max_bytes
-            ),
+            max_outstanding_messages=max_outstanding_messages,
+            max_outstanding_bytes=max_outstanding_bytes,
         )
 
         # Return the initial request.
@@ -1241,6 +1361,9 @@ class StreamingPullManager(object):
 
         After the messages have all had their ack deadline updated, execute
         the callback for each message using the executor.
+
+        With multiple streams, this is called concurrently from the consumer
+        thread of each stream.
         """
         if response is None:
             _LOGGER.debug(
@@ -1309,6 +1432,10 @@ class StreamingPullManager(object):
                 )
                 return
 
+            # The messages of a response are received at the same time and
+            # share the request queue, so look these up once per response.
+            request_queue = self._scheduler.queue
+            received_timestamp = time.time()
             i: int = 0
             for received_message in received_messages:
                 if (
@@ -1319,8 +1446,9 @@ class StreamingPullManager(object):
                         received_message.message,
                         received_message.ack_id,
                         received_message.delivery_attempt,
-                        self._scheduler.queue,
+                        request_queue,
                         self._exactly_once_delivery_enabled,
+                        received_timestamp,
                     )
                     if self._client.open_telemetry_enabled:
                         message.opentelemetry_data = subscribe_opentelemetry[i]
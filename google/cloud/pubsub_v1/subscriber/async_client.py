@@ -0,0 +1,232 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import os
+import typing
+from typing import Any, Awaitable, Callable, Sequence, Union
+import warnings
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber._protocol import async_streaming_pull_manager
+from google.pubsub_v1.services.subscriber import (
+    async_client as subscriber_async_client,
+)
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.pubsub_v1 import subscriber
+
+
+class AsyncClient(subscriber_async_client.SubscriberAsyncClient):
+    """An asyncio subscriber client for Google Cloud Pub/Sub.
+
+    This is the :mod:`asyncio` counterpart of
+    :class:`~google.cloud.pubsub_v1.subscriber.client.Client`. The streaming
+    pull runs over the ``grpc_asyncio`` transport, and the leasing, flow control
+    and acknowledgements all happen in tasks on the running event loop. No
+    threads are started by the client.
+
+    Args:
+        subscriber_options:
+            The options for the subscriber client. OpenTelemetry tracing is not
+            supported by this client.
+        kwargs:
+            Any additional arguments provided are sent as keyword arguments to the
+            underlying
+            :class:`~google.pubsub_v1.services.subscriber.async_client.SubscriberAsyncClient`.
+
+    Example:
+
+    .. code-block:: python
+
+        from google.cloud.pubsub_v1 import subscriber
+
+        async def main():
+            subscriber_client = subscriber.AsyncClient()
+
+            subscription = subscriber_client.subscription_path(
+                '[PROJECT]', '[SUBSCRIPTION]')
+
+            async def callback(message):
+                print(message)
+                message.ack()
+
+            future = await subscriber_client.subscribe(subscription, callback)
+            await future
+    """
+
+    def __init__(
+        self,
+        subscriber_options: Union[types.SubscriberOptions, Sequence] = (),
+        **kwargs: Any,
+    ):
+        assert (
+            isinstance(subscriber_options, types.SubscriberOptions)
+            or len(subscriber_options) == 0
+        ), "subscriber_options must be of type SubscriberOptions or an empty sequence."
+
+        # Sanity check: Is our goal to use the emulator?
+        # If so, create a grpc insecure channel with the emulator host
+        # as the target.
+        if os.environ.get("PUBSUB_EMULATOR_HOST"):
+            kwargs["client_options"] = {
+                "api_endpoint": os.environ.get("PUBSUB_EMULATOR_HOST")
+            }
+            # Configure credentials directly to transport, if provided.
+            if "transport" not in kwargs:
+                kwargs["credentials"] = AnonymousCredentials()
+
+        super().__init__(**kwargs)
+        self._target = self._client._transport._host
+        self._closed = False
+
+        self.subscriber_options = types.SubscriberOptions(*subscriber_options)
+
+        if self.subscriber_options.enable_open_telemetry_tracing:
+            warnings.warn(
+                message="Open Telemetry tracing is not supported by the asyncio "
+                "subscriber client. Disabling Open Telemetry tracing.",
+                category=RuntimeWarning,
+            )
+
+    @property
+    def target(self) -> str:
+        """Return the target (where the API is).
+
+        Returns:
+            The location of the API.
+        """
+        return self._target
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the client has been closed and cannot be used anymore."""
+        return self._closed
+
+    @property
+    def open_telemetry_enabled(self) -> bool:
+        return False
+
+    async def subscribe(
+        self,
+        subscription: str,
+        callback: Callable[["subscriber.message.Message"], Union[Awaitable[Any], Any]],
+        flow_control: Union[types.FlowControl, Sequence] = (),
+        use_legacy_flow_control: bool = False,
+        await_callbacks_on_shutdown: bool = False,
+    ) -> futures.AsyncStreamingPullFuture:
+        """Start receiving messages on a given subscription.
+
+        This method starts the streaming pull as tasks on the running event
+        loop, and returns right away. The ``callback`` is called with each
+        received :class:`google.cloud.pubsub_v1.subscriber.message.Message`,
+        and if it is a coroutine function, the returned coroutine is awaited in
+        its own task. It is the responsibility of the callback to either call
+        ``ack()`` or ``nack()`` on the message when it finished processing. If
+        an exception occurs in the callback, the exception is logged and the
+        message is ``nack()`` ed.
+
+        The callback runs on the event loop, thus it must not block. The
+        ``flow_control`` settings limit the number of messages whose callback
+        runs at the same time.
+
+        Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from google.cloud.pubsub_v1 import subscriber
+
+            async def main():
+                subscriber_client = subscriber.AsyncClient()
+
+                # existing subscription
+                subscription = subscriber_client.subscription_path(
+                    'my-project-id', 'my-subscription')
+
+                async def callback(message):
+                    print(message)
+                    message.ack()
+
+                future = await subscriber_client.subscribe(subscription, callback)
+
+                try:
+                    await asyncio.wait_for(future, timeout=60)
+                except asyncio.TimeoutError:
+                    future.cancel()  # Trigger the shutdown.
+                    await future  # Wait until the shutdown is complete.
+
+        Args:
+            subscription:
+                The name of the subscription. The subscription should have already been
+                created (for example, by using :meth:`create_subscription`).
+            callback:
+                The callback function. This function receives the message as
+                its only argument.
+            flow_control:
+                The flow control settings. Use this to prevent situations where you are
+                inundated with too many messages at once.
+            use_legacy_flow_control:
+                If set to ``True``, flow control at the Cloud Pub/Sub server is disabled,
+                though client-side flow control is still enabled. If set to ``False``
+                (default), both server-side and client-side flow control are enabled.
+            await_callbacks_on_shutdown:
+                If ``True``, after canceling the returned future, awaiting it waits
+                until all currently running callbacks are done.
+
+                If ``False`` (default), the running callbacks are cancelled on
+                shutdown, and their messages are nacked.
+
+        Returns:
+            A future that can be used to manage the streaming pull.
+        """
+        flow_control = types.FlowControl(*flow_control)
+
+        manager = async_streaming_pull_manager.AsyncStreamingPullManager(
+            self,
+            subscription,
+            flow_control=flow_control,
+            use_legacy_flow_control=use_legacy_flow_control,
+            await_callbacks_on_shutdown=await_callbacks_on_shutdown,
+        )
+
+        future = futures.AsyncStreamingPullFuture(manager)
+
+        manager.open(callback=callback, on_callback_error=future.set_exception)
+
+        return future
+
+    async def close(self) -> None:
+        """Close the underlying channel to release socket resources.
+
+        After a channel has been closed, the client instance cannot be used
+        anymore.
+
+        This method is idempotent.
+        """
+        await self.transport.close()
+        self._closed = True
+
+    async def __aenter__(self) -> "AsyncClient":
+        if self._closed:
+            raise RuntimeError("Closed subscriber cannot be used as context manager.")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -17,23 +17,31 @@ from __future__ import absolute_import
 import sys
 import os
 import typing
-from typing import cast, Any, Callable, Optional, Sequence, Union
+from typing import cast, Any, Callable, List, Optional, Sequence, Union
 import warnings
 
+from google.api_core import gapic_v1
 from google.auth.credentials import AnonymousCredentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
+from google.protobuf import empty_pb2
 
+from google.cloud.pubsub_v1 import _raw_rpc
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber import futures
 from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
 from google.pubsub_v1.services.subscriber import client as subscriber_client
+from google.pubsub_v1.services.subscriber.transports.grpc import (
+    SubscriberGrpcTransport,
+)
 from google.pubsub_v1 import gapic_version as package_version
+from google.pubsub_v1 import types as gapic_types
 
 if typing.TYPE_CHECKING:  # pragma: NO COVER
     from google.cloud.pubsub_v1 import subscriber
-    from google.pubsub_v1.services.subscriber.transports.grpc import (
-        SubscriberGrpcTransport,
-    )
+    from google.pubsub_v1.services.subscriber.client import OptionalRetry
+
+_raw_proto_acknowledge_request = gapic_types.AcknowledgeRequest.pb()
+_raw_proto_modify_ack_deadline_request = gapic_types.ModifyAckDeadlineRequest.pb()
 
 __version__ = package_version.__version__
 
@@ -96,6 +104,30 @@ class Client(subscriber_client.SubscriberClient):
         self._target = self._transport._host
         self._closed = False
 
+        # With the gRPC transport, the streaming pull manager sends its unary
+        # acks and modacks as serialized requests. With other transports, they
+        # are sent through the GAPIC public API.
+        self._raw_acknowledge_rpc: Optional[Callable[..., Any]] = None
+        self._raw_modify_ack_deadline_rpc: Optional[Callable[..., Any]] = None
+        if isinstance(self._transport, SubscriberGrpcTransport):
+            client_info = kwargs.get(
+                "client_info", subscriber_client.DEFAULT_CLIENT_INFO
+            )
+            self._raw_acknowledge_rpc = _raw_rpc.wrap_method(
+                self._transport,
+                self._transport.acknowledge,
+                "/google.pubsub.v1.Subscriber/Acknowledge",
+                empty_pb2.Empty.FromString,
+                client_info,
+            )
+            self._raw_modify_ack_deadline_rpc = _raw_rpc.wrap_method(
+                self._transport,
+                self._transport.modify_ack_deadline,
+                "/google.pubsub.v1.Subscriber/ModifyAckDeadline",
+                empty_pb2.Empty.FromString,
+                client_info,
+            )
+
         self.subscriber_options = types.SubscriberOptions(*subscriber_options)
 
         # Set / override Open Telemetry  option.
@@ -183,11 +215,17 @@ class Client(subscriber_client.SubscriberClient):
     def subscribe(
         self,
         subscription: str,
-        callback: Callable[["subscriber.message.Message"], Any],
+        callback: Optional[Callable[["subscriber.message.Message"], Any]] = None,
         flow_control: Union[types.FlowControl, Sequence] = (),
         scheduler: Optional["subscriber.scheduler.ThreadScheduler"] = None,
         use_legacy_flow_control: bool = False,
         await_callbacks_on_shutdown: bool = False,
+        batch_callback: Optional[
+            Callable[[List["subscriber.message.Message"]], Any]
+        ] = None,
+        max_batch_size: int = 100,
+        max_batch_latency: float = 0.1,
+        num_streams: int = 1,
     ) -> futures.StreamingPullFuture:
         """Asynchronously start receiving messages on a given subscription.
 
@@ -214,6 +252,18 @@ class Client(subscriber_client.SubscriberClient):
         settings at the Cloud Pub/Sub server, and only the client side flow control
         will be enforced.
 
+        Instead of a ``callback``, a ``batch_callback`` can be given, which is
+        called with lists of messages. A list is passed to the callback once it
+        holds ``max_batch_size`` messages, or once ``max_batch_latency`` seconds
+        have passed since its first message was received. The callback can then
+        use :func:`~google.cloud.pubsub_v1.subscriber.message.ack_many` and
+        :func:`~google.cloud.pubsub_v1.subscriber.message.nack_many` to
+        acknowledge the messages together. If an exception occurs in the batch
+        callback, all messages of the batch are ``nack()`` ed. Messages still
+        count towards the ``flow_control`` limits while they wait for their
+        batch to fill up, so ``max_batch_size`` should not exceed
+        ``flow_control.max_messages``.
+
         This method starts the receiver in the background and returns a
         *Future* representing its execution. Waiting on the future (calling
         ``result()``) will block forever or until a non-recoverable error
@@ -258,7 +308,8 @@ class Client(subscriber_client.SubscriberClient):
             callback:
                 The callback function. This function receives the message as
                 its only argument and will be called from a different thread/
-                process depending on the scheduling strategy.
+                process depending on the scheduling strategy. Exactly one of
+                ``callback`` and ``batch_callback`` must be given.
             flow_control:
                 The flow control settings. Use this to prevent situations where you are
                 inundated with too many messages at once.
@@ -281,12 +332,43 @@ class Client(subscriber_client.SubscriberClient):
                 immediately after the background stream and its helper threads have been
                 terminated, but some of the message callback threads might still be
                 running at that point.
+            batch_callback:
+                The callback function for batches of messages. This function receives
+                a list of messages as its only argument.
+            max_batch_size:
+                The maximum number of messages passed to ``batch_callback`` at once.
+            max_batch_latency:
+                The maximum number of seconds to wait for more messages before
+                passing a batch to ``batch_callback``.
+            num_streams:
+                The number of streaming pull RPCs to open on the subscription. A
+                single stream limits how fast messages can be received, so
+                subscribers with a high throughput can open several streams. The
+                streams share the ``flow_control`` limits, the lease management
+                and the ``scheduler``.
 
         Returns:
             A future instance that can be used to manage the background stream.
+
+        Raises:
+            ValueError:
+                If not exactly one of ``callback`` and ``batch_callback`` is given,
+                or if the batch size or latency, or ``num_streams`` is invalid.
         """
+        if (callback is None) == (batch_callback is None):
+            raise ValueError("Exactly one of callback and batch_callback is required.")
+
+        if num_streams < 1:
+            raise ValueError("num_streams must be at least 1.")
+
         flow_control = types.FlowControl(*flow_control)
 
+        if batch_callback is not None:
+            if max_batch_size < 1:
+                raise ValueError("max_batch_size must be at least 1.")
+            if max_batch_latency < 0:
+                raise ValueError("max_batch_latency must not be negative.")
+
         manager = streaming_pull_manager.StreamingPullManager(
             self,
             subscription,
@@ -294,14 +376,90 @@ class Client(subscriber_client.SubscriberClient):
             scheduler=scheduler,
             use_legacy_flow_control=use_legacy_flow_control,
             await_callbacks_on_shutdown=await_callbacks_on_shutdown,
+            max_batch_size=max_batch_size if batch_callback is not None else None,
+            max_batch_latency=max_batch_latency,
+            num_streams=num_streams,
         )
 
         future = futures.StreamingPullFuture(manager)
 
-        manager.open(callback=callback, on_callback_error=future.set_exception)
+        manager.open(
+            callback=callback if batch_callback is None else batch_callback,
+            on_callback_error=future.set_exception,
+        )
 
         return future
 
+    def _raw_acknowledge(
+        self,
+        subscription: str,
+        ack_ids: Sequence[str],
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+    ) -> None:
+        """Acknowledge the messages in a single acknowledge RPC.
+
+        With the gRPC transport, the request is serialized once, and the same
+        bytes are sent again on every retry. Otherwise, the GAPIC public API
+        is called directly.
+        """
+        if self._raw_acknowledge_rpc is None:
+            self.acknowledge(
+                subscription=subscription,
+                ack_ids=ack_ids,
+                retry=retry,
+                timeout=timeout,
+            )
+            return
+
+        request = _raw_proto_acknowledge_request(
+            subscription=subscription, ack_ids=ack_ids
+        )
+        self._validate_universe_domain()
+        self._raw_acknowledge_rpc(
+            request.SerializeToString(),
+            retry=retry,
+            timeout=timeout,
+            metadata=_raw_rpc.routing_metadata("subscription", subscription),
+        )
+
+    def _raw_modify_ack_deadline(
+        self,
+        subscription: str,
+        ack_ids: Sequence[str],
+        ack_deadline_seconds: int,
+        retry: "OptionalRetry" = gapic_v1.method.DEFAULT,
+        timeout: "types.OptionalTimeout" = gapic_v1.method.DEFAULT,
+    ) -> None:
+        """Modify the ack deadline of the messages in a single RPC.
+
+        With the gRPC transport, the request is serialized once, and the same
+        bytes are sent again on every retry. Otherwise, the GAPIC public API
+        is called directly.
+        """
+        if self._raw_modify_ack_deadline_rpc is None:
+            self.modify_ack_deadline(
+                subscription=subscription,
+                ack_ids=ack_ids,
+                ack_deadline_seconds=ack_deadline_seconds,
+                retry=retry,
+                timeout=timeout,
+            )
+            return
+
+        request = _raw_proto_modify_ack_deadline_request(
+            subscription=subscription,
+            ack_ids=ack_ids,
+            ack_deadline_seconds=ack_deadline_seconds,
+        )
+        self._validate_universe_domain()
+        self._raw_modify_ack_deadline_rpc(
+            request.SerializeToString(),
+            retry=retry,
+            timeout=timeout,
+            metadata=_raw_rpc.routing_metadata("subscription", subscription),
+        )
+
     def close(self) -> None:
         """Close the underlying channel to release socket resources.
 
@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 
+import asyncio
 import typing
 from typing import Any
 from typing import Union
@@ -22,6 +23,9 @@ from google.cloud.pubsub_v1 import futures
 from google.cloud.pubsub_v1.subscriber.exceptions import AcknowledgeStatus
 
 if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.pubsub_v1.subscriber._protocol.async_streaming_pull_manager import (
+        AsyncStreamingPullManager,
+    )
     from google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager import (
         StreamingPullManager,
     )
@@ -83,6 +87,81 @@ class StreamingPullFuture(futures.Future):
         return self.__cancelled
 
 
+class AsyncStreamingPullFuture(object):
+    """Represents a streaming pull that runs on the event loop, and awaits the
+    callback for each received message.
+
+    Awaiting this future suspends the awaiting task until the streaming pull is
+    stopped (via :meth:`cancel`), or until it encounters an unrecoverable error,
+    which is then raised. It must be created on the event loop that runs the
+    streaming pull.
+    """
+
+    def __init__(self, manager: "AsyncStreamingPullManager"):
+        self.__manager = manager
+        self.__manager.add_close_callback(self._on_close_callback)
+        self.__future: "asyncio.Future[bool]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.__cancelled = False
+
+    def _on_close_callback(self, manager: "AsyncStreamingPullManager", result: Any):
+        if result is None:
+            self.set_result(True)
+        else:
+            self.set_exception(result)
+
+    def set_result(self, result: bool) -> None:
+        """Resolve the future, unless it is done already."""
+        if not self.__future.done():
+            self.__future.set_result(result)
+
+    def set_exception(self, exception: BaseException) -> None:
+        """Fail the future with an exception, unless it is done already."""
+        if not self.__future.done():
+            self.__future.set_exception(exception)
+
+    def cancel(self) -> bool:
+        """Stops pulling messages and shuts down the streaming pull tasks.
+
+        The method does not wait for the shutdown. Await the future after
+        cancelling it to wait until the streaming pull has stopped.
+
+        Returns:
+            Always ``True``, as the shutdown is always initiated.
+        """
+        self.__cancelled = True
+        self.__manager.close()
+        return True
+
+    def cancelled(self) -> bool:
+        """
+        Returns:
+            ``True`` if the subscription has been cancelled.
+        """
+        return self.__cancelled
+
+    def done(self) -> bool:
+        """
+        Returns:
+            ``True`` if the streaming pull has stopped, or a callback failed.
+        """
+        return self.__future.done()
+
+    def result(self) -> bool:
+        """Return ``True`` if the streaming pull has been stopped, or raise its
+        error.
+
+        Raises:
+            asyncio.InvalidStateError: If the future is not done yet.
+        """
+        return self.__future.result()
+
+    def __await__(self):
+        # Cancelling the awaiting task must not cancel the streaming pull.
+        return asyncio.shield(self.__future).__await__()
+
+
 class Future(futures.Future):
     """This future object is for subscribe-side calls.
 
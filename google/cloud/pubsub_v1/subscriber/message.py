@@ -20,7 +20,7 @@ import logging
 import math
 import time
 import typing
-from typing import Optional, Callable
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 from google.cloud.pubsub_v1.subscriber import futures
@@ -95,6 +95,27 @@ class Message(object):
             Open Telemetry data associated with this message. None if Open Telemetry is not enabled.
     """
 
+    # A message is created for each received message, thus only compute the
+    # derived values when they are first needed. The slots speed up attribute
+    # access, while ``__dict__`` keeps instances open to custom attributes.
+    __slots__ = (
+        "_message",
+        "_ack_id",
+        "_delivery_attempt",
+        "_request_queue",
+        "_exactly_once_delivery_enabled_func",
+        "_received_timestamp",
+        "_message_id",
+        "_attributes",
+        "_data",
+        "_ordering_key",
+        "_publish_time",
+        "_size",
+        "_opentelemetry_data",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         message: "types.PubsubMessage._meta._pb",  # type: ignore
@@ -102,6 +123,7 @@ class Message(object):
         delivery_attempt: int,
         request_queue: "queue.Queue",
         exactly_once_delivery_enabled_func: Callable[[], bool] = lambda: False,
+        received_timestamp: Optional[float] = None,
     ):
         """Construct the Message.
 
@@ -127,37 +149,38 @@ class Message(object):
                 responsible for handling those requests.
             exactly_once_delivery_enabled_func (Callable[[], bool]):
                 A Callable that returns whether exactly-once delivery is currently-enabled. Defaults to a lambda that always returns False.
+            received_timestamp (Optional[float]):
+                The time at which the message was received, as returned by
+                :func:`time.time`. Defaults to the current time. Messages
+                received together can share a single timestamp.
         """
         self._message = message
         self._ack_id = ack_id
         self._delivery_attempt = delivery_attempt if delivery_attempt > 0 else None
         self._request_queue = request_queue
         self._exactly_once_delivery_enabled_func = exactly_once_delivery_enabled_func
-        self.message_id = message.message_id
-
-        # The instantiation time is the time that this message
-        # was received. Tracking this provides us a way to be smart about
-        # the default lease deadline.
-        self._received_timestamp = time.time()
-
-        # Store the message attributes directly to speed up attribute access, i.e.
-        # to avoid two lookups if self._message.<attribute> pattern was used in
-        # properties.
-        self._attributes = message.attributes
-        self._data = message.data
-        self._publish_time = dt.datetime.fromtimestamp(
-            message.publish_time.seconds + message.publish_time.nanos / 1e9,
-            tz=dt.timezone.utc,
-        )
-        self._ordering_key = message.ordering_key
-        self._size = message.ByteSize()
+
+        # The time that this message was received. Tracking this provides us a
+        # way to be smart about the default lease deadline.
+        if received_timestamp is None:
+            received_timestamp = time.time()
+        self._received_timestamp = received_timestamp
+
+        # Read from the protobuf message or computed on first access, and then
+        # cached, since each read of a protobuf field may copy its value.
+        self._message_id: Optional[str] = None
+        self._attributes: Optional["containers.ScalarMap"] = None
+        self._data: Optional[bytes] = None
+        self._ordering_key: Optional[str] = None
+        self._publish_time: Optional[dt.datetime] = None
+        self._size: Optional[int] = None
 
         # None if Open Telemetry is disabled. Else contains OpenTelemetry data.
         self._opentelemetry_data: Optional[SubscribeOpenTelemetry] = None
 
     def __repr__(self):
         # Get an abbreviated version of the data.
-        abbv_data = self._message.data
+        abbv_data = self.data
         if len(abbv_data) > 50:
             abbv_data = abbv_data[:50] + b"..."
 
@@ -169,6 +192,17 @@ class Message(object):
         pretty_attrs = pretty_attrs.lstrip()
         return _MESSAGE_REPR.format(abbv_data, str(self.ordering_key), pretty_attrs)
 
+    @property
+    def message_id(self) -> str:
+        """The message ID. In general, you should not need to use this directly."""
+        if self._message_id is None:
+            self._message_id = self._message.message_id
+        return self._message_id
+
+    @message_id.setter
+    def message_id(self, message_id: str) -> None:
+        self._message_id = message_id
+
     @property
     def opentelemetry_data(self):
         return self._opentelemetry_data  # pragma: NO COVER
@@ -194,6 +228,8 @@ class Message(object):
             containers.ScalarMap: The message's attributes. This is a
             ``dict``-like object provided by ``google.protobuf``.
         """
+        if self._attributes is None:
+            self._attributes = self._message.attributes
         return self._attributes
 
     @property
@@ -204,6 +240,8 @@ class Message(object):
             bytes: The message data. This is always a bytestring; if you want
             a text string, call :meth:`bytes.decode`.
         """
+        if self._data is None:
+            self._data = self._message.data
         return self._data
 
     @property
@@ -214,16 +252,26 @@ class Message(object):
             datetime.datetime: The date and time that the message was
             published.
         """
+        if self._publish_time is None:
+            publish_time = self._message.publish_time
+            self._publish_time = dt.datetime.fromtimestamp(
+                publish_time.seconds + publish_time.nanos / 1e9,
+                tz=dt.timezone.utc,
+            )
         return self._publish_time
 
     @property
     def ordering_key(self) -> str:
         """The ordering key used to publish the message."""
+        if self._ordering_key is None:
+            self._ordering_key = self._message.ordering_key
         return self._ordering_key
 
     @property
     def size(self) -> int:
         """Return the size of the underlying message, in bytes."""
+        if self._size is None:
+            self._size = self._message.ByteSize()
         return self._size
 
     @property
@@ -271,21 +319,7 @@ class Message(object):
             https://cloud.google.com/pubsub/docs/exactly-once-delivery."
 
         """
-        if self.opentelemetry_data:
-            self.opentelemetry_data.add_process_span_event("ack called")
-            self.opentelemetry_data.end_process_span()
-        time_to_ack = math.ceil(time.time() - self._received_timestamp)
-        self._request_queue.put(
-            requests.AckRequest(
-                message_id=self.message_id,
-                ack_id=self._ack_id,
-                byte_size=self.size,
-                time_to_ack=time_to_ack,
-                ordering_key=self.ordering_key,
-                future=None,
-                opentelemetry_data=self.opentelemetry_data,
-            )
-        )
+        self._request_queue.put(self._ack_request(future=None))
         _ACK_NACK_LOGGER.debug(
             "Called ack for message (id=%s, ack_id=%s, ordering_key=%s)",
             self.message_id,
@@ -338,9 +372,6 @@ class Message(object):
             self.ack_id,
             self.ordering_key,
         )
-        if self.opentelemetry_data:
-            self.opentelemetry_data.add_process_span_event("ack called")
-            self.opentelemetry_data.end_process_span()
         req_future: Optional[futures.Future]
         if self._exactly_once_delivery_enabled_func():
             future = futures.Future()
@@ -348,19 +379,24 @@ class Message(object):
         else:
             future = _SUCCESS_FUTURE
             req_future = None
+        self._request_queue.put(self._ack_request(future=req_future))
+        return future
+
+    def _ack_request(self, future: Optional[futures.Future]) -> requests.AckRequest:
+        """Return the request acknowledging this message."""
+        if self.opentelemetry_data:
+            self.opentelemetry_data.add_process_span_event("ack called")
+            self.opentelemetry_data.end_process_span()
         time_to_ack = math.ceil(time.time() - self._received_timestamp)
-        self._request_queue.put(
-            requests.AckRequest(
-                message_id=self.message_id,
-                ack_id=self._ack_id,
-                byte_size=self.size,
-                time_to_ack=time_to_ack,
-                ordering_key=self.ordering_key,
-                future=req_future,
-                opentelemetry_data=self.opentelemetry_data,
-            )
+        return requests.AckRequest(
+            message_id=self.message_id,
+            ack_id=self._ack_id,
+            byte_size=self.size,
+            time_to_ack=time_to_ack,
+            ordering_key=self.ordering_key,
+            future=future,
+            opentelemetry_data=self.opentelemetry_data,
         )
-        return future
 
     def drop(self) -> None:
         """Release the message from lease management.
@@ -487,18 +523,7 @@ class Message(object):
             self.ordering_key,
             self._exactly_once_delivery_enabled_func(),
         )
-        if self.opentelemetry_data:
-            self.opentelemetry_data.add_process_span_event("nack called")
-            self.opentelemetry_data.end_process_span()
-        self._request_queue.put(
-            requests.NackRequest(
-                ack_id=self._ack_id,
-                byte_size=self.size,
-                ordering_key=self.ordering_key,
-                future=None,
-                opentelemetry_data=self.opentelemetry_data,
-            )
-        )
+        self._request_queue.put(self._nack_request(future=None))
 
     def nack_with_response(self) -> "futures.Future":
         """Decline to acknowledge the given message, returning the response status via
@@ -534,9 +559,6 @@ class Message(object):
             will be thrown.
 
         """
-        if self.opentelemetry_data:
-            self.opentelemetry_data.add_process_span_event("nack called")
-            self.opentelemetry_data.end_process_span()
         req_future: Optional[futures.Future]
         if self._exactly_once_delivery_enabled_func():
             future = futures.Future()
@@ -545,18 +567,91 @@ class Message(object):
             future = _SUCCESS_FUTURE
             req_future = None
 
-        self._request_queue.put(
-            requests.NackRequest(
-                ack_id=self._ack_id,
-                byte_size=self.size,
-                ordering_key=self.ordering_key,
-                future=req_future,
-                opentelemetry_data=self.opentelemetry_data,
-            )
-        )
+        self._request_queue.put(self._nack_request(future=req_future))
 
         return future
 
+    def _nack_request(self, future: Optional[futures.Future]) -> requests.NackRequest:
+        """Return the request declining to acknowledge this message."""
+        if self.opentelemetry_data:
+            self.opentelemetry_data.add_process_span_event("nack called")
+            self.opentelemetry_data.end_process_span()
+        return requests.NackRequest(
+            ack_id=self._ack_id,
+            byte_size=self.size,
+            ordering_key=self.ordering_key,
+            future=future,
+            opentelemetry_data=self.opentelemetry_data,
+        )
+
     @property
     def exactly_once_enabled(self):
         return self._exactly_once_delivery_enabled_func()
+
+
+def _put_many(
+    messages: Iterable[Message],
+    make_request: Callable[[Message], Any],
+) -> None:
+    """Put the requests for several messages into their request queues, one
+    list of requests per queue."""
+    requests_by_queue: Dict[Any, List[Any]] = {}
+    for message in messages:
+        requests_by_queue.setdefault(message._request_queue, []).append(
+            make_request(message)
+        )
+
+    for request_queue, queue_requests in requests_by_queue.items():
+        request_queue.put(queue_requests)
+
+
+def _ack_many_request(message: Message) -> requests.AckRequest:
+    """Return the request acknowledging a message passed to :func:`ack_many`."""
+    _ACK_NACK_LOGGER.debug(
+        "Called ack for message (id=%s, ack_id=%s, ordering_key=%s)",
+        message.message_id,
+        message.ack_id,
+        message.ordering_key,
+    )
+    return message._ack_request(future=None)
+
+
+def _nack_many_request(message: Message) -> requests.NackRequest:
+    """Return the request declining a message passed to :func:`nack_many`."""
+    _ACK_NACK_LOGGER.debug(
+        "Called nack for message (id=%s, ack_id=%s, ordering_key=%s, exactly_once=%s)",
+        message.message_id,
+        message.ack_id,
+        message.ordering_key,
+        message._exactly_once_delivery_enabled_func(),
+    )
+    return message._nack_request(future=None)
+
+
+def ack_many(messages: Iterable[Message]) -> None:
+    """Acknowledge several messages at once.
+
+    This has the same effect as calling :meth:`Message.ack` on each of the
+    messages, but the requests of all messages received on the same
+    subscription are handed over to its streaming pull as a single batch.
+    This is meant for callbacks that process messages in batches, see the
+    ``batch_callback`` argument of
+    :meth:`~.pubsub_v1.subscriber.client.Client.subscribe`.
+
+    Args:
+        messages: The messages to acknowledge.
+    """
+    _put_many(messages, _ack_many_request)
+
+
+def nack_many(messages: Iterable[Message]) -> None:
+    """Decline to acknowledge several messages at once.
+
+    This has the same effect as calling :meth:`Message.nack` on each of the
+    messages, but the requests of all messages received on the same
+    subscription are handed over to its streaming pull as a single batch.
+
+    Args:
+        messages: The messages to decline.
+    """
+    _put_many(messages, _nack_many_request)
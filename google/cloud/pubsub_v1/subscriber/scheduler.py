@@ -20,16 +20,24 @@ each message.
 
 import abc
 import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import multiprocessing
+import os
 import queue
 import sys
+import threading
 import typing
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 import warnings
 
 if typing.TYPE_CHECKING:  # pragma: NO COVER
     from google.cloud import pubsub_v1
 
 
+_LOGGER = logging.getLogger(__name__)
+
+
 class Scheduler(metaclass=abc.ABCMeta):
     """Abstract base class for schedulers.
 
@@ -187,3 +195,222 @@ class ThreadScheduler(Scheduler):
 
         self._executor.shutdown(wait=await_msg_callbacks)
         return dropped_messages
+
+
+class _WorkerMessage(object):
+    """A copy of a received message, passed to a callback in a worker process.
+
+    It has the same data attributes as
+    :class:`~google.cloud.pubsub_v1.subscriber.message.Message`. Its
+    :meth:`ack`, :meth:`nack` and :meth:`modify_ack_deadline` methods only
+    record the call, which is then repeated on the original message in the
+    subscriber process once the callback returns.
+    """
+
+    def __init__(self, message: "pubsub_v1.subscriber.message.Message"):
+        self.message_id = message.message_id
+        self.data = message.data
+        self.attributes = dict(message.attributes)
+        self.publish_time = message.publish_time
+        self.ordering_key = message.ordering_key
+        self.size = message.size
+        self.ack_id = message.ack_id
+        self.delivery_attempt = message.delivery_attempt
+        self._calls: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def __repr__(self):
+        return "_WorkerMessage(message_id={!r}, data={!r})".format(
+            self.message_id, self.data
+        )
+
+    def ack(self) -> None:
+        """Acknowledge the message once the callback has returned."""
+        self._calls.append(("ack", ()))
+
+    def nack(self) -> None:
+        """Decline to acknowledge the message once the callback has returned."""
+        self._calls.append(("nack", ()))
+
+    def modify_ack_deadline(self, seconds: int) -> None:
+        """Modify the ack deadline of the message once the callback has returned.
+
+        Args:
+            seconds: The number of seconds to set the lease deadline to.
+        """
+        self._calls.append(("modify_ack_deadline", (seconds,)))
+
+
+def _run_in_worker(
+    callback: Callable, messages: Sequence[_WorkerMessage], batch: bool
+) -> Tuple[List[List[Tuple[str, Tuple[Any, ...]]]], Optional[Exception]]:
+    """Run the user callback in a worker process.
+
+    Returns:
+        The calls made on each of the messages, and the exception raised by
+        the callback, if any.
+    """
+    error = None
+    try:
+        if batch:
+            callback(list(messages))
+        else:
+            callback(messages[0])
+    except Exception as exc:
+        error = exc
+    return [message._calls for message in messages], error
+
+
+class _ProcessCallback(object):
+    """Runs a user callback in a process pool, on behalf of a thread of the
+    subscriber process."""
+
+    def __init__(self, scheduler: "ProcessScheduler", callback: Callable):
+        self._scheduler = scheduler
+        self._callback = callback
+
+    def __call__(self, message: Any) -> None:
+        # Batch callbacks are called with a list of messages.
+        batch = isinstance(message, list)
+        messages = message if batch else [message]
+
+        calls, error = self._scheduler._run_in_worker(
+            self._callback, [_WorkerMessage(msg) for msg in messages], batch
+        )
+
+        # Acks, nacks and modacks are sent from the subscriber process, where
+        # the messages are leased.
+        for msg, msg_calls in zip(messages, calls):
+            for method_name, args in msg_calls:
+                getattr(msg, method_name)(*args)
+
+        if error is not None:
+            raise error
+
+
+class ProcessScheduler(ThreadScheduler):
+    """A process pool-based scheduler. It must not be shared across
+       SubscriberClients.
+
+    This scheduler is useful for CPU-bound message processing, which would
+    otherwise be limited by the global interpreter lock. The callback runs in
+    a worker process, and receives a copy of the message with the same data
+    attributes as :class:`~google.cloud.pubsub_v1.subscriber.message.Message`.
+    Calling ``ack()``, ``nack()`` or ``modify_ack_deadline()`` on the copy
+    has the same effect on the original message, once the callback has
+    returned. The ``*_with_response()`` methods are not available in the
+    worker processes.
+
+    The messages are leased by the subscriber process, and each message
+    occupies one of its threads while its callback runs in a worker process.
+    The callback must be picklable, for example a function defined at the
+    top level of a module, and so must the exceptions it raises.
+
+    If a worker process dies abruptly, the callbacks that were running or
+    waiting in the pool fail with
+    :class:`~concurrent.futures.process.BrokenProcessPool`, and a new pool is
+    started for the callbacks scheduled after them.
+
+    Args:
+        max_workers:
+            The number of worker processes. Defaults to the number of CPUs.
+        mp_context:
+            The multiprocessing context used to start the worker processes.
+            Defaults to the ``"spawn"`` context, since forking a process that
+            already runs gRPC threads is not safe.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        mp_context: Optional[Any] = None,
+    ):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+
+        self._max_workers = max_workers
+        self._mp_context = mp_context
+        # Guards the replacement of a broken process pool against shutdown.
+        self._process_executor_lock = threading.Lock()
+        self._is_shutdown = False
+        self._process_executor = self._make_process_executor()
+        super().__init__(
+            executor=concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="ThreadPoolExecutor-ProcessScheduler",
+            )
+        )
+
+    def _make_process_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._max_workers, mp_context=self._mp_context
+        )
+
+    def _run_in_worker(
+        self, callback: Callable, messages: Sequence[_WorkerMessage], batch: bool
+    ) -> Tuple[List[List[Tuple[str, Tuple[Any, ...]]]], Optional[Exception]]:
+        """Run the user callback in a worker process, and wait for it.
+
+        Raises:
+            concurrent.futures.process.BrokenProcessPool: If a worker process
+                died before the callback returned. The broken pool is replaced
+                before the error is raised.
+        """
+        executor = self._process_executor
+        try:
+            future = executor.submit(_run_in_worker, callback, messages, batch)
+            return future.result()
+        except BrokenProcessPool:
+            self._replace_broken_process_executor(executor)
+            raise
+
+    def _replace_broken_process_executor(
+        self, executor: concurrent.futures.ProcessPoolExecutor
+    ) -> None:
+        """Replace a process pool whose worker died, unless that is already
+        done or the scheduler is shut down."""
+        with self._process_executor_lock:
+            if self._is_shutdown or self._process_executor is not executor:
+                return
+            _LOGGER.warning(
+                "A worker process of the ProcessScheduler terminated abruptly, "
+                "starting a new process pool."
+            )
+            self._process_executor = self._make_process_executor()
+        executor.shutdown(wait=False)
+
+    def wrap_callback(self, callback: Callable) -> Callable:
+        """Return a callable that runs ``callback`` in a worker process.
+
+        Args:
+            callback: The user callback, called with a message or a list of
+                messages.
+
+        Returns:
+            A callable to be passed to :meth:`schedule` in place of
+            ``callback``.
+        """
+        return _ProcessCallback(self, callback)
+
+    def shutdown(
+        self, await_msg_callbacks: bool = False
+    ) -> List["pubsub_v1.subscriber.message.Message"]:
+        """Shut down the scheduler and immediately end all pending callbacks.
+
+        Args:
+            await_msg_callbacks:
+                If ``True``, the method will block until the callbacks running
+                in the worker processes are done, and their messages have been
+                acknowledged or declined. If ``False`` (default), the method
+                will not wait for the running callbacks to complete.
+
+        Returns:
+            The messages submitted to the scheduler that were not yet dispatched
+            to their callbacks.
+        """
+        dropped_messages = super().shutdown(await_msg_callbacks=await_msg_callbacks)
+        with self._process_executor_lock:
+            self._is_shutdown = True
+        self._process_executor.shutdown(wait=await_msg_callbacks)
+        return dropped_messages
@@ -19,7 +19,7 @@ import enum
 import inspect
 import sys
 import typing
-from typing import Dict, NamedTuple, Union
+from typing import Dict, Iterator, Mapping, NamedTuple, Optional, Union
 
 import proto  # type: ignore
 
@@ -41,6 +41,7 @@ from google.pubsub_v1.types import pubsub as pubsub_gapic_types
 
 
 if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from concurrent import futures
     from types import ModuleType
     from google.pubsub_v1 import types as gapic_types
     from google.pubsub_v1.services.publisher.client import OptionalRetry
@@ -99,6 +100,139 @@ class BatchSettings(NamedTuple):
     )
 
 
+class AdaptiveBatchSettings(NamedTuple):
+    """The bounds within which the publisher tunes its batch settings.
+
+    With adaptive batching, the publisher client periodically adjusts its
+    :class:`BatchSettings` to the observed traffic. The maximum latency is
+    set to the part of the target publish latency that is not taken by the
+    publish RPC itself, and the maximum batch size follows the rate at which
+    messages are published, so that most batches are committed on time
+    rather than when full. All settings are halved when the publish latency
+    exceeds the target.
+
+    Attributes:
+        target_latency (float):
+            The publish latency, in seconds, that 99% of the messages should
+            stay under, measured from when the message is added to a batch to
+            when the publish RPC completes. Defaults to 100ms.
+        min_latency (float):
+            The lower bound of ``BatchSettings.max_latency``. Defaults to 1ms.
+        max_latency (float):
+            The upper bound of ``BatchSettings.max_latency``. Defaults to 100ms.
+        min_messages (int):
+            The lower bound of ``BatchSettings.max_messages``. Defaults to 10.
+        max_messages (int):
+            The upper bound of ``BatchSettings.max_messages``. Defaults to 1000.
+        min_bytes (int):
+            The lower bound of ``BatchSettings.max_bytes``. Defaults to 10 kB.
+        max_bytes (int):
+            The upper bound of ``BatchSettings.max_bytes``. Defaults to 5 MB.
+        adjust_interval (float):
+            The number of seconds over which the traffic is observed before
+            the batch settings are adjusted. Defaults to 1 second.
+    """
+
+    target_latency: float = 0.1  # 100 ms
+    (
+        "The publish latency, in seconds, that 99% of the messages should stay "
+        "under, measured from when the message is added to a batch to when the "
+        "publish RPC completes."
+    )
+
+    min_latency: float = 0.001  # 1 ms
+    "The lower bound of ``BatchSettings.max_latency``."
+
+    max_latency: float = 0.1  # 100 ms
+    "The upper bound of ``BatchSettings.max_latency``."
+
+    min_messages: int = 10
+    "The lower bound of ``BatchSettings.max_messages``."
+
+    max_messages: int = 1000
+    "The upper bound of ``BatchSettings.max_messages``."
+
+    min_bytes: int = 10 * 1000  # 10 kB
+    "The lower bound of ``BatchSettings.max_bytes``."
+
+    max_bytes: int = 5 * 1000 * 1000  # 5 MB
+    "The upper bound of ``BatchSettings.max_bytes``."
+
+    adjust_interval: float = 1.0  # 1 second
+    (
+        "The number of seconds over which the traffic is observed before the "
+        "batch settings are adjusted."
+    )
+
+
+class AdaptiveConcurrencySettings(NamedTuple):
+    """The bounds of the adaptive limit on concurrent publish RPCs per topic.
+
+    With adaptive concurrency, the publisher client limits the number of
+    batches of a topic that are being committed at the same time with an
+    additive-increase/multiplicative-decrease (AIMD) controller. The limit
+    grows by one for every round of healthy publish RPCs, and is halved when
+    an RPC fails with ``ResourceExhausted`` or ``DeadlineExceeded``, or takes
+    more than ``latency_tolerance`` times the usual publish latency. Batches
+    over the limit are queued in the client.
+
+    Attributes:
+        min_outstanding_batches (int):
+            The lower bound of the limit. Defaults to 1.
+        initial_outstanding_batches (int):
+            The limit that each topic starts with. Defaults to 10.
+        max_outstanding_batches (int):
+            The upper bound of the limit. Defaults to 100.
+        latency_tolerance (float):
+            How many times slower than usual a publish RPC may be before the
+            limit is decreased. Defaults to 2.
+    """
+
+    min_outstanding_batches: int = 1
+    "The lower bound of the limit."
+
+    initial_outstanding_batches: int = 10
+    "The limit that each topic starts with."
+
+    max_outstanding_batches: int = 100
+    "The upper bound of the limit."
+
+    latency_tolerance: float = 2.0
+    (
+        "How many times slower than usual a publish RPC may be before the "
+        "limit is decreased."
+    )
+
+
+class ScheduledRetrySettings(NamedTuple):
+    """The client-wide budget of publish retries that are scheduled on a timer.
+
+    With scheduled retries, a failed publish RPC is not retried by the thread
+    that sent it. Instead, the batch is committed again once a jittered
+    backoff has elapsed, which is waited for on a single timer thread that is
+    shared by the whole client. The backoff, the retried errors and the
+    deadline are taken from the retry of the batch.
+
+    All topics of the client share a budget of retry tokens. Each failed
+    publish RPC costs one token, and each successful one returns
+    ``token_ratio`` tokens. Once half of the tokens are spent, failed RPCs
+    are no longer retried, and their batches fail with the error.
+
+    Attributes:
+        max_tokens (float):
+            The number of tokens in the budget. Defaults to 100.
+        token_ratio (float):
+            The number of tokens that a successful publish RPC returns to the
+            budget. Defaults to 0.1.
+    """
+
+    max_tokens: float = 100.0
+    "The number of tokens in the budget."
+
+    token_ratio: float = 0.1
+    "The number of tokens that a successful publish RPC returns to the budget."
+
+
 class LimitExceededBehavior(str, enum.Enum):
     """The possible actions when exceeding the publish flow control limits."""
 
@@ -132,6 +266,113 @@ class PublishFlowControl(NamedTuple):
     """The action to take when publish flow control limits are exceeded."""
 
 
+class PublishRateLimit(NamedTuple):
+    """The rates at which the publisher client may publish messages.
+
+    Each limit is enforced with a token bucket that holds up to
+    ``burst_seconds`` worth of its rate. The client-wide limits apply to the
+    messages of all topics together, the topic limits to the messages of
+    each topic on its own. Limits that are ``None`` are not enforced.
+
+    Attributes:
+        messages_per_second (Optional[float]):
+            The number of messages per second that the client may publish.
+        bytes_per_second (Optional[float]):
+            The number of message bytes per second that the client may
+            publish.
+        topic_messages_per_second (Optional[float]):
+            The number of messages per second that the client may publish to
+            each topic.
+        topic_bytes_per_second (Optional[float]):
+            The number of message bytes per second that the client may
+            publish to each topic.
+        burst_seconds (float):
+            How many seconds worth of each rate may be published at once
+            after a quiet period. Defaults to 1.
+        limit_exceeded_behavior (LimitExceededBehavior):
+            The action to take when publishing a message would exceed a
+            limit. ``BLOCK`` delays the publish until the message fits into
+            the rate, ``ERROR`` fails its future, and ``IGNORE`` disables the
+            limits. Defaults to ``BLOCK``.
+    """
+
+    messages_per_second: Optional[float] = None
+    "The number of messages per second that the client may publish."
+
+    bytes_per_second: Optional[float] = None
+    "The number of message bytes per second that the client may publish."
+
+    topic_messages_per_second: Optional[float] = None
+    "The number of messages per second that the client may publish to each topic."
+
+    topic_bytes_per_second: Optional[float] = None
+    (
+        "The number of message bytes per second that the client may publish to "
+        "each topic."
+    )
+
+    burst_seconds: float = 1.0
+    (
+        "How many seconds worth of each rate may be published at once after a "
+        "quiet period."
+    )
+
+    limit_exceeded_behavior: LimitExceededBehavior = LimitExceededBehavior.BLOCK
+    "The action to take when publishing a message would exceed a limit."
+
+
+class PublishAttributes(Mapping[str, str]):
+    """Message attributes that are validated once, ahead of publishing.
+
+    The attribute values may be text strings or byte strings, the latter are
+    decoded as UTF-8. The publisher client trusts instances of this class,
+    and uses them as they are, without checking and copying the attributes
+    again for every message. This pays off when the same attributes are
+    published with many messages, e.g. through
+    :meth:`~.pubsub_v1.publisher.client.Client.publish_many`.
+
+    Instances are immutable.
+
+    Args:
+        attributes: The attributes, as a mapping or as keyword arguments.
+
+    Raises:
+        TypeError: If any of the attribute values is not a string.
+    """
+
+    __slots__ = ("_attributes",)
+
+    def __init__(
+        self,
+        attributes: Optional[Mapping[str, Union[bytes, str]]] = None,
+        **kwargs: Union[bytes, str],
+    ):
+        validated = dict(attributes or {}, **kwargs)
+        for key, value in validated.items():
+            if isinstance(value, str):
+                continue
+            if isinstance(value, bytes):
+                validated[key] = value.decode("utf-8")
+                continue
+            raise TypeError(
+                "All attributes being published to Pub/Sub must "
+                "be sent as text strings."
+            )
+        self._attributes: Dict[str, str] = validated
+
+    def __getitem__(self, key: str) -> str:
+        return self._attributes[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._attributes)
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __repr__(self) -> str:
+        return "PublishAttributes({!r})".format(self._attributes)
+
+
 # Define the default subscriber options.
 #
 # This class is used when creating a subscriber client to pass in options
@@ -175,6 +416,45 @@ class PublisherOptions(NamedTuple):
         timeout (OptionalTimeout):
             Timeout settings for message publishing by the client. It should be
             compatible with :class:`~.pubsub_v1.types.TimeoutType`.
+        enable_open_telemetry_tracing (bool):
+            Whether to enable OpenTelemetry tracing. Defaults to False.
+        commit_executor (Optional[concurrent.futures.Executor]):
+            The executor on which batches are committed. By default, a new
+            thread is started for each batch commit. Ignored by the asyncio
+            publisher client, which always commits on its event loop.
+        max_outstanding_batches (int):
+            The maximum number of batches per topic that are being committed
+            at the same time. Further batches are queued in the client until
+            an in-flight commit completes. Defaults to 0 (no limit).
+        adaptive_batching (Optional[AdaptiveBatchSettings]):
+            If set, the client tunes its batch settings to the observed
+            traffic, within the given bounds. The batch settings passed to the
+            client are used as the starting point. Ignored by the asyncio
+            publisher client. Disabled by default.
+        adaptive_concurrency (Optional[AdaptiveConcurrencySettings]):
+            If set, the number of batches per topic that are being committed
+            at the same time is limited adaptively, within the given bounds,
+            instead of by ``max_outstanding_batches``. Ignored by the asyncio
+            publisher client. Disabled by default.
+        coalesce_ordering_keys (bool):
+            Whether the batches of different ordering keys of a topic may be
+            published in the same publish RPC. If such an RPC fails, all of
+            its ordering keys are paused. Ignored by the asyncio publisher
+            client, and when OpenTelemetry tracing is enabled. Defaults to
+            False.
+        scheduled_retries (Optional[ScheduledRetrySettings]):
+            If set, failed publish RPCs are retried on a timer shared by the
+            whole client, within a client-wide retry budget, instead of by
+            the thread that sent them. Ignored by the asyncio publisher
+            client. Disabled by default.
+        rate_limit (Optional[PublishRateLimit]):
+            If set, the client limits the rate at which it publishes
+            messages, per client and per topic. Disabled by default.
+        topic_batch_settings (Optional[Mapping[str, BatchSettings]]):
+            The batch settings of particular topics, by topic path, which
+            are used instead of the batch settings of the client. These
+            topics are left out of adaptive batching. By default, all topics
+            share the batch settings of the client.
     """
 
     enable_message_ordering: bool = False
@@ -211,6 +491,63 @@ class PublisherOptions(NamedTuple):
     trace architecture changes without notice.
     """
 
+    commit_executor: "Optional[futures.Executor]" = None  # new thread per batch
+    (
+        "The executor on which batches are committed. By default, a new thread "
+        "is started for each batch commit. Ignored by the asyncio publisher "
+        "client, which always commits on its event loop."
+    )
+
+    max_outstanding_batches: int = 0  # no limit
+    (
+        "The maximum number of batches per topic that are being committed at "
+        "the same time. Further batches are queued in the client until an "
+        "in-flight commit completes. Zero means no limit."
+    )
+
+    adaptive_batching: Optional[AdaptiveBatchSettings] = None  # disabled
+    (
+        "If set, the client tunes its batch settings to the observed traffic, "
+        "within the given bounds. The batch settings passed to the client are "
+        "used as the starting point. Ignored by the asyncio publisher client."
+    )
+
+    adaptive_concurrency: Optional[AdaptiveConcurrencySettings] = None  # disabled
+    (
+        "If set, the number of batches per topic that are being committed at "
+        "the same time is limited adaptively, within the given bounds, instead "
+        "of by ``max_outstanding_batches``. Ignored by the asyncio publisher "
+        "client."
+    )
+
+    coalesce_ordering_keys: bool = False
+    (
+        "Whether the batches of different ordering keys of a topic may be "
+        "published in the same publish RPC. If such an RPC fails, all of its "
+        "ordering keys are paused. Ignored by the asyncio publisher client, and "
+        "when OpenTelemetry tracing is enabled."
+    )
+
+    scheduled_retries: Optional[ScheduledRetrySettings] = None  # disabled
+    (
+        "If set, failed publish RPCs are retried on a timer shared by the whole "
+        "client, within a client-wide retry budget, instead of by the thread "
+        "that sent them. Ignored by the asyncio publisher client."
+    )
+
+    rate_limit: Optional[PublishRateLimit] = None  # disabled
+    (
+        "If set, the client limits the rate at which it publishes messages, per "
+        "client and per topic."
+    )
+
+    topic_batch_settings: Optional[Mapping[str, BatchSettings]] = None
+    (
+        "The batch settings of particular topics, by topic path, which are used "
+        "instead of the batch settings of the client. These topics are left out "
+        "of adaptive batching."
+    )
+
 
 # Define the type class and default values for flow control settings.
 #
@@ -314,10 +651,15 @@ _shared_modules = [
 _local_modules = [pubsub_gapic_types]
 
 names = [
+    "AdaptiveBatchSettings",
+    "AdaptiveConcurrencySettings",
     "BatchSettings",
     "LimitExceededBehavior",
+    "PublishAttributes",
     "PublishFlowControl",
+    "PublishRateLimit",
     "PublisherOptions",
+    "ScheduledRetrySettings",
     "FlowControl",
 ]
 
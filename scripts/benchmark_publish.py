@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the client-side overhead of publishing a message.
+
+The publish RPCs are answered locally, so that only the work done by the
+publisher client itself is measured: validating the message, flow control and
+adding it to a batch. The end-to-end time also includes serializing the
+publish requests, and parsing them again on the answering side.
+
+With --buffer, the messages are published as views into a shared buffer,
+instead of as byte strings.
+"""
+
+import argparse
+import time
+
+from google.auth.credentials import AnonymousCredentials
+
+from google.cloud import pubsub_v1
+from google.pubsub_v1 import types as gapic_types
+
+
+TOPIC = "projects/benchmark-project/topics/benchmark-topic"
+
+
+def answer_publish(request, retry=None, timeout=None, metadata=()):
+    messages = gapic_types.PublishRequest.pb().FromString(request).messages
+    return gapic_types.PublishResponse.pb()(message_ids=["id"] * len(messages))
+
+
+def create_client(args):
+    client = pubsub_v1.PublisherClient(
+        credentials=AnonymousCredentials(),
+        batch_settings=pubsub_v1.types.BatchSettings(
+            max_messages=args.batch_size, max_latency=float("inf")
+        ),
+        publisher_options=pubsub_v1.types.PublisherOptions(
+            enable_open_telemetry_tracing=args.tracing,
+        ),
+    )
+    client._raw_publish_rpc = answer_publish
+    return client
+
+
+def run(args):
+    client = create_client(args)
+    if args.buffer:
+        data = memoryview(bytearray(b"x" * args.message_size))
+    else:
+        data = b"x" * args.message_size
+    attrs = {"key{}".format(i): "value" for i in range(args.attributes)}
+
+    publish_futures = []
+    start = time.perf_counter()
+    for _ in range(args.messages):
+        publish_futures.append(client.publish(TOPIC, data, **attrs))
+    published = time.perf_counter()
+
+    client.stop()
+    for future in publish_futures:
+        future.result()
+    return published - start, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--message-size", type=int, default=100)
+    parser.add_argument("--attributes", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tracing", action="store_true")
+    parser.add_argument("--buffer", action="store_true")
+    args = parser.parse_args()
+
+    runs = [run(args) for _ in range(args.repeat)]
+    print(
+        "{:.2f} us per publish() call, {:.2f} us per message end to end "
+        "(best of {} runs of {} messages)".format(
+            min(publish for publish, _ in runs) / args.messages * 1e6,
+            min(total for _, total in runs) / args.messages * 1e6,
+            args.repeat,
+            args.messages,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
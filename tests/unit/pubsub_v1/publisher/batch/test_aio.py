@@ -0,0 +1,265 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from unittest import mock
+
+import pytest
+
+import google.api_core.exceptions
+from google.api_core import gapic_v1
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch.base import BatchCancellationReason
+from google.cloud.pubsub_v1.publisher._batch.aio import Batch
+from google.pubsub_v1 import types as gapic_types
+from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
+    PublishMessageWrapper,
+)
+
+
+def create_batch(
+    topic="topic_name",
+    batch_done_callback=None,
+    commit_when_full=True,
+    **batch_settings,
+):
+    client = publisher.AsyncClient(credentials=credentials.AnonymousCredentials())
+    settings = types.BatchSettings(**batch_settings)
+    return Batch(
+        client,
+        topic,
+        settings,
+        batch_done_callback=batch_done_callback,
+        commit_when_full=commit_when_full,
+    )
+
+
+def create_wrapper(data):
+    return PublishMessageWrapper(message=gapic_types.PubsubMessage(data=data))
+
+
+@pytest.mark.asyncio
+async def test_commit():
+    batch = create_batch()
+    batch.publish(create_wrapper(b"foo"))
+
+    with mock.patch.object(type(batch.client), "_start_batch_commit") as start:
+        batch.commit()
+
+    start.assert_called_once_with("topic_name", batch._commit)
+    assert batch.status == BatchStatus.STARTING
+
+
+@pytest.mark.asyncio
+async def test_commit_no_op():
+    batch = create_batch()
+    batch._status = BatchStatus.IN_PROGRESS
+
+    with mock.patch.object(type(batch.client), "_start_batch_commit") as start:
+        batch.commit()
+
+    start.assert_not_called()
+    assert batch.status == BatchStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test__commit():
+    batch_done_callback = mock.Mock(spec=())
+    batch = create_batch(batch_done_callback=batch_done_callback)
+    futures = (
+        batch.publish(create_wrapper(b"This is my message.")),
+        batch.publish(create_wrapper(b"This is another message.")),
+    )
+
+    publish_response = gapic_types.PublishResponse(message_ids=["a", "b"])
+    patch = mock.patch.object(
+        type(batch.client),
+        "_gapic_publish",
+        new_callable=mock.AsyncMock,
+        return_value=publish_response,
+    )
+    with patch as publish:
+        await batch._commit()
+
+    publish.assert_awaited_once_with(
+        topic="topic_name",
+        messages=[
+            gapic_types.PubsubMessage(data=b"This is my message."),
+            gapic_types.PubsubMessage(data=b"This is another message."),
+        ],
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+    )
+    assert await futures[0] == "a"
+    assert await futures[1] == "b"
+    assert batch.status == BatchStatus.SUCCESS
+    batch_done_callback.assert_called_once_with(True)
+
+
+@pytest.mark.asyncio
+async def test__commit_api_error():
+    batch_done_callback = mock.Mock(spec=())
+    batch = create_batch(batch_done_callback=batch_done_callback)
+    future = batch.publish(create_wrapper(b"foo"))
+
+    error = google.api_core.exceptions.InternalServerError("uh oh")
+    patch = mock.patch.object(
+        type(batch.client),
+        "_gapic_publish",
+        new_callable=mock.AsyncMock,
+        side_effect=error,
+    )
+    with patch:
+        await batch._commit()
+
+    assert batch.status == BatchStatus.ERROR
+    assert future.exception() is error
+    batch_done_callback.assert_called_once_with(False)
+
+
+@pytest.mark.asyncio
+async def test__commit_unexpected_error():
+    batch_done_callback = mock.Mock(spec=())
+    batch = create_batch(batch_done_callback=batch_done_callback)
+    futures = (
+        batch.publish(create_wrapper(b"foo")),
+        batch.publish(create_wrapper(b"bar")),
+    )
+
+    error = ValueError("uh oh")
+    patch = mock.patch.object(
+        type(batch.client),
+        "_gapic_publish",
+        new_callable=mock.AsyncMock,
+        side_effect=error,
+    )
+    with patch:
+        await batch._commit()
+
+    assert batch.status == BatchStatus.ERROR
+    for future in futures:
+        assert future.exception() is error
+    batch_done_callback.assert_called_once_with(False)
+
+
+@pytest.mark.asyncio
+async def test__commit_cancelled():
+    batch_done_callback = mock.Mock(spec=())
+    batch = create_batch(batch_done_callback=batch_done_callback)
+    futures = (
+        batch.publish(create_wrapper(b"foo")),
+        batch.publish(create_wrapper(b"bar")),
+    )
+    publish_started = asyncio.Event()
+
+    async def gapic_publish(*args, **kwargs):
+        publish_started.set()
+        await asyncio.Event().wait()
+
+    with mock.patch.object(type(batch.client), "_gapic_publish", gapic_publish):
+        task = asyncio.get_running_loop().create_task(batch._commit())
+        await asyncio.wait_for(publish_started.wait(), timeout=5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert batch.status == BatchStatus.ERROR
+    # The callers awaiting the messages do not hang.
+    for future in futures:
+        assert future.cancelled()
+    batch_done_callback.assert_called_once_with(False)
+
+
+@pytest.mark.asyncio
+async def test__commit_wrong_number_of_message_ids():
+    batch = create_batch()
+    futures = (
+        batch.publish(create_wrapper(b"foo")),
+        batch.publish(create_wrapper(b"bar")),
+    )
+
+    publish_response = gapic_types.PublishResponse(message_ids=["a"])
+    patch = mock.patch.object(
+        type(batch.client),
+        "_gapic_publish",
+        new_callable=mock.AsyncMock,
+        return_value=publish_response,
+    )
+    with patch:
+        await batch._commit()
+
+    assert batch.status == BatchStatus.ERROR
+    for future in futures:
+        assert isinstance(future.exception(), exceptions.PublishError)
+
+
+@pytest.mark.asyncio
+async def test__commit_no_messages():
+    batch = create_batch()
+    with mock.patch.object(
+        type(batch.client), "_gapic_publish", new_callable=mock.AsyncMock
+    ) as publish:
+        await batch._commit()
+
+    publish.assert_not_awaited()
+    assert batch.status == BatchStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_publish_commits_when_full():
+    batch = create_batch(max_messages=2)
+
+    with mock.patch.object(batch, "commit") as commit:
+        assert batch.publish(create_wrapper(b"foo")) is not None
+        commit.assert_not_called()
+        assert batch.publish(create_wrapper(b"bar")) is None
+        commit.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_publish_not_accepting_messages():
+    batch = create_batch()
+    batch._status = BatchStatus.STARTING
+
+    assert batch.publish(create_wrapper(b"foo")) is None
+
+
+@pytest.mark.asyncio
+async def test_publish_message_too_large():
+    batch = create_batch()
+
+    with pytest.raises(exceptions.MessageTooLargeError):
+        batch.publish(create_wrapper(b"x" * 10 * 1000 * 1000))
+
+
+@pytest.mark.asyncio
+async def test_cancel():
+    batch = create_batch()
+    future = batch.publish(create_wrapper(b"foo"))
+
+    batch.cancel(BatchCancellationReason.PRIOR_ORDERED_MESSAGE_FAILED)
+
+    assert batch.status == BatchStatus.ERROR
+    with pytest.raises(RuntimeError):
+        await future
+
+
+@pytest.mark.asyncio
+async def test_make_lock():
+    assert isinstance(Batch.make_lock(), asyncio.Lock)
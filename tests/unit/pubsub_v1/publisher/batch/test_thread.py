@@ -26,6 +26,7 @@ from opentelemetry.trace import SpanContext
 
 import google.api_core.exceptions
 from google.api_core import gapic_v1
+from google.api_core import retry as retries
 from google.auth import credentials
 from google.auth import exceptions as auth_exceptions
 from google.cloud.pubsub_v1 import publisher
@@ -35,6 +36,7 @@ from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
 from google.cloud.pubsub_v1.publisher._batch.base import BatchCancellationReason
 from google.cloud.pubsub_v1.publisher._batch import thread
 from google.cloud.pubsub_v1.publisher._batch.thread import Batch
+from google.cloud.pubsub_v1.publisher._retry_scheduler import RetryScheduler
 from google.pubsub_v1 import types as gapic_types
 from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
     PublishMessageWrapper,
@@ -176,6 +178,74 @@ def test_blocking__commit():
     assert futures[1].result() == "b"
 
 
+def test_blocking__commit_records_batch_commit():
+    batch = create_batch(max_latency=float("inf"))
+    batch.publish(
+        wrapper=PublishMessageWrapper(
+            message=gapic_types.PubsubMessage(data=b"This is my message.")
+        )
+    )
+
+    publish_response = gapic_types.PublishResponse(message_ids=["a"])
+    patch_publish = mock.patch.object(
+        type(batch.client), "_gapic_publish", return_value=publish_response
+    )
+    patch_record = mock.patch.object(type(batch.client), "_record_batch_commit")
+    with patch_publish, patch_record as record:
+        batch._commit()
+
+    record.assert_called_once()
+    topic, settings, message_count, byte_count, age, rpc_latency = record.call_args.args
+    assert topic == "topic_name"
+    assert settings is batch.settings
+    assert message_count == 1
+    assert byte_count == batch.size
+    assert age >= 0
+    assert rpc_latency >= 0
+
+
+def test_blocking__commit_records_publish_rpc():
+    batch = create_batch(topic="topic_name", max_latency=float("inf"))
+    batch.publish(
+        wrapper=PublishMessageWrapper(
+            message=gapic_types.PubsubMessage(data=b"This is my message.")
+        )
+    )
+
+    publish_response = gapic_types.PublishResponse(message_ids=["a"])
+    patch_publish = mock.patch.object(
+        type(batch.client), "_gapic_publish", return_value=publish_response
+    )
+    patch_record = mock.patch.object(type(batch.client), "_record_publish_rpc")
+    with patch_publish, patch_record as record:
+        batch._commit()
+
+    record.assert_called_once()
+    topic, start, rpc_latency = record.call_args.args
+    assert topic == "topic_name"
+    assert start >= batch._created
+    assert rpc_latency >= 0
+
+
+def test_blocking__commit_records_failed_publish_rpc():
+    batch = create_batch(topic="topic_name", max_latency=float("inf"))
+    batch.publish(
+        wrapper=PublishMessageWrapper(
+            message=gapic_types.PubsubMessage(data=b"This is my message.")
+        )
+    )
+
+    error = google.api_core.exceptions.ResourceExhausted("Quota exceeded")
+    patch_publish = mock.patch.object(
+        type(batch.client), "_gapic_publish", side_effect=error
+    )
+    patch_record = mock.patch.object(type(batch.client), "_record_publish_rpc")
+    with patch_publish, patch_record as record:
+        batch._commit()
+
+    record.assert_called_once_with("topic_name", mock.ANY, mock.ANY, error)
+
+
 def test_blocking__commit_custom_retry():
     batch = create_batch(commit_retry=mock.sentinel.custom_retry)
     batch.publish(
@@ -386,6 +456,92 @@ def test_block__commmit_retry_error():
         assert future.exception() == error
 
 
+def run_callback_now(delay, callback):
+    callback()
+    return True
+
+
+def create_batch_with_scheduled_retries(**kwargs):
+    batch = create_batch(**kwargs)
+    client = batch.client
+    client._retry_scheduler = RetryScheduler(
+        types.ScheduledRetrySettings(),
+        default_retry=retries.Retry(
+            predicate=retries.if_exception_type(
+                google.api_core.exceptions.ServiceUnavailable
+            ),
+            deadline=60.0,
+        ),
+    )
+    # Run the retries right away, on the same thread.
+    client._retry_scheduler._timer = mock.Mock(
+        spec=["schedule"], schedule=run_callback_now
+    )
+    client._start_batch_commit = lambda topic, commit: commit()
+    return batch
+
+
+def test_blocking__commit_scheduled_retry():
+    batch = create_batch_with_scheduled_retries()
+    future = batch.publish(
+        wrapper=PublishMessageWrapper(
+            message=gapic_types.PubsubMessage(data=b"This is my message.")
+        )
+    )
+
+    error = google.api_core.exceptions.ServiceUnavailable("unavailable")
+    publish_response = gapic_types.PublishResponse(message_ids=["a"])
+    patch = mock.patch.object(
+        type(batch.client),
+        "_gapic_publish",
+        side_effect=[error, error, publish_response],
+    )
+    with patch as publish:
+        batch._commit()
+
+    assert future.result() == "a"
+    assert publish.call_count == 3
+    for call in publish.call_args_list:
+        assert call.kwargs["retry"] is None
+    assert batch.client._retry_scheduler.tokens == 98.1
+
+
+def test_blocking__commit_scheduled_retry_not_retryable():
+    batch = create_batch_with_scheduled_retries()
+    future = batch.publish(
+        wrapper=PublishMessageWrapper(
+            message=gapic_types.PubsubMessage(data=b"This is my message.")
+        )
+    )
+
+    error = google.api_core.exceptions.InvalidArgument("invalid")
+    patch = mock.patch.object(type(batch.client), "_gapic_publish", side_effect=error)
+    with patch as publish:
+        batch._commit()
+
+    assert future.exception() is error
+    publish.assert_called_once()
+
+
+def test_blocking__commit_scheduled_retry_custom_retry():
+    batch = create_batch_with_scheduled_retries(commit_retry=mock.sentinel.retry)
+    batch.publish(
+        wrapper=PublishMessageWrapper(
+            message=gapic_types.PubsubMessage(data=b"This is my message.")
+        )
+    )
+
+    publish_response = gapic_types.PublishResponse(message_ids=["a"])
+    patch = mock.patch.object(
+        type(batch.client), "_gapic_publish", return_value=publish_response
+    )
+    with patch as publish:
+        batch._commit()
+
+    # Retries that are not api_core retries are left to the RPC.
+    assert publish.call_args.kwargs["retry"] is mock.sentinel.retry
+
+
 def test_publish_updating_batch_size():
     batch = create_batch(topic="topic_foo")
     wrappers = (
@@ -428,6 +584,16 @@ def test_publish():
     assert batch._futures == [future]
 
 
+@pytest.mark.parametrize(
+    "data_size", [0, 100, 125, 126, 16378, 16379, 2**21, 2**21 + 10]
+)
+def test_request_size_increase(data_size):
+    message = gapic_types.PubsubMessage(data=b"x" * data_size)
+    expected = gapic_types.PublishRequest(messages=[message])._pb.ByteSize()
+
+    assert thread._request_size_increase(message._pb.ByteSize()) == expected
+
+
 def test_publish_max_messages_zero():
     batch = create_batch(topic="topic_foo", max_messages=0)
     wrapper = PublishMessageWrapper(
@@ -967,3 +1133,12 @@ def test_opentelemetry_commit(span_exporter):
     assert create_span1.events[1].name == "publish end"
     assert create_span2.events[0].name == "publish start"
     assert create_span2.events[1].name == "publish end"
+
+
+def test_start_commit_thread_hands_commit_to_client():
+    batch = create_batch()
+
+    with mock.patch.object(type(batch.client), "_start_batch_commit") as start:
+        batch._start_commit_thread()
+
+    start.assert_called_once_with("topic_name", batch._commit)
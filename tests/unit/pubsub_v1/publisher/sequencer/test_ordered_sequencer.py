@@ -19,6 +19,7 @@ import pytest
 
 from google.auth import credentials
 from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher._sequencer import ordered_sequencer
 from google.pubsub_v1 import types as gapic_types
 from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
@@ -35,7 +36,11 @@ def create_message():
 
 
 def create_client():
-    return publisher.Client(credentials=credentials.AnonymousCredentials())
+    # Batches are committed explicitly by the tests, disable the commit timer.
+    return publisher.Client(
+        credentials=credentials.AnonymousCredentials(),
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
 
 
 def create_ordered_sequencer(client):
@@ -227,11 +232,13 @@ def test_batch_done_successfully():
     sequencer = ordered_sequencer.OrderedSequencer(client, "topic_name", _ORDERING_KEY)
     sequencer._set_batch(batch)
 
-    sequencer._batch_done_callback(success=True)
+    with mock.patch.object(client, "_sequencer_finished") as sequencer_finished:
+        sequencer._batch_done_callback(success=True)
 
     # One batch is done, so the OrderedSequencer has no more work, and should
     # return true for is_finished().
     assert sequencer.is_finished()
+    sequencer_finished.assert_called_once_with("topic_name", _ORDERING_KEY)
 
     # No batches remain in the batches list.
     assert len(sequencer._get_batches()) == 0
@@ -283,6 +290,117 @@ def test_batch_done_successfully_many_batches_remain():
     assert len(sequencer._get_batches()) == 2
 
 
+def test_batch_done_commits_overdue_batch():
+    client = create_client()
+    batch1 = mock.Mock(spec=client._batch_class)
+    batch2 = mock.Mock(spec=client._batch_class)
+
+    sequencer = ordered_sequencer.OrderedSequencer(client, "topic_name", _ORDERING_KEY)
+    sequencer._set_batches([batch1, batch2])
+
+    # The deadline of the second batch expires while the first one is in
+    # flight, it cannot be committed yet.
+    sequencer.commit_batch(batch2)
+    assert batch2.commit.call_count == 0
+
+    sequencer._batch_done_callback(success=True)
+
+    # The second batch is now first in line and overdue, so commit it.
+    assert batch2.commit.call_count == 1
+
+
+def test_commit_batch_first_batch():
+    client = create_client()
+    batch1 = mock.Mock(spec=client._batch_class)
+    batch2 = mock.Mock(spec=client._batch_class)
+
+    sequencer = ordered_sequencer.OrderedSequencer(client, "topic_name", _ORDERING_KEY)
+    sequencer._set_batches([batch1, batch2])
+
+    sequencer.commit_batch(batch1)
+
+    assert batch1.commit.call_count == 1
+    assert batch2.commit.call_count == 0
+
+
+def test_commit_batch_unknown_batch():
+    client = create_client()
+    batch1 = mock.Mock(spec=client._batch_class)
+    done_batch = mock.Mock(spec=client._batch_class)
+
+    sequencer = ordered_sequencer.OrderedSequencer(client, "topic_name", _ORDERING_KEY)
+    sequencer._set_batch(batch1)
+
+    # The batch is already done and has been removed from the sequencer.
+    sequencer.commit_batch(done_batch)
+
+    assert done_batch.commit.call_count == 0
+    assert batch1.commit.call_count == 0
+    assert not sequencer._overdue_batches
+
+
+def test_commit_batch_paused():
+    client = create_client()
+    batch1 = mock.Mock(spec=client._batch_class)
+    batch2 = mock.Mock(spec=client._batch_class)
+
+    sequencer = ordered_sequencer.OrderedSequencer(client, "topic_name", _ORDERING_KEY)
+    sequencer._set_batches([batch1, batch2])
+    sequencer.commit_batch(batch2)
+
+    sequencer._batch_done_callback(success=False)
+    sequencer.commit_batch(batch2)
+
+    assert batch2.commit.call_count == 0
+    assert not sequencer._overdue_batches
+
+
+def test_flush():
+    client = create_client()
+    batch1 = mock.Mock(spec=client._batch_class)
+    batch2 = mock.Mock(spec=client._batch_class)
+
+    sequencer = ordered_sequencer.OrderedSequencer(client, "topic_name", _ORDERING_KEY)
+    sequencer._set_batches([batch1, batch2])
+
+    sequencer.flush()
+
+    assert batch1.commit.call_count == 1
+    assert batch2.commit.call_count == 0
+
+    sequencer._batch_done_callback(success=True)
+
+    # The second batch is committed as soon as it is first in line.
+    assert batch2.commit.call_count == 1
+
+
+def test_flush_stopped():
+    client = create_client()
+    batch = mock.Mock(spec=client._batch_class)
+
+    sequencer = ordered_sequencer.OrderedSequencer(client, "topic_name", _ORDERING_KEY)
+    sequencer._set_batch(batch)
+    sequencer.stop()
+
+    sequencer.flush()
+
+    assert batch.commit.call_count == 1
+    assert not sequencer._overdue_batches
+
+
+def test_publish_schedules_batch_commit():
+    client = create_client()
+    message = create_message()
+    sequencer = create_ordered_sequencer(client)
+
+    with mock.patch.object(client, "_schedule_batch_commit") as schedule:
+        sequencer.publish(message)
+        sequencer.publish(message)
+
+    batch = sequencer._ordered_batches[0]
+    schedule.assert_called_once_with(sequencer, batch)
+
+
 def test_batch_done_unsuccessfully():
     client = create_client()
     message = create_message()
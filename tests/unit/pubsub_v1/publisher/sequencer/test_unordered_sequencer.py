@@ -33,7 +33,11 @@ def create_message():
 
 
 def create_client():
-    return publisher.Client(credentials=credentials.AnonymousCredentials())
+    # Batches are committed explicitly by the tests, disable the commit timer.
+    return publisher.Client(
+        credentials=credentials.AnonymousCredentials(),
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
 
 
 def test_stop():
@@ -75,6 +79,28 @@ def test_commit_no_batch():
     sequencer.commit()
 
 
+def test_flush():
+    client = create_client()
+    batch = mock.Mock(spec=client._batch_class)
+
+    sequencer = unordered_sequencer.UnorderedSequencer(client, "topic_name")
+    sequencer._set_batch(batch)
+
+    sequencer.flush()
+
+    batch.commit.assert_called_once()
+    assert sequencer._current_batch is None
+
+
+def test_flush_stopped():
+    client = create_client()
+    sequencer = unordered_sequencer.UnorderedSequencer(client, "topic_name")
+    sequencer.stop()
+
+    # Unlike commit(), flushing a stopped sequencer does not raise.
+    sequencer.flush()
+
+
 def test_unpause():
     client = create_client()
     sequencer = unordered_sequencer.UnorderedSequencer(client, "topic_name")
@@ -159,3 +185,43 @@ def test_publish_after_batch_error():
     # message.
     future = sequencer.publish(message)
     assert future is not None
+
+
+def test_publish_schedules_batch_commit():
+    client = create_client()
+    message = create_message()
+    sequencer = unordered_sequencer.UnorderedSequencer(client, "topic_name")
+
+    with mock.patch.object(client, "_schedule_batch_commit") as schedule:
+        sequencer.publish(message)
+        sequencer.publish(message)
+
+    schedule.assert_called_once_with(sequencer, sequencer._current_batch)
+
+
+def test_commit_batch_current_batch():
+    client = create_client()
+    batch = mock.Mock(spec=client._batch_class)
+
+    sequencer = unordered_sequencer.UnorderedSequencer(client, "topic_name")
+    sequencer._set_batch(batch)
+
+    sequencer.commit_batch(batch)
+
+    batch.commit.assert_called_once()
+    assert sequencer._current_batch is None
+
+
+def test_commit_batch_previous_batch():
+    client = create_client()
+    old_batch = mock.Mock(spec=client._batch_class)
+    batch = mock.Mock(spec=client._batch_class)
+
+    sequencer = unordered_sequencer.UnorderedSequencer(client, "topic_name")
+    sequencer._set_batch(batch)
+
+    # The old batch was committed when it got full, nothing to do.
+    sequencer.commit_batch(old_batch)
+
+    old_batch.commit.assert_not_called()
+    batch.commit.assert_not_called()
@@ -0,0 +1,208 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import google.api_core.exceptions
+from google.api_core import retry as retries
+from google.auth import credentials
+
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
+    PublishMessageWrapper,
+)
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch.thread import Batch
+from google.cloud.pubsub_v1.publisher._batch_coalescer import BatchCoalescer
+from google.cloud.pubsub_v1.publisher._retry_scheduler import RetryScheduler
+from google.pubsub_v1 import types as gapic_types
+
+
+TOPIC = "topic_name"
+
+
+def create_client(**batch_settings):
+    batch_settings.setdefault("max_latency", float("inf"))
+    return publisher.Client(
+        credentials=credentials.AnonymousCredentials(),
+        batch_settings=types.BatchSettings(**batch_settings),
+        publisher_options=types.PublisherOptions(
+            enable_message_ordering=True, coalesce_ordering_keys=True
+        ),
+    )
+
+
+def create_batch(client, ordering_key, *data, commit_retry=None, commit_timeout=60):
+    batch = Batch(
+        client,
+        TOPIC,
+        client.batch_settings,
+        batch_done_callback=mock.Mock(spec=()),
+        commit_when_full=False,
+        commit_retry=commit_retry,
+        commit_timeout=commit_timeout,
+    )
+    for payload in data:
+        batch.publish(
+            PublishMessageWrapper(
+                message=gapic_types.PubsubMessage(
+                    data=payload, ordering_key=ordering_key
+                )
+            )
+        )
+    return batch
+
+
+def publish_with_data_ids(topic, messages, retry, timeout):
+    """Respond to a publish RPC with the messages' data as their IDs."""
+    return gapic_types.PublishResponse(
+        message_ids=[message.data.decode() for message in messages]
+    )
+
+
+def commit_batches(client, *batches, **publish_kwargs):
+    """Commit the batches through a coalescer, and return the publish mock."""
+    coalescer = BatchCoalescer(client, TOPIC)
+    commits = []
+    patch_start = mock.patch.object(
+        client,
+        "_start_batch_commit",
+        side_effect=lambda topic, commit: commits.append(commit),
+    )
+    patch_publish = mock.patch.object(client, "_gapic_publish", **publish_kwargs)
+    with patch_start, patch_publish as publish:
+        for batch in batches:
+            batch._status = BatchStatus.STARTING
+            coalescer.add(batch)
+        while commits:
+            commits.pop(0)()
+    return publish
+
+
+def test_batches_share_publish_rpc():
+    client = create_client()
+    batch1 = create_batch(client, "key1", b"a", b"b")
+    batch2 = create_batch(client, "key2", b"c")
+    response = gapic_types.PublishResponse(message_ids=["1", "2", "3"])
+
+    publish = commit_batches(client, batch1, batch2, return_value=response)
+
+    publish.assert_called_once()
+    messages = publish.call_args.kwargs["messages"]
+    assert [message.data for message in messages] == [b"a", b"b", b"c"]
+    assert [future.result() for future in batch1._futures] == ["1", "2"]
+    assert [future.result() for future in batch2._futures] == ["3"]
+    batch1._batch_done_callback.assert_called_once_with(True)
+    batch2._batch_done_callback.assert_called_once_with(True)
+
+
+def test_failed_publish_rpc_fails_all_batches():
+    client = create_client()
+    batch1 = create_batch(client, "key1", b"a")
+    batch2 = create_batch(client, "key2", b"b")
+    error = google.api_core.exceptions.InvalidArgument("bad message")
+
+    commit_batches(client, batch1, batch2, side_effect=error)
+
+    for batch in (batch1, batch2):
+        assert batch.status == BatchStatus.ERROR
+        assert batch._futures[0].exception() is error
+        batch._batch_done_callback.assert_called_once_with(False)
+
+
+def run_callback_now(delay, callback):
+    callback()
+    return True
+
+
+def test_failed_publish_rpc_retried_by_scheduler():
+    client = create_client()
+    client._retry_scheduler = RetryScheduler(types.ScheduledRetrySettings())
+    client._retry_scheduler._timer = mock.Mock(
+        spec=["schedule"], schedule=run_callback_now
+    )
+    retry = retries.Retry(
+        predicate=retries.if_exception_type(
+            google.api_core.exceptions.ServiceUnavailable
+        )
+    )
+    batch1 = create_batch(client, "key1", b"a", commit_retry=retry)
+    batch2 = create_batch(client, "key2", b"b", commit_retry=retry)
+    error = google.api_core.exceptions.ServiceUnavailable("unavailable")
+    response = gapic_types.PublishResponse(message_ids=["1", "2"])
+
+    publish = commit_batches(client, batch1, batch2, side_effect=[error, response])
+
+    assert publish.call_count == 2
+    assert publish.call_args.kwargs["retry"] is None
+    assert batch1._futures[0].result() == "1"
+    assert batch2._futures[0].result() == "2"
+
+
+def test_mismatched_message_ids_fail_all_batches():
+    client = create_client()
+    batch1 = create_batch(client, "key1", b"a")
+    batch2 = create_batch(client, "key2", b"b")
+    response = gapic_types.PublishResponse(message_ids=["1"])
+
+    commit_batches(client, batch1, batch2, return_value=response)
+
+    for batch in (batch1, batch2):
+        assert isinstance(batch._futures[0].exception(), exceptions.PublishError)
+        batch._batch_done_callback.assert_called_once_with(False)
+
+
+def test_batches_with_other_retry_settings_not_shared():
+    client = create_client()
+    batch1 = create_batch(client, "key1", b"a")
+    batch2 = create_batch(client, "key2", b"b", commit_timeout=30)
+    batch3 = create_batch(client, "key3", b"c")
+
+    publish = commit_batches(
+        client,
+        batch1,
+        batch2,
+        batch3,
+        side_effect=publish_with_data_ids,
+    )
+
+    assert [
+        [message.data for message in call.kwargs["messages"]]
+        for call in publish.call_args_list
+    ] == [[b"a", b"c"], [b"b"]]
+    assert batch2._futures[0].result() == "b"
+
+
+def test_publish_rpc_within_batch_settings():
+    client = create_client(max_messages=3)
+    batches = [create_batch(client, "key1", b"a", b"b")] + [
+        create_batch(client, "key{}".format(i), b"c") for i in range(2, 5)
+    ]
+
+    publish = commit_batches(client, *batches, side_effect=publish_with_data_ids)
+
+    assert [len(call.kwargs["messages"]) for call in publish.call_args_list] == [3, 2]
+
+
+def test_single_commit_scheduled_while_waiting():
+    client = create_client()
+    coalescer = BatchCoalescer(client, TOPIC)
+
+    with mock.patch.object(client, "_start_batch_commit") as start_batch_commit:
+        coalescer.add(create_batch(client, "key1", b"a"))
+        coalescer.add(create_batch(client, "key2", b"b"))
+
+    start_batch_commit.assert_called_once_with(TOPIC, coalescer._commit)
@@ -0,0 +1,140 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import _batch_tuner
+from google.cloud.pubsub_v1.publisher._batch_tuner import BatchSettingsTuner
+
+
+BOUNDS = types.AdaptiveBatchSettings(
+    target_latency=0.1,
+    min_latency=0.001,
+    max_latency=0.1,
+    min_messages=10,
+    max_messages=1000,
+    min_bytes=10 * 1000,
+    max_bytes=5 * 1000 * 1000,
+    adjust_interval=1.0,
+)
+SETTINGS = types.BatchSettings(max_bytes=100 * 1000, max_latency=0.01, max_messages=100)
+
+
+def create_tuner(bounds=BOUNDS, settings=SETTINGS):
+    with mock.patch.object(_batch_tuner.time, "monotonic", return_value=0.0):
+        return BatchSettingsTuner(bounds, settings)
+
+
+def record(tuner, now, **kwargs):
+    kwargs.setdefault("settings", tuner.settings)
+    kwargs.setdefault("message_count", 10)
+    kwargs.setdefault("byte_count", 1000)
+    kwargs.setdefault("age", 0.01)
+    kwargs.setdefault("rpc_latency", 0.02)
+    with mock.patch.object(_batch_tuner.time, "monotonic", return_value=now):
+        return tuner.record(**kwargs)
+
+
+def test_initial_settings_clamped():
+    tuner = create_tuner(
+        settings=types.BatchSettings(max_bytes=1, max_latency=10, max_messages=5000)
+    )
+
+    assert tuner.settings == types.BatchSettings(
+        max_bytes=10 * 1000, max_latency=0.1, max_messages=1000
+    )
+
+
+def test_no_adjustment_within_interval():
+    tuner = create_tuner()
+
+    assert record(tuner, now=0.5) is None
+    assert tuner.settings == SETTINGS
+
+
+def test_settings_follow_arrival_rate():
+    tuner = create_tuner()
+
+    # 200 messages/s of 100 bytes, with a fast RPC.
+    for now in (0.25, 0.5, 0.75):
+        record(tuner, now=now, message_count=50, byte_count=5000, rpc_latency=0.02)
+    settings = record(
+        tuner, now=1.0, message_count=50, byte_count=5000, rpc_latency=0.02
+    )
+
+    # The batches are sized for twice the messages expected within the
+    # latency, but no setting may change by more than a factor of two at once.
+    assert settings == types.BatchSettings(
+        max_bytes=50 * 1000, max_latency=0.02, max_messages=50
+    )
+    assert tuner.settings == settings
+
+
+def test_latency_takes_remaining_target():
+    tuner = create_tuner(
+        settings=types.BatchSettings(max_bytes=100 * 1000, max_latency=0.05)
+    )
+
+    settings = record(tuner, now=1.0, message_count=50, rpc_latency=0.07)
+
+    assert settings.max_latency == pytest.approx(0.03)
+
+
+def test_settings_halved_when_over_target_latency():
+    tuner = create_tuner()
+
+    settings = record(tuner, now=1.0, age=0.05, rpc_latency=0.08)
+
+    assert settings == types.BatchSettings(
+        max_bytes=50 * 1000, max_latency=0.005, max_messages=50
+    )
+
+
+def test_full_batches_grow():
+    tuner = create_tuner()
+
+    # Few messages per second overall, but the batches are all full.
+    settings = record(tuner, now=1.0, message_count=100, byte_count=10000)
+
+    assert settings.max_messages == 200
+
+
+def test_settings_within_bounds():
+    bounds = BOUNDS._replace(min_messages=90, max_latency=0.012)
+    tuner = create_tuner(bounds=bounds)
+
+    settings = record(tuner, now=1.0, message_count=1, byte_count=100)
+
+    assert settings.max_messages == 90
+    assert settings.max_latency == 0.012
+
+
+def test_unchanged_settings_not_reported():
+    tuner = create_tuner(
+        settings=types.BatchSettings(max_bytes=10000, max_latency=0.08, max_messages=10)
+    )
+
+    assert record(tuner, now=1.0, message_count=1, byte_count=100) is None
+
+
+def test_window_reset_after_adjustment():
+    tuner = create_tuner()
+    record(tuner, now=1.0, age=0.05, rpc_latency=0.08)
+
+    # The slow batch of the previous window does not count anymore.
+    assert record(tuner, now=1.5) is None
+    assert tuner._latencies == [0.03]
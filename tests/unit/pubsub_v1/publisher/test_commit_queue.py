@@ -0,0 +1,205 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.api_core import exceptions
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import _commit_queue
+from google.cloud.pubsub_v1.publisher._commit_queue import AdaptiveCommitQueue
+from google.cloud.pubsub_v1.publisher._commit_queue import CommitQueue
+
+
+def test_no_limit():
+    commit_queue = CommitQueue(max_outstanding=0)
+
+    for _ in range(100):
+        assert commit_queue.put(mock.sentinel.commit)
+
+    assert commit_queue.outstanding == 100
+    assert commit_queue.pending == 0
+
+
+def test_queues_commits_over_the_limit():
+    commit_queue = CommitQueue(max_outstanding=2)
+
+    assert commit_queue.put(mock.sentinel.commit1)
+    assert commit_queue.put(mock.sentinel.commit2)
+    assert not commit_queue.put(mock.sentinel.commit3)
+    assert not commit_queue.put(mock.sentinel.commit4)
+
+    assert commit_queue.outstanding == 2
+    assert commit_queue.pending == 2
+
+
+def test_task_done_hands_out_queued_commits_in_order():
+    commit_queue = CommitQueue(max_outstanding=1)
+    commit_queue.put(mock.sentinel.commit1)
+    commit_queue.put(mock.sentinel.commit2)
+    commit_queue.put(mock.sentinel.commit3)
+
+    assert commit_queue.task_done() is mock.sentinel.commit2
+    assert commit_queue.outstanding == 1
+    assert commit_queue.task_done() is mock.sentinel.commit3
+    assert commit_queue.outstanding == 1
+    assert commit_queue.task_done() is None
+    assert commit_queue.outstanding == 0
+
+    # There is free capacity again.
+    assert commit_queue.put(mock.sentinel.commit4)
+
+
+def create_adaptive_queue(**kwargs):
+    settings = types.AdaptiveConcurrencySettings(**kwargs)
+    return AdaptiveCommitQueue(settings)
+
+
+def fill(commit_queue, count):
+    for _ in range(count):
+        commit_queue.put(mock.sentinel.commit)
+
+
+def record(commit_queue, start=0.0, rpc_latency=0.1, error=None, now=1.0):
+    with mock.patch.object(_commit_queue.time, "monotonic", return_value=now):
+        commit_queue.record(start, rpc_latency, error)
+
+
+def test_adaptive_initial_limit_within_bounds():
+    assert create_adaptive_queue(initial_outstanding_batches=4).limit == 4
+    assert (
+        create_adaptive_queue(
+            initial_outstanding_batches=10, max_outstanding_batches=5
+        ).limit
+        == 5
+    )
+    assert (
+        create_adaptive_queue(
+            initial_outstanding_batches=1, min_outstanding_batches=2
+        ).limit
+        == 2
+    )
+
+
+def test_adaptive_limit_grows_by_one_per_round_of_healthy_rpcs():
+    commit_queue = create_adaptive_queue(initial_outstanding_batches=2)
+    fill(commit_queue, 3)
+
+    record(commit_queue)
+    assert commit_queue.limit == 2
+    record(commit_queue)
+    assert commit_queue.limit == 3
+
+    # The queued commit can be started now.
+    assert commit_queue.start_pending() == [mock.sentinel.commit]
+    assert commit_queue.outstanding == 3
+    assert commit_queue.pending == 0
+
+
+def test_adaptive_limit_does_not_grow_when_unused():
+    commit_queue = create_adaptive_queue(initial_outstanding_batches=2)
+    fill(commit_queue, 1)
+
+    for _ in range(10):
+        record(commit_queue)
+
+    assert commit_queue.limit == 2
+
+
+def test_adaptive_limit_does_not_grow_over_max():
+    commit_queue = create_adaptive_queue(
+        initial_outstanding_batches=2, max_outstanding_batches=2
+    )
+    fill(commit_queue, 3)
+
+    for _ in range(10):
+        record(commit_queue)
+
+    assert commit_queue.limit == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        exceptions.ResourceExhausted("Quota exceeded"),
+        exceptions.DeadlineExceeded("Too slow"),
+        exceptions.RetryError("Retries exhausted", cause=None),
+    ],
+)
+def test_adaptive_limit_halved_on_overload(error):
+    commit_queue = create_adaptive_queue(initial_outstanding_batches=8)
+
+    record(commit_queue, error=error)
+
+    assert commit_queue.limit == 4
+
+
+def test_adaptive_limit_kept_on_other_errors():
+    commit_queue = create_adaptive_queue(initial_outstanding_batches=8)
+    fill(commit_queue, 8)
+
+    record(commit_queue, error=exceptions.PermissionDenied("Forbidden"))
+
+    assert commit_queue.limit == 8
+
+
+def test_adaptive_limit_halved_on_slow_rpc():
+    commit_queue = create_adaptive_queue(
+        initial_outstanding_batches=8, latency_tolerance=2.0
+    )
+    record(commit_queue, rpc_latency=0.1)
+    record(commit_queue, start=0.5, rpc_latency=0.19)
+    assert commit_queue.limit == 8
+
+    record(commit_queue, start=1.0, rpc_latency=0.3)
+
+    assert commit_queue.limit == 4
+
+
+def test_adaptive_limit_halved_once_per_slowdown():
+    commit_queue = create_adaptive_queue(initial_outstanding_batches=8)
+    error = exceptions.ResourceExhausted("Quota exceeded")
+
+    record(commit_queue, start=0.5, error=error, now=1.0)
+    # RPCs that were in flight during the decrease do not count again.
+    record(commit_queue, start=0.6, error=error, now=1.1)
+    assert commit_queue.limit == 4
+
+    record(commit_queue, start=1.2, error=error, now=1.5)
+    assert commit_queue.limit == 2
+
+
+def test_adaptive_limit_not_below_min():
+    commit_queue = create_adaptive_queue(
+        initial_outstanding_batches=3, min_outstanding_batches=2
+    )
+
+    record(commit_queue, error=exceptions.ResourceExhausted("Quota exceeded"))
+
+    assert commit_queue.limit == 2
+
+
+def test_lowered_limit_holds_back_queued_commits():
+    commit_queue = create_adaptive_queue(initial_outstanding_batches=4)
+    fill(commit_queue, 5)
+
+    record(commit_queue, error=exceptions.ResourceExhausted("Quota exceeded"))
+
+    # Two of the four in-flight commits must complete before the queued one
+    # may take the place of the third one.
+    assert commit_queue.task_done() is None
+    assert commit_queue.task_done() is None
+    assert commit_queue.task_done() is mock.sentinel.commit
+    assert commit_queue.outstanding == 2
@@ -14,18 +14,23 @@
 
 from __future__ import absolute_import
 
+import asyncio
 import threading
 import time
 from typing import Callable
 from typing import Sequence
 from typing import Union
+from unittest import mock
 
 import pytest
 
 import google
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import flow_controller as flow_controller_module
+from google.cloud.pubsub_v1.publisher.flow_controller import AsyncFlowController
 from google.cloud.pubsub_v1.publisher.flow_controller import FlowController
+from google.cloud.pubsub_v1.publisher.flow_controller import RateLimiter
 from google.pubsub_v1 import types as grpc_types
 
 
@@ -120,6 +125,67 @@ def test_byte_size_overflow_error():
     assert expected_info in str(error.value)
 
 
+def test_precomputed_message_size():
+    settings = types.PublishFlowControl(
+        message_limit=10000,
+        byte_limit=199,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+    msg = grpc_types.PubsubMessage(data=b"foo")
+
+    # The given size is trusted, the message is not measured again.
+    flow_controller.add(msg, size=150)
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        flow_controller.add(msg, size=50)
+
+    assert "bytes: 200 / 199" in str(error.value)
+
+    flow_controller.release(msg, size=150)
+    assert flow_controller._total_bytes == 0
+
+
+def test_add_many():
+    settings = types.PublishFlowControl(
+        message_limit=3,
+        byte_limit=100,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    # Stops at the first message that would overflow, without raising.
+    assert flow_controller.add_many([10, 20, 80, 5]) == 2
+    assert flow_controller._message_count == 2
+    assert flow_controller._total_bytes == 30
+
+    assert flow_controller.add_many([5, 5]) == 1
+    assert flow_controller.add_many([]) == 0
+
+
+def test_add_many_ignore():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.IGNORE,
+    )
+    flow_controller = FlowController(settings)
+
+    assert flow_controller.add_many(iter([10, 20, 30])) == 3
+
+
+def test_add_many_yields_to_waiting_threads():
+    settings = types.PublishFlowControl(
+        message_limit=10,
+        byte_limit=100,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = FlowController(settings)
+    flow_controller._waiting[mock.sentinel.thread] = mock.Mock()
+
+    assert flow_controller.add_many([1]) == 0
+    assert flow_controller._message_count == 0
+
+
 def test_no_error_on_moderate_message_flow():
     settings = types.PublishFlowControl(
         message_limit=2,
@@ -448,3 +514,321 @@ def test_warning_on_internal_reservation_stats_error_when_unblocking():
     matches = [warning for warning in warned if warning.category is RuntimeWarning]
     assert len(matches) == 1
     assert "too many bytes reserved" in str(matches[0].message).lower()
+
+
+def test_release_wakes_up_only_satisfied_waiters():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=1_000_000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = FlowController(settings)
+    message = grpc_types.PubsubMessage(data=b"x")
+    flow_controller.add(message)
+
+    adding_done_events = [threading.Event() for _ in range(3)]
+    for adding_done in adding_done_events:
+        _run_in_daemon(flow_controller.add, [message], adding_done)
+        time.sleep(0.1)
+    assert flow_controller.wait_statistics.waiting == 3
+
+    wakeups = [reservation.wakeup for reservation in flow_controller._waiting.values()]
+    notify_patches = [
+        mock.patch.object(wakeup, "notify", wraps=wakeup.notify) for wakeup in wakeups
+    ]
+    notifies = [patch.start() for patch in notify_patches]
+    try:
+        flow_controller.release(message)
+        if not adding_done_events[0].wait(timeout=1):  # pragma: NO COVER
+            pytest.fail("The first waiting message was not added.")
+    finally:
+        for patch in notify_patches:
+            patch.stop()
+
+    # Only the thread at the front of the queue was woken up.
+    assert [notify.call_count for notify in notifies] == [1, 0, 0]
+    assert not adding_done_events[1].is_set()
+    assert not adding_done_events[2].is_set()
+
+    # Unblock the remaining threads.
+    for adding_done in adding_done_events[1:]:
+        flow_controller.release(message)
+        if not adding_done.wait(timeout=1):  # pragma: NO COVER
+            pytest.fail("A waiting message was not added.")
+
+
+def test_wait_statistics():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = FlowController(settings)
+    message = grpc_types.PubsubMessage(data=b"x")
+
+    flow_controller.add(message)
+    assert flow_controller.wait_statistics == (0, 0, 0.0, 0.0)
+
+    adding_done = threading.Event()
+    _run_in_daemon(flow_controller.add, [message], adding_done)
+    time.sleep(0.1)
+    assert flow_controller.wait_statistics.waiting == 1
+
+    flow_controller.release(message)
+    if not adding_done.wait(timeout=1):  # pragma: NO COVER
+        pytest.fail("The waiting message was not added.")
+
+    statistics = flow_controller.wait_statistics
+    assert statistics.waiting == 0
+    assert statistics.wait_count == 1
+    assert statistics.total_wait_time >= 0.1
+    assert statistics.max_wait_time == statistics.total_wait_time
+
+
+@pytest.mark.asyncio
+async def test_async_error_on_overflow():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=10000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = AsyncFlowController(settings)
+
+    await flow_controller.add(grpc_types.PubsubMessage(data=b"foo"))
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        await flow_controller.add(grpc_types.PubsubMessage(data=b"bar"))
+
+    assert "messages: 2 / 1" in str(error.value)
+
+
+@pytest.mark.asyncio
+async def test_async_blocking_on_overflow_until_free_capacity():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=10000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = AsyncFlowController(settings)
+    msg1 = grpc_types.PubsubMessage(data=b"foo")
+    msg2 = grpc_types.PubsubMessage(data=b"bar")
+    msg3 = grpc_types.PubsubMessage(data=b"baz")
+
+    await flow_controller.add(msg1)
+    adding_2 = asyncio.ensure_future(flow_controller.add(msg2))
+    adding_3 = asyncio.ensure_future(flow_controller.add(msg3))
+    await asyncio.sleep(0)
+    assert not adding_2.done()
+    assert not adding_3.done()
+
+    # Capacity is handed out in FIFO order, one message at a time.
+    flow_controller.release(msg1)
+    await asyncio.wait_for(adding_2, timeout=1)
+    assert not adding_3.done()
+
+    flow_controller.release(msg2)
+    await asyncio.wait_for(adding_3, timeout=1)
+    assert flow_controller._message_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_blocking_cancelled_waiter_is_skipped():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=10000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = AsyncFlowController(settings)
+    msg1 = grpc_types.PubsubMessage(data=b"foo")
+    msg2 = grpc_types.PubsubMessage(data=b"bar")
+    msg3 = grpc_types.PubsubMessage(data=b"baz")
+
+    await flow_controller.add(msg1)
+    adding_2 = asyncio.ensure_future(flow_controller.add(msg2))
+    adding_3 = asyncio.ensure_future(flow_controller.add(msg3))
+    await asyncio.sleep(0)
+
+    adding_2.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await adding_2
+
+    flow_controller.release(msg1)
+    await asyncio.wait_for(adding_3, timeout=1)
+    assert flow_controller._message_count == 1
+    assert flow_controller._total_bytes == msg3._pb.ByteSize()
+
+
+@pytest.mark.asyncio
+async def test_async_error_if_message_would_block_forever():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = AsyncFlowController(settings)
+
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        await flow_controller.add(grpc_types.PubsubMessage(data=b"foo"))
+
+    assert "would block forever" in str(error.value)
+
+
+@pytest.mark.asyncio
+async def test_async_warning_on_release_of_unknown_message():
+    settings = types.PublishFlowControl(
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = AsyncFlowController(settings)
+
+    with pytest.warns(RuntimeWarning, match="never added or already released"):
+        flow_controller.release(grpc_types.PubsubMessage(data=b"foo"))
+
+    assert flow_controller._message_count == 0
+    assert flow_controller._total_bytes == 0
+
+
+def _reserve(rate_limiter, topic="topic", message_count=1, byte_count=0, now=0.0):
+    with mock.patch.object(flow_controller_module.time, "monotonic", return_value=now):
+        return rate_limiter.reserve(topic, message_count, byte_count)
+
+
+def _create_rate_limiter(now=0.0, **kwargs):
+    with mock.patch.object(flow_controller_module.time, "monotonic", return_value=now):
+        return RateLimiter(types.PublishRateLimit(**kwargs))
+
+
+def test_rate_limiter_spreads_messages_over_time():
+    rate_limiter = _create_rate_limiter(messages_per_second=10)
+
+    # The burst is allowed right away, further messages queue up behind it.
+    for _ in range(10):
+        assert _reserve(rate_limiter) == 0
+    assert _reserve(rate_limiter) == pytest.approx(0.1)
+    assert _reserve(rate_limiter) == pytest.approx(0.2)
+
+    # The debt is paid off over time.
+    assert _reserve(rate_limiter, now=0.1) == pytest.approx(0.2)
+
+
+def test_rate_limiter_limits_bytes():
+    rate_limiter = _create_rate_limiter(bytes_per_second=1000, burst_seconds=0.5)
+
+    assert _reserve(rate_limiter, byte_count=500) == 0
+    assert _reserve(rate_limiter, byte_count=250) == pytest.approx(0.25)
+    assert _reserve(rate_limiter, byte_count=100, now=1.0) == 0
+
+
+def test_rate_limiter_topic_limits_are_separate():
+    rate_limiter = _create_rate_limiter(topic_messages_per_second=1)
+
+    assert _reserve(rate_limiter, topic="topic1") == 0
+    assert _reserve(rate_limiter, topic="topic2") == 0
+    assert _reserve(rate_limiter, topic="topic1") == pytest.approx(1.0)
+
+
+def test_rate_limiter_waits_for_slowest_limit():
+    rate_limiter = _create_rate_limiter(
+        messages_per_second=100, topic_bytes_per_second=10
+    )
+
+    assert _reserve(rate_limiter, byte_count=20) == pytest.approx(1.0)
+
+
+def test_rate_limiter_error():
+    rate_limiter = _create_rate_limiter(
+        messages_per_second=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+
+    assert _reserve(rate_limiter) == 0
+    with pytest.raises(exceptions.RateLimitExceededError):
+        _reserve(rate_limiter, now=0.5)
+
+    # The rejected message did not take any tokens.
+    assert _reserve(rate_limiter, now=1.0) == 0
+
+
+def test_rate_limiter_fanout_counts_each_topic():
+    rate_limiter = _create_rate_limiter(
+        messages_per_second=3, topic_messages_per_second=1
+    )
+
+    with mock.patch.object(flow_controller_module.time, "monotonic", return_value=0):
+        assert rate_limiter._reserve(["topic1", "topic2"], 1, 0) == 0
+        # The same topic twice takes its tokens twice.
+        assert rate_limiter._reserve(["topic3", "topic3"], 1, 0) == pytest.approx(1.0)
+
+    # The client-wide limit counted the messages to all four topics.
+    assert _reserve(rate_limiter, topic="topic4") == pytest.approx(2 / 3)
+
+
+def test_rate_limiter_fanout_error_takes_no_tokens():
+    rate_limiter = _create_rate_limiter(
+        topic_messages_per_second=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    assert _reserve(rate_limiter, topic="topic2") == 0
+
+    with mock.patch.object(flow_controller_module.time, "monotonic", return_value=0):
+        with pytest.raises(exceptions.RateLimitExceededError):
+            rate_limiter.acquire_fanout(["topic1", "topic2"], 1, 0)
+
+    # The topic that was within its limit did not lose its tokens.
+    assert _reserve(rate_limiter, topic="topic1") == 0
+
+
+def test_rate_limiter_ignore():
+    rate_limiter = _create_rate_limiter(
+        messages_per_second=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.IGNORE,
+    )
+
+    for _ in range(10):
+        assert _reserve(rate_limiter) == 0
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        types.PublishRateLimit(messages_per_second=0),
+        types.PublishRateLimit(topic_bytes_per_second=-1),
+        types.PublishRateLimit(burst_seconds=0),
+    ],
+)
+def test_rate_limiter_invalid_settings(settings):
+    with pytest.raises(ValueError, match="rate_limit"):
+        RateLimiter(settings)
+
+
+def test_rate_limiter_acquire_sleeps():
+    rate_limiter = RateLimiter(types.PublishRateLimit(messages_per_second=1))
+    rate_limiter.reserve("topic", 1, 0)
+
+    with mock.patch.object(flow_controller_module.time, "sleep") as sleep:
+        rate_limiter.acquire("topic", 1, 0)
+
+    sleep.assert_called_once()
+    assert 0 < sleep.call_args.args[0] <= 1.0
+
+
+def test_rate_limiter_acquire_fanout_sleeps():
+    rate_limiter = RateLimiter(types.PublishRateLimit(topic_messages_per_second=1))
+    rate_limiter.reserve("topic2", 1, 0)
+
+    with mock.patch.object(flow_controller_module.time, "sleep") as sleep:
+        rate_limiter.acquire_fanout(["topic1", "topic2"], 1, 0)
+
+    sleep.assert_called_once()
+    assert 0 < sleep.call_args.args[0] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire_async_sleeps():
+    rate_limiter = RateLimiter(types.PublishRateLimit(messages_per_second=1))
+    rate_limiter.reserve("topic", 1, 0)
+
+    with mock.patch.object(
+        flow_controller_module.asyncio, "sleep", new_callable=mock.AsyncMock
+    ) as sleep:
+        await rate_limiter.acquire_async("topic", 1, 0)
+
+    sleep.assert_awaited_once()
+    assert 0 < sleep.call_args.args[0] <= 1.0
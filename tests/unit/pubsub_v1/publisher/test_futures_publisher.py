@@ -14,6 +14,10 @@
 
 from __future__ import absolute_import
 
+import concurrent.futures
+import threading
+from unittest import mock
+
 import pytest
 
 from google.cloud.pubsub_v1.publisher import futures
@@ -38,3 +42,144 @@ class TestFuture(object):
         future.set_exception(RuntimeError("Something bad happened."))
         with pytest.raises(RuntimeError):
             future.result()
+
+
+class TestMessageFuture(object):
+    def test_result_on_success(self):
+        batch_result = futures._BatchResult()
+        future1 = batch_result.new_future()
+        future2 = batch_result.new_future()
+        assert not future1.done()
+        assert future1.running()
+
+        batch_result.set_result(["1", "2"])
+
+        assert future1.done()
+        assert future1.result() == "1"
+        assert future2.result() == "2"
+        assert future2.exception() is None
+
+    def test_result_on_failure(self):
+        batch_result = futures._BatchResult()
+        future1 = batch_result.new_future()
+        future2 = batch_result.new_future()
+        exc = RuntimeError("Something bad happened.")
+
+        batch_result.set_exception(exc)
+
+        assert future1.exception() is exc
+        with pytest.raises(RuntimeError):
+            future2.result()
+
+    def test_result_timeout(self):
+        future = futures._BatchResult().new_future()
+        with pytest.raises(concurrent.futures.TimeoutError):
+            future.result(timeout=0.01)
+
+    def test_result_waits_for_batch(self):
+        batch_result = futures._BatchResult()
+        future = batch_result.new_future()
+
+        timer = threading.Timer(0.01, batch_result.set_result, args=(["1"],))
+        timer.start()
+
+        assert future.result(timeout=5) == "1"
+        timer.join()
+
+    def test_done_callbacks(self):
+        batch_result = futures._BatchResult()
+        future1 = batch_result.new_future()
+        future2 = batch_result.new_future()
+        batch_result.new_future()  # Not observed.
+        callback = mock.Mock(spec=["__call__"])
+
+        future1.add_done_callback(callback)
+        future2.add_done_callback(callback)
+        assert callback.call_count == 0
+        assert batch_result._observed == [future1, future2]
+
+        batch_result.set_result(["1", "2", "3"])
+        assert callback.mock_calls == [mock.call(future1), mock.call(future2)]
+
+        # Callbacks added later are called immediately.
+        future1.add_done_callback(callback)
+        assert callback.call_count == 3
+
+    def test_concurrent_futures_wait(self):
+        batch_result = futures._BatchResult()
+        other_batch_result = futures._BatchResult()
+        future1 = batch_result.new_future()
+        future2 = batch_result.new_future()
+        other_future = other_batch_result.new_future()
+
+        timer = threading.Timer(0.01, batch_result.set_result, args=(["1", "2"],))
+        timer.start()
+
+        done, not_done = concurrent.futures.wait(
+            [future1, future2, other_future],
+            timeout=5,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        timer.join()
+
+        assert done == {future1, future2}
+        assert not_done == {other_future}
+
+    def test_concurrent_futures_as_completed(self):
+        batch_result = futures._BatchResult()
+        future_list = [batch_result.new_future() for _ in range(3)]
+
+        timer = threading.Timer(0.01, batch_result.set_exception, args=(ValueError(),))
+        timer.start()
+
+        completed = list(concurrent.futures.as_completed(future_list, timeout=5))
+        timer.join()
+
+        assert set(completed) == set(future_list)
+
+    def test_batch_result_set_once(self):
+        batch_result = futures._BatchResult()
+        batch_result.set_result([])
+
+        with pytest.raises(concurrent.futures.InvalidStateError):
+            batch_result.set_exception(RuntimeError())
+
+    def test_set_result_not_supported(self):
+        future = futures._BatchResult().new_future()
+
+        with pytest.raises(NotImplementedError):
+            future.set_result("1")
+        with pytest.raises(NotImplementedError):
+            future.set_exception(RuntimeError())
+
+    def test_repr(self):
+        batch_result = futures._BatchResult()
+        future = batch_result.new_future()
+        assert "state=pending" in repr(future)
+
+        batch_result.set_result(["1"])
+        assert "state=finished returned str" in repr(future)
+
+
+class TestGather(object):
+    def test_result_on_success(self):
+        future1 = futures.Future()
+        future2 = futures.Future()
+
+        gathered = futures._gather([future1, future2])
+        future2.set_result("2")
+        assert not gathered.done()
+
+        future1.set_result("1")
+        assert gathered.result(timeout=0) == ["1", "2"]
+
+    def test_result_on_failure(self):
+        future1 = futures.Future()
+        future2 = futures.Future()
+        error = RuntimeError("Something bad happened.")
+
+        gathered = futures._gather([future1, future2])
+        future1.set_result("1")
+        future2.set_exception(error)
+
+        assert gathered.exception(timeout=0) is error
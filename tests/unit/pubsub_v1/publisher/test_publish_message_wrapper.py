@@ -28,6 +28,22 @@ def test_message_setter():
     assert wrapper.message == another_message
 
 
+def test_size():
+    message = gapic_types.PubsubMessage(data=b"foo", attributes={"bar": "baz"})
+    wrapper = PublishMessageWrapper(message=message)
+
+    assert wrapper.size == message._pb.ByteSize()
+
+
+def test_size_reset_by_message_setter():
+    wrapper = PublishMessageWrapper(message=gapic_types.PubsubMessage(data=b"foo"))
+    assert wrapper.size == 5
+
+    wrapper.message = gapic_types.PubsubMessage(data=b"foobar")
+
+    assert wrapper.size == 8
+
+
 def test_eq():
     wrapper1 = PublishMessageWrapper(message=gapic_types.PubsubMessage(data=b"foo"))
     wrapper2 = PublishMessageWrapper(message=gapic_types.PubsubMessage(data=b"bar"))
@@ -0,0 +1,462 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gc
+import weakref
+
+from unittest import mock
+
+import pytest
+
+import google.api_core.exceptions
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.pubsub_v1 import types as gapic_types
+
+
+TOPIC = "projects/foo/topics/bar"
+
+
+def _patch_gapic_publish(client, **kwargs):
+    return mock.patch.object(
+        type(client), "_gapic_publish", new_callable=mock.AsyncMock, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_init(creds):
+    client = publisher.AsyncClient(credentials=creds)
+
+    assert client.batch_settings == types.BatchSettings()
+    assert client.publisher_options == types.PublisherOptions()
+    assert client.open_telemetry_enabled is False
+    assert client.target == "pubsub.googleapis.com:443"
+
+
+@pytest.mark.asyncio
+async def test_init_open_telemetry_not_supported(creds):
+    options = types.PublisherOptions(enable_open_telemetry_tracing=True)
+
+    with pytest.warns(RuntimeWarning, match="not supported"):
+        client = publisher.AsyncClient(credentials=creds, publisher_options=options)
+
+    assert client.open_telemetry_enabled is False
+
+
+@pytest.mark.asyncio
+async def test_publish(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=0.01),
+    )
+    response = gapic_types.PublishResponse(message_ids=["1", "2"])
+
+    with _patch_gapic_publish(client, return_value=response) as publish:
+        future1 = await client.publish(TOPIC, b"spam")
+        future2 = await client.publish(TOPIC, b"foo", bar="baz", qux=b"quux")
+
+        assert await asyncio.wait_for(future1, timeout=5) == "1"
+        assert await asyncio.wait_for(future2, timeout=5) == "2"
+
+    publish.assert_awaited_once()
+    messages = publish.call_args.kwargs["messages"]
+    assert messages == [
+        gapic_types.PubsubMessage(data=b"spam"),
+        gapic_types.PubsubMessage(
+            data=b"foo", attributes={"bar": "baz", "qux": "quux"}
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_commits_full_batch_without_timer(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_messages=2, max_latency=float("inf")),
+    )
+    response = gapic_types.PublishResponse(message_ids=["1"])
+
+    with _patch_gapic_publish(client, return_value=response) as publish:
+        future1 = await client.publish(TOPIC, b"spam")
+        future2 = await client.publish(TOPIC, b"eggs")
+
+        # The first batch got full and was committed, the second one is open.
+        assert await asyncio.wait_for(future1, timeout=5) == "1"
+        assert not future2.done()
+
+    publish.assert_awaited_once()
+
+    assert client._cleanup_timer is None
+
+
+@pytest.mark.asyncio
+async def test_batch_committed_early_not_kept_by_timer(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_messages=1, max_latency=600),
+    )
+    response = gapic_types.PublishResponse(message_ids=["1"])
+    loop = asyncio.get_running_loop()
+
+    with _patch_gapic_publish(client, return_value=response), mock.patch.object(
+        loop, "call_later", wraps=loop.call_later
+    ) as call_later:
+        future = await client.publish(TOPIC, b"spam")
+        assert await asyncio.wait_for(future, timeout=5) == "1"
+        batch_ref = weakref.ref(client._sequencers[(TOPIC, "")]._current_batch)
+        # The next batch takes the place of the first one in the sequencer.
+        future = await client.publish(TOPIC, b"eggs")
+        assert await asyncio.wait_for(future, timeout=5) == "1"
+
+    # The first batch was committed long before its deadline, and is freed
+    # although its deadline is still pending.
+    deadline_calls = [call for call in call_later.call_args_list if call.args[0] == 600]
+    assert len(deadline_calls) == 2
+    gc.collect()
+    assert batch_ref() is None
+    callback = deadline_calls[0].args[1]
+    with mock.patch.object(client, "_commit_batch_at_deadline") as commit:
+        callback()
+    commit.assert_not_called()
+
+    client.stop()
+
+
+@pytest.mark.asyncio
+async def test_publish_topic_batch_settings(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        publisher_options=types.PublisherOptions(
+            topic_batch_settings={"urgent": types.BatchSettings(max_latency=0.001)}
+        ),
+    )
+    response = gapic_types.PublishResponse(message_ids=["1"])
+
+    with _patch_gapic_publish(client, return_value=response) as publish:
+        urgent_future = await client.publish("urgent", b"spam")
+        bulk_future = await client.publish(TOPIC, b"eggs")
+
+        # Only the batch of the urgent topic gets committed by a timer.
+        assert await asyncio.wait_for(urgent_future, timeout=5) == "1"
+        assert not bulk_future.done()
+
+    publish.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_data_not_bytestring_error(creds):
+    client = publisher.AsyncClient(credentials=creds)
+
+    with pytest.raises(TypeError):
+        await client.publish(TOPIC, "This is a text string.")
+
+
+@pytest.mark.asyncio
+async def test_publish_attrs_type_error(creds):
+    client = publisher.AsyncClient(credentials=creds)
+
+    with pytest.raises(TypeError):
+        await client.publish(TOPIC, b"foo", answer=42)
+
+
+@pytest.mark.asyncio
+async def test_publish_message_ordering_not_enabled_error(creds):
+    client = publisher.AsyncClient(credentials=creds)
+
+    with pytest.raises(ValueError):
+        await client.publish(TOPIC, b"foo", ordering_key="key")
+
+
+@pytest.mark.asyncio
+async def test_publish_flow_control_error(creds):
+    flow_control = types.PublishFlowControl(
+        message_limit=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        publisher_options=types.PublisherOptions(flow_control=flow_control),
+    )
+
+    await client.publish(TOPIC, b"foo")
+    future = await client.publish(TOPIC, b"bar")
+
+    with pytest.raises(exceptions.FlowControlLimitError):
+        await future
+
+
+@pytest.mark.asyncio
+async def test_publish_flow_control_block_waits_for_capacity(creds):
+    flow_control = types.PublishFlowControl(
+        message_limit=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=0.01),
+        publisher_options=types.PublisherOptions(flow_control=flow_control),
+    )
+
+    async def gapic_publish(topic, messages, retry, timeout):
+        return gapic_types.PublishResponse(
+            message_ids=[str(i) for i, _ in enumerate(messages)]
+        )
+
+    with _patch_gapic_publish(client, side_effect=gapic_publish) as publish:
+        future1 = await client.publish(TOPIC, b"foo")
+        # The second publish can only proceed once the first message has been
+        # published and released from flow control.
+        future2 = await asyncio.wait_for(client.publish(TOPIC, b"bar"), timeout=5)
+
+        assert future1.done()
+        assert await asyncio.wait_for(future2, timeout=5) == "0"
+
+    assert publish.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_rate_limit_error(creds):
+    rate_limit = types.PublishRateLimit(
+        messages_per_second=1,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        publisher_options=types.PublisherOptions(rate_limit=rate_limit),
+    )
+
+    await client.publish(TOPIC, b"foo")
+    future = await client.publish(TOPIC, b"bar")
+
+    with pytest.raises(exceptions.RateLimitExceededError):
+        await future
+    assert client._flow_controller._message_count == 0
+
+
+@pytest.mark.asyncio
+async def test_publish_rate_limit_awaits(creds):
+    rate_limit = types.PublishRateLimit(topic_bytes_per_second=1000)
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        publisher_options=types.PublisherOptions(rate_limit=rate_limit),
+    )
+
+    with mock.patch.object(
+        client._rate_limiter, "acquire_async", new_callable=mock.AsyncMock
+    ) as acquire_async:
+        await client.publish(TOPIC, b"foo")
+
+    acquire_async.assert_awaited_once_with(TOPIC, 1, mock.ANY)
+
+
+@pytest.mark.asyncio
+async def test_publish_with_ordering_key(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=0.01),
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+    )
+    response = gapic_types.PublishResponse(message_ids=["1", "2"])
+
+    with _patch_gapic_publish(client, return_value=response) as publish:
+        future1 = await client.publish(TOPIC, b"spam", ordering_key="k")
+        future2 = await client.publish(TOPIC, b"eggs", ordering_key="k")
+
+        assert await asyncio.wait_for(future1, timeout=5) == "1"
+        assert await asyncio.wait_for(future2, timeout=5) == "2"
+
+    assert publish.call_args.kwargs["timeout"] == 2.0**32
+
+
+@pytest.mark.asyncio
+async def test_publish_to_paused_ordering_key(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=0.01),
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+    )
+    error = google.api_core.exceptions.InvalidArgument("bad message")
+
+    with _patch_gapic_publish(client, side_effect=error):
+        future = await client.publish(TOPIC, b"spam", ordering_key="k")
+        with pytest.raises(google.api_core.exceptions.InvalidArgument):
+            await asyncio.wait_for(future, timeout=5)
+
+        paused_future = await client.publish(TOPIC, b"eggs", ordering_key="k")
+        with pytest.raises(exceptions.PublishToPausedOrderingKeyException):
+            await paused_future
+
+    client.resume_publish(TOPIC, "k")
+    assert not client._sequencers[(TOPIC, "k")].is_finished()
+
+
+@pytest.mark.asyncio
+async def test_finished_ordered_sequencer_cleaned_up(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=0.01),
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+    )
+
+    response = gapic_types.PublishResponse(message_ids=["1"])
+
+    with _patch_gapic_publish(client, return_value=response):
+        future = await client.publish(TOPIC, b"spam", ordering_key="k")
+        await asyncio.wait_for(future, timeout=5)
+
+    assert client._finished_sequencer_keys == {(TOPIC, "k")}
+    assert client._cleanup_timer is not None
+
+    await asyncio.sleep(0.05)
+
+    assert (TOPIC, "k") not in client._sequencers
+    assert not client._finished_sequencer_keys
+
+
+@pytest.mark.asyncio
+async def test_finished_ordered_sequencer_cleaned_up_topic_max_latency(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        publisher_options=types.PublisherOptions(
+            enable_message_ordering=True,
+            topic_batch_settings={TOPIC: types.BatchSettings(max_latency=0.01)},
+        ),
+    )
+
+    response = gapic_types.PublishResponse(message_ids=["1"])
+
+    with _patch_gapic_publish(client, return_value=response):
+        future = await client.publish(TOPIC, b"spam", ordering_key="k")
+        await asyncio.wait_for(future, timeout=5)
+
+    # The cleanup follows the max_latency of the topic, not the default one.
+    assert client._finished_sequencer_keys == {(TOPIC, "k")}
+    assert client._cleanup_timer is not None
+
+    await asyncio.sleep(0.05)
+
+    assert (TOPIC, "k") not in client._sequencers
+
+
+@pytest.mark.asyncio
+async def test_resume_publish_ordering_keys_not_enabled(creds):
+    client = publisher.AsyncClient(credentials=creds)
+
+    with pytest.raises(ValueError):
+        client.resume_publish(TOPIC, "k")
+
+
+@pytest.mark.asyncio
+async def test_stop(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
+    response = gapic_types.PublishResponse(message_ids=["1"])
+
+    with _patch_gapic_publish(client, return_value=response) as publish:
+        future = await client.publish(TOPIC, b"spam")
+        client.stop()
+
+        assert await asyncio.wait_for(future, timeout=5) == "1"
+
+    publish.assert_awaited_once()
+
+    with pytest.raises(RuntimeError):
+        await client.publish(TOPIC, b"eggs")
+
+    with pytest.raises(RuntimeError):
+        client.stop()
+
+
+@pytest.mark.asyncio
+async def test_flush(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+    )
+    response = gapic_types.PublishResponse(message_ids=["1"])
+
+    with _patch_gapic_publish(client, return_value=response) as publish:
+        future1 = await client.publish(TOPIC, b"spam")
+        future2 = await client.publish(TOPIC, b"eggs", ordering_key="k")
+
+        await client.flush(timeout=5)
+
+        assert future1.result() == "1"
+        assert future2.result() == "1"
+        assert publish.await_count == 2
+
+        # The client can still be used.
+        future3 = await client.publish(TOPIC, b"ham")
+        await client.flush(timeout=5)
+        assert future3.result() == "1"
+
+
+@pytest.mark.asyncio
+async def test_flush_timeout(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
+    release_publish = asyncio.Event()
+
+    async def gapic_publish(*args, **kwargs):
+        await release_publish.wait()
+        return gapic_types.PublishResponse(message_ids=["1"])
+
+    with _patch_gapic_publish(client, side_effect=gapic_publish):
+        future = await client.publish(TOPIC, b"spam")
+
+        with pytest.raises(exceptions.TimeoutError):
+            await client.flush(timeout=0.01)
+
+        release_publish.set()
+        assert await asyncio.wait_for(future, timeout=5) == "1"
+
+
+@pytest.mark.asyncio
+async def test_max_outstanding_batches(creds):
+    client = publisher.AsyncClient(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_messages=1, max_latency=float("inf")),
+        publisher_options=types.PublisherOptions(max_outstanding_batches=1),
+    )
+    in_flight = []
+    max_in_flight = []
+
+    async def gapic_publish(topic, messages, retry, timeout):
+        in_flight.append(None)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return gapic_types.PublishResponse(message_ids=["1"] * len(messages))
+
+    with _patch_gapic_publish(client, side_effect=gapic_publish):
+        publish_futures = [await client.publish(TOPIC, b"msg") for _ in range(5)]
+        assert client._commit_queues[TOPIC].pending > 0
+
+        results = await asyncio.wait_for(asyncio.gather(*publish_futures), timeout=5)
+
+    assert results == ["1"] * 5
+    assert max(max_in_flight) == 1
+    assert client._commit_queues[TOPIC].outstanding == 0
@@ -15,6 +15,9 @@
 from __future__ import absolute_import
 from __future__ import division
 
+from concurrent import futures
+
+import gc
 import inspect
 import sys
 
@@ -24,11 +27,14 @@ import math
 from unittest import mock
 
 import pytest
+import threading
 import time
+import weakref
 from flaky import flaky
 from typing import cast, Callable, Any, TypeVar
 
 from opentelemetry import trace
+from google.api_core import exceptions as core_exceptions
 from google.api_core import gapic_v1
 from google.api_core import retry as retries
 from google.api_core.gapic_v1.client_info import METRICS_METADATA_KEY
@@ -37,7 +43,13 @@ from google.api_core.timeout import ConstantTimeout
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import _serialized
+from google.cloud.pubsub_v1.publisher._batch import thread
+from google.cloud.pubsub_v1.publisher._batch_coalescer import BatchCoalescer
+from google.cloud.pubsub_v1.publisher._commit_queue import AdaptiveCommitQueue
+from google.cloud.pubsub_v1.publisher._commit_queue import CommitQueue
 from google.cloud.pubsub_v1.publisher._sequencer import ordered_sequencer
+from google.cloud.pubsub_v1.publisher._sequencer import unordered_sequencer
 from google.pubsub_v1 import types as gapic_types
 from google.pubsub_v1.services.publisher import client as publisher_client
 from google.pubsub_v1.services.publisher.transports.grpc import PublisherGrpcTransport
@@ -184,6 +196,15 @@ def test_open_telemetry_publisher_options(creds, enable_open_telemetry):
             assert client._open_telemetry_enabled is False
 
 
+def test_flow_control_wait_statistics(creds):
+    client = publisher.Client(credentials=creds)
+
+    statistics = client.flow_control_wait_statistics
+
+    assert statistics == client._flow_controller.wait_statistics
+    assert statistics.wait_count == 0
+
+
 def test_opentelemetry_context_setter():
     msg = gapic_types.PubsubMessage(data=b"foo")
     OpenTelemetryContextSetter().set(carrier=msg, key="key", value="bar")
@@ -541,6 +562,248 @@ def test_publish_message_ordering_not_enabled_error(creds):
         client.publish(topic, b"bytestring body", ordering_key="ABC")
 
 
+def test_publish_to_other_topic_does_not_wait_for_batch_lock(creds):
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    topics = ["topic{}".format(i) for i in range(len(client._batch_locks) + 1)]
+    busy_topic = topics[0]
+    busy_lock = client._batch_lock_for(busy_topic, "")
+    other_topic = next(
+        topic for topic in topics if client._batch_lock_for(topic, "") is not busy_lock
+    )
+
+    with busy_lock:
+        publish_thread = threading.Thread(
+            target=client.publish, args=(other_topic, b"spam")
+        )
+        publish_thread.start()
+        publish_thread.join(timeout=5)
+
+        assert not publish_thread.is_alive()
+    assert (other_topic, "") in client._sequencers
+
+
+def test_stop_waits_for_publish_in_progress(creds):
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    batch_lock = client._batch_lock_for("topic", "")
+
+    with batch_lock:
+        stop_thread = threading.Thread(target=client.stop)
+        stop_thread.start()
+        stop_thread.join(timeout=0.05)
+
+        # A publish holding the topic's batch lock completes before the stop.
+        assert stop_thread.is_alive()
+        assert not client._is_stopped
+
+    stop_thread.join(timeout=5)
+    assert client._is_stopped
+
+
+def test_publish_many(creds):
+    client = publisher.Client(credentials=creds)
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = (mock.Mock(), mock.Mock())
+    topic = "topic/path"
+    client._set_batch(topic, batch)
+
+    batch_lock = mock.MagicMock(wraps=client._batch_lock_for(topic, ""))
+    with mock.patch.object(client, "_batch_lock_for", return_value=batch_lock):
+        result = client.publish_many(
+            topic, [(b"spam", {}), (b"foo", {"bar": "baz", "qux": b"quux"})]
+        )
+
+    assert len(result) == 2
+    # The batch lock is taken once for all messages.
+    assert batch_lock.__enter__.call_count == 1
+    batch.publish.assert_has_calls(
+        [
+            mock.call(
+                PublishMessageWrapper(message=gapic_types.PubsubMessage(data=b"spam"))
+            ),
+            mock.call(
+                PublishMessageWrapper(
+                    message=gapic_types.PubsubMessage(
+                        data=b"foo", attributes={"bar": "baz", "qux": "quux"}
+                    )
+                )
+            ),
+        ]
+    )
+    # Without flow control limits, nothing needs to be released when done.
+    for future in result:
+        future.add_done_callback.assert_not_called()
+
+
+def test_publish_many_releases_flow_control_when_done(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            message_limit=10,
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=publisher_options,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
+    client._gapic_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1", "2"])
+    )
+
+    result = client.publish_many("topic/path", [(b"spam", {}), (b"eggs", {})])
+    assert client._flow_controller._message_count == 2
+
+    client.stop()  # Commits the batch.
+
+    assert [future.result(timeout=5) for future in result] == ["1", "2"]
+    assert client._flow_controller._message_count == 0
+    assert client._flow_controller._total_bytes == 0
+
+
+def test_publish_many_error_exceeding_flow_control_limits(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            message_limit=10,
+            byte_limit=150,
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+
+    mock_batch = mock.Mock(spec=client._batch_class)
+    topic = "topic/path"
+    client._set_batch(topic, mock_batch)
+
+    future1, future2, future3 = client.publish_many(
+        topic, [(b"a" * 100, {}), (b"b" * 100, {}), (b"c", {})]
+    )
+
+    future1.result()  # no error, still within flow control limits
+    with pytest.raises(exceptions.FlowControlLimitError):
+        future2.result()
+    future3.result()  # small enough to fit
+    assert mock_batch.publish.call_count == 2
+
+
+def test_publish_many_blocks_on_flow_control(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            message_limit=1,
+            limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+        )
+    )
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=publisher_options,
+        batch_settings=types.BatchSettings(max_messages=1),
+    )
+    client._gapic_publish = mock.Mock(
+        side_effect=lambda messages, **kwargs: gapic_types.PublishResponse(
+            message_ids=[m.data.decode() for m in messages]
+        )
+    )
+
+    # Only one message fits into flow control at a time, the next one must
+    # wait until the previous one gets published.
+    result = client.publish_many("topic/path", [(b"1", {}), (b"2", {}), (b"3", {})])
+
+    assert [future.result(timeout=5) for future in result] == ["1", "2", "3"]
+
+
+def test_publish_many_error_exceeding_rate_limit(creds):
+    publisher_options = types.PublisherOptions(
+        rate_limit=types.PublishRateLimit(
+            topic_messages_per_second=2,
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+    mock_batch = mock.Mock(spec=client._batch_class)
+    topic = "topic/path"
+    client._set_batch(topic, mock_batch)
+
+    client.publish_many(topic, [(b"a", {}), (b"b", {})])
+    result = client.publish_many(topic, [(b"c", {}), (b"d", {})])
+
+    for future in result:
+        with pytest.raises(exceptions.RateLimitExceededError):
+            future.result()
+    assert mock_batch.publish.call_count == 2
+    assert client._flow_controller._message_count == 0
+
+
+def test_publish_waits_for_rate_limit(creds):
+    publisher_options = types.PublisherOptions(
+        rate_limit=types.PublishRateLimit(messages_per_second=1000)
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+    mock_batch = mock.Mock(spec=client._batch_class)
+    topic = "topic/path"
+    client._set_batch(topic, mock_batch)
+
+    with mock.patch.object(client._rate_limiter, "acquire") as acquire:
+        client.publish(topic, b"spam")
+        client.publish_many(topic, [(b"eggs", {}), (b"ham", {})])
+
+    assert acquire.call_args_list == [
+        mock.call(topic, 1, mock.ANY),
+        mock.call(topic, 2, mock.ANY),
+    ]
+    assert mock_batch.publish.call_count == 3
+
+
+def test_publish_many_message_too_large(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=publisher_options,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
+
+    with mock.patch.object(thread, "_SERVER_PUBLISH_MAX_BYTES", 100):
+        future1, future2 = client.publish_many(
+            "topic/path", [(b"x" * 200, {}), (b"spam", {})]
+        )
+
+    with pytest.raises(exceptions.MessageTooLargeError):
+        future1.result()
+    assert not future2.done()
+    assert client._flow_controller._message_count == 1
+
+
+def test_publish_many_data_not_bytestring_error(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+    with pytest.raises(TypeError):
+        client.publish_many("topic/path", [(b"spam", {}), ("eggs", {})])
+    assert client._flow_controller._message_count == 0
+
+
+def test_publish_many_stopped_client(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+    client.stop()
+
+    with pytest.raises(RuntimeError):
+        client.publish_many("topic/path", [(b"spam", {})])
+    assert client._flow_controller._message_count == 0
+
+
 def test_publish_empty_ordering_key_when_message_ordering_enabled(creds):
     client = publisher.Client(
         publisher_options=types.PublisherOptions(enable_message_ordering=True),
@@ -696,169 +959,791 @@ def test_publish_attrs_type_error(creds):
         client.publish(topic, b"foo", answer=42)
 
 
-def test_publish_custom_retry_overrides_configured_retry(creds):
-    client = publisher.Client(
-        credentials=creds,
-        publisher_options=types.PublisherOptions(retry=mock.sentinel.publish_retry),
-    )
+def test_publish_attributes_validated_once():
+    attributes = types.PublishAttributes({"foo": b"bar"}, baz="qux")
 
-    topic = "topic/path"
-    client._flow_controller = mock.Mock()
-    fake_sequencer = mock.Mock()
-    client._get_or_create_sequencer = mock.Mock(return_value=fake_sequencer)
-    client.publish(topic, b"hello!", retry=mock.sentinel.custom_retry)
+    assert dict(attributes) == {"foo": "bar", "baz": "qux"}
+    with pytest.raises(TypeError):
+        attributes["foo"] = "spam"
+    with pytest.raises(TypeError):
+        types.PublishAttributes(answer=42)
 
-    fake_sequencer.publish.assert_called_once_with(
-        wrapper=mock.ANY, retry=mock.sentinel.custom_retry, timeout=mock.ANY
+
+def test_publish_fanout(creds):
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    client._raw_publish = mock.Mock(
+        side_effect=lambda topic, request, **kwargs: gapic_types.PublishResponse(
+            message_ids=[topic[-1]]
+        )
+    )
+
+    future = client.publish_fanout(["topic1", "topic2"], b"spam", foo="bar")
+
+    batches = [
+        client._sequencers[(topic, "")]._current_batch for topic in ("topic1", "topic2")
+    ]
+    # The serialized message is shared by the batches of both topics.
+    wrapper = batches[0].message_wrappers[0]
+    assert isinstance(wrapper, _serialized.SerializedMessageWrapper)
+    assert batches[1].message_wrappers == [wrapper]
+    assert wrapper.message == gapic_types.PubsubMessage(
+        data=b"spam", attributes={"foo": "bar"}
     )
-    message = fake_sequencer.publish.call_args.kwargs["wrapper"].message
-    assert message.data == b"hello!"
 
+    client.flush(timeout=5)
 
-def test_publish_custom_timeout_overrides_configured_timeout(creds):
+    assert future.result(timeout=0) == ["1", "2"]
+    assert client._raw_publish.call_count == 2
+
+
+def test_publish_fanout_flow_control_counts_message_once(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            message_limit=1,
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
     client = publisher.Client(
         credentials=creds,
-        publisher_options=types.PublisherOptions(timeout=mock.sentinel.publish_timeout),
+        publisher_options=publisher_options,
+        batch_settings=batch_settings,
     )
-
-    topic = "topic/path"
-    client._flow_controller = mock.Mock()
-    fake_sequencer = mock.Mock()
-    client._get_or_create_sequencer = mock.Mock(return_value=fake_sequencer)
-    client.publish(topic, b"hello!", timeout=mock.sentinel.custom_timeout)
-
-    fake_sequencer.publish.assert_called_once_with(
-        wrapper=mock.ANY, retry=mock.ANY, timeout=mock.sentinel.custom_timeout
+    client._raw_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1"])
     )
-    message = fake_sequencer.publish.call_args.kwargs["wrapper"].message
-    assert message.data == b"hello!"
 
+    future = client.publish_fanout(["topic1", "topic2"], b"spam")
 
-def test_stop(creds):
-    client = publisher.Client(credentials=creds)
+    assert client._flow_controller._message_count == 1
+    over_limit_future = client.publish("topic1", b"eggs")
+    with pytest.raises(exceptions.FlowControlLimitError):
+        over_limit_future.result(timeout=0)
 
-    batch1 = mock.Mock(spec=client._batch_class)
-    topic = "topic/path"
-    client._set_batch(topic, batch1)
+    client._sequencers[("topic1", "")].commit()
+    assert client._flow_controller._message_count == 1
 
-    client.stop()
+    # The message is released once it is published to all topics.
+    client._sequencers[("topic2", "")].commit()
+    assert future.result(timeout=5) == ["1", "1"]
+    assert client._flow_controller._message_count == 0
 
-    assert batch1.commit.call_count == 1
 
-    with pytest.raises(RuntimeError):
-        client.publish("topic1", b"msg2")
+def test_publish_fanout_error_exceeding_rate_limit(creds):
+    publisher_options = types.PublisherOptions(
+        rate_limit=types.PublishRateLimit(
+            topic_messages_per_second=1,
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=publisher_options,
+        batch_settings=batch_settings,
+    )
+    client.publish("topic2", b"spam")
 
-    with pytest.raises(RuntimeError):
-        client.resume_publish("topic", "ord_key")
+    future = client.publish_fanout(["topic1", "topic2"], b"eggs")
 
-    with pytest.raises(RuntimeError):
-        client.stop()
+    with pytest.raises(exceptions.RateLimitExceededError):
+        future.result(timeout=0)
+    assert ("topic1", "") not in client._sequencers
+    # The rejected message did not use up the tokens of the first topic.
+    assert client._rate_limiter.reserve("topic1", 1, 0) == 0
 
 
-def test_gapic_instance_method(creds):
+def test_publish_fanout_publish_error(creds):
     client = publisher.Client(credentials=creds)
+    error = core_exceptions.InternalServerError("bad")
 
-    topic = gapic_types.Topic(name="projects/foo/topics/bar")
-    with mock.patch.object(client, "create_topic") as patched:
-        client.create_topic(topic)
-
-    assert patched.call_count == 1
-    _, args, _ = patched.mock_calls[0]
-    assert args[0] == gapic_types.Topic(name="projects/foo/topics/bar")
+    def raw_publish(topic, request, **kwargs):
+        if topic == "topic2":
+            raise error
+        return gapic_types.PublishResponse(message_ids=["1"])
 
+    client._raw_publish = mock.Mock(side_effect=raw_publish)
 
-def test_gapic_class_method_on_class():
-    answer = publisher.Client.topic_path("foo", "bar")
-    assert answer == "projects/foo/topics/bar"
+    future = client.publish_fanout(["topic1", "topic2"], b"spam", retry=None)
 
+    assert future.exception(timeout=5) is error
 
-def test_class_method_factory():
-    patch = mock.patch(
-        "google.oauth2.service_account.Credentials.from_service_account_file"
-    )
 
-    with patch:
-        client = publisher.Client.from_service_account_file("filename.json")
+def test_publish_fanout_no_topics(creds):
+    client = publisher.Client(credentials=creds)
 
-    assert isinstance(client, publisher.Client)
+    with pytest.raises(ValueError):
+        client.publish_fanout([], b"spam")
 
 
-def test_gapic_class_method_on_instance(creds):
+def test_publish_fanout_stopped_client(creds):
     client = publisher.Client(credentials=creds)
-    answer = client.topic_path("foo", "bar")
-    assert answer == "projects/foo/topics/bar"
-
+    client.stop()
 
-def test_commit_thread_created_on_publish(creds):
-    # Max latency is not infinite so a commit thread is created.
-    batch_settings = types.BatchSettings(max_latency=600)
-    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    with pytest.raises(RuntimeError):
+        client.publish_fanout(["topic1", "topic2"], b"spam")
 
-    with mock.patch.object(
-        client, "_start_commit_thread", autospec=True
-    ) as _start_commit_thread:
-        # First publish should create a commit thread.
-        assert client.publish("topic", b"bytestring body", ordering_key="") is not None
-        _start_commit_thread.assert_called_once()
+    assert client._flow_controller._message_count == 0
 
-        # Since _start_commit_thread is a mock, no actual thread has been
-        # created, so let's put a sentinel there to mimic real behavior.
-        client._commit_thread = mock.Mock()
 
-        # Second publish should not create a commit thread since one (the mock)
-        # already exists.
-        assert client.publish("topic", b"bytestring body", ordering_key="") is not None
-        # Call count should remain 1.
-        _start_commit_thread.assert_called_once()
+def test_publish_many_with_publish_attributes(creds):
+    client = publisher.Client(credentials=creds)
+    batch = mock.Mock(spec=client._batch_class)
+    topic = "topic/path"
+    client._set_batch(topic, batch)
+    attributes = types.PublishAttributes(bar=b"baz")
 
+    with mock.patch.object(
+        types.PublishAttributes, "items", side_effect=AssertionError
+    ):
+        client.publish_many(topic, [(b"spam", attributes), (b"eggs", attributes)])
 
-def test_commit_thread_not_created_on_publish_if_max_latency_is_inf(creds):
-    # Max latency is infinite so a commit thread is not created.
-    batch_settings = types.BatchSettings(max_latency=float("inf"))
-    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    batch.publish.assert_has_calls(
+        [
+            mock.call(
+                PublishMessageWrapper(
+                    message=gapic_types.PubsubMessage(
+                        data=data, attributes={"bar": "baz"}
+                    )
+                )
+            )
+            for data in (b"spam", b"eggs")
+        ]
+    )
+
+
+def test_publish_releases_flow_control_when_done(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            message_limit=10,
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=publisher_options,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
+    client._gapic_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1"])
+    )
+
+    future = client.publish("topic/path", b"spam")
+    assert client._flow_controller._message_count == 1
+
+    client.stop()  # Commits the batch.
+
+    assert future.result(timeout=5) == "1"
+    assert client._flow_controller._message_count == 0
+    assert client._flow_controller._total_bytes == 0
+
+
+def test_publish_stopped_client_releases_flow_control(creds):
+    publisher_options = types.PublisherOptions(
+        flow_control=types.PublishFlowControl(
+            limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+        )
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+    client.stop()
+
+    with pytest.raises(RuntimeError):
+        client.publish("topic/path", b"spam")
+    assert client._flow_controller._message_count == 0
+
+
+def test_publish_buffers_in_serialized_request(creds):
+    client = publisher.Client(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
+    client._raw_publish_rpc = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1", "2", "3"])
+    )
+    client._gapic_publish = mock.Mock(spec=())
+    topic = "topic/path"
+
+    shared = bytearray(b"spam and eggs")
+    result = [
+        client.publish(topic, memoryview(shared)[:4], foo=b"bar"),
+        client.publish(topic, bytearray(b"eggs")),
+        client.publish(topic, b"ham"),
+    ]
+    client.stop()  # Commits the batch.
+
+    assert [future.result(timeout=5) for future in result] == ["1", "2", "3"]
+    client._gapic_publish.assert_not_called()
+    client._raw_publish_rpc.assert_called_once()
+    (request,) = client._raw_publish_rpc.call_args.args
+    assert gapic_types.PublishRequest.deserialize(request) == (
+        gapic_types.PublishRequest(
+            topic=topic,
+            messages=[
+                gapic_types.PubsubMessage(data=b"spam", attributes={"foo": "bar"}),
+                gapic_types.PubsubMessage(data=b"eggs"),
+                gapic_types.PubsubMessage(data=b"ham"),
+            ],
+        )
+    )
+    metadata = client._raw_publish_rpc.call_args.kwargs["metadata"]
+    assert metadata == (("x-goog-request-params", "topic=topic/path"),)
+
+
+def test_publish_buffers_without_grpc_transport(creds):
+    client = publisher.Client(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+    )
+    client._raw_publish_rpc = None
+    client._gapic_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1"])
+    )
+
+    future = client.publish("topic/path", bytearray(b"spam"))
+    client.stop()  # Commits the batch.
+
+    assert future.result(timeout=5) == "1"
+    messages = client._gapic_publish.call_args.kwargs["messages"]
+    assert messages == [gapic_types.PubsubMessage(data=b"spam")]
+
+
+def test_gapic_publish_sends_raw_request(creds):
+    client = publisher.Client(credentials=creds)
+    response = gapic_types.PublishResponse.pb()(message_ids=["1", "2"])
+    client._raw_publish_rpc = mock.Mock(return_value=response)
+    messages = [
+        gapic_types.PubsubMessage(data=b"spam"),
+        gapic_types.PubsubMessage(data=b"eggs", attributes={"foo": "bar"}),
+    ]
+
+    result = client._gapic_publish(topic="topic/path", messages=messages, timeout=7)
+
+    assert result is response
+    (request,) = client._raw_publish_rpc.call_args.args
+    assert gapic_types.PublishRequest.deserialize(request) == (
+        gapic_types.PublishRequest(topic="topic/path", messages=messages)
+    )
+    assert client._raw_publish_rpc.call_args.kwargs == {
+        "retry": gapic_v1.method.DEFAULT,
+        "timeout": 7,
+        "metadata": (("x-goog-request-params", "topic=topic/path"),),
+    }
+
+
+def test_gapic_publish_without_grpc_transport(creds):
+    client = publisher.Client(credentials=creds)
+    client._raw_publish_rpc = None
+    messages = [gapic_types.PubsubMessage(data=b"spam")]
+
+    with mock.patch.object(
+        publisher_client.PublisherClient, "publish", autospec=True
+    ) as publish:
+        result = client._gapic_publish(topic="topic/path", messages=messages)
+
+    assert result is publish.return_value
+    publish.assert_called_once_with(
+        client,
+        topic="topic/path",
+        messages=messages,
+        retry=gapic_v1.method.DEFAULT,
+        timeout=gapic_v1.method.DEFAULT,
+    )
+
+
+def test_publish_serialized(creds):
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+    )
+    batch = mock.Mock(spec=client._batch_class)
+    topic = "topic/path"
+    client._set_batch(topic, batch, ordering_key="key")
+    message = gapic_types.PubsubMessage(data=b"spam", ordering_key="key")
+
+    future = client.publish_serialized(
+        topic, gapic_types.PubsubMessage.serialize(message), ordering_key="key"
+    )
+
+    assert future is batch.publish.return_value
+    batch.publish.assert_called_once_with(PublishMessageWrapper(message=message))
+
+
+def test_publish_serialized_errors(creds):
+    client = publisher.Client(credentials=creds)
+    with pytest.raises(TypeError):
+        client.publish_serialized("topic/path", "spam")
+    with pytest.raises(ValueError):
+        client.publish_serialized("topic/path", b"", ordering_key="key")
+
+
+@pytest.mark.parametrize(
+    "ordering_key, encoded_ordering_key", [("", "key"), ("key", ""), ("a", "b")]
+)
+def test_publish_serialized_ordering_key_mismatch(
+    creds, ordering_key, encoded_ordering_key
+):
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+    )
+    client._flow_controller = mock.Mock()
+    message = gapic_types.PubsubMessage(data=b"spam", ordering_key=encoded_ordering_key)
+
+    with pytest.raises(ValueError, match="does not match"):
+        client.publish_serialized(
+            "topic/path",
+            gapic_types.PubsubMessage.serialize(message),
+            ordering_key=ordering_key,
+        )
+
+    client._flow_controller.add.assert_not_called()
+    assert not client._sequencers
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason="Open Telemetry not supported below Python version 3.8",
+)
+def test_opentelemetry_publish_serialized(creds, span_exporter):
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=types.PublisherOptions(
+            enable_open_telemetry_tracing=True,
+        ),
+    )
+    batch = mock.Mock(spec=client._batch_class)
+    topic = "projects/projectID/topics/topicID"
+    client._set_batch(topic, batch)
+    message = gapic_types.PubsubMessage(data=b"spam", attributes={"foo": "bar"})
+
+    client.publish_serialized(topic, gapic_types.PubsubMessage.serialize(message))
+
+    (wrapper,) = batch.publish.call_args.args
+    assert wrapper.message.data == b"spam"
+    assert wrapper.message.attributes["foo"] == "bar"
+    assert "googclient_traceparent" in wrapper.message.attributes
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason="Open Telemetry not supported below Python version 3.8",
+)
+def test_opentelemetry_publish_serialized_ordering_key(creds, span_exporter):
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=types.PublisherOptions(
+            enable_open_telemetry_tracing=True,
+            enable_message_ordering=True,
+        ),
+    )
+    batch = mock.Mock(spec=client._batch_class)
+    topic = "projects/projectID/topics/topicID"
+    client._set_batch(topic, batch, ordering_key="key")
+    serialized = gapic_types.PubsubMessage.serialize(
+        gapic_types.PubsubMessage(data=b"spam", ordering_key="key")
+    )
+
+    # The ordering key is checked against the message with tracing, too.
+    with pytest.raises(ValueError, match="does not match"):
+        client.publish_serialized(topic, serialized)
+    batch.publish.assert_not_called()
+
+    client.publish_serialized(topic, serialized, ordering_key="key")
+
+    (wrapper,) = batch.publish.call_args.args
+    assert wrapper.ordering_key == "key"
+    assert wrapper.message.ordering_key == "key"
+
+
+def test_publish_custom_retry_overrides_configured_retry(creds):
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=types.PublisherOptions(retry=mock.sentinel.publish_retry),
+    )
+
+    topic = "topic/path"
+    client._flow_controller = mock.Mock()
+    fake_sequencer = mock.Mock()
+    client._get_or_create_sequencer = mock.Mock(return_value=fake_sequencer)
+    client.publish(topic, b"hello!", retry=mock.sentinel.custom_retry)
+
+    fake_sequencer.publish.assert_called_once_with(
+        wrapper=mock.ANY, retry=mock.sentinel.custom_retry, timeout=mock.ANY
+    )
+    message = fake_sequencer.publish.call_args.kwargs["wrapper"].message
+    assert message.data == b"hello!"
+
+
+def test_publish_custom_timeout_overrides_configured_timeout(creds):
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=types.PublisherOptions(timeout=mock.sentinel.publish_timeout),
+    )
+
+    topic = "topic/path"
+    client._flow_controller = mock.Mock()
+    fake_sequencer = mock.Mock()
+    client._get_or_create_sequencer = mock.Mock(return_value=fake_sequencer)
+    client.publish(topic, b"hello!", timeout=mock.sentinel.custom_timeout)
+
+    fake_sequencer.publish.assert_called_once_with(
+        wrapper=mock.ANY, retry=mock.ANY, timeout=mock.sentinel.custom_timeout
+    )
+    message = fake_sequencer.publish.call_args.kwargs["wrapper"].message
+    assert message.data == b"hello!"
+
+
+def test_stop(creds):
+    client = publisher.Client(credentials=creds)
+
+    batch1 = mock.Mock(spec=client._batch_class)
+    topic = "topic/path"
+    client._set_batch(topic, batch1)
+
+    client.stop()
+
+    assert batch1.commit.call_count == 1
+
+    with pytest.raises(RuntimeError):
+        client.publish("topic1", b"msg2")
+
+    with pytest.raises(RuntimeError):
+        client.resume_publish("topic", "ord_key")
+
+    with pytest.raises(RuntimeError):
+        client.stop()
+
+
+def test_gapic_instance_method(creds):
+    client = publisher.Client(credentials=creds)
+
+    topic = gapic_types.Topic(name="projects/foo/topics/bar")
+    with mock.patch.object(client, "create_topic") as patched:
+        client.create_topic(topic)
+
+    assert patched.call_count == 1
+    _, args, _ = patched.mock_calls[0]
+    assert args[0] == gapic_types.Topic(name="projects/foo/topics/bar")
+
+
+def test_gapic_class_method_on_class():
+    answer = publisher.Client.topic_path("foo", "bar")
+    assert answer == "projects/foo/topics/bar"
+
+
+def test_class_method_factory():
+    patch = mock.patch(
+        "google.oauth2.service_account.Credentials.from_service_account_file"
+    )
+
+    with patch:
+        client = publisher.Client.from_service_account_file("filename.json")
+
+    assert isinstance(client, publisher.Client)
+
+
+def test_gapic_class_method_on_instance(creds):
+    client = publisher.Client(credentials=creds)
+    answer = client.topic_path("foo", "bar")
+    assert answer == "projects/foo/topics/bar"
+
+
+def test_adaptive_batching_disabled_by_default(creds):
+    client = publisher.Client(credentials=creds)
+
+    assert client._batch_tuner is None
+    # Nothing to learn from the batch.
+    client._record_batch_commit("topic", client.batch_settings, 1, 100, 0.01, 0.02)
+    assert client.batch_settings == types.BatchSettings()
+
+
+def test_adaptive_batching_tunes_batch_settings(creds):
+    publisher_options = types.PublisherOptions(
+        adaptive_batching=types.AdaptiveBatchSettings(min_messages=200)
+    )
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=publisher_options,
+        batch_settings=types.BatchSettings(max_messages=100),
+    )
+
+    # The initial settings are kept within the bounds.
+    assert client.batch_settings.max_messages == 200
+
+    new_settings = types.BatchSettings(max_messages=400)
+    with mock.patch.object(
+        client._batch_tuner, "record", return_value=new_settings
+    ) as record:
+        client._record_batch_commit(
+            "topic", mock.sentinel.settings, 10, 1000, 0.01, 0.02
+        )
+
+    record.assert_called_once_with(mock.sentinel.settings, 10, 1000, 0.01, 0.02)
+    assert client.batch_settings is new_settings
+
+
+def test_adaptive_batching_keeps_settings_if_not_adjusted(creds):
+    publisher_options = types.PublisherOptions(
+        adaptive_batching=types.AdaptiveBatchSettings()
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+    settings = client.batch_settings
+
+    with mock.patch.object(client._batch_tuner, "record", return_value=None):
+        client._record_batch_commit("topic", settings, 10, 1000, 0.01, 0.02)
+
+    assert client.batch_settings is settings
+
+
+def test_adaptive_batching_ignores_topic_batch_settings(creds):
+    topic_settings = types.BatchSettings(max_messages=1)
+    publisher_options = types.PublisherOptions(
+        adaptive_batching=types.AdaptiveBatchSettings(),
+        topic_batch_settings={"urgent": topic_settings},
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+
+    with mock.patch.object(client._batch_tuner, "record") as record:
+        client._record_batch_commit("urgent", topic_settings, 1, 100, 0.0, 0.02)
+
+    record.assert_not_called()
+
+
+def test_adaptive_batching_topic_settings_equal_to_default(creds):
+    publisher_options = types.PublisherOptions(
+        adaptive_batching=types.AdaptiveBatchSettings(),
+        topic_batch_settings={"urgent": types.BatchSettings()},
+    )
+    client = publisher.Client(credentials=creds, publisher_options=publisher_options)
+    settings = client.batch_settings
+    assert settings == client._topic_batch_settings["urgent"]
+
+    with mock.patch.object(client._batch_tuner, "record") as record:
+        client._record_batch_commit("topic", settings, 10, 1000, 0.01, 0.02)
+
+    # The batch of a topic without its own settings counts, even though its
+    # settings equal those of another topic.
+    record.assert_called_once_with(settings, 10, 1000, 0.01, 0.02)
+
+
+def test_topic_batch_settings(creds):
+    topic_settings = types.BatchSettings(max_messages=1, max_latency=0.001)
+    publisher_options = types.PublisherOptions(
+        topic_batch_settings={"urgent": topic_settings}
+    )
+    client = publisher.Client(
+        credentials=creds,
+        publisher_options=publisher_options,
+        batch_settings=types.BatchSettings(max_latency=600),
+    )
+    client._gapic_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1"])
+    )
+
+    with mock.patch.object(client._commit_timer, "schedule", autospec=True) as schedule:
+        urgent_future = client.publish("urgent", b"spam")
+        client.publish("bulk", b"eggs")
+
+    # The batch of the urgent topic got full, and was committed right away.
+    assert urgent_future.result(timeout=5) == "1"
+    assert [call.args[0] for call in schedule.call_args_list] == [0.001, 600]
+
+    urgent_batch = client._sequencers[("urgent", "")]._current_batch
+    assert urgent_batch.settings is topic_settings
+    bulk_batch = client._sequencers[("bulk", "")]._current_batch
+    assert bulk_batch.settings is client.batch_settings
+
+
+def test_batch_commit_scheduled_on_publish(creds):
+    # Max latency is not infinite so the batch is committed by the timer.
+    batch_settings = types.BatchSettings(max_latency=600)
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+
+    with mock.patch.object(client._commit_timer, "schedule", autospec=True) as schedule:
+        # First publish opens a batch, whose commit is scheduled.
+        assert client.publish("topic", b"bytestring body", ordering_key="") is not None
+        schedule.assert_called_once()
+        assert schedule.call_args.args[0] == 600
+
+        # Second publish goes to the same batch, nothing new is scheduled.
+        assert client.publish("topic", b"bytestring body", ordering_key="") is not None
+        schedule.assert_called_once()
+
+
+def test_batch_commit_not_scheduled_on_publish_if_max_latency_is_inf(creds):
+    # Max latency is infinite so batches are only committed when full.
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
 
     assert client.publish("topic", b"bytestring body", ordering_key="") is not None
-    assert client._commit_thread is None
+    assert len(client._commit_timer) == 0
 
 
-def test_wait_and_commit_sequencers(creds):
-    # Max latency is infinite so a commit thread is not created.
-    # We don't want a commit thread to interfere with this test.
+def test_batch_committed_early_not_kept_by_timer(creds):
+    batch_settings = types.BatchSettings(max_latency=600, max_messages=1)
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    client._gapic_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1"])
+    )
+
+    assert client.publish("topic", b"spam").result(timeout=5) == "1"
+    sequencer = client._sequencers[("topic", "")]
+    batch_ref = weakref.ref(sequencer._current_batch)
+    callback = client._commit_timer._heap[0][2]
+    # The next batch takes the place of the first one in the sequencer.
+    assert client.publish("topic", b"eggs").result(timeout=5) == "1"
+
+    # The first batch was committed long before its deadline, and is freed
+    # although its deadline is still pending.
+    assert len(client._commit_timer) == 2
+    gc.collect()
+    assert batch_ref() is None
+    with mock.patch.object(client, "_commit_batch_at_deadline") as commit:
+        callback()
+    commit.assert_not_called()
+    client.stop()
+
+
+def test_commit_batch_at_deadline(creds):
     batch_settings = types.BatchSettings(max_latency=float("inf"))
     client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    sequencer = mock.Mock(spec=unordered_sequencer.UnorderedSequencer)
+    sequencer._topic = "topic"
 
-    # Mock out time so no sleep is actually done.
-    with mock.patch.object(time, "sleep"):
-        with mock.patch.object(client, "_commit_sequencers") as _commit_sequencers:
-            assert (
-                client.publish("topic", b"bytestring body", ordering_key="") is not None
-            )
-            # Call _wait_and_commit_sequencers to simulate what would happen if a
-            # commit thread actually ran.
-            client._wait_and_commit_sequencers()
-            assert _commit_sequencers.call_count == 1
+    client._commit_batch_at_deadline(sequencer, mock.sentinel.batch)
+
+    sequencer.commit_batch.assert_called_once_with(mock.sentinel.batch)
 
 
-def test_stopped_client_does_not_commit_sequencers(creds):
-    # Max latency is infinite so a commit thread is not created.
-    # We don't want a commit thread to interfere with this test.
+def test_stopped_client_does_not_commit_batch_at_deadline(creds):
     batch_settings = types.BatchSettings(max_latency=float("inf"))
     client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    sequencer = mock.Mock(spec=unordered_sequencer.UnorderedSequencer)
+    sequencer._topic = "topic"
 
-    # Mock out time so no sleep is actually done.
-    with mock.patch.object(time, "sleep"):
-        with mock.patch.object(client, "_commit_sequencers") as _commit_sequencers:
-            assert (
-                client.publish("topic", b"bytestring body", ordering_key="") is not None
-            )
+    client.stop()
+    client._commit_batch_at_deadline(sequencer, mock.sentinel.batch)
+
+    # Should not be called since Client is stopped.
+    sequencer.commit_batch.assert_not_called()
+
+
+def test_batch_committed_by_timer(creds):
+    batch_settings = types.BatchSettings(max_latency=0.01)
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    client._gapic_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1"])
+    )
+
+    future = client.publish("topic", b"bytestring body", ordering_key="")
+
+    assert future.result(timeout=5) == "1"
+    client._gapic_publish.assert_called_once()
+
+
+def test_flush(creds):
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    publisher_options = types.PublisherOptions(enable_message_ordering=True)
+    client = publisher.Client(
+        batch_settings=batch_settings,
+        publisher_options=publisher_options,
+        credentials=creds,
+    )
+    client._gapic_publish = mock.Mock(
+        side_effect=lambda topic, messages, **kwargs: gapic_types.PublishResponse(
+            message_ids=[m.data.decode() for m in messages]
+        )
+    )
+
+    future1 = client.publish("topic", b"1")
+    future2 = client.publish("topic", b"2", ordering_key="k")
+
+    client.flush(timeout=5)
+
+    assert future1.result(timeout=0) == "1"
+    assert future2.result(timeout=0) == "2"
+    assert client._gapic_publish.call_count == 2
+
+    # The client can still be used.
+    future3 = client.publish("topic", b"3")
+    client.flush(timeout=5)
+    assert future3.result(timeout=0) == "3"
+
+
+def test_flush_commits_all_ordered_batches(creds):
+    batch_settings = types.BatchSettings(max_messages=1, max_latency=float("inf"))
+    publisher_options = types.PublisherOptions(enable_message_ordering=True)
+    client = publisher.Client(
+        batch_settings=batch_settings,
+        publisher_options=publisher_options,
+        credentials=creds,
+    )
+    client._gapic_publish = mock.Mock(
+        side_effect=lambda topic, messages, **kwargs: gapic_types.PublishResponse(
+            message_ids=[m.data.decode() for m in messages]
+        )
+    )
+
+    publish_futures = [
+        client.publish("topic", str(i).encode(), ordering_key="k") for i in range(3)
+    ]
+
+    client.flush(timeout=5)
+
+    assert [future.result(timeout=0) for future in publish_futures] == ["0", "1", "2"]
+
+
+def test_flush_timeout(creds):
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    publish_started = threading.Event()
+    release_publish = threading.Event()
+
+    def gapic_publish(topic, messages, **kwargs):
+        publish_started.set()
+        release_publish.wait()
+        return gapic_types.PublishResponse(message_ids=["1"])
+
+    client._gapic_publish = mock.Mock(side_effect=gapic_publish)
+
+    future = client.publish("topic", b"spam")
+
+    with pytest.raises(exceptions.TimeoutError):
+        client.flush(timeout=0.01)
+
+    assert publish_started.wait(timeout=5)
+    release_publish.set()
+    assert future.result(timeout=5) == "1"
+
+
+def test_flush_stopped_client(creds):
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    client._gapic_publish = mock.Mock(
+        return_value=gapic_types.PublishResponse(message_ids=["1"])
+    )
+
+    future = client.publish("topic", b"spam")
+    client.stop()
+    client.flush(timeout=5)
 
-            client.stop()
+    assert future.result(timeout=0) == "1"
 
-            # Call _wait_and_commit_sequencers to simulate what would happen if a
-            # commit thread actually ran after the client was stopped.
-            client._wait_and_commit_sequencers()
-            # Should not be called since Client is stopped.
-            assert _commit_sequencers.call_count == 0
+
+def test_ensure_cleanup_and_commit_timer_runs(creds):
+    batch_settings = types.BatchSettings(max_latency=600)
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+
+    with mock.patch.object(client._commit_timer, "schedule", autospec=True) as schedule:
+        client.ensure_cleanup_and_commit_timer_runs()
+        # A cleanup is already scheduled, do not schedule another one.
+        client.ensure_cleanup_and_commit_timer_runs()
+
+    schedule.assert_called_once_with(600, client._cleanup_sequencers)
+
+    client._cleanup_sequencers()
+    assert not client._cleanup_scheduled
 
 
 def test_publish_with_ordering_key(creds):
@@ -907,8 +1792,8 @@ def test_publish_with_ordering_key(creds):
 
 
 def test_ordered_sequencer_cleaned_up(creds):
-    # Max latency is infinite so a commit thread is not created.
-    # We don't want a commit thread to interfere with this test.
+    # Max latency is infinite, so finished sequencers are cleaned up after a
+    # fixed interval instead.
     batch_settings = types.BatchSettings(max_latency=float("inf"))
     publisher_options = types.PublisherOptions(enable_message_ordering=True)
     client = publisher.Client(
@@ -923,17 +1808,79 @@ def test_ordered_sequencer_cleaned_up(creds):
     sequencer.is_finished.return_value = False
     client._set_sequencer(topic=topic, sequencer=sequencer, ordering_key=ordering_key)
 
+    with mock.patch.object(client._commit_timer, "schedule", autospec=True) as schedule:
+        client._sequencer_finished(topic, ordering_key)
+    schedule.assert_called_once_with(
+        publisher.client._SEQUENCER_CLEANUP_INTERVAL,
+        client._cleanup_sequencers,
+    )
     assert len(client._sequencers) == 1
-    # 'sequencer' is not finished yet so don't remove it.
-    client._commit_sequencers()
+
+    # 'sequencer' accepted new messages since it finished, so don't remove it.
+    client._cleanup_sequencers()
     assert len(client._sequencers) == 1
 
     sequencer.is_finished.return_value = True
+    with mock.patch.object(client._commit_timer, "schedule", autospec=True):
+        client._sequencer_finished(topic, ordering_key)
     # 'sequencer' is finished so remove it.
-    client._commit_sequencers()
+    client._cleanup_sequencers()
     assert len(client._sequencers) == 0
 
 
+def test_sequencer_finished_does_not_take_all_batch_locks(creds):
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+
+    with mock.patch.object(
+        client, "_all_batch_locks"
+    ) as all_batch_locks, mock.patch.object(
+        client._commit_timer, "schedule", autospec=True
+    ):
+        client._sequencer_finished("topic", "a")
+        client._sequencer_finished("topic", "b")
+
+    all_batch_locks.assert_not_called()
+    assert client._finished_sequencer_keys == {("topic", "a"), ("topic", "b")}
+
+
+def test_sequencer_finished_uses_topic_max_latency(creds):
+    publisher_options = types.PublisherOptions(
+        topic_batch_settings={"urgent": types.BatchSettings(max_latency=0.05)}
+    )
+    client = publisher.Client(
+        credentials=creds,
+        batch_settings=types.BatchSettings(max_latency=float("inf")),
+        publisher_options=publisher_options,
+    )
+
+    with mock.patch.object(client._commit_timer, "schedule", autospec=True) as schedule:
+        client._sequencer_finished("urgent", "a")
+
+    schedule.assert_called_once_with(0.05, client._cleanup_sequencers)
+
+
+def test_cleanup_only_visits_finished_sequencers(creds):
+    batch_settings = types.BatchSettings(max_latency=600)
+    client = publisher.Client(batch_settings=batch_settings, credentials=creds)
+    sequencers = {}
+    for ordering_key in ("a", "b"):
+        sequencer = mock.Mock(spec=ordered_sequencer.OrderedSequencer)
+        sequencer.is_finished.return_value = True
+        client._set_sequencer("topic", sequencer, ordering_key=ordering_key)
+        sequencers[ordering_key] = sequencer
+
+    with mock.patch.object(client._commit_timer, "schedule", autospec=True) as schedule:
+        client._sequencer_finished("topic", "a")
+
+    schedule.assert_called_once_with(600, client._cleanup_sequencers)
+    client._cleanup_sequencers()
+
+    assert list(client._sequencers) == [("topic", "b")]
+    sequencers["b"].is_finished.assert_not_called()
+    assert not client._finished_sequencer_keys
+
+
 def test_resume_publish(creds):
     publisher_options = types.PublisherOptions(enable_message_ordering=True)
     client = publisher.Client(publisher_options=publisher_options, credentials=creds)
@@ -963,3 +1910,277 @@ def test_resume_publish_ordering_keys_not_enabled(creds):
     # Throw on calling resume_publish() when enable_message_ordering is False.
     with pytest.raises(ValueError):
         client.resume_publish("topic", "ord_key")
+
+
+def test_init_negative_max_outstanding_batches(creds):
+    options = types.PublisherOptions(max_outstanding_batches=-1)
+
+    with pytest.raises(ValueError, match="max_outstanding_batches"):
+        publisher.Client(credentials=creds, publisher_options=options)
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        types.AdaptiveConcurrencySettings(min_outstanding_batches=0),
+        types.AdaptiveConcurrencySettings(
+            min_outstanding_batches=5, max_outstanding_batches=4
+        ),
+    ],
+)
+def test_init_invalid_adaptive_concurrency(creds, settings):
+    options = types.PublisherOptions(adaptive_concurrency=settings)
+
+    with pytest.raises(ValueError, match="adaptive_concurrency"):
+        publisher.Client(credentials=creds, publisher_options=options)
+
+
+def test_init_scheduled_retries(creds):
+    client = publisher.Client(credentials=creds)
+    assert client._retry_scheduler is None
+
+    options = types.PublisherOptions(
+        scheduled_retries=types.ScheduledRetrySettings(max_tokens=10)
+    )
+    client = publisher.Client(credentials=creds, publisher_options=options)
+
+    transport = client._transport
+    default_retry = transport._wrapped_methods[transport.publish]._retry
+    assert client._retry_scheduler.tokens == 10
+    assert (
+        client._retry_scheduler.scheduled_retry(gapic_v1.method.DEFAULT)
+        is default_retry
+    )
+
+
+def test_stop_stops_retry_scheduler(creds):
+    options = types.PublisherOptions(scheduled_retries=types.ScheduledRetrySettings())
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    retry_timer = client._retry_scheduler._timer
+    calls = []
+    retry_timer.schedule(0.05, lambda: calls.append(1))
+
+    client.stop()
+    retry_timer._thread.join(timeout=5)
+
+    assert not retry_timer._thread.is_alive()
+    assert calls == [1]
+
+
+def test_batch_commit_runs_on_commit_executor(creds):
+    executor = mock.Mock(spec=["submit"])
+    options = types.PublisherOptions(commit_executor=executor)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    commit = mock.Mock(spec=())
+
+    with mock.patch("threading.Thread", autospec=True) as Thread:
+        client._start_batch_commit("topic", commit)
+
+    Thread.assert_not_called()
+    executor.submit.assert_called_once_with(commit)
+
+
+def test_batch_commit_runs_on_new_thread_by_default(creds):
+    client = publisher.Client(credentials=creds)
+    commit = mock.Mock(spec=())
+
+    with mock.patch("threading.Thread", autospec=True) as Thread:
+        client._start_batch_commit("topic", commit)
+
+    Thread.assert_called_once_with(
+        name="Thread-CommitBatchPublisher", target=commit, daemon=True
+    )
+    Thread.return_value.start.assert_called_once_with()
+
+
+def test_max_outstanding_batches_queues_commits_per_topic(creds):
+    submitted = []
+    executor = mock.Mock(spec=["submit"])
+    executor.submit.side_effect = submitted.append
+    options = types.PublisherOptions(
+        commit_executor=executor, max_outstanding_batches=1
+    )
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    calls = []
+
+    client._start_batch_commit("topic1", lambda: calls.append("1a"))
+    client._start_batch_commit("topic1", lambda: calls.append("1b"))
+    client._start_batch_commit("topic2", lambda: calls.append("2a"))
+
+    # Only one commit per topic is submitted, the second one for topic1 waits.
+    assert len(submitted) == 2
+    assert client._commit_queues["topic1"].pending == 1
+
+    for run in submitted:
+        run()
+
+    # The queued commit is run by the same worker after the first one is done.
+    assert calls == ["1a", "1b", "2a"]
+    assert client._commit_queues["topic1"].outstanding == 0
+    assert client._commit_queues["topic2"].outstanding == 0
+
+
+def test_max_outstanding_batches_publish(creds):
+    executor = futures.ThreadPoolExecutor(max_workers=4)
+    options = types.PublisherOptions(
+        commit_executor=executor, max_outstanding_batches=1
+    )
+    batch_settings = types.BatchSettings(max_messages=1)
+    client = publisher.Client(
+        credentials=creds, batch_settings=batch_settings, publisher_options=options
+    )
+    in_flight = []
+    max_in_flight = []
+
+    def api_publish(topic, messages, retry=None, timeout=None):
+        in_flight.append(None)
+        max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        in_flight.pop()
+        return gapic_types.PublishResponse(message_ids=["1"] * len(messages))
+
+    with mock.patch.object(client, "_gapic_publish", side_effect=api_publish):
+        publish_futures = [client.publish("topic", b"msg") for _ in range(5)]
+        for future in publish_futures:
+            assert future.result(timeout=5) == "1"
+
+    executor.shutdown()
+    assert max(max_in_flight) == 1
+
+
+def test_adaptive_concurrency_queues_commits(creds):
+    submitted = []
+    executor = mock.Mock(spec=["submit"])
+    executor.submit.side_effect = submitted.append
+    options = types.PublisherOptions(
+        commit_executor=executor,
+        adaptive_concurrency=types.AdaptiveConcurrencySettings(
+            initial_outstanding_batches=1
+        ),
+    )
+    client = publisher.Client(credentials=creds, publisher_options=options)
+
+    client._start_batch_commit("topic", mock.sentinel.commit1)
+    client._start_batch_commit("topic", mock.sentinel.commit2)
+
+    commit_queue = client._commit_queues["topic"]
+    assert isinstance(commit_queue, AdaptiveCommitQueue)
+    assert len(submitted) == 1
+    assert commit_queue.pending == 1
+
+
+def test_record_publish_rpc_starts_queued_commits(creds):
+    submitted = []
+    executor = mock.Mock(spec=["submit"])
+    executor.submit.side_effect = submitted.append
+    options = types.PublisherOptions(
+        commit_executor=executor,
+        adaptive_concurrency=types.AdaptiveConcurrencySettings(
+            initial_outstanding_batches=1
+        ),
+    )
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    calls = []
+    client._start_batch_commit("topic", lambda: calls.append("a"))
+    client._start_batch_commit("topic", lambda: calls.append("b"))
+
+    # A healthy RPC raises the limit from one to two.
+    client._record_publish_rpc("topic", time.monotonic(), 0.1)
+
+    assert client._commit_queues["topic"].limit == 2
+    assert len(submitted) == 2
+    submitted[1]()
+    assert calls == ["b"]
+
+
+def test_adaptive_concurrency_learns_from_retried_attempts(creds):
+    options = types.PublisherOptions(
+        adaptive_concurrency=types.AdaptiveConcurrencySettings(
+            initial_outstanding_batches=4
+        ),
+    )
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    on_error = mock.Mock()
+    retry = retries.Retry(
+        predicate=retries.if_exception_type(core_exceptions.ResourceExhausted),
+        initial=0.01,
+        maximum=0.01,
+        timeout=5,
+        on_error=on_error,
+    )
+    error = core_exceptions.ResourceExhausted("Quota exceeded")
+    response = gapic_types.PublishResponse(message_ids=["1"])
+    stub = mock.Mock(side_effect=[error, response._pb])
+    client._raw_publish_rpc = gapic_v1.method.wrap_method(stub, default_timeout=None)
+
+    future = client.publish("topic", b"msg", retry=retry)
+
+    assert future.result(timeout=5) == "1"
+    assert stub.call_count == 2
+    # The retry succeeded, yet the failed attempt halved the limit.
+    assert client._commit_queues["topic"].limit == 2
+    on_error.assert_called_once_with(error)
+
+
+def test_record_publish_rpc_without_adaptive_concurrency(creds):
+    options = types.PublisherOptions(max_outstanding_batches=1)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    client._commit_queues["topic"] = commit_queue = CommitQueue(1)
+
+    error = core_exceptions.ResourceExhausted("Quota exceeded")
+    client._record_publish_rpc("topic", time.monotonic(), 0.1, error)
+
+    assert commit_queue.limit == 1
+
+
+def test_ordering_keys_not_coalesced_by_default(creds):
+    options = types.PublisherOptions(enable_message_ordering=True)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+
+    assert client._get_batch_coalescer("topic") is None
+
+
+def test_ordering_keys_coalesced(creds):
+    submitted = []
+    executor = mock.Mock(spec=["submit"])
+    executor.submit.side_effect = submitted.append
+    options = types.PublisherOptions(
+        enable_message_ordering=True,
+        coalesce_ordering_keys=True,
+        commit_executor=executor,
+    )
+    batch_settings = types.BatchSettings(max_latency=float("inf"))
+    client = publisher.Client(
+        credentials=creds, batch_settings=batch_settings, publisher_options=options
+    )
+    response = gapic_types.PublishResponse(message_ids=["1", "2"])
+
+    future1 = client.publish("topic", b"spam", ordering_key="key1")
+    future2 = client.publish("topic", b"eggs", ordering_key="key2")
+    for sequencer in client._sequencers.values():
+        sequencer.commit()
+
+    # Both batches are published by the single commit that was submitted.
+    assert len(submitted) == 1
+    with mock.patch.object(client, "_gapic_publish", return_value=response) as publish:
+        submitted[0]()
+
+    publish.assert_called_once()
+    assert future1.result() == "1"
+    assert future2.result() == "2"
+    assert isinstance(client._get_batch_coalescer("topic"), BatchCoalescer)
+
+
+def test_ordered_retry_reused(creds):
+    options = types.PublisherOptions(enable_message_ordering=True)
+    client = publisher.Client(credentials=creds, publisher_options=options)
+    custom_retry = retries.Retry()
+
+    default1, _ = client._ordered_retry_and_timeout(gapic_v1.method.DEFAULT, None)
+    default2, _ = client._ordered_retry_and_timeout(gapic_v1.method.DEFAULT, None)
+    custom, timeout = client._ordered_retry_and_timeout(custom_retry, 10)
+
+    assert default1 is default2
+    assert custom is not default1
+    assert custom.deadline == 2.0**32
+    assert timeout == 2.0**32
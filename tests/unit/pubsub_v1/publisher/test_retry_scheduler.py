@@ -0,0 +1,151 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.api_core import exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import _retry_scheduler
+from google.cloud.pubsub_v1.publisher._retry_scheduler import RetryScheduler
+
+
+RETRY = retries.Retry(
+    predicate=retries.if_exception_type(exceptions.ServiceUnavailable),
+    initial=0.1,
+    maximum=1.0,
+    multiplier=2.0,
+    deadline=60.0,
+)
+
+
+def create_scheduler(**kwargs):
+    scheduler = RetryScheduler(
+        types.ScheduledRetrySettings(**kwargs), default_retry=RETRY
+    )
+    scheduler._timer = mock.Mock(spec=["schedule", "stop"])
+    scheduler._timer.schedule.return_value = True
+    return scheduler
+
+
+def retry_later(scheduler, attempt=0, first_start=0.0, error=None, now=1.0):
+    if error is None:
+        error = exceptions.ServiceUnavailable("unavailable")
+    with mock.patch.object(_retry_scheduler.time, "monotonic", return_value=now):
+        return scheduler.retry_later(
+            RETRY, attempt, first_start, error, mock.sentinel.callback
+        )
+
+
+def test_scheduled_retry():
+    scheduler = create_scheduler()
+    custom_retry = RETRY.with_deadline(10.0)
+
+    assert scheduler.scheduled_retry(custom_retry) is custom_retry
+    assert scheduler.scheduled_retry(gapic_v1.method.DEFAULT) is RETRY
+    assert scheduler.scheduled_retry(None) is None
+    assert scheduler.scheduled_retry(mock.sentinel.retry) is None
+
+
+def test_retry_later_schedules_jittered_backoff():
+    scheduler = create_scheduler()
+
+    with mock.patch.object(
+        _retry_scheduler.random, "uniform", return_value=0.3
+    ) as uniform:
+        assert retry_later(scheduler, attempt=2) is None
+
+    uniform.assert_called_once_with(0.0, 0.4)
+    scheduler._timer.schedule.assert_called_once_with(0.3, mock.sentinel.callback)
+    assert scheduler.tokens == 99
+
+
+def test_retry_later_caps_backoff():
+    scheduler = create_scheduler()
+
+    with mock.patch.object(
+        _retry_scheduler.random, "uniform", return_value=0.5
+    ) as uniform:
+        assert retry_later(scheduler, attempt=10000) is None
+
+    uniform.assert_called_once_with(0.0, 1.0)
+
+
+def test_retry_later_not_retryable_error():
+    scheduler = create_scheduler()
+    error = exceptions.InvalidArgument("invalid")
+
+    assert retry_later(scheduler, error=error) is error
+    scheduler._timer.schedule.assert_not_called()
+    assert scheduler.tokens == 100
+
+
+def test_retry_later_deadline_exceeded():
+    scheduler = create_scheduler()
+    error = exceptions.ServiceUnavailable("unavailable")
+
+    result = retry_later(scheduler, error=error, first_start=0.0, now=61.0)
+
+    assert isinstance(result, exceptions.RetryError)
+    assert result.cause is error
+    scheduler._timer.schedule.assert_not_called()
+
+
+def test_retry_later_delay_within_deadline():
+    scheduler = create_scheduler()
+
+    with mock.patch.object(_retry_scheduler.random, "uniform", return_value=0.9):
+        assert retry_later(scheduler, attempt=5, first_start=0.0, now=59.5) is None
+
+    scheduler._timer.schedule.assert_called_once_with(0.5, mock.sentinel.callback)
+
+
+def test_retry_later_budget_spent():
+    scheduler = create_scheduler(max_tokens=4)
+
+    assert retry_later(scheduler) is None
+    error = exceptions.ServiceUnavailable("unavailable")
+    assert retry_later(scheduler, error=error) is error
+    assert scheduler._timer.schedule.call_count == 1
+
+
+def test_record_success_refills_budget():
+    scheduler = create_scheduler(max_tokens=4, token_ratio=0.5)
+    retry_later(scheduler)
+    retry_later(scheduler)
+    assert scheduler.tokens == 2
+
+    scheduler.record_success()
+    assert scheduler.tokens == 2.5
+    for _ in range(10):
+        scheduler.record_success()
+    assert scheduler.tokens == 4
+
+
+def test_retry_later_timer_stopped():
+    scheduler = create_scheduler()
+    scheduler._timer.schedule.return_value = False
+    error = exceptions.ServiceUnavailable("unavailable")
+
+    assert retry_later(scheduler, error=error) is error
+
+
+def test_stop_drains_timer():
+    scheduler = create_scheduler()
+
+    scheduler.stop()
+
+    scheduler._timer.stop.assert_called_once_with(drain=True)
@@ -0,0 +1,117 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from google.cloud.pubsub_v1.open_telemetry.publish_message_wrapper import (
+    PublishMessageWrapper,
+)
+from google.cloud.pubsub_v1.publisher import _serialized
+from google.pubsub_v1 import types as gapic_types
+
+
+@pytest.mark.parametrize("size", [0, 1, 127, 128, 300000])
+def test_wrap_buffer_message(size):
+    buffer = bytearray(b"x" * size)
+
+    wrapper = _serialized.wrap_buffer_message(buffer, "key", {"foo": "bar"})
+
+    expected = gapic_types.PubsubMessage(
+        data=bytes(buffer), ordering_key="key", attributes={"foo": "bar"}
+    )
+    assert wrapper.message == expected
+    assert wrapper.size == expected._pb.ByteSize()
+    assert wrapper.ordering_key == "key"
+
+
+def test_wrap_buffer_message_does_not_copy_data():
+    buffer = bytearray(b"spam")
+
+    wrapper = _serialized.wrap_buffer_message(memoryview(buffer), "", {})
+    buffer[:] = b"eggs"
+
+    assert wrapper.message.data == b"eggs"
+
+
+def test_wrap_buffer_message_not_contiguous():
+    with pytest.raises(TypeError):
+        _serialized.wrap_buffer_message(memoryview(b"spam")[::2], "", {})
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        gapic_types.PubsubMessage(),
+        gapic_types.PubsubMessage(data=b"x" * 300, attributes={"foo": "bar"}),
+        gapic_types.PubsubMessage(data=b"spam", ordering_key="key"),
+        gapic_types.PubsubMessage(
+            data=b"spam",
+            message_id="123",
+            publish_time={"seconds": 1, "nanos": 2},
+            ordering_key="k\u00e9y",
+        ),
+    ],
+)
+def test_read_ordering_key(message):
+    serialized = gapic_types.PubsubMessage.serialize(message)
+
+    assert _serialized.read_ordering_key(serialized) == message.ordering_key
+    assert _serialized.read_ordering_key(bytearray(serialized)) == message.ordering_key
+
+
+def test_read_ordering_key_last_occurrence_wins():
+    serialized = gapic_types.PubsubMessage.serialize(
+        gapic_types.PubsubMessage(ordering_key="first")
+    ) + gapic_types.PubsubMessage.serialize(
+        gapic_types.PubsubMessage(data=b"spam", ordering_key="last")
+    )
+
+    assert _serialized.read_ordering_key(serialized) == "last"
+
+
+@pytest.mark.parametrize(
+    "serialized",
+    [
+        # The data is shorter than its length.
+        b"\x0a\x05spam",
+        # The length of the data is cut off.
+        b"\x0a\x80",
+        # A start group tag, which messages do not use.
+        b"\x0b",
+    ],
+)
+def test_read_ordering_key_invalid(serialized):
+    with pytest.raises(ValueError):
+        _serialized.read_ordering_key(serialized)
+
+
+def test_serialize_publish_request():
+    messages = [
+        gapic_types.PubsubMessage(data=b"spam", attributes={"foo": "bar"}),
+        gapic_types.PubsubMessage(data=b"x" * 200, ordering_key="key"),
+        gapic_types.PubsubMessage(data=b"eggs"),
+    ]
+    wrappers = [
+        _serialized.wrap_buffer_message(bytearray(b"spam"), "", {"foo": "bar"}),
+        _serialized.SerializedMessageWrapper(
+            (gapic_types.PubsubMessage.serialize(messages[1]),), "key"
+        ),
+        PublishMessageWrapper(messages[2]),
+    ]
+
+    request = _serialized.serialize_publish_request("topic/path", wrappers)
+
+    assert gapic_types.PublishRequest.deserialize(request) == (
+        gapic_types.PublishRequest(topic="topic/path", messages=messages)
+    )
@@ -0,0 +1,86 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from unittest import mock
+
+from google.cloud.pubsub_v1.subscriber._protocol import callback_batcher
+
+
+def make_batcher(schedule, max_batch_size=3, max_batch_latency=60.0):
+    return callback_batcher.CallbackBatcher(
+        schedule, max_batch_size=max_batch_size, max_batch_latency=max_batch_latency
+    )
+
+
+def test_add_full_batch():
+    schedule = mock.Mock()
+    batcher = make_batcher(schedule)
+
+    for item in ("a", "b", "c", "d"):
+        batcher.add(item)
+
+    schedule.assert_called_once_with(["a", "b", "c"])
+    assert batcher.stop() == ["d"]
+
+
+def test_add_latency_elapsed():
+    batch_scheduled = threading.Event()
+    schedule = mock.Mock(side_effect=lambda batch: batch_scheduled.set())
+    batcher = make_batcher(schedule, max_batch_latency=0.01)
+
+    batcher.add("a")
+    batcher.add("b")
+
+    assert batch_scheduled.wait(timeout=3)
+    schedule.assert_called_once_with(["a", "b"])
+    assert batcher.stop() == []
+
+
+def test_on_timer_batch_already_handed_over():
+    schedule = mock.Mock()
+    batcher = make_batcher(schedule, max_batch_size=2)
+
+    batcher.add("a")
+    batcher.add("b")
+    batcher.add("c")
+    schedule.reset_mock()
+
+    # The timer of the first batch fires late.
+    batcher._on_timer(0)
+
+    schedule.assert_not_called()
+    assert batcher.stop() == ["c"]
+
+
+def test_on_timer_no_messages():
+    schedule = mock.Mock()
+    batcher = make_batcher(schedule)
+
+    batcher._on_timer(batcher._batch_number)
+
+    schedule.assert_not_called()
+    batcher.stop()
+
+
+def test_stop():
+    schedule = mock.Mock()
+    batcher = make_batcher(schedule)
+
+    batcher.add("a")
+    batcher.add("b")
+
+    assert batcher.stop() == ["a", "b"]
+    schedule.assert_not_called()
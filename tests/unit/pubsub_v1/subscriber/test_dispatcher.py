@@ -355,6 +355,26 @@ def test_dispatch_duplicate_items_callback_active_manager_no_futures_eod(
     manager._exactly_once_delivery_enabled.assert_called()
 
 
+def test_dispatch_callback_list_of_requests():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    ack_1 = requests.AckRequest("0", 0, 0, "", None)
+    ack_2 = requests.AckRequest("1", 0, 0, "", None)
+    nack = requests.NackRequest("2", 0, "", None)
+    items = [[ack_1, ack_2], nack]
+
+    with mock.patch.object(dispatcher_, "ack") as ack, mock.patch.object(
+        dispatcher_, "nack"
+    ) as nack_method:
+        dispatcher_.dispatch_callback(items)
+
+    ack.assert_called_once_with([ack_1, ack_2])
+    nack_method.assert_called_once_with([nack])
+
+
 def test_unknown_request_type():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True
@@ -14,10 +14,12 @@
 
 from __future__ import absolute_import
 
+import asyncio
 from unittest import mock
 import pytest
 
 from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber._protocol import async_streaming_pull_manager
 from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
 from google.cloud.pubsub_v1.subscriber.exceptions import (
     AcknowledgeError,
@@ -82,6 +84,74 @@ class TestStreamingPullFuture(object):
         assert future.cancelled()
 
 
+class TestAsyncStreamingPullFuture(object):
+    def make_future(self):
+        manager = mock.create_autospec(
+            async_streaming_pull_manager.AsyncStreamingPullManager, instance=True
+        )
+        future = futures.AsyncStreamingPullFuture(manager)
+        return future
+
+    @pytest.mark.asyncio
+    async def test_default_state(self):
+        future = self.make_future()
+        manager = future._AsyncStreamingPullFuture__manager
+
+        assert not future.done()
+        assert not future.cancelled()
+        manager.add_close_callback.assert_called_once_with(future._on_close_callback)
+
+    @pytest.mark.asyncio
+    async def test__on_close_callback_success(self):
+        future = self.make_future()
+
+        future._on_close_callback(mock.sentinel.manager, None)
+
+        assert await future is True
+        assert future.result() is True
+
+    @pytest.mark.asyncio
+    async def test__on_close_callback_failure(self):
+        future = self.make_future()
+
+        future._on_close_callback(mock.sentinel.manager, ValueError("meep"))
+
+        with pytest.raises(ValueError):
+            await future
+
+    @pytest.mark.asyncio
+    async def test__on_close_callback_future_already_done(self):
+        future = self.make_future()
+
+        future.set_exception(ValueError("meep"))
+        future._on_close_callback(mock.sentinel.manager, None)
+
+        with pytest.raises(ValueError):
+            await future
+
+    @pytest.mark.asyncio
+    async def test_cancel(self):
+        future = self.make_future()
+        manager = future._AsyncStreamingPullFuture__manager
+
+        assert future.cancel() is True
+
+        manager.close.assert_called_once()
+        assert future.cancelled()
+        assert not future.done()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_awaiting_task(self):
+        future = self.make_future()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(future, timeout=0.01)
+
+        # The streaming pull still resolves the future.
+        future.set_result(True)
+        assert await future is True
+
+
 class TestFuture(object):
     def test_cancel(self):
         future = futures.Future()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import logging
 import queue
 import time
 
@@ -109,6 +110,57 @@ def test_ordering_key():
     assert msg.ordering_key == "key1"
 
 
+def test_message_id():
+    msg = create_message(b"foo")
+    assert msg.message_id == "message_id"
+
+
+def test_message_id_settable():
+    msg = create_message(b"foo")
+    msg.message_id = "other_id"
+    assert msg.message_id == "other_id"
+
+
+def test_custom_attributes():
+    msg = create_message(b"foo")
+    msg.custom = "value"
+    assert msg.custom == "value"
+
+
+def test_data_and_attributes_cached():
+    msg = create_message(b"foo", baz="bacon")
+    assert msg.data is msg.data
+    assert msg.attributes is msg.attributes
+    assert msg.ordering_key is msg.ordering_key
+
+
+def test_derived_fields_computed_lazily():
+    msg = create_message(b"foo")
+    assert msg._publish_time is None
+    assert msg._size is None
+
+    publish_time = msg.publish_time
+    assert publish_time == PUBLISHED
+    assert msg.publish_time is publish_time  # cached
+    assert msg.size == 30
+    assert msg._size == 30
+
+
+def test_received_timestamp():
+    msg = message.Message(
+        gapic_types.PubsubMessage(data=b"foo")._pb,
+        "ACKID",
+        0,
+        queue.Queue(),
+        received_timestamp=RECEIVED_SECONDS - 3,
+    )
+
+    with mock.patch.object(time, "time", return_value=RECEIVED_SECONDS):
+        msg.ack()
+
+    assert msg._request_queue.get_nowait().time_to_ack == 3
+
+
 def check_call_types(mock, *args, **kwargs):
     """Checks a mock's call types.
 
@@ -432,6 +484,78 @@ def test_nack_with_response_exactly_once_delivery_enabled():
         check_call_types(put, requests.NackRequest)
 
 
+def test_ack_many():
+    msg_1 = create_message(b"foo", ack_id="ack_id_1")
+    msg_2 = create_message(b"bar", ack_id="ack_id_2")
+    msg_3 = create_message(b"baz", ack_id="ack_id_3")
+    msg_2._request_queue = msg_1._request_queue
+
+    message.ack_many([msg_1, msg_2, msg_3])
+
+    assert msg_1._request_queue.get_nowait() == [
+        requests.AckRequest(
+            message_id="message_id",
+            ack_id=ack_id,
+            byte_size=30,
+            time_to_ack=mock.ANY,
+            ordering_key="",
+            future=None,
+        )
+        for ack_id in ("ack_id_1", "ack_id_2")
+    ]
+    assert msg_1._request_queue.empty()
+    assert msg_3._request_queue.get_nowait() == [
+        requests.AckRequest(
+            message_id="message_id",
+            ack_id="ack_id_3",
+            byte_size=30,
+            time_to_ack=mock.ANY,
+            ordering_key="",
+            future=None,
+        )
+    ]
+
+
+def test_nack_many():
+    msg_1 = create_message(b"foo", ack_id="ack_id_1")
+    msg_2 = create_message(b"bar", ack_id="ack_id_2", ordering_key="key")
+    msg_2._request_queue = msg_1._request_queue
+
+    message.nack_many([msg_1, msg_2])
+
+    assert msg_1._request_queue.get_nowait() == [
+        requests.NackRequest(
+            ack_id="ack_id_1", byte_size=30, ordering_key="", future=None
+        ),
+        requests.NackRequest(
+            ack_id="ack_id_2", byte_size=35, ordering_key="key", future=None
+        ),
+    ]
+    assert msg_1._request_queue.empty()
+
+
+def test_ack_many_and_nack_many_log_each_message(caplog):
+    caplog.set_level(logging.DEBUG, logger="ack-nack")
+    msg_1 = create_message(b"foo", ack_id="ack_id_1")
+    msg_2 = create_message(b"bar", ack_id="ack_id_2")
+
+    message.ack_many([msg_1])
+    message.nack_many([msg_2])
+
+    assert (
+        "Called ack for message (id=message_id, ack_id=ack_id_1, ordering_key=)"
+        in caplog.text
+    )
+    assert (
+        "Called nack for message (id=message_id, ack_id=ack_id_2, ordering_key=, "
+        "exactly_once=False)" in caplog.text
+    )
+
+
+def test_ack_many_no_messages():
+    message.ack_many([])
+
+
 def test_repr():
     data = b"foo"
     ordering_key = "ord_key"
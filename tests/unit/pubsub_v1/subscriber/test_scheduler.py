@@ -13,6 +13,9 @@
 # limitations under the License.
 
 import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import operator
+import os
 import queue
 import pytest
 import threading
@@ -20,7 +23,10 @@ import time
 
 from unittest import mock
 
+from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.pubsub_v1 import types as gapic_types
 
 
 def test_subclasses_base_abc():
@@ -173,3 +179,183 @@ def test_shutdown_handles_executor_queue_sentinels():
     for msg in dropped:
         assert msg is not None
         assert msg.startswith("message_")
+
+
+def create_message(request_queue, data=b"foo", ack_id="ACKID"):
+    pubsub_message = gapic_types.PubsubMessage(
+        data=data, message_id="message_id", attributes={"key": "value"}
+    )
+    return message.Message(pubsub_message._pb, ack_id, 0, request_queue)
+
+
+def nack_all(worker_messages):
+    """A batch callback that can be pickled for the worker processes."""
+    for worker_message in worker_messages:
+        worker_message.nack()
+
+
+def exit_worker(worker_message):
+    """A callback that kills its worker process."""
+    os._exit(1)
+
+
+def make_process_scheduler():
+    """Return a ProcessScheduler that runs the callbacks in a thread pool of
+    this process instead, so that the callbacks do not need to be picklable."""
+    scheduler_ = scheduler.ProcessScheduler(max_workers=2)
+    scheduler_._process_executor.shutdown()
+    scheduler_._process_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    return scheduler_
+
+
+def test_process_scheduler_constructor_defaults():
+    scheduler_ = scheduler.ProcessScheduler()
+
+    assert isinstance(scheduler_, scheduler.ThreadScheduler)
+    assert isinstance(scheduler_.queue, queue.Queue)
+    assert isinstance(
+        scheduler_._process_executor, concurrent.futures.ProcessPoolExecutor
+    )
+    assert scheduler_._process_executor._mp_context.get_start_method() == "spawn"
+
+    scheduler_.shutdown()
+
+
+def test_process_scheduler_wrap_callback():
+    scheduler_ = make_process_scheduler()
+    msg = create_message(scheduler_.queue)
+    received = []
+
+    def callback(worker_message):
+        received.append(worker_message)
+        worker_message.modify_ack_deadline(30)
+        worker_message.ack()
+
+    scheduler_.wrap_callback(callback)(msg)
+
+    (worker_message,) = received
+    assert worker_message is not msg
+    assert worker_message.data == b"foo"
+    assert worker_message.attributes == {"key": "value"}
+    assert worker_message.ack_id == "ACKID"
+    assert worker_message.size == msg.size
+
+    modack_request = scheduler_.queue.get_nowait()
+    assert isinstance(modack_request, requests.ModAckRequest)
+    assert modack_request.seconds == 30
+    assert isinstance(scheduler_.queue.get_nowait(), requests.AckRequest)
+    assert scheduler_.queue.empty()
+
+    scheduler_.shutdown()
+
+
+def test_process_scheduler_wrap_callback_batch():
+    scheduler_ = make_process_scheduler()
+    messages = [
+        create_message(scheduler_.queue, ack_id="ack_1"),
+        create_message(scheduler_.queue, ack_id="ack_2"),
+    ]
+
+    def callback(worker_messages):
+        worker_messages[0].ack()
+        worker_messages[1].nack()
+
+    scheduler_.wrap_callback(callback)(messages)
+
+    ack_request = scheduler_.queue.get_nowait()
+    assert isinstance(ack_request, requests.AckRequest)
+    assert ack_request.ack_id == "ack_1"
+    nack_request = scheduler_.queue.get_nowait()
+    assert isinstance(nack_request, requests.NackRequest)
+    assert nack_request.ack_id == "ack_2"
+
+    scheduler_.shutdown()
+
+
+def test_process_scheduler_wrap_callback_error():
+    scheduler_ = make_process_scheduler()
+    msg = create_message(scheduler_.queue)
+
+    def callback(worker_message):
+        worker_message.ack()
+        raise ValueError("meep")
+
+    with pytest.raises(ValueError, match="meep"):
+        scheduler_.wrap_callback(callback)(msg)
+
+    # The calls made before the error are still applied.
+    assert isinstance(scheduler_.queue.get_nowait(), requests.AckRequest)
+
+    scheduler_.shutdown()
+
+
+def test_process_scheduler_runs_callback_in_worker_process():
+    scheduler_ = scheduler.ProcessScheduler(max_workers=1)
+    msg = create_message(scheduler_.queue)
+
+    scheduler_.schedule(scheduler_.wrap_callback(operator.methodcaller("ack")), msg)
+    ack_request = scheduler_.queue.get(timeout=30)
+
+    assert isinstance(ack_request, requests.AckRequest)
+    assert ack_request.ack_id == "ACKID"
+    assert scheduler_.shutdown(await_msg_callbacks=True) == []
+
+
+def test_process_scheduler_runs_batch_callback_in_worker_process():
+    scheduler_ = scheduler.ProcessScheduler(max_workers=1)
+    messages = [
+        create_message(scheduler_.queue, ack_id="ack_1"),
+        create_message(scheduler_.queue, ack_id="ack_2"),
+    ]
+
+    # The worker messages are pickled to the worker process and back.
+    scheduler_.wrap_callback(nack_all)(messages)
+
+    nack_requests = [scheduler_.queue.get_nowait() for _ in messages]
+    assert all(isinstance(request, requests.NackRequest) for request in nack_requests)
+    assert [request.ack_id for request in nack_requests] == ["ack_1", "ack_2"]
+    assert scheduler_.shutdown(await_msg_callbacks=True) == []
+
+
+def test_process_scheduler_replaces_broken_process_pool():
+    scheduler_ = scheduler.ProcessScheduler(max_workers=1)
+    broken_executor = scheduler_._process_executor
+    msg = create_message(scheduler_.queue)
+
+    with pytest.raises(BrokenProcessPool):
+        scheduler_.wrap_callback(exit_worker)(msg)
+
+    assert scheduler_._process_executor is not broken_executor
+    assert scheduler_.queue.empty()
+
+    # The callbacks scheduled later run in the new process pool.
+    scheduler_.wrap_callback(operator.methodcaller("ack"))(msg)
+    assert isinstance(scheduler_.queue.get_nowait(), requests.AckRequest)
+    assert scheduler_.shutdown(await_msg_callbacks=True) == []
+
+
+def test_process_scheduler_broken_process_pool_after_shutdown():
+    scheduler_ = scheduler.ProcessScheduler(max_workers=1)
+    broken_executor = scheduler_._process_executor
+    scheduler_.shutdown(await_msg_callbacks=True)
+
+    scheduler_._replace_broken_process_executor(broken_executor)
+
+    assert scheduler_._process_executor is broken_executor
+
+
+@pytest.mark.parametrize("await_msg_callbacks", [True, False])
+def test_process_scheduler_shutdown(await_msg_callbacks):
+    scheduler_ = scheduler.ProcessScheduler(max_workers=1)
+    process_executor = scheduler_._process_executor = mock.create_autospec(
+        concurrent.futures.ProcessPoolExecutor, instance=True
+    )
+
+    with mock.patch.object(
+        scheduler.ThreadScheduler, "shutdown", return_value=["message_1"]
+    ) as thread_shutdown:
+        dropped = scheduler_.shutdown(await_msg_callbacks=await_msg_callbacks)
+
+    assert dropped == ["message_1"]
+    thread_shutdown.assert_called_once_with(await_msg_callbacks=await_msg_callbacks)
+    process_executor.shutdown.assert_called_once_with(wait=await_msg_callbacks)
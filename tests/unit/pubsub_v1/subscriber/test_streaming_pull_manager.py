@@ -41,6 +41,7 @@ from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber import client
 from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import callback_batcher
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
 from google.cloud.pubsub_v1.subscriber._protocol import leaser
@@ -113,6 +114,34 @@ def test__wrap_callback_errors_error(callback_error):
     on_callback_error.assert_called_once_with(callback_error)
 
 
+def test__wrap_batch_callback_errors_no_error():
+    messages = [create_mock_message(), create_mock_message()]
+    callback = mock.Mock()
+    on_callback_error = mock.Mock()
+
+    streaming_pull_manager._wrap_batch_callback_errors(
+        callback, on_callback_error, messages
+    )
+
+    callback.assert_called_once_with(messages)
+    on_callback_error.assert_not_called()
+
+
+def test__wrap_batch_callback_errors_error():
+    messages = [create_mock_message(), create_mock_message()]
+    callback_error = ValueError("ValueError")
+    callback = mock.Mock(side_effect=callback_error)
+    on_callback_error = mock.Mock()
+
+    with mock.patch.object(message, "nack_many", autospec=True) as nack_many:
+        streaming_pull_manager._wrap_batch_callback_errors(
+            callback, on_callback_error, messages
+        )
+
+    nack_many.assert_called_once_with(messages)
+    on_callback_error.assert_called_once_with(callback_error)
+
+
 def test_constructor_and_default_state():
     mock.sentinel.subscription = str()
     manager = streaming_pull_manager.StreamingPullManager(
@@ -434,8 +463,9 @@ def test_lease_load_and_pause():
         flow_control=types.FlowControl(max_messages=10, max_bytes=1000)
     )
     manager._leaser = leaser.Leaser(manager)
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_paused = False
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_paused = False
 
     # This should mean that our messages count is at 10%, and our bytes
     # are at 15%; load should return the higher (0.15), and shouldn't cause
@@ -445,7 +475,7 @@ def test_lease_load_and_pause():
     )
     assert manager.load == 0.15
     manager.maybe_pause_consumer()
-    manager._consumer.pause.assert_not_called()
+    consumer.pause.assert_not_called()
 
     # After this message is added, the messages should be higher at 20%
     # (versus 16% for bytes).
@@ -460,7 +490,7 @@ def test_lease_load_and_pause():
     )
     assert manager.load == 1.16
     manager.maybe_pause_consumer()
-    manager._consumer.pause.assert_called_once()
+    consumer.pause.assert_called_once()
 
 
 def test_drop_and_resume():
@@ -468,8 +498,9 @@ def test_drop_and_resume():
         flow_control=types.FlowControl(max_messages=10, max_bytes=1000)
     )
     manager._leaser = leaser.Leaser(manager)
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_paused = True
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_paused = True
 
     # Add several messages until we're over the load threshold.
     manager.leaser.add(
@@ -483,7 +514,7 @@ def test_drop_and_resume():
 
     # Trying to resume now should have no effect as we're over the threshold.
     manager.maybe_resume_consumer()
-    manager._consumer.resume.assert_not_called()
+    consumer.resume.assert_not_called()
 
     # Drop the 200 byte message, which should put us under the resume
     # threshold.
@@ -491,17 +522,51 @@ def test_drop_and_resume():
         [requests.DropRequest(ack_id="two", byte_size=250, ordering_key="")]
     )
     manager.maybe_resume_consumer()
-    manager._consumer.resume.assert_called_once()
+    consumer.resume.assert_called_once()
+
+
+def test_pause_and_resume_multiple_streams():
+    manager = make_manager(
+        flow_control=types.FlowControl(max_messages=10, max_bytes=1000)
+    )
+    manager._leaser = leaser.Leaser(manager)
+    consumers = [
+        mock.create_autospec(bidi.BackgroundConsumer, instance=True) for _ in range(3)
+    ]
+    for consumer in consumers:
+        consumer.is_paused = False
+    consumers[2].is_paused = True
+    manager._consumers = consumers
+
+    manager.leaser.add(
+        [requests.LeaseRequest(ack_id="one", byte_size=1000, ordering_key="")]
+    )
+    manager.maybe_pause_consumer()
+
+    consumers[0].pause.assert_called_once()
+    consumers[1].pause.assert_called_once()
+    consumers[2].pause.assert_not_called()
+
+    consumers[0].is_paused = True
+    manager.leaser.remove(
+        [requests.DropRequest(ack_id="one", byte_size=1000, ordering_key="")]
+    )
+    manager.maybe_resume_consumer()
+
+    consumers[0].resume.assert_called_once()
+    consumers[1].resume.assert_not_called()
+    consumers[2].resume.assert_called_once()
 
 
 def test_resume_not_paused():
     manager = make_manager()
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_paused = False
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_paused = False
 
     # Resuming should have no effect is the consumer is not actually paused.
     manager.maybe_resume_consumer()
-    manager._consumer.resume.assert_not_called()
+    consumer.resume.assert_not_called()
 
 
 def test_maybe_resume_consumer_wo_consumer_set():
@@ -730,7 +795,7 @@ def test_send_unary_ack():
     }
     manager.send_unary_ack(ack_ids=["ack_id1", "ack_id2"], ack_reqs_dict=ack_reqs_dict)
 
-    manager._client.acknowledge.assert_called_once_with(
+    manager._client._raw_acknowledge.assert_called_once_with(
         subscription=manager._subscription, ack_ids=["ack_id1", "ack_id2"]
     )
 
@@ -759,7 +824,7 @@ def test_send_unary_ack_exactly_once_enabled_with_futures():
     }
     manager.send_unary_ack(ack_ids=["ack_id1", "ack_id2"], ack_reqs_dict=ack_reqs_dict)
 
-    manager._client.acknowledge.assert_called_once_with(
+    manager._client._raw_acknowledge.assert_called_once_with(
         subscription=manager._subscription, ack_ids=["ack_id1", "ack_id2"]
     )
     assert future1.result() == subscriber_exceptions.AcknowledgeStatus.SUCCESS
@@ -789,7 +854,7 @@ def test_send_unary_ack_exactly_once_disabled_with_futures():
     }
     manager.send_unary_ack(ack_ids=["ack_id1", "ack_id2"], ack_reqs_dict=ack_reqs_dict)
 
-    manager._client.acknowledge.assert_called_once_with(
+    manager._client._raw_acknowledge.assert_called_once_with(
         subscription=manager._subscription, ack_ids=["ack_id1", "ack_id2"]
     )
     assert future1.result() == subscriber_exceptions.AcknowledgeStatus.SUCCESS
@@ -810,7 +875,7 @@ def test_send_unary_modack():
         ack_reqs_dict=ack_reqs_dict,
     )
 
-    manager._client.modify_ack_deadline.assert_has_calls(
+    manager._client._raw_modify_ack_deadline.assert_has_calls(
         [
             mock.call(
                 subscription=manager._subscription,
@@ -842,7 +907,7 @@ def test_send_unary_modack_default_deadline():
         default_deadline=10,
     )
 
-    manager._client.modify_ack_deadline.assert_has_calls(
+    manager._client._raw_modify_ack_deadline.assert_has_calls(
         [
             mock.call(
                 subscription=manager._subscription,
@@ -872,7 +937,7 @@ def test_send_unary_modack_exactly_once_enabled_with_futures():
         ack_reqs_dict=ack_reqs_dict,
     )
 
-    manager._client.modify_ack_deadline.assert_has_calls(
+    manager._client._raw_modify_ack_deadline.assert_has_calls(
         [
             mock.call(
                 subscription=manager._subscription,
@@ -909,7 +974,7 @@ def test_send_unary_modack_exactly_once_disabled_with_futures():
         ack_reqs_dict=ack_reqs_dict,
     )
 
-    manager._client.modify_ack_deadline.assert_has_calls(
+    manager._client._raw_modify_ack_deadline.assert_has_calls(
         [
             mock.call(
                 subscription=manager._subscription,
@@ -935,7 +1000,7 @@ def test_send_unary_ack_api_call_error(caplog, modify_google_logger_propagation)
     manager = make_manager()
 
     error = exceptions.GoogleAPICallError("The front fell off")
-    manager._client.acknowledge.side_effect = error
+    manager._client._raw_acknowledge.side_effect = error
 
     ack_reqs_dict = {
         "ack_id1": requests.AckRequest(
@@ -956,7 +1021,7 @@ def test_send_unary_modack_api_call_error(caplog, modify_google_logger_propagati
     manager = make_manager()
 
     error = exceptions.GoogleAPICallError("The front fell off")
-    manager._client.modify_ack_deadline.side_effect = error
+    manager._client._raw_modify_ack_deadline.side_effect = error
 
     ack_reqs_dict = {
         "ack_id1": requests.AckRequest(
@@ -994,7 +1059,7 @@ def test_send_unary_ack_retry_error_exactly_once_disabled_no_futures(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.acknowledge.side_effect = error
+    manager._client._raw_acknowledge.side_effect = error
 
     ack_reqs_dict = {
         "ack_id1": requests.AckRequest(
@@ -1032,7 +1097,7 @@ def test_send_unary_ack_retry_error_exactly_once_disabled_with_futures(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.acknowledge.side_effect = error
+    manager._client._raw_acknowledge.side_effect = error
 
     future1 = futures.Future()
     future2 = futures.Future()
@@ -1074,7 +1139,7 @@ def test_send_unary_ack_retry_error_exactly_once_enabled_no_futures(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.acknowledge.side_effect = error
+    manager._client._raw_acknowledge.side_effect = error
 
     ack_reqs_dict = {
         "ack_id1": requests.AckRequest(
@@ -1112,7 +1177,7 @@ def test_send_unary_ack_retry_error_exactly_once_enabled_with_futures(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.acknowledge.side_effect = error
+    manager._client._raw_acknowledge.side_effect = error
 
     future1 = futures.Future()
     future2 = futures.Future()
@@ -1160,7 +1225,7 @@ def test_send_unary_modack_retry_error_exactly_once_disabled_no_future(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.modify_ack_deadline.side_effect = error
+    manager._client._raw_modify_ack_deadline.side_effect = error
 
     ack_reqs_dict = {
         "ackid1": requests.ModAckRequest(ack_id="ackid1", seconds=60, future=None)
@@ -1187,7 +1252,7 @@ def test_send_unary_modack_retry_error_exactly_once_disabled_with_futures(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.modify_ack_deadline.side_effect = error
+    manager._client._raw_modify_ack_deadline.side_effect = error
 
     future = futures.Future()
     ack_reqs_dict = {
@@ -1216,7 +1281,7 @@ def test_send_unary_modack_retry_error_exactly_once_enabled_no_futures(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.modify_ack_deadline.side_effect = error
+    manager._client._raw_modify_ack_deadline.side_effect = error
 
     ack_reqs_dict = {
         "ackid1": requests.ModAckRequest(ack_id="ackid1", seconds=60, future=None)
@@ -1243,7 +1308,7 @@ def test_send_unary_modack_retry_error_exactly_once_enabled_with_futures(
     error = exceptions.RetryError(
         "Too long a transient error", cause=Exception("Out of time!")
     )
-    manager._client.modify_ack_deadline.side_effect = error
+    manager._client._raw_modify_ack_deadline.side_effect = error
 
     future = futures.Future()
     ack_reqs_dict = {
@@ -1266,39 +1331,58 @@ def test_send_unary_modack_retry_error_exactly_once_enabled_with_futures(
 
 def test_heartbeat():
     manager = make_manager()
-    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
-    manager._rpc.is_active = True
+    rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpcs = [rpc]
+    rpc.is_active = True
 
     result = manager.heartbeat()
 
-    manager._rpc.send.assert_called_once_with(gapic_types.StreamingPullRequest())
+    rpc.send.assert_called_once_with(gapic_types.StreamingPullRequest())
     assert result
 
 
 def test_heartbeat_inactive():
     manager = make_manager()
-    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
-    manager._rpc.is_active = False
+    rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpcs = [rpc]
+    rpc.is_active = False
 
     manager.heartbeat()
 
-    result = manager._rpc.send.assert_not_called()
+    result = rpc.send.assert_not_called()
     assert not result
 
 
+def test_heartbeat_multiple_streams():
+    manager = make_manager(num_streams=3)
+    rpcs = [mock.create_autospec(bidi.BidiRpc, instance=True) for _ in range(3)]
+    for rpc in rpcs:
+        rpc.is_active = True
+    rpcs[1].is_active = False
+    manager._rpcs = rpcs
+
+    result = manager.heartbeat()
+
+    assert result
+    rpcs[0].send.assert_called_once_with(gapic_types.StreamingPullRequest())
+    rpcs[1].send.assert_not_called()
+    rpcs[2].send.assert_called_once_with(gapic_types.StreamingPullRequest())
+
+
 def test_heartbeat_stream_ack_deadline_seconds(
     caplog, modify_google_logger_propagation
 ):
     caplog.set_level(logging.DEBUG)
     manager = make_manager()
-    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
-    manager._rpc.is_active = True
+    rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpcs = [rpc]
+    rpc.is_active = True
     # Send new ack deadline with next heartbeat.
     manager._send_new_ack_deadline = True
 
     result = manager.heartbeat()
 
-    manager._rpc.send.assert_called_once_with(
+    rpc.send.assert_called_once_with(
         gapic_types.StreamingPullRequest(stream_ack_deadline_seconds=60)
     )
     assert result
@@ -1338,13 +1422,17 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
 
     if streaming_pull_manager._SHOULD_USE_ON_FATAL_ERROR_CALLBACK:
         background_consumer.assert_called_once_with(
-            manager._rpc, manager._on_response, manager._on_fatal_exception
+            resumable_bidi_rpc.return_value,
+            manager._on_response,
+            on_fatal_exception=manager._on_fatal_exception,
         )
     else:
-        background_consumer.assert_called_once_with(manager._rpc, manager._on_response)
+        background_consumer.assert_called_once_with(
+            resumable_bidi_rpc.return_value, manager._on_response
+        )
 
     background_consumer.return_value.start.assert_called_once()
-    assert manager._consumer == background_consumer.return_value
+    assert manager._consumers == [background_consumer.return_value]
 
     resumable_bidi_rpc.assert_called_once_with(
         start_rpc=manager._client.streaming_pull,
@@ -1362,16 +1450,56 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
     resumable_bidi_rpc.return_value.add_done_callback.assert_called_once_with(
         manager._on_rpc_done
     )
-    assert manager._rpc == resumable_bidi_rpc.return_value
+    assert manager._rpcs == [resumable_bidi_rpc.return_value]
 
-    manager._consumer.is_active = True
+    background_consumer.return_value.is_active = True
     assert manager.is_active is True
 
 
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_multiple_streams(
+    heartbeater, dispatcher, leaser, background_consumer, resumable_bidi_rpc
+):
+    rpcs = [mock.Mock(name="rpc_{}".format(i)) for i in range(3)]
+    consumers = [mock.Mock(name="consumer_{}".format(i)) for i in range(3)]
+    resumable_bidi_rpc.side_effect = rpcs
+    background_consumer.side_effect = consumers
+    manager = make_manager(num_streams=3)
+
+    with mock.patch.object(
+        type(manager), "ack_deadline", new=mock.PropertyMock(return_value=18)
+    ):
+        manager.open(mock.sentinel.callback, mock.sentinel.on_callback_error)
+
+    # One dispatcher, leaser and heartbeater are shared by all streams.
+    dispatcher.assert_called_once_with(manager, manager._scheduler.queue)
+    leaser.assert_called_once_with(manager)
+    heartbeater.assert_called_once_with(manager)
+
+    assert resumable_bidi_rpc.call_count == 3
+    assert manager._rpcs == rpcs
+    assert manager._consumers == consumers
+    for rpc, consumer, consumer_call in zip(
+        rpcs, consumers, background_consumer.call_args_list
+    ):
+        rpc.add_done_callback.assert_called_once_with(manager._on_rpc_done)
+        assert consumer_call.args == (rpc, manager._on_response)
+        consumer.start.assert_called_once()
+
+
 def test_open_already_active():
     manager = make_manager()
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_active = True
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_active = True
 
     with pytest.raises(ValueError, match="already open"):
         manager.open(mock.sentinel.callback, mock.sentinel.on_callback_error)
@@ -1385,20 +1513,88 @@ def test_open_has_been_closed():
         manager.open(mock.sentinel.callback, mock.sentinel.on_callback_error)
 
 
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_with_batch_callback(
+    heartbeater, dispatcher, leaser, background_consumer, resumable_bidi_rpc
+):
+    manager = make_manager(max_batch_size=2, max_batch_latency=60.0)
+    callback = mock.Mock()
+
+    with mock.patch.object(
+        type(manager), "ack_deadline", new=mock.PropertyMock(return_value=18)
+    ):
+        manager.open(callback, mock.sentinel.on_callback_error)
+
+    assert manager._callback.func is streaming_pull_manager._wrap_batch_callback_errors
+    batcher = manager._callback_batcher
+    assert isinstance(batcher, callback_batcher.CallbackBatcher)
+
+    msg_1 = create_mock_message(size=10, opentelemetry_data=None)
+    msg_2 = create_mock_message(size=10, opentelemetry_data=None)
+    manager._schedule_message_on_hold(msg_1)
+    manager._scheduler.schedule.assert_not_called()
+    manager._schedule_message_on_hold(msg_2)
+
+    manager._scheduler.schedule.assert_called_once_with(
+        manager._callback, [msg_1, msg_2]
+    )
+    assert batcher.stop() == []
+
+
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_with_process_scheduler(
+    heartbeater, dispatcher, leaser, background_consumer, resumable_bidi_rpc
+):
+    client_ = mock.create_autospec(client.Client, instance=True)
+    scheduler_ = mock.create_autospec(scheduler.ProcessScheduler, instance=True)
+    manager = streaming_pull_manager.StreamingPullManager(
+        client_, "subscription-name", scheduler=scheduler_
+    )
+
+    with mock.patch.object(
+        type(manager), "ack_deadline", new=mock.PropertyMock(return_value=18)
+    ):
+        manager.open(mock.sentinel.callback, mock.sentinel.on_callback_error)
+
+    scheduler_.wrap_callback.assert_called_once_with(mock.sentinel.callback)
+    assert manager._callback.func is streaming_pull_manager._wrap_callback_errors
+    assert manager._callback.args == (
+        scheduler_.wrap_callback.return_value,
+        mock.sentinel.on_callback_error,
+    )
+
+
 def make_running_manager(
     enable_open_telemetry: bool = False,
     subscription_name: str = "subscription-name",
     **kwargs,
 ):
     manager = make_manager(enable_open_telemetry, subscription_name, **kwargs)
-    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
-    manager._consumer.is_active = True
+    consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumers = [consumer]
+    consumer.is_active = True
     manager._dispatcher = mock.create_autospec(dispatcher.Dispatcher, instance=True)
     manager._leaser = mock.create_autospec(leaser.Leaser, instance=True)
     manager._heartbeater = mock.create_autospec(heartbeater.Heartbeater, instance=True)
     return (
         manager,
-        manager._consumer,
+        consumer,
         manager._dispatcher,
         manager._leaser,
         manager._heartbeater,
@@ -1466,6 +1662,21 @@ def test_closes_on_fatal_consumer_error():
         assert manager.is_active is False
 
 
+def test_close_multiple_streams():
+    manager, consumer, _, _, _, _ = make_running_manager(num_streams=2)
+    inactive_consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    inactive_consumer.is_active = False
+    manager._consumers.append(inactive_consumer)
+
+    manager.close()
+    await_manager_shutdown(manager, timeout=3)
+
+    consumer.stop.assert_called_once()
+    inactive_consumer.stop.assert_not_called()
+    assert manager._consumers == []
+    assert manager.is_active is False
+
+
 def test_close_inactive_consumer():
     (
         manager,
@@ -1655,6 +1866,34 @@ def test_close_nacks_internally_queued_messages():
     assert sorted(nacked_messages) == [b"msg1", b"msg2", b"msg3"]
 
 
+def test_close_nacks_batched_messages():
+    nacked_messages = []
+
+    def fake_nack(self):
+        nacked_messages.append(self.data)
+
+    messages = [
+        create_message(data=b"msg1"),
+        create_message(data=b"msg2"),
+        create_message(data=b"msg3"),
+    ]
+    for msg in messages:
+        msg.nack = stdlib_types.MethodType(fake_nack, msg)
+
+    manager, _, _, _, _, _ = make_running_manager()
+    manager._callback_batcher = mock.create_autospec(
+        callback_batcher.CallbackBatcher, instance=True
+    )
+    manager._callback_batcher.stop.return_value = [messages[2]]
+    manager._scheduler.shutdown.return_value = [messages[:2]]
+
+    manager.close()
+    await_manager_shutdown(manager, timeout=3)
+
+    manager._callback_batcher.stop.assert_called_once()
+    assert sorted(nacked_messages) == [b"msg1", b"msg2", b"msg3"]
+
+
 def test__get_initial_request():
     manager = make_manager()
     manager._leaser = mock.create_autospec(leaser.Leaser, instance=True)
@@ -1682,6 +1921,27 @@ def test__get_initial_request_wo_leaser():
     assert initial_request.modify_deadline_seconds == []
 
 
+def test__get_initial_request_multiple_streams():
+    manager = make_manager(
+        flow_control=types.FlowControl(max_messages=10, max_bytes=1000),
+        num_streams=3,
+    )
+
+    initial_request = manager._get_initial_request(123)
+
+    assert initial_request.max_outstanding_messages == 4
+    assert initial_request.max_outstanding_bytes == 334
+
+
+def test__get_initial_request_multiple_streams_legacy_flow_control():
+    manager = make_manager(num_streams=3, use_legacy_flow_control=True)
+
+    initial_request = manager._get_initial_request(123)
+
+    assert initial_request.max_outstanding_messages == 0
+    assert initial_request.max_outstanding_bytes == 0
+
+
 def test__on_response_delivery_attempt():
     manager, _, dispatcher, leaser, _, scheduler = make_running_manager()
     manager._callback = mock.sentinel.callback
@@ -1832,8 +2092,9 @@ def test__on_response_send_ack_deadline_after_enabling_exactly_once():
     complete_modify_ack_deadline_calls(dispatcher)
 
     # set up an active RPC
-    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
-    manager._rpc.is_active = True
+    rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpcs = [rpc]
+    rpc.is_active = True
 
     # make p99 value smaller than exactly_once min lease
     manager.ack_histogram.add(10)
@@ -1865,7 +2126,7 @@ def test__on_response_send_ack_deadline_after_enabling_exactly_once():
     assert heartbeat_request_sent
 
     # heartbeat request is sent with the 60 sec min lease value for exactly_once subscriptions
-    manager._rpc.send.assert_called_once_with(
+    rpc.send.assert_called_once_with(
         gapic_types.StreamingPullRequest(stream_ack_deadline_seconds=60)
     )
 
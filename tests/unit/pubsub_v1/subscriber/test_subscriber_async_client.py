@@ -0,0 +1,414 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from unittest import mock
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.pubsub_v1 import subscriber
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber.exceptions import AcknowledgeStatus
+from google.pubsub_v1 import types as gapic_types
+
+
+SUBSCRIPTION = "projects/foo/subscriptions/bar"
+
+
+class _FakeStreams(object):
+    """Serves the streaming pull RPCs of a client from a queue of responses.
+
+    An exception put into the queue ends the current stream with that error.
+    """
+
+    def __init__(self):
+        self.responses = asyncio.Queue()
+        self.initial_requests = []
+
+    async def streaming_pull(self, requests=None, metadata=()):
+        self.initial_requests.append(await requests.__anext__())
+
+        async def stream():
+            while True:
+                response = await self.responses.get()
+                if isinstance(response, BaseException):
+                    raise response
+                yield response
+
+        return stream()
+
+
+def _response(*ack_ids, exactly_once=False):
+    return gapic_types.StreamingPullResponse(
+        received_messages=[
+            gapic_types.ReceivedMessage(
+                ack_id=ack_id,
+                message=gapic_types.PubsubMessage(
+                    data=b"data-" + ack_id.encode(), message_id="id-" + ack_id
+                ),
+            )
+            for ack_id in ack_ids
+        ],
+        subscription_properties=gapic_types.StreamingPullResponse.SubscriptionProperties(
+            exactly_once_delivery_enabled=exactly_once
+        ),
+    )
+
+
+@pytest.fixture
+def patch_rpcs():
+    def patch(client):
+        streams = _FakeStreams()
+        patchers = [
+            mock.patch.object(client, "streaming_pull", new=streams.streaming_pull),
+            mock.patch.object(client, "acknowledge", new_callable=mock.AsyncMock),
+            mock.patch.object(
+                client, "modify_ack_deadline", new_callable=mock.AsyncMock
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+        started.extend(patchers)
+        return streams
+
+    started = []
+    yield patch
+    for patcher in started:
+        patcher.stop()
+
+
+async def _wait_for(condition, timeout=5):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def _acked_ids(client):
+    return [
+        ack_id
+        for call in client.acknowledge.await_args_list
+        for ack_id in call.kwargs["ack_ids"]
+    ]
+
+
+def _modacked_ids(client, seconds):
+    return {
+        ack_id
+        for call in client.modify_ack_deadline.await_args_list
+        if call.kwargs["ack_deadline_seconds"] == seconds
+        for ack_id in call.kwargs["ack_ids"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_init(creds):
+    client = subscriber.AsyncClient(credentials=creds)
+
+    assert client.subscriber_options == types.SubscriberOptions()
+    assert client.open_telemetry_enabled is False
+    assert client.target == "pubsub.googleapis.com:443"
+    assert not client.closed
+
+
+@pytest.mark.asyncio
+async def test_init_open_telemetry_not_supported(creds):
+    options = types.SubscriberOptions(enable_open_telemetry_tracing=True)
+
+    with pytest.warns(RuntimeWarning, match="not supported"):
+        client = subscriber.AsyncClient(credentials=creds, subscriber_options=options)
+
+    assert client.open_telemetry_enabled is False
+
+
+@pytest.mark.asyncio
+async def test_close(creds):
+    client = subscriber.AsyncClient(credentials=creds)
+
+    with mock.patch.object(
+        type(client.transport), "close", new_callable=mock.AsyncMock
+    ) as close:
+        async with client:
+            pass
+
+    close.assert_awaited_once()
+    assert client.closed
+
+    with pytest.raises(RuntimeError, match="Closed subscriber"):
+        async with client:
+            pass  # pragma: NO COVER
+
+
+@pytest.mark.asyncio
+async def test_subscribe_awaits_async_callback(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    received = []
+
+    async def callback(message):
+        await asyncio.sleep(0)
+        received.append(message.data)
+        message.ack()
+
+    future = await client.subscribe(
+        SUBSCRIPTION,
+        callback,
+        flow_control=types.FlowControl(max_messages=5, max_bytes=1000),
+    )
+    await streams.responses.put(_response("1", "2"))
+    await _wait_for(lambda: len(_acked_ids(client)) == 2)
+
+    assert sorted(received) == [b"data-1", b"data-2"]
+    assert sorted(_acked_ids(client)) == ["1", "2"]
+    # The messages were modacked on receipt.
+    assert _modacked_ids(client, 10) == {"1", "2"}
+
+    (initial_request,) = streams.initial_requests
+    assert initial_request.subscription == SUBSCRIPTION
+    assert initial_request.max_outstanding_messages == 5
+    assert initial_request.max_outstanding_bytes == 1000
+
+    assert not future.done()
+    assert future.cancel() is True
+    assert await asyncio.wait_for(future, timeout=5) is True
+    assert future.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_sync_callback(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+
+    future = await client.subscribe(SUBSCRIPTION, lambda message: message.ack())
+    await streams.responses.put(_response("1"))
+    await _wait_for(lambda: _acked_ids(client) == ["1"])
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_callback_error(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    error = ValueError("meep")
+
+    async def callback(message):
+        raise error
+
+    future = await client.subscribe(SUBSCRIPTION, callback)
+    await streams.responses.put(_response("1"))
+
+    with pytest.raises(ValueError, match="meep"):
+        await asyncio.wait_for(future, timeout=5)
+
+    # The message is nacked.
+    await _wait_for(lambda: _modacked_ids(client, 0) == {"1"})
+
+    future.cancel()
+    with pytest.raises(ValueError, match="meep"):
+        await asyncio.wait_for(future, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_flow_control(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    running = []
+    release = asyncio.Event()
+
+    async def callback(message):
+        running.append(message.ack_id)
+        await release.wait()
+        message.ack()
+
+    future = await client.subscribe(
+        SUBSCRIPTION, callback, flow_control=types.FlowControl(max_messages=1)
+    )
+    await streams.responses.put(_response("1", "2"))
+    await _wait_for(lambda: running == ["1"])
+    await asyncio.sleep(0.05)
+
+    # The second message is on hold until the first one is acked.
+    assert running == ["1"]
+
+    release.set()
+    await _wait_for(lambda: len(_acked_ids(client)) == 2)
+    assert running == ["1", "2"]
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_ordering_keys(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    running = []
+    release = asyncio.Event()
+
+    async def callback(message):
+        running.append(message.ack_id)
+        await release.wait()
+        message.ack()
+
+    future = await client.subscribe(SUBSCRIPTION, callback)
+    response = _response("1", "2")
+    for received_message in response.received_messages:
+        received_message.message.ordering_key = "key"
+    await streams.responses.put(response)
+    await _wait_for(lambda: running == ["1"])
+    await asyncio.sleep(0.05)
+
+    # The second message of the key waits for the first one.
+    assert running == ["1"]
+
+    release.set()
+    await _wait_for(lambda: len(_acked_ids(client)) == 2)
+    assert running == ["1", "2"]
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_terminating_stream_error(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    error = exceptions.PermissionDenied("nope")
+
+    future = await client.subscribe(SUBSCRIPTION, mock.Mock())
+    await streams.responses.put(error)
+
+    with pytest.raises(exceptions.PermissionDenied):
+        await asyncio.wait_for(future, timeout=5)
+    assert not future.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_reopens_stream(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+
+    future = await client.subscribe(SUBSCRIPTION, lambda message: message.ack())
+    await streams.responses.put(exceptions.ServiceUnavailable("later"))
+    await streams.responses.put(_response("1"))
+    await _wait_for(lambda: _acked_ids(client) == ["1"])
+
+    assert len(streams.initial_requests) == 2
+    # All streams use the same client id.
+    assert streams.initial_requests[0].client_id
+    assert streams.initial_requests[0].client_id == (
+        streams.initial_requests[1].client_id
+    )
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_cancel_nacks_running_callbacks(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    cancelled = []
+
+    async def callback(message):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(message.ack_id)
+            raise
+
+    future = await client.subscribe(
+        SUBSCRIPTION, callback, flow_control=types.FlowControl(max_messages=1)
+    )
+    await streams.responses.put(_response("1", "2"))
+    await _wait_for(lambda: _modacked_ids(client, 10) == {"1", "2"})
+    await asyncio.sleep(0.01)
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
+
+    assert cancelled == ["1"]
+    # Both the running and the held message are nacked.
+    assert _modacked_ids(client, 0) == {"1", "2"}
+
+
+@pytest.mark.asyncio
+async def test_cancel_awaits_callbacks(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    started = asyncio.Event()
+
+    async def callback(message):
+        started.set()
+        await asyncio.sleep(0.05)
+        message.ack()
+
+    future = await client.subscribe(
+        SUBSCRIPTION, callback, await_callbacks_on_shutdown=True
+    )
+    await streams.responses.put(_response("1"))
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
+
+    # The ack of the finished callback is sent before the shutdown completes.
+    assert _acked_ids(client) == ["1"]
+    assert _modacked_ids(client, 0) == set()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_exactly_once(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    ack_futures = []
+
+    async def callback(message):
+        ack_futures.append(asyncio.wrap_future(message.ack_with_response()))
+
+    future = await client.subscribe(SUBSCRIPTION, callback)
+    await streams.responses.put(_response("1", exactly_once=True))
+    await _wait_for(lambda: len(ack_futures) == 1)
+
+    assert await asyncio.wait_for(ack_futures[0], timeout=5) == (
+        AcknowledgeStatus.SUCCESS
+    )
+    assert _acked_ids(client) == ["1"]
+    # With exactly-once delivery, the minimum lease deadline is higher.
+    assert _modacked_ids(client, 60) == {"1"}
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_ack_from_another_thread(creds, patch_rpcs):
+    client = subscriber.AsyncClient(credentials=creds)
+    streams = patch_rpcs(client)
+    loop = asyncio.get_running_loop()
+
+    async def callback(message):
+        await loop.run_in_executor(None, message.ack)
+
+    future = await client.subscribe(SUBSCRIPTION, callback)
+    await streams.responses.put(_response("1"))
+    await _wait_for(lambda: _acked_ids(client) == ["1"])
+
+    future.cancel()
+    await asyncio.wait_for(future, timeout=5)
@@ -29,6 +29,7 @@ from google.pubsub_v1.services.subscriber.transports.grpc import SubscriberGrpcT
 from google.cloud.pubsub_v1.open_telemetry.context_propagation import (
     OpenTelemetryContextGetter,
 )
+from google.pubsub_v1 import types as gapic_types
 from google.pubsub_v1.types import PubsubMessage
 
 
@@ -194,6 +195,7 @@ def test_subscribe_options(manager_open, creds):
         flow_control=flow_control,
         scheduler=scheduler,
         await_callbacks_on_shutdown=mock.sentinel.await_callbacks,
+        num_streams=3,
     )
     assert isinstance(future, futures.StreamingPullFuture)
 
@@ -202,6 +204,7 @@ def test_subscribe_options(manager_open, creds):
     assert manager.flow_control == flow_control
     assert manager._scheduler == scheduler
     assert manager._await_callbacks_on_shutdown is mock.sentinel.await_callbacks
+    assert manager._num_streams == 3
     manager_open.assert_called_once_with(
         mock.ANY,
         callback=mock.sentinel.callback,
@@ -209,6 +212,64 @@ def test_subscribe_options(manager_open, creds):
     )
 
 
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_batch_callback(manager_open, creds):
+    client = subscriber.Client(credentials=creds)
+
+    future = client.subscribe(
+        "sub_name_a",
+        batch_callback=mock.sentinel.batch_callback,
+        max_batch_size=10,
+        max_batch_latency=0.5,
+    )
+    assert isinstance(future, futures.StreamingPullFuture)
+
+    manager = future._StreamingPullFuture__manager
+    assert manager._max_batch_size == 10
+    assert manager._max_batch_latency == 0.5
+    manager_open.assert_called_once_with(
+        mock.ANY,
+        callback=mock.sentinel.batch_callback,
+        on_callback_error=future.set_exception,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({}, "Exactly one of callback and batch_callback"),
+        (
+            {
+                "callback": mock.sentinel.callback,
+                "batch_callback": mock.sentinel.batch_callback,
+            },
+            "Exactly one of callback and batch_callback",
+        ),
+        (
+            {"batch_callback": mock.sentinel.batch_callback, "max_batch_size": 0},
+            "max_batch_size",
+        ),
+        (
+            {"batch_callback": mock.sentinel.batch_callback, "max_batch_latency": -1},
+            "max_batch_latency",
+        ),
+        (
+            {"callback": mock.sentinel.callback, "num_streams": 0},
+            "num_streams",
+        ),
+    ],
+)
+def test_subscribe_invalid_callback_args(kwargs, match, creds):
+    client = subscriber.Client(credentials=creds)
+
+    with pytest.raises(ValueError, match=match):
+        client.subscribe("sub_name_a", **kwargs)
+
+
 def test_close(creds):
     client = subscriber.Client(credentials=creds)
     patcher = mock.patch.object(client._transport.grpc_channel, "close")
@@ -286,6 +347,75 @@ def test_streaming_pull_gapic_monkeypatch(creds):
     assert not transport.streaming_pull._prefetch_first_result_
 
 
+def test_raw_acknowledge(creds):
+    client = subscriber.Client(credentials=creds)
+    client._raw_acknowledge_rpc = mock.Mock()
+    subscription = "projects/foo/subscriptions/bar"
+
+    client._raw_acknowledge(subscription=subscription, ack_ids=["ack1", "ack2"])
+
+    (request,) = client._raw_acknowledge_rpc.call_args.args
+    assert gapic_types.AcknowledgeRequest.deserialize(request) == (
+        gapic_types.AcknowledgeRequest(
+            subscription=subscription, ack_ids=["ack1", "ack2"]
+        )
+    )
+    metadata = client._raw_acknowledge_rpc.call_args.kwargs["metadata"]
+    assert metadata == (
+        ("x-goog-request-params", "subscription=projects/foo/subscriptions/bar"),
+    )
+
+
+def test_raw_modify_ack_deadline(creds):
+    client = subscriber.Client(credentials=creds)
+    client._raw_modify_ack_deadline_rpc = mock.Mock()
+    subscription = "projects/foo/subscriptions/bar"
+
+    client._raw_modify_ack_deadline(
+        subscription=subscription, ack_ids=["ack1"], ack_deadline_seconds=42
+    )
+
+    (request,) = client._raw_modify_ack_deadline_rpc.call_args.args
+    assert gapic_types.ModifyAckDeadlineRequest.deserialize(request) == (
+        gapic_types.ModifyAckDeadlineRequest(
+            subscription=subscription, ack_ids=["ack1"], ack_deadline_seconds=42
+        )
+    )
+    metadata = client._raw_modify_ack_deadline_rpc.call_args.kwargs["metadata"]
+    assert metadata == (
+        ("x-goog-request-params", "subscription=projects/foo/subscriptions/bar"),
+    )
+
+
+def test_raw_rpcs_without_grpc_transport(creds):
+    client = subscriber.Client(credentials=creds)
+    client._raw_acknowledge_rpc = None
+    client._raw_modify_ack_deadline_rpc = None
+    subscription = "projects/foo/subscriptions/bar"
+
+    with mock.patch.object(client, "acknowledge") as acknowledge, mock.patch.object(
+        client, "modify_ack_deadline"
+    ) as modify_ack_deadline:
+        client._raw_acknowledge(subscription=subscription, ack_ids=["ack1"])
+        client._raw_modify_ack_deadline(
+            subscription=subscription, ack_ids=["ack2"], ack_deadline_seconds=42
+        )
+
+    acknowledge.assert_called_once_with(
+        subscription=subscription,
+        ack_ids=["ack1"],
+        retry=mock.ANY,
+        timeout=mock.ANY,
+    )
+    modify_ack_deadline.assert_called_once_with(
+        subscription=subscription,
+        ack_ids=["ack2"],
+        ack_deadline_seconds=42,
+        retry=mock.ANY,
+        timeout=mock.ANY,
+    )
+
+
 def test_sync_pull_warning_if_return_immediately(creds):
     client = subscriber.Client(credentials=creds)
     subscription_path = "projects/foo/subscriptions/bar"
@@ -0,0 +1,121 @@
+# Copyright 2026, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from google.cloud.pubsub_v1._timer import DeadlineTimer
+
+
+def test_thread_started_lazily():
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    assert timer._thread is None
+
+    timer.schedule(600, lambda: None)
+
+    assert timer._thread is not None
+    assert timer._thread.daemon
+    assert timer._thread.name == "Thread-TestDeadlineTimer"
+    assert len(timer) == 1
+    timer.stop()
+
+
+def test_callbacks_run_in_deadline_order():
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    calls = []
+    done = threading.Event()
+
+    def make_callback(name):
+        def callback():
+            calls.append(name)
+            if len(calls) == 3:
+                done.set()
+
+        return callback
+
+    timer.schedule(0.06, make_callback("last"))
+    timer.schedule(0.02, make_callback("first"))
+    timer.schedule(0.04, make_callback("second"))
+
+    assert done.wait(timeout=5)
+    assert calls == ["first", "second", "last"]
+    assert len(timer) == 0
+    timer.stop()
+
+
+def test_callback_error_does_not_stop_timer(caplog):
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    done = threading.Event()
+
+    def failing_callback():
+        raise ValueError("Boom!")
+
+    timer.schedule(0, failing_callback)
+    timer.schedule(0.01, done.set)
+
+    assert done.wait(timeout=5)
+    assert "Error in a deadline timer callback." in caplog.text
+    timer.stop()
+
+
+def test_stop_drops_pending_callbacks():
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    calls = []
+
+    timer.schedule(600, lambda: calls.append(1))
+    timer.stop()
+    timer._thread.join(timeout=5)
+
+    assert not timer._thread.is_alive()
+    assert len(timer) == 0
+    assert calls == []
+
+
+def test_schedule_after_stop_is_ignored():
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    timer.stop()
+
+    assert not timer.schedule(0, lambda: None)
+
+    assert len(timer) == 0
+    assert timer._thread is None
+
+
+def test_stop_drain_runs_pending_callbacks():
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    calls = []
+
+    def first_callback():
+        calls.append("first")
+        # Callbacks scheduled while draining still run.
+        assert timer.schedule(0.01, lambda: calls.append("second"))
+
+    assert timer.schedule(0.05, first_callback)
+    timer.stop(drain=True)
+    timer._thread.join(timeout=5)
+
+    assert not timer._thread.is_alive()
+    assert calls == ["first", "second"]
+    assert not timer.schedule(0, lambda: None)
+
+
+def test_stop_drain_without_callbacks():
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    assert timer.schedule(0, lambda: None)
+    timer.stop()
+
+    timer = DeadlineTimer(name="Thread-TestDeadlineTimer")
+    timer.stop(drain=True)
+
+    assert not timer.schedule(0, lambda: None)
+    assert timer._thread is None